@@ -21,7 +21,7 @@ import houdini_toolbox.logging.config
 houdini_toolbox.logging.config.init_config()
 
 from houdini_toolbox.pyfilter.manager import PyFilterManager
-from houdini_toolbox.pyfilter.property import get_property
+from houdini_toolbox.pyfilter.property import cache_properties, get_property
 
 _logger = logging.getLogger("houdini_toolbox-pyfilter")
 
@@ -95,9 +95,11 @@ def filterFog():
     a fog object. The function can query fog: settings and possibly alter them.
 
     """
-    _logger.debug("filterFog (%s)", get_property("object:name"))
+    # Share any properties read for logging with the operations.
+    with cache_properties():
+        _logger.debug("filterFog (%s)", get_property("object:name"))
 
-    _PYFILTER_MANAGER.run_operations_for_stage("filter_fog")
+        _PYFILTER_MANAGER.run_operations_for_stage("filter_fog")
 
 
 def filterGeometry():
@@ -121,8 +123,10 @@ def filterInstance():
     alter them.
 
     """
-    _logger.debug("filterInstance (%s)", get_property("object:name"))
-    _PYFILTER_MANAGER.run_operations_for_stage("filter_instance")
+    # Share any properties read for logging with the operations.
+    with cache_properties():
+        _logger.debug("filterInstance (%s)", get_property("object:name"))
+        _PYFILTER_MANAGER.run_operations_for_stage("filter_instance")
 
 
 def filterLight():
@@ -133,9 +137,11 @@ def filterLight():
     them.
 
     """
-    _logger.debug("filterLight (%s)", get_property("object:name"))
+    # Share any properties read for logging with the operations.
+    with cache_properties():
+        _logger.debug("filterLight (%s)", get_property("object:name"))
 
-    _PYFILTER_MANAGER.run_operations_for_stage("filter_light")
+        _PYFILTER_MANAGER.run_operations_for_stage("filter_light")
 
 
 def filterMaterial():
@@ -165,16 +171,18 @@ def filterOutputAssets(assets):  # pylint: disable=unused-argument
 
 def filterPlane():
     """Change query and modify image plane properties."""
-    variable = get_property("plane:variable")
-    channel = get_property("plane:channel")
+    # Share any properties read for logging with the operations.
+    with cache_properties():
+        variable = get_property("plane:variable")
+        channel = get_property("plane:channel")
 
-    if channel in (variable, ""):
-        _logger.debug("filterPlane (%s)", variable)
+        if channel in (variable, ""):
+            _logger.debug("filterPlane (%s)", variable)
 
-    else:
-        _logger.debug("filterPlane (%s -> %s)", variable, channel)
+        else:
+            _logger.debug("filterPlane (%s -> %s)", variable, channel)
 
-    _PYFILTER_MANAGER.run_operations_for_stage("filter_plane")
+        _PYFILTER_MANAGER.run_operations_for_stage("filter_plane")
 
 
 def filterQuit():
@@ -17,10 +17,14 @@ import houdini_toolbox.logging.config
 houdini_toolbox.logging.config.init_config()
 
 # Houdini Toolbox
-import houdini_toolbox.events
-import houdini_toolbox.events.callbacks
-import houdini_toolbox.nodes.styles
-import houdini_toolbox.sohohooks.aovs
+from houdini_toolbox.profiler import startup_profile
 
-# Create any dynamic event handlers, such as using Python's atexit module
-houdini_toolbox.events.callbacks.register_callbacks()
+# Profile the package startup if HT_STARTUP_PROFILE is set.
+with startup_profile():
+    import houdini_toolbox.events
+    import houdini_toolbox.events.callbacks
+    import houdini_toolbox.nodes.styles
+    import houdini_toolbox.sohohooks.aovs
+
+    # Create any dynamic event handlers, such as using Python's atexit module
+    houdini_toolbox.events.callbacks.register_callbacks()
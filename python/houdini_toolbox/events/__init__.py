@@ -6,12 +6,16 @@
 
 # flake8: noqa: F401
 
+# Standard Library
+import os
+
 # Houdini Toolbox
-from houdini_toolbox.events.events import rop_render, scene_load
+from houdini_toolbox.events.events import node_batch
 from houdini_toolbox.events.manager import (
     register_event_group,
     register_function,
     register_item,
+    register_lazy,
     run_event,
 )
 from houdini_toolbox.events.types import (
@@ -24,7 +28,26 @@ from houdini_toolbox.events.types import (
 # =============================================================================
 
 
-# Register the package's ROP render script events.
-register_event_group(rop_render.RopRenderEvent())
+# Register the package's ROP render script events.  The handlers are only
+# imported when one of their events is first run.
+register_lazy(
+    "houdini_toolbox.events.events.rop_render",
+    "RopRenderEvent",
+    (
+        RopEvents.PreRender,
+        RopEvents.PreFrame,
+        RopEvents.PostFrame,
+        RopEvents.PostRender,
+        RopEvents.PostWrite,
+    ),
+)
+
+register_lazy(
+    "houdini_toolbox.events.events.scene_load",
+    "clear_session_settings",
+    (SceneEvents.Load,),
+)
 
-register_function(scene_load.clear_session_settings, SceneEvents.Load)
+# Optionally batch node events while hip files are loaded or merged.
+if node_batch.BATCH_NODE_EVENTS_VAR in os.environ:
+    register_event_group(node_batch.NodeEventBatchGroup())
@@ -12,6 +12,7 @@ import atexit
 from typing import Any
 
 # Houdini Toolbox
+from houdini_toolbox.events.deferred import DEFERRED_RUNNER
 from houdini_toolbox.events.manager import run_event
 from houdini_toolbox.events.types import HipFileEvents, SceneEvents
 
@@ -28,11 +29,15 @@ def _atexit_callback(
 ) -> None:  # pylint: disable=unused-argument
     """Run SceneEvents.Exit events.
 
+    Any deferred callables are completed before exiting.
+
     :return:
 
     """
     run_event(SceneEvents.Exit)
 
+    DEFERRED_RUNNER.shutdown()
+
 
 def _emit_ui_available(
     *args: Any, **kwargs: Any
@@ -0,0 +1,65 @@
+"""This module contains the context object passed to context aware event items."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from houdini_toolbox.events.event import HoudiniEvent
+    from houdini_toolbox.events.item import HoudiniEventItem
+    from houdini_toolbox.events.manager import HoudiniEventManager
+
+# =============================================================================
+# CLASSES
+# =============================================================================
+
+
+class EventContext:
+    """Lightweight state about a running event.
+
+    Context aware items receive this alongside the scriptargs rather than
+    having the manager, event and item added to and removed from the
+    scriptargs as they run.
+
+    :param manager: The manager running the event.
+    :param event: The running event.
+    :param item: The running item.
+
+    """
+
+    __slots__ = ("event", "item", "manager")
+
+    def __init__(
+        self,
+        manager: Optional[HoudiniEventManager] = None,
+        event: Optional[HoudiniEvent] = None,
+        item: Optional[HoudiniEventItem] = None,
+    ) -> None:
+        self.event = event
+        self.item = item
+        self.manager = manager
+
+    # -------------------------------------------------------------------------
+    # SPECIAL METHODS
+    # -------------------------------------------------------------------------
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self.event} {self.item}>"
+
+    # -------------------------------------------------------------------------
+    # METHODS
+    # -------------------------------------------------------------------------
+
+    def copy(self) -> EventContext:
+        """Create a copy of the context.
+
+        :return: The context copy.
+
+        """
+        return EventContext(self.manager, self.event, self.item)
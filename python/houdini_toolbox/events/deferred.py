@@ -0,0 +1,207 @@
+"""This module contains a class and functions for running event callables
+after the event which triggered them has completed.
+
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import collections
+import concurrent.futures
+import logging
+import threading
+from typing import Any, Callable, Deque, Optional, Set, Tuple
+
+# Houdini
+import hou
+
+_logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CLASSES
+# =============================================================================
+
+
+class DeferredRunner:
+    """Run callables outside of the event which triggered them.
+
+    In a graphical session callables are run one at a time when Houdini is
+    idle. Otherwise they are run on a bounded pool of worker threads.  Callables
+    submitted from a worker thread are run immediately on that thread since
+    waiting for a free slot could deadlock the pool.
+
+    :param max_workers: The maximum number of worker threads.
+    :param max_pending: The maximum number of callables which can be waiting
+        to run on the worker threads before submitting blocks.
+
+    """
+
+    def __init__(self, max_workers: int = 1, max_pending: int = 1000) -> None:
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._futures: Set[concurrent.futures.Future] = set()
+        self._idle_queue: Deque[Tuple[Callable, Any]] = collections.deque()
+        self._max_workers = max_workers
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._worker_state = threading.local()
+
+    # -------------------------------------------------------------------------
+    # SPECIAL METHODS
+    # -------------------------------------------------------------------------
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self.pending} pending>"
+
+    # -------------------------------------------------------------------------
+    # NON-PUBLIC METHODS
+    # -------------------------------------------------------------------------
+
+    def _init_worker(self) -> None:
+        """Mark the current thread as one of the pool's worker threads.
+
+        :return:
+
+        """
+        self._worker_state.is_worker = True
+
+    def _on_future_done(self, future: concurrent.futures.Future) -> None:
+        """Release the slot held by a completed worker thread callable.
+
+        :param future: The completed future.
+        :return:
+
+        """
+        self._futures.discard(future)
+        self._slots.release()
+
+    def _run_next_idle(self) -> None:
+        """Run the oldest callable waiting for Houdini to be idle.
+
+        :return:
+
+        """
+        # The queue may have already been flushed.
+        if self._idle_queue:
+            func, args = self._idle_queue.popleft()
+
+            _run_callable(func, args)
+
+    def _submit_to_pool(self, func: Callable, args: Any) -> None:
+        """Submit a callable to be run on the worker threads.
+
+        :param func: The callable to run.
+        :param args: The args to run the callable with.
+        :return:
+
+        """
+        # A worker thread waiting for a slot would never release its own so
+        # run the callable now.  It is already outside of the event.
+        if getattr(self._worker_state, "is_worker", False):
+            _run_callable(func, args)
+            return
+
+        # Wait for a free slot so the number of waiting callables, and the
+        # memory held by their args, stays bounded.
+        self._slots.acquire()  # pylint: disable=consider-using-with
+
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="houdini_toolbox",
+                initializer=self._init_worker,
+            )
+
+        future = self._executor.submit(_run_callable, func, args)
+
+        self._futures.add(future)
+        future.add_done_callback(self._on_future_done)
+
+    # -------------------------------------------------------------------------
+    # PROPERTIES
+    # -------------------------------------------------------------------------
+
+    @property
+    def pending(self) -> int:
+        """The number of callables which have not yet completed."""
+        return len(self._idle_queue) + len(self._futures)
+
+    # -------------------------------------------------------------------------
+    # METHODS
+    # -------------------------------------------------------------------------
+
+    def flush(self) -> None:
+        """Complete all pending callables.
+
+        Callables waiting for Houdini to be idle are run immediately.
+
+        :return:
+
+        """
+        while self._idle_queue:
+            self._run_next_idle()
+
+        if self._futures:
+            concurrent.futures.wait(list(self._futures))
+
+    def shutdown(self) -> None:
+        """Complete all pending callables and stop the worker threads.
+
+        :return:
+
+        """
+        self.flush()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def submit(self, func: Callable, args: Any) -> None:
+        """Submit a callable to be run later.
+
+        :param func: The callable to run.
+        :param args: The args to run the callable with.
+        :return:
+
+        """
+        if hou.isUIAvailable():
+            # Import here in case UI is not available.
+            import hdefereval
+
+            self._idle_queue.append((func, args))
+
+            hdefereval.executeDeferred(self._run_next_idle)
+
+        else:
+            self._submit_to_pool(func, args)
+
+
+# =============================================================================
+# NON-PUBLIC FUNCTIONS
+# =============================================================================
+
+
+def _run_callable(func: Callable, args: Any) -> None:
+    """Run a deferred callable, logging any errors.
+
+    There is no caller to handle an exception so it is logged instead.
+
+    :param func: The callable to run.
+    :param args: The args to run the callable with.
+    :return:
+
+    """
+    try:
+        func(args)
+
+    except Exception:  # pylint: disable=broad-except
+        _logger.exception("Error running deferred %s", func)
+
+
+# =============================================================================
+
+DEFERRED_RUNNER = DeferredRunner()
@@ -9,9 +9,11 @@ from __future__ import annotations
 
 # Standard Library
 import enum
-from typing import Any, Dict, List, Type
+import functools
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
 # Houdini Toolbox
+from houdini_toolbox.events.context import EventContext
 from houdini_toolbox.events.item import HoudiniEventItem
 from houdini_toolbox.events.stats import HoudiniEventStats
 
@@ -63,10 +65,15 @@ class HoudiniEvent:
     """
 
     def __init__(self, name: str) -> None:
+        self._batch_dispatch_plan: Optional[Tuple[Callable, ...]] = None
+        self._batch_queue: Optional[List[dict]] = None
+        self._context = EventContext(event=self)
         self._data: Dict[Any, Any] = {}
+        self._dispatch_plan: Optional[Tuple[Callable, ...]] = None
         self._enabled = True
         self._name = name
         self._item_map: Dict[int, List[HoudiniEventItem]] = {}
+        self._needs_scriptargs_keys: Optional[bool] = None
 
         self._stats = HoudiniEventStats(name)
 
@@ -77,15 +84,82 @@ class HoudiniEvent:
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}: {self.name}>"
 
+    # -------------------------------------------------------------------------
+    # NON-PUBLIC METHODS
+    # -------------------------------------------------------------------------
+
+    def _build_dispatch_plan(self, batch: bool = False) -> Tuple[Callable, ...]:
+        """Build a flattened tuple of item run methods in decreasing priority order.
+
+        :param batch: Whether to build the plan for running a batch of args.
+        :return: The bound run methods of all registered items.
+
+        """
+        plan = []
+
+        for priority in sorted(self.item_map.keys(), reverse=True):
+            for item in self.item_map[priority]:
+                run_method = item.get_run_method(batch=batch, context=self.context)
+
+                # Items without a run method, such as superseded exclusive
+                # items, are left out of the plan.
+                if run_method is None:
+                    continue
+
+                if item.time_budget is not None:
+                    # Batches are timed as a whole and averaged over their args.
+                    budget_method = (
+                        item.run_batch_against_budget
+                        if batch
+                        else item.run_against_budget
+                    )
+                    run_method = functools.partial(budget_method, run_method)
+
+                plan.append(run_method)
+
+        return tuple(plan)
+
     # -------------------------------------------------------------------------
     # PROPERTIES
     # -------------------------------------------------------------------------
 
+    @property
+    def batch_dispatch_plan(self) -> Tuple[Callable, ...]:
+        """The priority ordered item batch run methods."""
+        if self._batch_dispatch_plan is None:
+            self._batch_dispatch_plan = self._build_dispatch_plan(batch=True)
+
+        return self._batch_dispatch_plan
+
+    @property
+    def batching(self) -> bool:
+        """Whether the event is currently queuing runs into a batch."""
+        return self._batch_queue is not None
+
+    @property
+    def context(self) -> EventContext:
+        """The context passed to context aware items."""
+        return self._context
+
     @property
     def data(self) -> dict:
         """Internal data for storing data that can be shared across event functions."""
         return self._data
 
+    @property
+    def dispatch_plan(self) -> Tuple[Callable, ...]:
+        """The priority ordered item run methods.
+
+        The plan is built the first time it is needed and is only rebuilt after
+        an item is registered, the enabled state changes or the plans are
+        invalidated.
+
+        """
+        if self._dispatch_plan is None:
+            self._dispatch_plan = self._build_dispatch_plan()
+
+        return self._dispatch_plan
+
     @property
     def enabled(self) -> bool:
         """Whether the action is enabled."""
@@ -94,10 +168,16 @@ class HoudiniEvent:
     @enabled.setter
     def enabled(self, enabled: bool) -> None:
         self._enabled = enabled
+        self.invalidate_dispatch_plans()
 
     @property
     def item_map(self) -> dict:
-        """Internal event map used to register the functions of this event."""
+        """Internal event map used to register the functions of this event.
+
+        Items should be added using register_item() so the dispatch plan is
+        kept up to date.
+
+        """
         return self._item_map
 
     @property
@@ -105,6 +185,21 @@ class HoudiniEvent:
         """str: The event name."""
         return self._name
 
+    @property
+    def needs_scriptargs_keys(self) -> bool:
+        """Whether any items expect the manager, event and item to be added to
+        the scriptargs.
+
+        """
+        if self._needs_scriptargs_keys is None:
+            self._needs_scriptargs_keys = any(
+                not item.uses_context
+                for items in self.item_map.values()
+                for item in items
+            )
+
+        return self._needs_scriptargs_keys
+
     @property
     def stats(self) -> HoudiniEventStats:
         """Statistics related to this event."""
@@ -114,6 +209,41 @@ class HoudiniEvent:
     # METHODS
     # -------------------------------------------------------------------------
 
+    def begin_batch(self) -> None:
+        """Begin queuing any runs of this event into a batch.
+
+        The queued runs are delivered when end_batch() is called.
+
+        :return:
+
+        """
+        if self._batch_queue is None:
+            self._batch_queue = []
+
+    def end_batch(self) -> None:
+        """Stop batching and run the items with all the queued args.
+
+        :return:
+
+        """
+        queue = self._batch_queue
+        self._batch_queue = None
+
+        if queue:
+            self.run_batch(queue)
+
+    def invalidate_dispatch_plans(self) -> None:
+        """Force the dispatch plans to be rebuilt the next time they are needed.
+
+        This should be called after changing how a registered item is run.
+
+        :return:
+
+        """
+        self._batch_dispatch_plan = None
+        self._dispatch_plan = None
+        self._needs_scriptargs_keys = None
+
     def register_item(self, item: HoudiniEventItem) -> None:
         """Register an item to run.
 
@@ -127,6 +257,11 @@ class HoudiniEvent:
         priority_items = self.item_map.setdefault(item.priority, [])
         priority_items.append(item)
 
+        item.on_registered(self)
+
+        # Force the plans to be rebuilt to include the new item.
+        self.invalidate_dispatch_plans()
+
     def run(self, scriptargs: dict) -> None:
         """Run the items with the given args.
 
@@ -137,18 +272,75 @@ class HoudiniEvent:
 
         """
         # Abort if this action should not run.
+        if not self._enabled:
+            return
+
+        # Store the args to be run later as part of a batch.
+        if self._batch_queue is not None:
+            self._batch_queue.append(scriptargs)
+            return
+
+        # The cached values are read directly as this is run for every event.
+        plan = self._dispatch_plan
+
+        if plan is None:
+            plan = self.dispatch_plan
+
+        needs_keys = self._needs_scriptargs_keys
+
+        if needs_keys is None:
+            needs_keys = self.needs_scriptargs_keys
+
+        # Add the Event to the scriptargs in case it needs to be accessed.
+        # Context aware items get it from their context instead.
+        if needs_keys:
+            scriptargs["_event_"] = self
+
+        stats = self._stats
+
+        # The plan is already in order of decreasing priority.
+        if stats.enabled:
+            with stats:
+                for run_item in plan:
+                    run_item(scriptargs)
+
+        else:
+            for run_item in plan:
+                run_item(scriptargs)
+
+        if needs_keys:
+            del scriptargs["_event_"]
+
+    def run_batch(self, scriptargs_list: List[dict]) -> None:
+        """Run the items with a list of args.
+
+        Batch aware items receive all the args at once while other items are
+        run once for each args.
+
+        :param scriptargs_list: A list of arguments passed to the event from the caller.
+        :return:
+
+        """
         if not self.enabled:
             return
 
-        # Add the Event to the scriptargs in case it needs to be accessed
-        scriptargs["_event_"] = self
+        needs_keys = self.needs_scriptargs_keys
+
+        if needs_keys:
+            for scriptargs in scriptargs_list:
+                scriptargs["_event_"] = self
+
+        stats = self.stats
 
-        with self.stats:
-            # Run in order of decreasing priority
-            for priority in sorted(self.item_map.keys(), reverse=True):
-                priority_items = self.item_map[priority]
+        if stats.enabled:
+            with stats:
+                for run_item_batch in self.batch_dispatch_plan:
+                    run_item_batch(scriptargs_list)
 
-                for item in priority_items:
-                    item.run(scriptargs)
+        else:
+            for run_item_batch in self.batch_dispatch_plan:
+                run_item_batch(scriptargs_list)
 
-        del scriptargs["_event_"]
+        if needs_keys:
+            for scriptargs in scriptargs_list:
+                del scriptargs["_event_"]
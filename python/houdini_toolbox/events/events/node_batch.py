@@ -0,0 +1,88 @@
+"""This module contains an event to batch node events while hip files are
+loaded or merged.
+
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+# Standard Library
+import enum
+from typing import Sequence, Tuple
+
+# Houdini Toolbox
+from houdini_toolbox.events.group import HoudiniEventGroup
+from houdini_toolbox.events.item import HoudiniEventItem
+from houdini_toolbox.events.types import HipFileEvents, NodeEvents
+
+# Environment variable which enables batching of node events.
+BATCH_NODE_EVENTS_VAR = "HT_BATCH_NODE_EVENTS"
+
+# =============================================================================
+# CLASSES
+# =============================================================================
+
+
+class NodeEventBatchGroup(HoudiniEventGroup):
+    """Event to queue node events while a hip file is loaded or merged.
+
+    The queued node events are delivered once the load or merge is complete.
+
+    :param names: The node events to batch.
+
+    """
+
+    def __init__(
+        self, names: Sequence[enum.Enum] = (NodeEvents.OnCreated, NodeEvents.OnLoaded)
+    ) -> None:
+        super().__init__()
+
+        self._names = tuple(names)
+
+        begin_item = HoudiniEventItem((self.begin_batch,))
+
+        # Deliver the queued events before any other post load/merge items run
+        # so that they see fully processed nodes.
+        end_item = HoudiniEventItem((self.end_batch,), priority=100)
+
+        self.event_map.update(
+            {
+                HipFileEvents.BeforeLoad: begin_item,
+                HipFileEvents.BeforeMerge: begin_item,
+                HipFileEvents.AfterLoad: end_item,
+                HipFileEvents.AfterMerge: end_item,
+            }
+        )
+
+    # -------------------------------------------------------------------------
+    # PROPERTIES
+    # -------------------------------------------------------------------------
+
+    @property
+    def names(self) -> Tuple[enum.Enum, ...]:
+        """The node events to batch."""
+        return self._names
+
+    # -------------------------------------------------------------------------
+    # METHODS
+    # -------------------------------------------------------------------------
+
+    def begin_batch(self, scriptargs: dict) -> None:
+        """Begin batching the node events.
+
+        :param scriptargs: Event data.
+        :return:
+
+        """
+        scriptargs["_manager_"].begin_batch(self.names)
+
+    @staticmethod
+    def end_batch(scriptargs: dict) -> None:
+        """Deliver any queued node events.
+
+        :param scriptargs: Event data.
+        :return:
+
+        """
+        scriptargs["_manager_"].end_batch()
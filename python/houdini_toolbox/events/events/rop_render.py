@@ -9,27 +9,70 @@ scripts.
 
 # Standard Library
 import logging
+import os
+import socket
 import time
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 # Houdini Toolbox
 from houdini_toolbox.events.group import HoudiniEventGroup
 from houdini_toolbox.events.item import HoudiniEventItem
+from houdini_toolbox.events.telemetry import PeakRssSampler, get_telemetry_writer
 from houdini_toolbox.events.types import RopEvents
+from houdini_toolbox.events.verification import get_output_verifier
 
 # Houdini
 import hou
 
 _logger = logging.getLogger(__name__)
 
+# Information about currently rendering ROPs, keyed by node session id.
+_RENDER_INFO_CACHE: Dict[int, "_RopRenderInfo"] = {}
+
 
 # =============================================================================
 # CLASSES
 # =============================================================================
 
 
+class _RopRenderInfo:
+    """Information about a ROP which does not change while it renders.
+
+    :param node: The rendering node.
+
+    """
+
+    __slots__ = ("frame_range", "target_parm")
+
+    def __init__(self, node: hou.RopNode) -> None:
+        self.frame_range = _get_frame_range(node)
+        self.target_parm = _get_target_parm(node)
+
+    # -------------------------------------------------------------------------
+    # METHODS
+    # -------------------------------------------------------------------------
+
+    def get_target_file(self) -> Optional[str]:
+        """Evaluate the current target output file.
+
+        :return: The output file path, if any.
+
+        """
+        if self.target_parm is None:
+            return None
+
+        return self.target_parm.eval()
+
+
 class RopRenderEvent(HoudiniEventGroup):
-    """Event to run on ROP render script events."""
+    """Event to run on ROP render script events.
+
+    If HT_ROP_TELEMETRY is set then a telemetry record is also written for
+    each frame.  If HT_VERIFY_ROP_OUTPUT is set then written files are
+    verified in the background and any failures reported when the render
+    completes.
+
+    """
 
     def __init__(self) -> None:
         super().__init__()
@@ -37,6 +80,10 @@ class RopRenderEvent(HoudiniEventGroup):
         self._frame_start = None
         self._render_start = None
 
+        self._telemetry = get_telemetry_writer()
+        self._rss_sampler = PeakRssSampler() if self._telemetry is not None else None
+        self._verifier = get_output_verifier()
+
         self.event_map.update(
             {
                 RopEvents.PreRender: HoudiniEventItem((self.pre_render,)),
@@ -47,6 +94,49 @@ class RopRenderEvent(HoudiniEventGroup):
             }
         )
 
+    # -------------------------------------------------------------------------
+    # NON-PUBLIC METHODS
+    # -------------------------------------------------------------------------
+
+    def _write_frame_telemetry(self, scriptargs: dict) -> None:
+        """Write a telemetry record for the completed frame.
+
+        :param scriptargs: Event data.
+        :return:
+
+        """
+        if self._telemetry is None:
+            return
+
+        peak_rss = self._rss_sampler.stop() if self._rss_sampler is not None else None
+
+        node = scriptargs.get("node")
+        path = scriptargs.get("path")
+
+        size = None
+
+        if path and os.path.isfile(path):
+            size = os.path.getsize(path)
+
+        wall_time = None
+
+        if self._frame_start is not None:
+            wall_time = scriptargs["time"] - self._frame_start
+
+        self._telemetry.write(
+            {
+                "frame": scriptargs["frame"],
+                "host": socket.gethostname(),
+                "node": node.path() if node is not None else None,
+                "path": path,
+                "peak_rss": peak_rss,
+                "pid": os.getpid(),
+                "size": size,
+                "start": self._frame_start,
+                "wall_time": wall_time,
+            }
+        )
+
     # -------------------------------------------------------------------------
     # METHODS
     # -------------------------------------------------------------------------
@@ -62,6 +152,9 @@ class RopRenderEvent(HoudiniEventGroup):
         # frame is completed to get the duration.
         self._frame_start = scriptargs["time"]
 
+        if self._rss_sampler is not None:
+            self._rss_sampler.start()
+
         _logger.info("Starting Frame: %s", scriptargs["frame"])
 
     def pre_render(self, scriptargs: dict) -> None:
@@ -73,6 +166,30 @@ class RopRenderEvent(HoudiniEventGroup):
         """
         self._render_start = scriptargs["time"]
 
+        # Files submitted by an aborted render, which never ran post_render(),
+        # are collected now so they are not reported as part of this render.
+        if self._verifier is not None and self._verifier.pending:
+            _report_verification_failures(self._verifier.finish())
+
+        node = scriptargs.get("node")
+
+        # Always rebuild the cached node information for the frame callbacks.
+        # An aborted or failed render never runs post_render() so an existing
+        # entry may be stale, including the one the scriptargs for this event
+        # were built from.  The entry is removed first so that it does not
+        # survive if the information cannot be built.
+        if node is not None:
+            session_id = node.sessionId()
+
+            _RENDER_INFO_CACHE.pop(session_id, None)
+
+            render_info = _RopRenderInfo(node)
+
+            _RENDER_INFO_CACHE[session_id] = render_info
+
+            scriptargs["frame_range"] = render_info.frame_range
+            scriptargs["path"] = render_info.get_target_file()
+
         frame_range = scriptargs["frame_range"]
 
         if frame_range is not None:
@@ -104,6 +221,9 @@ class RopRenderEvent(HoudiniEventGroup):
         else:
             _logger.info("Completed Frame: %s", scriptargs["frame"])
 
+        if self._telemetry is not None:
+            self._write_frame_telemetry(scriptargs)
+
     def post_render(self, scriptargs: dict) -> None:
         """Action run after the render is complete.
 
@@ -119,8 +239,19 @@ class RopRenderEvent(HoudiniEventGroup):
         else:
             _logger.info("Completed Render")
 
-    @staticmethod
-    def post_write(scriptargs: dict) -> None:
+        node = scriptargs.get("node")
+
+        if node is not None:
+            _RENDER_INFO_CACHE.pop(node.sessionId(), None)
+
+        # Write any buffered frame records now that the render is complete.
+        if self._telemetry is not None:
+            self._telemetry.flush()
+
+        if self._verifier is not None:
+            _report_verification_failures(self._verifier.finish())
+
+    def post_write(self, scriptargs: dict) -> None:
         """Action run after the frame is written to disk.
 
         :param scriptargs: Event data.
@@ -132,6 +263,10 @@ class RopRenderEvent(HoudiniEventGroup):
                 "Wrote frame %s to %s", scriptargs["frame"], scriptargs["path"]
             )
 
+            # Verify the file in the background so the render is not blocked.
+            if self._verifier is not None and scriptargs["path"]:
+                self._verifier.submit(scriptargs["path"], scriptargs["frame"])
+
         else:
             _logger.info("Wrote frame %s", scriptargs["frame"])
 
@@ -141,27 +276,42 @@ class RopRenderEvent(HoudiniEventGroup):
 # =============================================================================
 
 
-def _get_target_file(node: hou.RopNode) -> Optional[str]:
-    """Attempt to determine the target output file:
+def _get_frame_range(node: hou.RopNode) -> Optional[Tuple[float, float, float]]:
+    """Get the frame range a node is rendering.
+
+    :param node: The rendering node.
+    :return: The frame range, if the node is rendering a range.
+
+    """
+    trange_parm = node.parm("trange")
+
+    if trange_parm is not None and trange_parm.evalAsString() != "off":
+        return node.evalParmTuple("f")
+
+    return None
+
+
+def _get_target_parm(node: hou.RopNode) -> Optional[hou.Parm]:
+    """Attempt to determine the parameter containing the target output file.
 
     :param node: The running node.
-    :return: The output file path, if any.
+    :return: The output file parameter, if any.
 
     """
     node_type = node.type()
     node_type_name = node_type.name()
 
     if node_type_name in ("geometry", "rop_geometry"):
-        return node.evalParm("sopoutput")
+        return node.parm("sopoutput")
 
     if node_type_name in ("alembic", "rop_alembic"):
-        return node.evalParm("filename")
+        return node.parm("filename")
 
     if node_type_name in ("ifd",):
         if node.evalParm("soho_outputmode"):
-            return node.evalParm("soho_diskfile")
+            return node.parm("soho_diskfile")
 
-        return node.evalParm("vm_picture")
+        return node.parm("vm_picture")
 
     return None
 
@@ -189,6 +339,25 @@ def _print_frame_write(scriptargs: dict) -> None:
             )
 
 
+def _report_verification_failures(failures: List[dict]) -> None:
+    """Report any output files which failed verification.
+
+    :param failures: The failed verification results.
+    :return:
+
+    """
+    for failure in failures:
+        _logger.error(
+            "Output verification failed for frame %s: %s (%s)",
+            failure["frame"],
+            failure["path"],
+            failure["error"],
+        )
+
+    if failures:
+        _logger.error("%s output files failed verification", len(failures))
+
+
 # =============================================================================
 # FUNCTIONS
 # =============================================================================
@@ -197,26 +366,30 @@ def _print_frame_write(scriptargs: dict) -> None:
 def build_scriptargs(node: Optional[hou.Node] = None) -> dict:
     """Build relevant scriptargs for this action.
 
+    While a node is rendering, the frame range and output parameter cached by
+    RopRenderEvent.pre_render() are used so only the output path needs to be
+    evaluated for each frame.
+
     :param node: Optionally rendering node.
     :return: Data related to the running script parm.
 
     """
-    frame_range = None
+    render_info = None
 
     if node is not None:
-        trange_parm = node.parm("trange")
+        render_info = _RENDER_INFO_CACHE.get(node.sessionId())
 
-        if trange_parm is not None and trange_parm.evalAsString() != "off":
-            frame_range = node.evalParmTuple("f")
+        if render_info is None:
+            render_info = _RopRenderInfo(node)
 
     scriptargs = {
         "node": node,
         "frame": hou.frame(),
-        "frame_range": frame_range,
+        "frame_range": render_info.frame_range if render_info is not None else None,
         "time": time.time(),
     }
 
-    if node is not None:
-        scriptargs["path"] = _get_target_file(node)
+    if render_info is not None:
+        scriptargs["path"] = render_info.get_target_file()
 
     return scriptargs
@@ -8,11 +8,22 @@
 from __future__ import annotations
 
 # Standard Library
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import functools
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
 # Houdini Toolbox
+from houdini_toolbox.events.context import EventContext
+from houdini_toolbox.events.deferred import DEFERRED_RUNNER
 from houdini_toolbox.events.stats import HoudiniEventItemStats
 
+if TYPE_CHECKING:
+    from houdini_toolbox.events.event import HoudiniEvent
+
+# The weight given to the latest run time when updating the average run time
+# checked against an item's time budget.
+_BUDGET_AVERAGE_WEIGHT = 0.2
+
 # =============================================================================
 # CLASSES
 # =============================================================================
@@ -25,20 +36,35 @@ class HoudiniEventItem:
     :param name: Optional item name.
     :param priority: The item priority.
     :param stat_tags: Optional stat tags.
+    :param deferred: Whether to run the callables after the event instead of during it.
+    :param time_budget: Optional average run time, in seconds, the item should not exceed.
+    :param defer_over_budget: Whether to defer the item if it exceeds its time budget.
     :return:
 
     """
 
+    # Whether the callables receive an EventContext instead of expecting the
+    # manager, event and item to be added to the scriptargs.
+    uses_context = False
+
     def __init__(
         self,
         callables: Union[List[Callable], Tuple[Callable]],
         name: str = None,
         priority: int = 1,
         stat_tags: List[str] = None,
+        deferred: bool = False,
+        time_budget: Optional[float] = None,
+        defer_over_budget: bool = False,
     ):
+        self._budget_average_ns = 0.0
+        self._budget_run_count = 0
         self._callables = list(callables)
+        self._defer_over_budget = defer_over_budget
+        self._deferred = deferred
         self._name = name
         self._priority = priority
+        self._time_budget = time_budget
 
         self._data: Dict[Any, Any] = {}
 
@@ -86,10 +112,41 @@ class HoudiniEventItem:
             f"<{self.__class__.__name__} {self.name} ({len(self.callables)} callables)>"
         )
 
+    # -------------------------------------------------------------------------
+    # NON-PUBLIC METHODS
+    # -------------------------------------------------------------------------
+
+    def _record_budget_time(self, run_time_ns: float) -> None:
+        """Add a run time to the average run time checked against the budget.
+
+        :param run_time_ns: The run time, in nanoseconds.
+        :return:
+
+        """
+        if self._budget_run_count:
+            self._budget_average_ns += (
+                run_time_ns - self._budget_average_ns
+            ) * _BUDGET_AVERAGE_WEIGHT
+
+        else:
+            self._budget_average_ns = run_time_ns
+
+        self._budget_run_count += 1
+
     # -------------------------------------------------------------------------
     # PROPERTIES
     # -------------------------------------------------------------------------
 
+    @property
+    def budget_average(self) -> float:
+        """The weighted average time, in seconds, of the item's budgeted runs."""
+        return self._budget_average_ns / 1e9
+
+    @property
+    def budget_run_count(self) -> int:
+        """The number of runs timed against the item's time budget."""
+        return self._budget_run_count
+
     @property
     def callables(self) -> List[Callable]:
         """list: A list of callable objects to call."""
@@ -101,6 +158,25 @@ class HoudiniEventItem:
         functions."""
         return self._data
 
+    @property
+    def defer_over_budget(self) -> bool:
+        """Whether the item is deferred if it exceeds its time budget."""
+        return self._defer_over_budget
+
+    @property
+    def deferred(self) -> bool:
+        """Whether the callables are run after the event instead of during it.
+
+        Events decide how to run their items when building their dispatch plans
+        so this should be set before the item is registered.
+
+        """
+        return self._deferred
+
+    @deferred.setter
+    def deferred(self, deferred: bool) -> None:
+        self._deferred = deferred
+
     @property
     def name(self) -> Optional[str]:
         """The item name."""
@@ -116,10 +192,47 @@ class HoudiniEventItem:
         """Stats for the item."""
         return self._stats
 
+    @property
+    def time_budget(self) -> Optional[float]:
+        """The average run time, in seconds, the item should not exceed.
+
+        Budgets are enforced by the event manager using the item's own run
+        times, which are recorded separately from its stats since those may be
+        shared with other items of the same name.  Only the time the item
+        blocks the event is counted so deferred runs take almost no time.
+
+        """
+        return self._time_budget
+
     # -------------------------------------------------------------------------
     # METHODS
     # -------------------------------------------------------------------------
 
+    def get_run_method(
+        self,
+        batch: bool = False,
+        context: Optional[EventContext] = None,  # pylint: disable=unused-argument
+    ) -> Optional[Callable]:
+        """Get the method events should call to run this item.
+
+        :param batch: Whether to get the method for running a batch of args.
+        :param context: The context of the event the item is registered to.
+        :return: The bound run method, or None if the item should not be run.
+
+        """
+        if self.deferred:
+            return self.run_batch_deferred if batch else self.run_deferred
+
+        return self.run_batch if batch else self.run
+
+    def on_registered(self, event: HoudiniEvent) -> None:
+        """Called by an event when the item is registered to it.
+
+        :param event: The event the item was registered to.
+        :return:
+
+        """
+
     def run(self, scriptargs: dict) -> None:
         """Run the callables with the given args.
 
@@ -129,22 +242,311 @@ class HoudiniEventItem:
         """
         scriptargs["_item_"] = self
 
-        with self.stats:
-            for func in self.callables:
-                with self.stats.time_function(func):
+        stats = self._stats
+
+        if stats.enabled:
+            with stats:
+                for func in self._callables:
+                    start = time.perf_counter_ns()
                     func(scriptargs)
+                    stats.add_function_time(func, time.perf_counter_ns() - start, start)
+
+        else:
+            for func in self._callables:
+                func(scriptargs)
 
         del scriptargs["_item_"]
 
+    def run_against_budget(self, run_method: Callable, args: Any) -> None:
+        """Call a run method of the item and record its run time.
+
+        Events use this to run items which have time budgets.
+
+        :param run_method: The run method returned by get_run_method().
+        :param args: The args to call the run method with.
+        :return:
+
+        """
+        start = time.perf_counter_ns()
+
+        try:
+            run_method(args)
+
+        finally:
+            self._record_budget_time(time.perf_counter_ns() - start)
+
+    def run_batch_against_budget(
+        self, run_method: Callable, scriptargs_list: List[dict]
+    ) -> None:
+        """Call a batch run method of the item and record its run time.
+
+        The run time is averaged over the batch so it can be compared against
+        the budget of a single run.
+
+        :param run_method: The batch run method returned by get_run_method().
+        :param scriptargs_list: A list of arguments passed to the event from the caller.
+        :return:
+
+        """
+        start = time.perf_counter_ns()
+
+        try:
+            run_method(scriptargs_list)
+
+        finally:
+            run_time_ns = time.perf_counter_ns() - start
+
+            self._record_budget_time(run_time_ns / max(len(scriptargs_list), 1))
+
+    def run_batch(self, scriptargs_list: List[dict]) -> None:
+        """Run the callables for a list of args.
+
+        Items are not batch aware by default so the callables are run once for
+        each args.
+
+        :param scriptargs_list: A list of arguments passed to the event from the caller.
+        :return:
+
+        """
+        for scriptargs in scriptargs_list:
+            self.run(scriptargs)
+
+    def run_batch_deferred(self, scriptargs_list: List[dict]) -> None:
+        """Run the callables for a list of args after the event has completed.
+
+        :param scriptargs_list: A list of arguments passed to the event from the caller.
+        :return:
+
+        """
+        DEFERRED_RUNNER.submit(
+            self.run_batch, [dict(scriptargs) for scriptargs in scriptargs_list]
+        )
+
+    def run_deferred(self, scriptargs: dict) -> None:
+        """Run the callables with the given args after the event has completed.
+
+        The args are copied since the caller may modify them once the event has
+        completed.
+
+        :param scriptargs: Arguments passed to the event from the caller
+        :return:
+
+        """
+        DEFERRED_RUNNER.submit(self.run, dict(scriptargs))
+
+
+class BatchHoudiniEventItem(HoudiniEventItem):
+    """HoudiniEventItem subclass whose callables receive a batch of args at once.
+
+    The callables are passed a single dictionary containing the list of args
+    under 'batch' and a list of any nodes contained in those args under 'nodes'.
+    When the event is not batching the callables receive a batch of one.
+
+    :param callables: A list of callables to run.
+    :param name: Optional item name.
+    :param priority: The item priority.
+    :param stat_tags: Optional stat tags.
+    :param deferred: Whether to run the callables after the event instead of during it.
+    :param time_budget: Optional average run time, in seconds, the item should not exceed.
+    :param defer_over_budget: Whether to defer the item if it exceeds its time budget.
+    :return:
+
+    """
+
+    # -------------------------------------------------------------------------
+    # METHODS
+    # -------------------------------------------------------------------------
+
+    def run(self, scriptargs: dict) -> None:
+        """Run the callables with the given args as a batch of one.
+
+        :param scriptargs: Arguments passed to the event from the caller
+        :return:
+
+        """
+        self.run_batch([scriptargs])
+
+    def run_batch(self, scriptargs_list: List[dict]) -> None:
+        """Run the callables once for a list of args.
+
+        :param scriptargs_list: A list of arguments passed to the event from the caller.
+        :return:
+
+        """
+        batch_args = {
+            "batch": scriptargs_list,
+            "nodes": [
+                scriptargs["node"]
+                for scriptargs in scriptargs_list
+                if "node" in scriptargs
+            ],
+        }
+
+        # The args of a batch all come from the same manager and event so pass
+        # those on as they would be for a single run.
+        if scriptargs_list:
+            first_args = scriptargs_list[0]
+
+            for key in ("_manager_", "_event_"):
+                if key in first_args:
+                    batch_args[key] = first_args[key]
+
+        super().run(batch_args)
+
+
+class ContextHoudiniEventItem(HoudiniEventItem):
+    """HoudiniEventItem subclass whose callables receive an EventContext.
+
+    The callables are called with the scriptargs and the context of the running
+    event. Nothing is added to the scriptargs for them so when an event only has
+    context aware items the scriptargs are never modified.
+
+    :param callables: A list of callables to run.
+    :param name: Optional item name.
+    :param priority: The item priority.
+    :param stat_tags: Optional stat tags.
+    :param deferred: Whether to run the callables after the event instead of during it.
+    :param time_budget: Optional average run time, in seconds, the item should not exceed.
+    :param defer_over_budget: Whether to defer the item if it exceeds its time budget.
+    :return:
+
+    """
+
+    uses_context = True
+
+    # -------------------------------------------------------------------------
+    # METHODS
+    # -------------------------------------------------------------------------
+
+    def get_run_method(
+        self, batch: bool = False, context: Optional[EventContext] = None
+    ) -> Optional[Callable]:
+        """Get the method events should call to run this item.
+
+        The returned method has the context bound to it so it can be called
+        with only the scriptargs.
+
+        :param batch: Whether to get the method for running a batch of args.
+        :param context: The context of the event the item is registered to.
+        :return: The bound run method, or None if the item should not be run.
+
+        """
+        if context is None:
+            return super().get_run_method(batch)
+
+        if self.deferred:
+            method = (
+                self.run_batch_deferred_in_context
+                if batch
+                else self.run_deferred_in_context
+            )
+
+        else:
+            method = self.run_batch_in_context if batch else self.run_in_context
+
+        return functools.partial(method, context)
+
+    def run(self, scriptargs: dict) -> None:
+        """Run the callables with the given args.
+
+        This is used when the item is run outside of an event context so one is
+        created from any event data in the scriptargs.
+
+        :param scriptargs: Arguments passed to the event from the caller
+        :return:
+
+        """
+        context = EventContext(scriptargs.get("_manager_"), scriptargs.get("_event_"))
+
+        self.run_in_context(context, scriptargs)
+
+    def run_batch_deferred_in_context(
+        self, context: EventContext, scriptargs_list: List[dict]
+    ) -> None:
+        """Run the callables for a list of args after the event has completed.
+
+        :param context: The context of the running event.
+        :param scriptargs_list: A list of arguments passed to the event from the caller.
+        :return:
+
+        """
+        DEFERRED_RUNNER.submit(
+            functools.partial(self.run_batch_in_context, context.copy()),
+            [dict(scriptargs) for scriptargs in scriptargs_list],
+        )
+
+    def run_batch_in_context(
+        self, context: EventContext, scriptargs_list: List[dict]
+    ) -> None:
+        """Run the callables for a list of args.
+
+        :param context: The context of the running event.
+        :param scriptargs_list: A list of arguments passed to the event from the caller.
+        :return:
+
+        """
+        for scriptargs in scriptargs_list:
+            self.run_in_context(context, scriptargs)
+
+    def run_deferred_in_context(self, context: EventContext, scriptargs: dict) -> None:
+        """Run the callables with the given args after the event has completed.
+
+        The context and args are copied since they will have changed by the
+        time the callables are run.
+
+        :param context: The context of the running event.
+        :param scriptargs: Arguments passed to the event from the caller
+        :return:
+
+        """
+        DEFERRED_RUNNER.submit(
+            functools.partial(self.run_in_context, context.copy()), dict(scriptargs)
+        )
+
+    def run_in_context(self, context: EventContext, scriptargs: dict) -> None:
+        """Run the callables with the given context and args.
+
+        :param context: The context of the running event.
+        :param scriptargs: Arguments passed to the event from the caller
+        :return:
+
+        """
+        # Events can be run recursively by their own items so restore the
+        # previous item once finished.
+        previous_item = context.item
+        context.item = self
+
+        stats = self._stats
+
+        if stats.enabled:
+            with stats:
+                for func in self._callables:
+                    start = time.perf_counter_ns()
+                    func(scriptargs, context)
+                    stats.add_function_time(func, time.perf_counter_ns() - start, start)
+
+        else:
+            for func in self._callables:
+                func(scriptargs, context)
+
+        context.item = previous_item
+
 
 class ExclusiveHoudiniEventItem(HoudiniEventItem):
     """HoudiniEventItem subclass which uses the name and priority to determine
     which item of the same name should be run.
 
+    The exclusive item for a name is resolved when items are created.  Any
+    superseded items are left out of the dispatch plans of the events they are
+    registered to but can still be found using get_superseded_items().
+
     :param callables: A list of callables to run.
     :param name: Optional item name.
     :param priority: The item priority.
     :param stat_tags: Optional stat tags.
+    :param deferred: Whether to run the callables after the event instead of during it.
+    :param time_budget: Optional average run time, in seconds, the item should not exceed.
+    :param defer_over_budget: Whether to defer the item if it exceeds its time budget.
     :return:
 
     """
@@ -152,35 +554,134 @@ class ExclusiveHoudiniEventItem(HoudiniEventItem):
     # Name to item mapping.
     _exclusive_map: Dict[Optional[str], ExclusiveHoudiniEventItem] = {}
 
+    # Name to superseded items mapping.
+    _superseded_map: Dict[Optional[str], List[ExclusiveHoudiniEventItem]] = {}
+
     def __init__(
         self,
         callables: Union[List[Callable], Tuple[Callable]],
         name: str = None,
         priority: int = 1,
         stat_tags: List[str] = None,
+        deferred: bool = False,
+        time_budget: Optional[float] = None,
+        defer_over_budget: bool = False,
     ) -> None:
-        super().__init__(callables, name, priority, stat_tags)
+        super().__init__(
+            callables,
+            name,
+            priority,
+            stat_tags,
+            deferred,
+            time_budget,
+            defer_over_budget,
+        )
+
+        self._events: List[HoudiniEvent] = []
 
         # Get the current entry (or add this item if one isn't set.)
         exclusive_item = self._exclusive_map.setdefault(name, self)
 
-        # If this item has the higher priority then point to this item.
-        if self.priority > exclusive_item.priority:
-            self._exclusive_map[name] = self
+        if exclusive_item is not self:
+            # If this item has the higher priority then point to this item.
+            if self.priority > exclusive_item.priority:
+                self._exclusive_map[name] = self
+                exclusive_item._supersede()
+
+            else:
+                self._supersede()
+
+    # -------------------------------------------------------------------------
+    # NON-PUBLIC METHODS
+    # -------------------------------------------------------------------------
+
+    def _supersede(self) -> None:
+        """Mark this item as superseded by another item of the same name.
+
+        The dispatch plans of any events the item is registered to are
+        invalidated so that they no longer include it.
+
+        :return:
+
+        """
+        self._superseded_map.setdefault(self.name, []).append(self)
+
+        for event in self._events:
+            event.invalidate_dispatch_plans()
+
+    # -------------------------------------------------------------------------
+    # CLASS METHODS
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def get_superseded_items(
+        cls, name: Optional[str] = None
+    ) -> Tuple[ExclusiveHoudiniEventItem, ...]:
+        """Get any items which have been superseded by another item.
+
+        :param name: Optional item name to get the superseded items for.
+        :return: The superseded items.
+
+        """
+        if name is not None:
+            return tuple(cls._superseded_map.get(name, ()))
+
+        return tuple(item for items in cls._superseded_map.values() for item in items)
+
+    # -------------------------------------------------------------------------
+    # PROPERTIES
+    # -------------------------------------------------------------------------
+
+    @property
+    def events(self) -> Tuple[HoudiniEvent, ...]:
+        """The events the item is registered to."""
+        return tuple(self._events)
+
+    @property
+    def superseded(self) -> bool:
+        """Whether another item of the same name will be run instead."""
+        return self._exclusive_map.get(self._name) is not self
 
     # -------------------------------------------------------------------------
     # METHODS
     # -------------------------------------------------------------------------
 
+    def get_run_method(
+        self, batch: bool = False, context: Optional[EventContext] = None
+    ) -> Optional[Callable]:
+        """Get the method events should call to run this item.
+
+        Superseded items are not run so have no run method.
+
+        :param batch: Whether to get the method for running a batch of args.
+        :param context: The context of the event the item is registered to.
+        :return: The bound run method, or None if the item is superseded.
+
+        """
+        if self.superseded:
+            return None
+
+        return super().get_run_method(batch, context)
+
+    def on_registered(self, event: HoudiniEvent) -> None:
+        """Called by an event when the item is registered to it.
+
+        :param event: The event the item was registered to.
+        :return:
+
+        """
+        self._events.append(event)
+
     def run(self, scriptargs: dict) -> None:
         """Run the callables with the given args.
 
-        The item is only run if it is the exclusive item.
+        The item is only run if it is the exclusive item.  Events never call
+        this for superseded items but it may still be called directly.
 
         :param scriptargs: Arguments passed to the event from the caller
         :return:
 
         """
         # Only run this item if this item is the exclusive item for the name.
-        if self._exclusive_map[self.name] == self:
+        if self._exclusive_map.get(self._name) is self:
             super().run(scriptargs)
@@ -0,0 +1,126 @@
+"""This module contains a class for declaring event handlers which are only
+imported the first time one of their events is run.
+
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import enum
+import importlib
+import inspect
+import logging
+from typing import TYPE_CHECKING, Sequence, Tuple
+
+# Houdini Toolbox
+from houdini_toolbox.events.group import HoudiniEventGroup
+from houdini_toolbox.events.item import HoudiniEventItem
+
+if TYPE_CHECKING:
+    from houdini_toolbox.events.manager import HoudiniEventManager
+
+_logger = logging.getLogger(__name__)
+
+# =============================================================================
+# CLASSES
+# =============================================================================
+
+
+class LazyRegistration:
+    """A manifest entry for an event group or function to register on demand.
+
+    Only the module and attribute names are stored so declaring the entry does
+    not import anything.  Functions are registered to each of the event names
+    while event groups are constructed and register themselves.
+
+    :param module_name: The name of the module containing the handler.
+    :param attribute: The name of the event group class or function.
+    :param names: The names of the events the handler runs for.
+
+    """
+
+    __slots__ = ("_attribute", "_loaded", "_module_name", "_names")
+
+    def __init__(
+        self, module_name: str, attribute: str, names: Sequence[enum.Enum]
+    ) -> None:
+        self._attribute = attribute
+        self._loaded = False
+        self._module_name = module_name
+        self._names = tuple(names)
+
+    # -------------------------------------------------------------------------
+    # SPECIAL METHODS
+    # -------------------------------------------------------------------------
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self.module_name}.{self.attribute}>"
+
+    # -------------------------------------------------------------------------
+    # PROPERTIES
+    # -------------------------------------------------------------------------
+
+    @property
+    def attribute(self) -> str:
+        """The name of the event group class or function."""
+        return self._attribute
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the handler has been imported and registered."""
+        return self._loaded
+
+    @property
+    def module_name(self) -> str:
+        """The name of the module containing the handler."""
+        return self._module_name
+
+    @property
+    def names(self) -> Tuple[enum.Enum, ...]:
+        """The names of the events the handler runs for."""
+        return self._names
+
+    # -------------------------------------------------------------------------
+    # METHODS
+    # -------------------------------------------------------------------------
+
+    def load(self, manager: HoudiniEventManager) -> bool:
+        """Import the handler and register it with a manager.
+
+        The handler is only ever registered once.  If the handler cannot be
+        imported the error is logged and loading can be tried again later.
+
+        :param manager: The manager to register the handler with.
+        :return: Whether the handler is loaded.
+
+        """
+        if self._loaded:
+            return True
+
+        try:
+            module = importlib.import_module(self.module_name)
+            handler = getattr(module, self.attribute)
+
+        # There is no caller to handle an exception since the handler is being
+        # loaded by an event so it is logged instead.
+        except Exception:  # pylint: disable=broad-except
+            _logger.exception(
+                "Could not import %s.%s", self.module_name, self.attribute
+            )
+            return False
+
+        if inspect.isclass(handler) and issubclass(handler, HoudiniEventGroup):
+            manager.register_event_group(handler())
+
+        else:
+            for name in self.names:
+                manager.register_item(HoudiniEventItem((handler,)), name)
+
+        self._loaded = True
+
+        return True
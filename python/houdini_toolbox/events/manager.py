@@ -10,13 +10,21 @@ events in Houdini.
 
 # Standard Library
 import enum
+import logging
 from contextlib import contextmanager
-from typing import Callable, Generator, List, Optional
+from typing import Callable, Dict, Generator, List, Optional, Sequence
 
 # Houdini Toolbox
 from houdini_toolbox.events.event import HoudiniEvent, HoudiniEventFactory
 from houdini_toolbox.events.group import HoudiniEventGroup
 from houdini_toolbox.events.item import HoudiniEventItem
+from houdini_toolbox.events.lazy import LazyRegistration
+
+_logger = logging.getLogger(__name__)
+
+# The number of runs an item must have before its time budget is enforced so
+# that one off slow runs, such as the first run importing modules, are ignored.
+_BUDGET_MIN_RUNS = 5
 
 # =============================================================================
 # CLASSES
@@ -27,13 +35,25 @@ class HoudiniEventManager:
     """Manager and execute events in Houdini."""
 
     def __init__(self) -> None:
+        self._batched_events: List[HoudiniEvent] = []
+        self._budgeted_items: Dict[enum.Enum, List[HoudiniEventItem]] = {}
         self._data: dict = {}
         self._events: dict = {}
 
+        # Handlers waiting to be registered, keyed by the names of the events
+        # they run for.
+        self._lazy_registrations: Dict[enum.Enum, List[LazyRegistration]] = {}
+
         # Special dict used to maintain event enabled states when using
         # disabling context manager.
         self._event_states: dict = {}
 
+        # Whether the disabling context manager is active, and the names of
+        # the events it disables, so events created while it is active can be
+        # disabled too.
+        self._disabling = False
+        self._disabling_names: Optional[List[str]] = None
+
     # -------------------------------------------------------------------------
     # SPECIAL METHODS
     # -------------------------------------------------------------------------
@@ -45,6 +65,47 @@ class HoudiniEventManager:
     # NON-PUBLIC METHODS
     # -------------------------------------------------------------------------
 
+    def _check_time_budgets(
+        self, event: HoudiniEvent, items: List[HoudiniEventItem]
+    ) -> None:
+        """Check whether any items have exceeded their time budgets.
+
+        Items which are over budget are only reported once, and are deferred if
+        they allow it so that they no longer block the event.
+
+        :param event: The event the items are registered to.
+        :param items: The items with time budgets.
+        :return:
+
+        """
+        for item in list(items):
+            time_budget = item.time_budget
+
+            if (
+                time_budget is None
+                or item.budget_run_count < _BUDGET_MIN_RUNS
+                or item.budget_average <= time_budget
+            ):
+                continue
+
+            items.remove(item)
+
+            _logger.warning(
+                "%s is averaging %0.1fms per run of %s, exceeding its budget of %0.1fms",
+                item,
+                item.budget_average * 1000,
+                event.name,
+                time_budget * 1000,
+            )
+
+            if item.defer_over_budget and not item.deferred:
+                _logger.warning("Deferring %s", item)
+
+                item.deferred = True
+
+                # Rebuild the plans so the item is run using its deferred methods.
+                event.invalidate_dispatch_plans()
+
     def _disable_events(self, names: Optional[List[str]] = None) -> None:
         """Disable any events with matching names.
 
@@ -52,6 +113,9 @@ class HoudiniEventManager:
         :return:
 
         """
+        self._disabling = True
+        self._disabling_names = names
+
         if names is not None:
             for event in list(self.events.values()):
                 if event.name in names:
@@ -63,17 +127,60 @@ class HoudiniEventManager:
                 self._event_states[event.name] = event.enabled
                 event.enabled = False
 
+    def _load_lazy_registrations(self, event_name: enum.Enum) -> None:
+        """Register any handlers waiting for an event to be run.
+
+        :param event_name: The name of the event which is about to run.
+        :return:
+
+        """
+        registrations = self._lazy_registrations.get(event_name, ())
+
+        for registration in list(registrations):
+            # Handlers which failed to load are left waiting so they can be
+            # tried again the next time the event is run.
+            if not registration.load(self):
+                continue
+
+            # Handlers can run for multiple events so make sure they are no
+            # longer waiting on any of them.
+            for name in registration.names:
+                pending = self._lazy_registrations.get(name)
+
+                if pending is not None and registration in pending:
+                    pending.remove(registration)
+
+                    if not pending:
+                        del self._lazy_registrations[name]
+
     def _restore_events(self) -> None:
         """Restore the enabled state of any events that were disabled.
 
         :return:
 
         """
-        for name, state in list(self._event_states.items()):
-            self.events[name].enabled = state
+        # The states are stored by event name which may not be the key the
+        # event is stored under.
+        for event in list(self.events.values()):
+            if event.name in self._event_states:
+                event.enabled = self._event_states[event.name]
 
         self._event_states.clear()
 
+        self._disabling = False
+        self._disabling_names = None
+
+    def _track_time_budget(self, item: HoudiniEventItem, event_name: enum.Enum) -> None:
+        """Track the item if it has a time budget.
+
+        :param item: The registered item.
+        :param event_name: The name of the event the item is registered to.
+        :return:
+
+        """
+        if item.time_budget is not None:
+            self._budgeted_items.setdefault(event_name, []).append(item)
+
     # -------------------------------------------------------------------------
     # PROPERTIES
     # -------------------------------------------------------------------------
@@ -92,6 +199,47 @@ class HoudiniEventManager:
     # METHODS
     # -------------------------------------------------------------------------
 
+    @contextmanager
+    def batch_events(self, names: List[enum.Enum]) -> Generator[None, None, None]:
+        """Context manager to batch any runs of the named events.
+
+        :param names: A list of names of events to batch.
+        :return:
+
+        """
+        self.begin_batch(names)
+
+        # Wrap the yield in a try/finally block so even if an exception occurs
+        # the queued runs will always be delivered.
+        try:
+            yield
+
+        finally:
+            self.end_batch()
+
+    def begin_batch(self, names: List[enum.Enum]) -> None:
+        """Begin batching any runs of the named events.
+
+        Runs of these events will be queued until end_batch() is called.  Any
+        events which do not exist yet are created so that runs of them are
+        still batched if items, such as lazy registrations, are added to them
+        during the batch.
+
+        :param names: A list of names of events to batch.
+        :return:
+
+        """
+        for name in names:
+            event = self.events.get(name)
+
+            if event is None:
+                event = self.create_event(name)
+
+            if not event.batching:
+                event.begin_batch()
+
+                self._batched_events.append(event)
+
     def create_event(self, name: enum.Enum) -> HoudiniEvent:
         """Create an event with a given name.
 
@@ -100,11 +248,32 @@ class HoudiniEventManager:
 
         """
         event = HoudiniEventFactory.get_event_type(name)
+        event.context.manager = self
+
+        # Events created while events are being disabled, such as by lazily
+        # loaded handlers, should be disabled as well.
+        if self._disabling and (
+            self._disabling_names is None or event.name in self._disabling_names
+        ):
+            self._event_states[event.name] = event.enabled
+            event.enabled = False
 
         self.events[name] = event
 
         return event
 
+    def end_batch(self) -> None:
+        """Stop batching and run all the queued events.
+
+        :return:
+
+        """
+        batched_events = self._batched_events
+        self._batched_events = []
+
+        for event in batched_events:
+            event.end_batch()
+
     @contextmanager
     def event_disabler(
         self, names: Optional[List[str]] = None
@@ -154,6 +323,8 @@ class HoudiniEventManager:
             for item in items:
                 event.register_item(item)
 
+                self._track_time_budget(item, name)
+
     def register_item(self, item: HoudiniEventItem, event_name: enum.Enum) -> None:
         """Register a function for a given event name.
 
@@ -171,27 +342,55 @@ class HoudiniEventManager:
         event = self.events[event_name]
         event.register_item(item)
 
+        self._track_time_budget(item, event_name)
+
+    def register_lazy(self, registration: LazyRegistration) -> None:
+        """Register a handler to be imported the first time one of its events runs.
+
+        :param registration: The lazy handler registration.
+        :return:
+
+        """
+        if not isinstance(registration, LazyRegistration):
+            raise TypeError(f"Expected LazyRegistration, got {type(registration)}")
+
+        for name in registration.names:
+            self._lazy_registrations.setdefault(name, []).append(registration)
+
     def run_event(self, event_name: enum.Enum, scriptargs: dict = None) -> None:
         """Run all registered events for the given name with the supplied args.
 
-        Events are run in decreasing order of priority.
+        Events are run in decreasing order of priority.  Afterwards any items
+        with time budgets are checked to see if they have exceeded them.
 
         :param event_name: The name of the event to run
         :param scriptargs: Arguments passed to the event from the caller
         :return:
 
         """
-        event = self.events.get(event_name)
+        lazy_registrations = self._lazy_registrations
+
+        if lazy_registrations and event_name in lazy_registrations:
+            self._load_lazy_registrations(event_name)
+
+        event = self._events.get(event_name)
 
         if event is not None:
             if scriptargs is None:
                 scriptargs = {}
 
-            # Add data about the manager and event to the scriptargs
-            scriptargs["_manager_"] = self
+            # Add data about the manager to the scriptargs for any items which
+            # are not context aware.
+            if event.needs_scriptargs_keys:
+                scriptargs["_manager_"] = self
 
             event.run(scriptargs)
 
+            budgeted_items = self._budgeted_items.get(event_name)
+
+            if budgeted_items:
+                self._check_time_budgets(event, budgeted_items)
+
 
 # =============================================================================
 # FUNCTIONS
@@ -217,6 +416,9 @@ def register_function(
     item_name: Optional[str] = None,
     priority: int = 1,
     stat_tags: Optional[List[str]] = None,
+    deferred: bool = False,
+    time_budget: Optional[float] = None,
+    defer_over_budget: bool = False,
 ) -> None:
     """Register a function for a given event name.
 
@@ -225,13 +427,24 @@ def register_function(
     :param item_name: Optional item name.
     :param priority: The event priority.
     :param stat_tags: Optional tags to group stats together.
+    :param deferred: Whether to run the function after the event instead of during it.
+    :param time_budget: Optional average run time, in seconds, the function should not exceed.
+    :param defer_over_budget: Whether to defer the function if it exceeds its time budget.
     :return:
 
     """
     if not callable(func):
         raise TypeError(f"{func} is not callable")
 
-    item = HoudiniEventItem((func,), item_name, priority, stat_tags=stat_tags)
+    item = HoudiniEventItem(
+        (func,),
+        item_name,
+        priority,
+        stat_tags=stat_tags,
+        deferred=deferred,
+        time_budget=time_budget,
+        defer_over_budget=defer_over_budget,
+    )
 
     register_item(item, event_name)
 
@@ -250,6 +463,23 @@ def register_item(item: HoudiniEventItem, event_name: enum.Enum) -> None:
     EVENT_MANAGER.register_item(item, event_name)
 
 
+def register_lazy(
+    module_name: str, attribute: str, event_names: Sequence[enum.Enum]
+) -> None:
+    """Register an event group or function to be imported on demand.
+
+    The handler's module is only imported, and the handler registered, the
+    first time one of the events is run.
+
+    :param module_name: The name of the module containing the handler.
+    :param attribute: The name of the event group class or function.
+    :param event_names: The names of the events the handler runs for.
+    :return:
+
+    """
+    EVENT_MANAGER.register_lazy(LazyRegistration(module_name, attribute, event_names))
+
+
 def run_event(event_name: enum.Enum, scriptargs: dict = None) -> None:
     """Run all registered events for the given name with the supplied args.
 
@@ -8,12 +8,19 @@
 from __future__ import annotations
 
 # Standard Library
+import array
+import atexit
 import collections
+import json
 import logging
+import math
+import os
+import threading
 import time
 from contextlib import contextmanager
 from typing import (
     Callable,
+    Deque,
     Dict,
     Generator,
     List,
@@ -26,6 +33,33 @@ from typing import (
 
 _logger = logging.getLogger(__name__)
 
+# Environment variable which disables the timing of all event stats.
+DISABLE_STATS_VAR = "HT_DISABLE_EVENT_STATS"
+
+# The number of bits of precision used for each power of two range of latency
+# histogram values.  3 bits gives 8 buckets per range, or a maximum relative
+# error of 12.5%.
+_HISTOGRAM_SUB_BUCKET_BITS = 3
+_HISTOGRAM_SUB_BUCKET_COUNT = 1 << _HISTOGRAM_SUB_BUCKET_BITS
+
+# The largest trackable latency, in nanoseconds (~18 minutes).  Larger values
+# are counted in the last bucket.
+_HISTOGRAM_MAX_VALUE = (1 << 40) - 1
+
+# The percentiles reported in latency summaries.
+_SUMMARY_PERCENTILES = (50, 95, 99)
+
+# The weight given to the latest run time when updating the rolling average.
+# Lower values smooth out occasional slow runs.
+_ROLLING_AVERAGE_WEIGHT = 0.2
+
+# Environment variable containing a file path to write a trace of all event
+# runs to when Python exits.
+TRACE_PATH_VAR = "HT_EVENT_TRACE"
+
+# The default maximum number of spans kept by a tracer.
+DEFAULT_TRACE_BUFFER_SIZE = 100000
+
 
 ItemStatsType = TypeVar("ItemStatsType", bound="HoudiniEventStats")
 
@@ -96,6 +130,232 @@ class _StatsMeta(type):
         return inst
 
 
+class CallableStats:
+    """Aggregated run statistics for a single callable."""
+
+    __slots__ = ("run_count", "total_time_ns")
+
+    def __init__(self) -> None:
+        self.run_count = 0
+        self.total_time_ns = 0
+
+    # -------------------------------------------------------------------------
+    # SPECIAL METHODS
+    # -------------------------------------------------------------------------
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: run_count={self.run_count} total_time={self.total_time:0.3f}>"
+
+    # -------------------------------------------------------------------------
+    # PROPERTIES
+    # -------------------------------------------------------------------------
+
+    @property
+    def total_time(self) -> float:
+        """The total time for all runs, in seconds."""
+        return self.total_time_ns / 1e9
+
+
+class EventTracer:
+    """Record event, item and callable runs as spans in a ring buffer.
+
+    The spans can be written out in the Chrome Trace Event Format to be viewed
+    in chrome://tracing or Perfetto.
+
+    :param buffer_size: The maximum number of spans to keep. Once full, the
+        oldest spans are discarded.
+
+    """
+
+    __slots__ = ("_spans",)
+
+    def __init__(self, buffer_size: int = DEFAULT_TRACE_BUFFER_SIZE) -> None:
+        self._spans: Deque[Tuple[str, str, int, int, int]] = collections.deque(
+            maxlen=buffer_size
+        )
+
+    # -------------------------------------------------------------------------
+    # SPECIAL METHODS
+    # -------------------------------------------------------------------------
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {len(self._spans)} spans>"
+
+    # -------------------------------------------------------------------------
+    # METHODS
+    # -------------------------------------------------------------------------
+
+    def clear(self) -> None:
+        """Remove all recorded spans.
+
+        :return:
+
+        """
+        self._spans.clear()
+
+    def get_trace_events(self) -> List[dict]:
+        """Get the recorded spans as Chrome trace events.
+
+        :return: A list of complete ('X') trace events, ordered by start time.
+
+        """
+        pid = os.getpid()
+
+        # Sort by start time and then longest first so that enclosing spans come
+        # before the spans they contain.
+        spans = sorted(self._spans, key=lambda span: (span[2], -span[3]))
+
+        return [
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": started_ns / 1000,
+                "dur": run_time_ns / 1000,
+                "pid": pid,
+                "tid": thread_id,
+            }
+            for category, name, started_ns, run_time_ns, thread_id in spans
+        ]
+
+    def record(
+        self, category: str, name: Optional[str], started_ns: int, run_time_ns: int
+    ) -> None:
+        """Record a span.
+
+        :param category: The span category.
+        :param name: The span name.
+        :param started_ns: The start time of the span, in nanoseconds.
+        :param run_time_ns: The duration of the span, in nanoseconds.
+        :return:
+
+        """
+        self._spans.append(
+            (category, str(name), started_ns, run_time_ns, threading.get_ident())
+        )
+
+    def write(self, path: str) -> None:
+        """Write the recorded spans to a Chrome trace file.
+
+        :param path: The path to write the trace to.
+        :return:
+
+        """
+        data = {"traceEvents": self.get_trace_events(), "displayTimeUnit": "ms"}
+
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(data, handle)
+
+
+class LatencyHistogram:
+    """A streaming histogram of latencies using logarithmic buckets.
+
+    Values are stored in buckets whose size doubles every power of two so the
+    memory used is fixed regardless of how many values are recorded, while the
+    relative error of any reported percentile stays bounded.
+
+    """
+
+    __slots__ = ("_counts", "_max_value", "_total_count")
+
+    def __init__(self) -> None:
+        self._counts = array.array(
+            "Q", bytes(8 * (_get_bucket_index(_HISTOGRAM_MAX_VALUE) + 1))
+        )
+        self._max_value = 0
+        self._total_count = 0
+
+    # -------------------------------------------------------------------------
+    # SPECIAL METHODS
+    # -------------------------------------------------------------------------
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: count={self.count}>"
+
+    # -------------------------------------------------------------------------
+    # PROPERTIES
+    # -------------------------------------------------------------------------
+
+    @property
+    def count(self) -> int:
+        """The number of recorded values."""
+        return self._total_count
+
+    @property
+    def max(self) -> float:
+        """The largest recorded value, in seconds."""
+        return self._max_value / 1e9
+
+    # -------------------------------------------------------------------------
+    # METHODS
+    # -------------------------------------------------------------------------
+
+    def percentile(self, percent: float) -> float:
+        """Get the value at a percentile.
+
+        The value is the upper bound of the bucket containing the percentile,
+        limited to the largest recorded value.
+
+        :param percent: The percentile to get, from 0 to 100.
+        :return: The value at the percentile, in seconds.
+
+        """
+        if not self._total_count:
+            return 0.0
+
+        target = max(math.ceil(self._total_count * percent / 100), 1)
+
+        running_count = 0
+
+        for index, count in enumerate(self._counts):
+            running_count += count
+
+            if running_count >= target:
+                value = min(_get_bucket_upper_bound(index), self._max_value)
+
+                return value / 1e9
+
+        return self.max
+
+    def record(self, value_ns: int) -> None:
+        """Record a value.
+
+        :param value_ns: The value to record, in nanoseconds.
+        :return:
+
+        """
+        self._counts[_get_bucket_index(min(value_ns, _HISTOGRAM_MAX_VALUE))] += 1
+        self._total_count += 1
+
+        if value_ns > self._max_value:
+            self._max_value = value_ns
+
+    def reset(self) -> None:
+        """Clear all recorded values.
+
+        :return:
+
+        """
+        for index in range(len(self._counts)):
+            self._counts[index] = 0
+
+        self._max_value = 0
+        self._total_count = 0
+
+    def summary(self) -> Dict[str, float]:
+        """Get a summary of the common percentiles and max value.
+
+        :return: The p50, p95, p99 and max values, in seconds.
+
+        """
+        result = {
+            f"p{percent}": self.percentile(percent) for percent in _SUMMARY_PERCENTILES
+        }
+        result["max"] = self.max
+
+        return result
+
+
 class HoudiniEventStats(metaclass=_StatsMeta):
     """The base statistics class.
 
@@ -106,18 +366,39 @@ class HoudiniEventStats(metaclass=_StatsMeta):
 
     """
 
+    # Whether runs should be timed.  This is checked by the events and items
+    # before timing anything and can be set on an instance to override the
+    # global setting for a specific event or item.
+    enabled = DISABLE_STATS_VAR not in os.environ
+
+    # The active tracer, if any, which runs are recorded to.  Runs can only be
+    # traced when timing is enabled.
+    tracer: Optional[EventTracer] = None
+
+    # The trace category of the runs.
+    _trace_category = "event"
+
     def __init__(
         self,
         name: Optional[str] = None,
         tags: Optional[List[str]] = None,
         post_report: bool = False,
     ) -> None:
-        self._last_run_time = 0
-        self._last_started: float = 0
+        self._histogram = LatencyHistogram()
+        self._last_run_time_ns = 0
+        self._last_started_ns = 0
+
+        # Deferred items can be run on worker threads so runs may be timed on
+        # more than one thread at once.  Start times are kept per thread and
+        # the results are recorded under the lock.
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
         self._name = name
         self._post_report = post_report
+        self._rolling_average_ns = 0.0
         self._run_count = 0
-        self._total_time = 0
+        self._total_time_ns = 0
 
         if tags is None:
             tags = []
@@ -132,29 +413,28 @@ class HoudiniEventStats(metaclass=_StatsMeta):
         return f"<{self.__class__.__name__}: {self.name} run_count={self.run_count} total_time={self.total_time:0.3f}>"
 
     def __enter__(self) -> HoudiniEventStats:
-        self._last_started = time.time()
+        self._local.started_ns = time.perf_counter_ns()
 
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):  # type: ignore
-        end = time.time()
+        started_ns = self._local.started_ns
 
-        self._last_run_time = end - self._last_started
-        self._total_time += self._last_run_time
-
-        self._run_count += 1
-
-        if self.post_report:
-            self.print_report()
+        self.record_run(started_ns, time.perf_counter_ns() - started_ns)
 
     # -------------------------------------------------------------------------
     # PROPERTIES
     # -------------------------------------------------------------------------
 
+    @property
+    def histogram(self) -> LatencyHistogram:
+        """The distribution of run times."""
+        return self._histogram
+
     @property
     def last_run_time(self) -> float:
-        """The run time of the most recent run."""
-        return self._last_run_time
+        """The run time of the most recent run, in seconds."""
+        return self._last_run_time_ns / 1e9
 
     @property
     def name(self) -> Optional[str]:
@@ -166,6 +446,11 @@ class HoudiniEventStats(metaclass=_StatsMeta):
         """Whether to print the report at exit."""
         return self._post_report
 
+    @property
+    def rolling_average(self) -> float:
+        """The exponentially weighted average run time of recent runs, in seconds."""
+        return self._rolling_average_ns / 1e9
+
     @property
     def run_count(self) -> int:
         """The number of times the stats have been run."""
@@ -178,8 +463,8 @@ class HoudiniEventStats(metaclass=_StatsMeta):
 
     @property
     def total_time(self) -> float:
-        """The total time for all stats runs."""
-        return self._total_time
+        """The total time for all stats runs, in seconds."""
+        return self._total_time_ns / 1e9
 
     # -------------------------------------------------------------------------
     # METHODS
@@ -194,6 +479,41 @@ class HoudiniEventStats(metaclass=_StatsMeta):
         _logger.info("Event name: %s", self.name)
         _logger.info("\tRun Count: %s", self.run_count)
         _logger.info("\tRun Time: %s", self.last_run_time)
+        _log_latency_summary(self.histogram)
+
+    def record_run(self, started_ns: int, run_time_ns: int) -> None:
+        """Record a run.
+
+        This is safe to call from any thread.
+
+        :param started_ns: The start time of the run, in nanoseconds.
+        :param run_time_ns: The run time, in nanoseconds.
+        :return:
+
+        """
+        with self._lock:
+            self._last_started_ns = started_ns
+            self._last_run_time_ns = run_time_ns
+            self._total_time_ns += run_time_ns
+            self._histogram.record(run_time_ns)
+
+            if self._run_count:
+                self._rolling_average_ns += (
+                    run_time_ns - self._rolling_average_ns
+                ) * _ROLLING_AVERAGE_WEIGHT
+
+            else:
+                self._rolling_average_ns = run_time_ns
+
+            self._run_count += 1
+
+        if self.tracer is not None:
+            self.tracer.record(
+                self._trace_category, self._name, started_ns, run_time_ns
+            )
+
+        if self._post_report:
+            self.print_report()
 
     def reset(self) -> None:
         """Reset all counts.
@@ -201,9 +521,13 @@ class HoudiniEventStats(metaclass=_StatsMeta):
         :return:
 
         """
-        self._last_run_time = 0
-        self._run_count = 0
-        self._total_time = 0
+        with self._lock:
+            self._last_run_time_ns = 0
+            self._rolling_average_ns = 0.0
+            self._run_count = 0
+            self._total_time_ns = 0
+
+            self.histogram.reset()
 
 
 class HoudiniEventItemStats(HoudiniEventStats):
@@ -216,6 +540,8 @@ class HoudiniEventItemStats(HoudiniEventStats):
 
     """
 
+    _trace_category = "item"
+
     def __init__(
         self,
         name: Optional[str] = None,
@@ -249,10 +575,11 @@ class HoudiniEventItemStats(HoudiniEventStats):
         _logger.info("\tRun Count: %s", self.run_count)
         _logger.info("\tCallables:")
 
-        for item_name, item_time in list(self.item_stats.items()):
-            _logger.info("\t\t%s: %0.4f", item_name, item_time)
+        for item_name, callable_stats in list(self.item_stats.items()):
+            _logger.info("\t\t%s: %0.4f", item_name, callable_stats.total_time)
 
         _logger.info("\tRun Time: %0.4f", self.last_run_time)
+        _log_latency_summary(self.histogram)
 
     def reset(self) -> None:
         """Reset all counts.
@@ -262,7 +589,33 @@ class HoudiniEventItemStats(HoudiniEventStats):
         """
         super().reset()
 
-        self.item_stats.clear()
+        with self._lock:
+            self.item_stats.clear()
+
+    def add_function_time(
+        self, func: Callable, run_time_ns: int, started_ns: int
+    ) -> None:
+        """Add a run of a function to its stats.
+
+        :param func: Function.
+        :param run_time_ns: The function run time, in nanoseconds.
+        :param started_ns: The function start time, in nanoseconds.
+        :return:
+
+        """
+        name = func.__name__
+
+        if self.tracer is not None:
+            self.tracer.record("callable", name, started_ns, run_time_ns)
+
+        with self._lock:
+            callable_stats = self._item_stats.get(name)
+
+            if callable_stats is None:
+                callable_stats = self._item_stats[name] = CallableStats()
+
+            callable_stats.run_count += 1
+            callable_stats.total_time_ns += run_time_ns
 
     @contextmanager
     def time_function(self, func: Callable) -> Generator[None, None, None]:
@@ -272,17 +625,11 @@ class HoudiniEventItemStats(HoudiniEventStats):
         :return:
 
         """
-        name = func.__name__
-        start = time.time()
+        start = time.perf_counter_ns()
 
         yield
 
-        end = time.time()
-
-        if name not in self.item_stats:
-            self.item_stats[name] = 0
-
-        self.item_stats[name] += end - start
+        self.add_function_time(func, time.perf_counter_ns() - start, start)
 
 
 # =============================================================================
@@ -290,6 +637,47 @@ class HoudiniEventItemStats(HoudiniEventStats):
 # =============================================================================
 
 
+def _get_bucket_index(value_ns: int) -> int:
+    """Get the latency histogram bucket index for a value.
+
+    Values smaller than twice the sub-bucket count are stored exactly. Larger
+    values keep their top bits and are grouped by their power of two.
+
+    :param value_ns: A value, in nanoseconds.
+    :return: The bucket index.
+
+    """
+    shift = max(value_ns.bit_length() - _HISTOGRAM_SUB_BUCKET_BITS - 1, 0)
+
+    return shift * _HISTOGRAM_SUB_BUCKET_COUNT + (value_ns >> shift)
+
+
+def _get_bucket_upper_bound(index: int) -> int:
+    """Get the largest value which is stored in a latency histogram bucket.
+
+    :param index: A bucket index.
+    :return: The largest value for the bucket, in nanoseconds.
+
+    """
+    if index < 2 * _HISTOGRAM_SUB_BUCKET_COUNT:
+        return index
+
+    shift = index // _HISTOGRAM_SUB_BUCKET_COUNT - 1
+    top = index - shift * _HISTOGRAM_SUB_BUCKET_COUNT
+
+    return ((top + 1) << shift) - 1
+
+
+def _get_latencies(stats: Tuple[HoudiniEventStats, ...]) -> Dict[str, Dict[str, float]]:
+    """Get the latency summaries for stats objects.
+
+    :param stats: The stats objects to get the latencies for.
+    :return: The latency summaries, keyed by the stats name.
+
+    """
+    return {str(stat.name): stat.histogram.summary() for stat in stats}
+
+
 def _get_matching_stats(
     stats: List[ItemStatsType], tags: List[str]
 ) -> Tuple[ItemStatsType, ...]:
@@ -313,11 +701,54 @@ def _get_matching_stats(
     return tuple(matching_stats)
 
 
+def _log_latency_summary(histogram: LatencyHistogram) -> None:
+    """Log the percentile and max latencies of a histogram.
+
+    :param histogram: The histogram to log.
+    :return:
+
+    """
+    summary = histogram.summary()
+
+    _logger.info(
+        "\tLatency: p50=%0.4f p95=%0.4f p99=%0.4f max=%0.4f",
+        summary["p50"],
+        summary["p95"],
+        summary["p99"],
+        summary["max"],
+    )
+
+
+def _start_env_trace() -> None:
+    """Start tracing event runs to the file set in the environment.
+
+    The trace file will be written when Python exits.
+
+    :return:
+
+    """
+    tracer = start_trace()
+
+    atexit.register(tracer.write, os.environ[TRACE_PATH_VAR])
+
+
 # =============================================================================
 # FUNCTIONS
 # =============================================================================
 
 
+def get_event_latencies(
+    matching_tags: Optional[List[str]] = None,
+) -> Dict[str, Dict[str, float]]:
+    """Get the latency summaries of events, optionally filtered by tag.
+
+    :param matching_tags: An optional list of tag values to filter by.
+    :return: The p50, p95, p99 and max run times, keyed by event name.
+
+    """
+    return _get_latencies(get_event_stats(matching_tags))
+
+
 def get_event_stats(
     matching_tags: Optional[List[str]] = None,
 ) -> Tuple[HoudiniEventStats, ...]:
@@ -339,6 +770,18 @@ def get_event_stats(
     return _get_matching_stats(all_stats, matching_tags)
 
 
+def get_item_latencies(
+    matching_tags: Optional[List[str]] = None,
+) -> Dict[str, Dict[str, float]]:
+    """Get the latency summaries of event items, optionally filtered by tag.
+
+    :param matching_tags: An optional list of tag values to filter by.
+    :return: The p50, p95, p99 and max run times, keyed by item name.
+
+    """
+    return _get_latencies(get_item_stats(matching_tags))
+
+
 def get_item_stats(
     matching_tags: Optional[List[str]] = None,
 ) -> Tuple[HoudiniEventItemStats, ...]:
@@ -358,3 +801,77 @@ def get_item_stats(
         return tuple(all_stats)
 
     return _get_matching_stats(all_stats, matching_tags)
+
+
+def set_stats_enabled(enabled: bool) -> None:
+    """Globally enable or disable the timing of event stats.
+
+    Stats which have had their enabled state set directly are not affected.
+
+    :param enabled: Whether stats should be timed.
+    :return:
+
+    """
+    HoudiniEventStats.enabled = enabled
+
+
+def start_trace(buffer_size: int = DEFAULT_TRACE_BUFFER_SIZE) -> EventTracer:
+    """Start recording all event runs to a new tracer.
+
+    :param buffer_size: The maximum number of spans to keep.
+    :return: The new active tracer.
+
+    """
+    tracer = EventTracer(buffer_size)
+
+    HoudiniEventStats.tracer = tracer
+
+    return tracer
+
+
+def stop_trace() -> Optional[EventTracer]:
+    """Stop recording event runs.
+
+    :return: The tracer which was active, if any.
+
+    """
+    tracer = HoudiniEventStats.tracer
+
+    HoudiniEventStats.tracer = None
+
+    return tracer
+
+
+@contextmanager
+def trace_events(
+    path: Optional[str] = None, buffer_size: int = DEFAULT_TRACE_BUFFER_SIZE
+) -> Generator[EventTracer, None, None]:
+    """Context manager to record all event runs.
+
+    Any previously active tracer is restored on exit.
+
+    :param path: Optional path to write the trace to on exit.
+    :param buffer_size: The maximum number of spans to keep.
+    :return: The active tracer.
+
+    """
+    previous = HoudiniEventStats.tracer
+
+    tracer = start_trace(buffer_size)
+
+    # Wrap the yield in a try/finally block so even if an exception occurs
+    # the trace will be stopped and written.
+    try:
+        yield tracer
+
+    finally:
+        HoudiniEventStats.tracer = previous
+
+        if path is not None:
+            tracer.write(path)
+
+
+# =============================================================================
+
+if TRACE_PATH_VAR in os.environ:
+    _start_env_trace()
@@ -0,0 +1,372 @@
+"""This module contains classes and functions for streaming render telemetry
+records as JSON lines.
+
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import atexit
+import json
+import logging
+import os
+import socket
+import sys
+import threading
+from typing import IO, List, Optional
+
+_logger = logging.getLogger(__name__)
+
+# Environment variable containing the target to stream frame telemetry to.
+# This is either a file path or a tcp://host:port address.
+TELEMETRY_TARGET_VAR = "HT_ROP_TELEMETRY"
+
+# The default number of records buffered before they are written.
+DEFAULT_BATCH_SIZE = 50
+
+# The default interval, in seconds, between memory samples.
+DEFAULT_SAMPLE_INTERVAL = 0.05
+
+# The timeout, in seconds, when connecting and writing to a socket target.
+_SOCKET_TIMEOUT = 2.0
+
+# The prefix of socket targets.
+_TCP_PREFIX = "tcp://"
+
+# The writer for the target set in the environment, which is created when
+# first requested by get_telemetry_writer().
+_TELEMETRY_WRITER: Optional[TelemetryWriter] = None
+
+
+# =============================================================================
+# CLASSES
+# =============================================================================
+
+
+class PeakRssSampler:
+    """Sample the resident memory of the process to find the peak over a period.
+
+    Samples are taken on a background thread between start() and stop().  If
+    the current resident memory cannot be read then the peak of the entire
+    process is reported instead.
+
+    :param interval: The interval, in seconds, between samples.
+
+    """
+
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL) -> None:
+        self._interval = interval
+        self._peak: Optional[int] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # -------------------------------------------------------------------------
+    # SPECIAL METHODS
+    # -------------------------------------------------------------------------
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self.peak}>"
+
+    # -------------------------------------------------------------------------
+    # NON-PUBLIC METHODS
+    # -------------------------------------------------------------------------
+
+    def _run(self) -> None:
+        """Take samples until stopped.
+
+        :return:
+
+        """
+        while not self._stop_event.wait(self._interval):
+            self._sample()
+
+    def _sample(self) -> None:
+        """Sample the current resident memory.
+
+        :return:
+
+        """
+        rss = _get_current_rss()
+
+        if rss is not None and (self._peak is None or rss > self._peak):
+            self._peak = rss
+
+    # -------------------------------------------------------------------------
+    # PROPERTIES
+    # -------------------------------------------------------------------------
+
+    @property
+    def peak(self) -> Optional[int]:
+        """The peak resident memory, in bytes, of the last sampling period."""
+        return self._peak
+
+    @property
+    def running(self) -> bool:
+        """Whether samples are currently being taken."""
+        return self._thread is not None
+
+    # -------------------------------------------------------------------------
+    # METHODS
+    # -------------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start sampling.
+
+        :return:
+
+        """
+        if self._thread is not None:
+            return
+
+        self._peak = None
+        self._stop_event.clear()
+
+        self._sample()
+
+        self._thread = threading.Thread(
+            target=self._run, name="houdini_toolbox_rss_sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> Optional[int]:
+        """Stop sampling.
+
+        :return: The peak resident memory, in bytes, while sampling.
+
+        """
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+
+            self._sample()
+
+        if self._peak is None:
+            self._peak = _get_max_rss()
+
+        return self._peak
+
+
+class TelemetryWriter:
+    """Write records as JSON lines to a file or socket.
+
+    Records are buffered and written in batches to keep the cost of each
+    record low.  Socket targets are written with a short timeout.  If a batch
+    cannot be written the error is logged, the batch is dropped and the writer
+    is disabled so that telemetry problems never stall or interrupt a render.
+
+    :param target: A file path or tcp://host:port address to write to.
+    :param batch_size: The number of records to buffer before writing.
+
+    """
+
+    def __init__(self, target: str, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        self._batch_size = batch_size
+        self._buffer: List[str] = []
+        self._disabled = False
+        self._handle: Optional[IO[str]] = None
+        self._socket: Optional[socket.socket] = None
+        self._target = target
+
+    # -------------------------------------------------------------------------
+    # SPECIAL METHODS
+    # -------------------------------------------------------------------------
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self.target}>"
+
+    # -------------------------------------------------------------------------
+    # NON-PUBLIC METHODS
+    # -------------------------------------------------------------------------
+
+    def _send(self, data: str) -> None:
+        """Write data to the target, opening it if required.
+
+        :param data: The data to write.
+        :return:
+
+        """
+        if self._target.startswith(_TCP_PREFIX):
+            if self._socket is None:
+                address = self._target.replace(_TCP_PREFIX, "", 1)
+                host, port = address.rsplit(":", 1)
+
+                self._socket = socket.create_connection(
+                    (host, int(port)), timeout=_SOCKET_TIMEOUT
+                )
+
+            self._socket.sendall(data.encode("utf-8"))
+
+        else:
+            if self._handle is None:
+                self._handle = open(  # pylint: disable=consider-using-with
+                    self._target, "a", encoding="utf-8"
+                )
+
+            self._handle.write(data)
+            self._handle.flush()
+
+    # -------------------------------------------------------------------------
+    # PROPERTIES
+    # -------------------------------------------------------------------------
+
+    @property
+    def batch_size(self) -> int:
+        """The number of records buffered before they are written."""
+        return self._batch_size
+
+    @property
+    def disabled(self) -> bool:
+        """Whether the writer is disabled after failing to write."""
+        return self._disabled
+
+    @property
+    def pending(self) -> int:
+        """The number of records which have not been written."""
+        return len(self._buffer)
+
+    @property
+    def target(self) -> str:
+        """The file path or address the records are written to."""
+        return self._target
+
+    # -------------------------------------------------------------------------
+    # METHODS
+    # -------------------------------------------------------------------------
+
+    def close(self) -> None:
+        """Write any buffered records and close the target.
+
+        :return:
+
+        """
+        self.flush()
+
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def flush(self) -> None:
+        """Write any buffered records.
+
+        :return:
+
+        """
+        if not self._buffer:
+            return
+
+        data = "".join(self._buffer)
+        self._buffer.clear()
+
+        if self._disabled:
+            return
+
+        try:
+            self._send(data)
+
+        # socket.timeout is a subclass of OSError.
+        except (OSError, ValueError):
+            _logger.warning(
+                "Could not write telemetry to %s, disabling telemetry", self._target
+            )
+
+            self._disabled = True
+
+            if self._socket is not None:
+                self._socket.close()
+                self._socket = None
+
+    def write(self, record: dict) -> None:
+        """Buffer a record, writing the buffer if it is full.
+
+        :param record: The record to write.
+        :return:
+
+        """
+        if self._disabled:
+            return
+
+        self._buffer.append(json.dumps(record, sort_keys=True) + "\n")
+
+        if len(self._buffer) >= self._batch_size:
+            self.flush()
+
+
+# =============================================================================
+# NON-PUBLIC FUNCTIONS
+# =============================================================================
+
+
+def _get_current_rss() -> Optional[int]:
+    """Get the current resident memory of the process.
+
+    :return: The resident memory in bytes, if it can be determined.
+
+    """
+    try:
+        with open("/proc/self/statm", encoding="utf-8") as handle:
+            pages = int(handle.read().split()[1])
+
+    except (OSError, IndexError, ValueError):
+        return None
+
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def _get_max_rss() -> Optional[int]:
+    """Get the peak resident memory of the process.
+
+    :return: The peak resident memory in bytes, if it can be determined.
+
+    """
+    try:
+        import resource  # pylint: disable=import-outside-toplevel
+
+    except ImportError:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # The value is in bytes on macOS and kilobytes elsewhere.
+    if sys.platform == "darwin":
+        return max_rss
+
+    return max_rss * 1024
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+
+
+def get_telemetry_writer() -> Optional[TelemetryWriter]:
+    """Get the writer for the telemetry target set in the environment.
+
+    The writer is created the first time it is requested and is closed when
+    Python exits.
+
+    :return: The telemetry writer, if a target is set.
+
+    """
+    global _TELEMETRY_WRITER  # pylint: disable=global-statement
+
+    if _TELEMETRY_WRITER is None:
+        target = os.environ.get(TELEMETRY_TARGET_VAR)
+
+        if not target:
+            return None
+
+        _TELEMETRY_WRITER = TelemetryWriter(target)
+
+        atexit.register(_TELEMETRY_WRITER.close)
+
+    return _TELEMETRY_WRITER
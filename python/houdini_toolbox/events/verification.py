@@ -0,0 +1,286 @@
+"""This module contains a class and functions for verifying render output
+files in the background while rendering continues.
+
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import atexit
+import concurrent.futures
+import hashlib
+import json
+import logging
+import os
+from typing import List, Optional, Tuple
+
+_logger = logging.getLogger(__name__)
+
+# Environment variable containing the path of a manifest to write output
+# verification results to.  Verification is only enabled if this is set.
+VERIFY_MANIFEST_VAR = "HT_VERIFY_ROP_OUTPUT"
+
+# The default number of threads used to verify files.
+DEFAULT_MAX_WORKERS = 4
+
+# The size of the chunks files are read in when computing checksums.
+_CHUNK_SIZE = 1024 * 1024
+
+# Image extensions and the possible leading bytes of valid files.
+_IMAGE_MAGIC = {
+    ".dpx": (b"SDPX", b"XPDS"),
+    ".exr": (b"\x76\x2f\x31\x01",),
+    ".hdr": (b"#?RADIANCE", b"#?RGBE"),
+    ".jpeg": (b"\xff\xd8\xff",),
+    ".jpg": (b"\xff\xd8\xff",),
+    ".png": (b"\x89PNG\r\n\x1a\n",),
+    ".tif": (b"II*\x00", b"MM\x00*"),
+    ".tiff": (b"II*\x00", b"MM\x00*"),
+}
+
+# The number of leading bytes to read to check an image header.
+_MAGIC_SIZE = max(len(magic) for values in _IMAGE_MAGIC.values() for magic in values)
+
+
+# =============================================================================
+# CLASSES
+# =============================================================================
+
+
+class OutputVerifier:
+    """Verify output files on a pool of worker threads.
+
+    Files are submitted as they are written and the results are collected,
+    and written to the manifest, by finish().
+
+    :param manifest_path: Optional path of a JSON lines manifest to append results to.
+    :param max_workers: The maximum number of worker threads.
+
+    """
+
+    def __init__(
+        self,
+        manifest_path: Optional[str] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._futures: List[concurrent.futures.Future] = []
+        self._manifest_path = manifest_path
+        self._max_workers = max_workers
+
+    # -------------------------------------------------------------------------
+    # SPECIAL METHODS
+    # -------------------------------------------------------------------------
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self.pending} pending>"
+
+    # -------------------------------------------------------------------------
+    # NON-PUBLIC METHODS
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _write_manifest(manifest_path: str, results: List[dict]) -> None:
+        """Append results to the manifest.
+
+        :param manifest_path: The path to the manifest.
+        :param results: The results to write.
+        :return:
+
+        """
+        try:
+            with open(manifest_path, "a", encoding="utf-8") as handle:
+                for result in results:
+                    handle.write(json.dumps(result, sort_keys=True) + "\n")
+
+        except OSError:
+            _logger.warning("Could not write manifest %s", manifest_path)
+
+    # -------------------------------------------------------------------------
+    # PROPERTIES
+    # -------------------------------------------------------------------------
+
+    @property
+    def manifest_path(self) -> Optional[str]:
+        """The path of the manifest results are written to."""
+        return self._manifest_path
+
+    @property
+    def pending(self) -> int:
+        """The number of files which have been submitted but not collected."""
+        return len(self._futures)
+
+    # -------------------------------------------------------------------------
+    # METHODS
+    # -------------------------------------------------------------------------
+
+    def finish(self) -> List[dict]:
+        """Wait for all submitted files to be verified and collect the results.
+
+        The results are written to the manifest, if any.
+
+        :return: The results of any files which failed verification.
+
+        """
+        futures = self._futures
+        self._futures = []
+
+        results = [future.result() for future in futures]
+
+        if results and self._manifest_path is not None:
+            self._write_manifest(self._manifest_path, results)
+
+        return [result for result in results if result["error"] is not None]
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once any submitted files are verified.
+
+        :return:
+
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def submit(self, path: str, frame: Optional[float] = None) -> None:
+        """Submit a file to be verified.
+
+        :param path: The path of the file to verify.
+        :param frame: The frame the file was written for.
+        :return:
+
+        """
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="houdini_toolbox_verify",
+            )
+
+        self._futures.append(self._executor.submit(verify_output, path, frame))
+
+
+# =============================================================================
+# NON-PUBLIC FUNCTIONS
+# =============================================================================
+
+
+def _check_file(path: str) -> Tuple[int, str, bytes]:
+    """Read a file to get its size, checksum and leading bytes.
+
+    :param path: The path of the file to read.
+    :return: The file size, SHA-256 checksum and header bytes.
+
+    """
+    checksum = hashlib.sha256()
+    header = b""
+    size = 0
+
+    with open(path, "rb") as handle:
+        while True:
+            chunk = handle.read(_CHUNK_SIZE)
+
+            if not chunk:
+                break
+
+            if not size:
+                header = chunk[:_MAGIC_SIZE]
+
+            checksum.update(chunk)
+            size += len(chunk)
+
+    return size, checksum.hexdigest(), header
+
+
+def _is_header_valid(path: str, header: bytes) -> Optional[bool]:
+    """Check whether the leading bytes of a file are a valid image header.
+
+    :param path: The path of the file.
+    :param header: The leading bytes of the file.
+    :return: Whether the header is valid, or None if the format is unknown.
+
+    """
+    magic = _IMAGE_MAGIC.get(os.path.splitext(path)[1].lower())
+
+    if magic is None:
+        return None
+
+    return header.startswith(magic)
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+
+
+def get_output_verifier() -> Optional[OutputVerifier]:
+    """Get an output verifier if verification is enabled in the environment.
+
+    The worker threads of the verifier are shut down when Python exits.
+
+    :return: An output verifier, if enabled.
+
+    """
+    manifest_path = os.environ.get(VERIFY_MANIFEST_VAR)
+
+    if not manifest_path:
+        return None
+
+    verifier = OutputVerifier(manifest_path)
+
+    atexit.register(verifier.shutdown)
+
+    return verifier
+
+
+def verify_output(path: str, frame: Optional[float] = None) -> dict:
+    """Verify an output file.
+
+    The file must exist, not be empty and, for known image formats, have a
+    valid header.  A checksum of the file is recorded so that later copies can
+    be checked against it.
+
+    :param path: The path of the file to verify.
+    :param frame: The frame the file was written for.
+    :return: The verification result.
+
+    """
+    result = {
+        "checksum": None,
+        "error": None,
+        "frame": frame,
+        "header_valid": None,
+        "path": path,
+        "size": None,
+    }
+
+    if not os.path.isfile(path):
+        result["error"] = "File does not exist"
+        return result
+
+    try:
+        size, checksum, header = _check_file(path)
+
+    except OSError as inst:
+        result["error"] = f"Could not read file: {inst}"
+        return result
+
+    result["checksum"] = checksum
+    result["size"] = size
+
+    if not size:
+        result["error"] = "File is empty"
+        return result
+
+    header_valid = _is_header_valid(path, header)
+
+    result["header_valid"] = header_valid
+
+    if header_valid is False:
+        result["error"] = "Invalid image header"
+
+    return result
@@ -5,7 +5,7 @@
 # =============================================================================
 
 # Houdini Toolbox
-from houdini_toolbox.nodes.styles.manager import STYLE_MANAGER
+from houdini_toolbox.nodes.styles.manager import get_style_manager
 
 # =============================================================================
 # FUNCTIONS
@@ -21,7 +21,7 @@ def style_node_by_name(scriptargs: dict) -> None:
     """
     node = scriptargs["node"]
 
-    STYLE_MANAGER.style_node_by_name(node)
+    get_style_manager().style_node_by_name(node)
 
 
 def style_node_on_creation(scriptargs: dict) -> None:
@@ -33,4 +33,16 @@ def style_node_on_creation(scriptargs: dict) -> None:
     """
     node = scriptargs["node"]
 
-    STYLE_MANAGER.style_node(node)
+    get_style_manager().style_node(node)
+
+
+def style_nodes_on_creation(scriptargs: dict) -> None:
+    """Style a batch of nodes on creation.
+
+    :param scriptargs: Batch data passed by event runner.
+    :return:
+
+    """
+    nodes = scriptargs["nodes"]
+
+    get_style_manager().style_nodes(nodes)
@@ -14,7 +14,7 @@ from __future__ import annotations
 import glob
 import json
 import os
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 # Houdini Toolbox
 from houdini_toolbox.nodes.styles import constants
@@ -23,6 +23,10 @@ from houdini_toolbox.nodes.styles.styles import ConstantRule, StyleConstant, Sty
 # Houdini
 import hou
 
+# The style manager, which is built when first requested by get_style_manager().
+_STYLE_MANAGER: Optional[StyleManager] = None
+
+
 # =============================================================================
 # CLASSES
 # =============================================================================
@@ -213,6 +217,28 @@ class StyleManager:
 
         return None
 
+    def _get_style(
+        self, node_type: hou.NodeType
+    ) -> Optional[Union[StyleConstant, StyleRule]]:
+        """Look for a style match for a node type.
+
+        :param node_type: The node type to find a style for.
+        :return: An applicable styling object.
+
+        """
+        # Look for a match with the node type name.
+        style = self._get_node_type_style(node_type)
+
+        # Look for a match given the node's Tab menu entries.
+        if style is None:
+            style = self._get_tool_style(node_type)
+
+        # Check if the node is a manager or generator.
+        if style is None and (node_type.isManager() or node_type.isGenerator()):
+            style = self._get_manager_generator_style(node_type)
+
+        return style
+
     def _get_tool_style(
         self, node_type: hou.NodeType
     ) -> Optional[Union[StyleConstant, StyleRule]]:
@@ -300,23 +326,34 @@ class StyleManager:
         :return:
 
         """
+        style = self._get_style(node.type())
 
-        node_type = node.type()
+        # If a color was found, set it.
+        if style is not None:
+            style.apply_to_node(node)
 
-        # Look for a match with the node type name.
-        style = self._get_node_type_style(node_type)
+    def style_nodes(self, nodes: Sequence[hou.Node]) -> None:
+        """Style a list of nodes given their properties.
 
-        # Look for a match given the node's Tab menu entries.
-        if style is None:
-            style = self._get_tool_style(node_type)
+        The style lookup is only performed once for each node type.
 
-        # Check if the node is a manager or generator.
-        if style is None and (node_type.isManager() or node_type.isGenerator()):
-            style = self._get_manager_generator_style(node_type)
+        :param nodes: The nodes to style.
+        :return:
 
-        # If a color was found, set it.
-        if style is not None:
-            style.apply_to_node(node)
+        """
+        type_styles: Dict[hou.NodeType, Optional[Union[StyleConstant, StyleRule]]] = {}
+
+        for node in nodes:
+            node_type = node.type()
+
+            if node_type not in type_styles:
+                type_styles[node_type] = self._get_style(node_type)
+
+            style = type_styles[node_type]
+
+            # If a color was found, set it.
+            if style is not None:
+                style.apply_to_node(node)
 
     def style_node_by_name(self, node: hou.Node) -> None:
         """Style the node given its name.
@@ -522,5 +559,22 @@ def _get_tool_menu_locations(node_type: hou.NodeType) -> Tuple[str, ...]:
 
 
 # =============================================================================
+# FUNCTIONS
+# =============================================================================
+
+
+def get_style_manager() -> StyleManager:
+    """Get the style manager.
+
+    The manager is only built the first time it is needed since building it
+    requires finding and parsing all the style files.
+
+    :return: The style manager.
+
+    """
+    global _STYLE_MANAGER  # pylint: disable=global-statement
+
+    if _STYLE_MANAGER is None:
+        _STYLE_MANAGER = StyleManager()
 
-STYLE_MANAGER = StyleManager()
+    return _STYLE_MANAGER
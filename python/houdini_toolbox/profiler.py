@@ -0,0 +1,499 @@
+"""This module contains a profiler for measuring the startup cost of the
+houdini_toolbox package.
+
+The profiler can be run from hython:
+
+>>> import houdini_toolbox.profiler
+>>> houdini_toolbox.profiler.profile_startup("/tmp/startup.json")
+
+or during Houdini startup by setting HT_STARTUP_PROFILE to the path of the
+JSON report to write.
+
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import contextlib
+import importlib
+import importlib.abc
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
+
+_logger = logging.getLogger(__name__)
+
+# Environment variable containing a file path to write a profile of the
+# package startup to.
+PROFILE_PATH_VAR = "HT_STARTUP_PROFILE"
+
+# The modules imported when Houdini starts.
+_STARTUP_MODULES = (
+    "houdini_toolbox.events",
+    "houdini_toolbox.events.callbacks",
+    "houdini_toolbox.nodes.styles",
+    "houdini_toolbox.sohohooks.aovs",
+)
+
+# The name the inline library creation is reported under.
+_CREATE_LIBRARY_NAME = "inline.lib.createLibrary"
+
+
+# =============================================================================
+# CLASSES
+# =============================================================================
+
+
+class _TimedLoader:
+    """Loader wrapper which times the loading of a module.
+
+    Any attributes other than the loading methods are looked up on the
+    wrapped loader.
+
+    :param loader: The loader to wrap.
+    :param profiler: The profiler to record the times with.
+
+    """
+
+    def __init__(self, loader: Any, profiler: StartupProfiler) -> None:
+        self._loader = loader
+        self._profiler = profiler
+
+    # -------------------------------------------------------------------------
+    # SPECIAL METHODS
+    # -------------------------------------------------------------------------
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+    # -------------------------------------------------------------------------
+    # METHODS
+    # -------------------------------------------------------------------------
+
+    def create_module(self, spec: Any) -> Any:
+        """Create the module, timing the creation.
+
+        Extension modules are initialized while being created.
+
+        :param spec: The module spec.
+        :return: The created module, if any.
+
+        """
+        return self._profiler.time_import(spec.name, self._loader.create_module, spec)
+
+    def exec_module(self, module: Any) -> None:
+        """Execute the module, timing the execution.
+
+        :param module: The module to execute.
+        :return:
+
+        """
+        # Point the module back at the real loader so that nothing sees the
+        # wrapper once the profile is finished.
+        module.__loader__ = self._loader
+
+        if getattr(module, "__spec__", None) is not None:
+            module.__spec__.loader = self._loader
+
+        self._profiler.time_import(module.__name__, self._loader.exec_module, module)
+
+
+class StartupProfiler(importlib.abc.MetaPathFinder):
+    """Measure the cost of importing modules and constructing objects.
+
+    While started the profiler sits at the front of sys.meta_path and times
+    the loading of every module which is imported for the first time.  Modules
+    which have already been imported are not measured.
+
+    """
+
+    def __init__(self) -> None:
+        self._constructions: Dict[str, float] = {}
+        self._imports: Dict[str, List[float]] = {}
+        self._local = threading.local()
+        self._started: Optional[float] = None
+        self._total_time = 0.0
+
+    # -------------------------------------------------------------------------
+    # SPECIAL METHODS
+    # -------------------------------------------------------------------------
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {len(self._imports)} imports>"
+
+    # -------------------------------------------------------------------------
+    # NON-PUBLIC METHODS
+    # -------------------------------------------------------------------------
+
+    def _get_stack(self) -> List[List[float]]:
+        """Get the stack of imports being timed by the current thread.
+
+        :return: The timing stack for the current thread.
+
+        """
+        stack = getattr(self._local, "stack", None)
+
+        if stack is None:
+            stack = self._local.stack = []
+
+        return stack
+
+    # -------------------------------------------------------------------------
+    # PROPERTIES
+    # -------------------------------------------------------------------------
+
+    @property
+    def constructions(self) -> Dict[str, float]:
+        """The construction times, in seconds, of any timed objects."""
+        return self._constructions
+
+    @property
+    def imports(self) -> Dict[str, Tuple[float, float]]:
+        """The self and cumulative import times, in seconds, of each module."""
+        return {name: (times[0], times[1]) for name, times in self._imports.items()}
+
+    @property
+    def running(self) -> bool:
+        """Whether the profiler is currently timing imports."""
+        return self._started is not None
+
+    @property
+    def total_time(self) -> float:
+        """The total time, in seconds, the profiler has been running for."""
+        if self._started is not None:
+            return self._total_time + time.perf_counter() - self._started
+
+        return self._total_time
+
+    # -------------------------------------------------------------------------
+    # METHODS
+    # -------------------------------------------------------------------------
+
+    def find_spec(  # pylint: disable=unused-argument
+        self, fullname: str, path: Any, target: Any = None
+    ) -> Any:
+        """Find the module spec using the other finders and time its loading.
+
+        :param fullname: The full name of the module being imported.
+        :param path: The parent package search path.
+        :param target: The module being reloaded, if any.
+        :return: The found module spec, if any.
+
+        """
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+
+            find_spec = getattr(finder, "find_spec", None)
+
+            if find_spec is None:
+                continue
+
+            spec = find_spec(fullname, path, target)
+
+            if spec is not None:
+                break
+
+        else:
+            return None
+
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self)
+
+        return spec
+
+    def format_report(self) -> str:
+        """Format the profile as a report sorted by decreasing cost.
+
+        :return: The formatted report.
+
+        """
+        report = self.get_report()
+
+        lines = [f"Startup profile: {report['total_seconds']:0.4f}s"]
+
+        lines.append("Imports (self / cumulative):")
+
+        for entry in report["imports"]:
+            lines.append(
+                f"\t{entry['self_seconds']:0.4f}s / "
+                f"{entry['cumulative_seconds']:0.4f}s\t{entry['module']}"
+            )
+
+        lines.append("Constructions:")
+
+        for entry in report["constructions"]:
+            lines.append(f"\t{entry['seconds']:0.4f}s\t{entry['name']}")
+
+        return "\n".join(lines)
+
+    def get_report(self) -> dict:
+        """Get the profile as a dictionary.
+
+        Imports are sorted by decreasing self time and constructions by
+        decreasing time.
+
+        :return: The profile data.
+
+        """
+        imports = sorted(self._imports.items(), key=lambda item: (-item[1][0], item[0]))
+        constructions = sorted(
+            self._constructions.items(), key=lambda item: (-item[1], item[0])
+        )
+
+        return {
+            "total_seconds": self.total_time,
+            "imports": [
+                {
+                    "module": name,
+                    "self_seconds": self_time,
+                    "cumulative_seconds": cumulative_time,
+                }
+                for name, (self_time, cumulative_time) in imports
+            ],
+            "constructions": [
+                {"name": name, "seconds": seconds} for name, seconds in constructions
+            ],
+        }
+
+    def start(self) -> None:
+        """Start timing imports.
+
+        :return:
+
+        """
+        if self._started is not None:
+            return
+
+        sys.meta_path.insert(0, self)
+
+        self._started = time.perf_counter()
+
+    def stop(self) -> None:
+        """Stop timing imports.
+
+        :return:
+
+        """
+        if self._started is None:
+            return
+
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+        self._total_time += time.perf_counter() - self._started
+        self._started = None
+
+    def time_call(self, name: str, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Call a function and record how long it took as a construction.
+
+        :param name: The name to record the time under.
+        :param func: The function to call.
+        :return: The result of the function.
+
+        """
+        start = time.perf_counter()
+
+        try:
+            return func(*args, **kwargs)
+
+        finally:
+            self._constructions[name] = (
+                self._constructions.get(name, 0.0) + time.perf_counter() - start
+            )
+
+    def time_import(self, name: str, func: Callable, *args: Any) -> Any:
+        """Call a module loading function and record how long it took.
+
+        Time spent importing other modules while the function runs is
+        excluded from the module's self time.
+
+        :param name: The name of the module being loaded.
+        :param func: The loading function to call.
+        :return: The result of the function.
+
+        """
+        stack = self._get_stack()
+
+        # The start time and time spent in nested imports.
+        timing = [time.perf_counter(), 0.0]
+        stack.append(timing)
+
+        try:
+            return func(*args)
+
+        finally:
+            stack.pop()
+
+            cumulative_time = time.perf_counter() - timing[0]
+
+            if stack:
+                stack[-1][1] += cumulative_time
+
+            times = self._imports.setdefault(name, [0.0, 0.0])
+            times[0] += cumulative_time - timing[1]
+            times[1] += cumulative_time
+
+    def write(self, path: str) -> None:
+        """Write the profile to a JSON file.
+
+        :param path: The path to write the profile to.
+        :return:
+
+        """
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(self.get_report(), handle, indent=4)
+
+
+# =============================================================================
+# NON-PUBLIC FUNCTIONS
+# =============================================================================
+
+
+def _time_constructions(profiler: StartupProfiler) -> None:
+    """Time the first construction of the lazily built package singletons.
+
+    The singletons are built through their getters so that nothing is built
+    twice.  Any which have already been built are skipped.  The event manager
+    is built when its module is imported so it is part of that import time.
+
+    :param profiler: The profiler to record the times with.
+    :return:
+
+    """
+    # pylint: disable=import-outside-toplevel,protected-access
+    from houdini_toolbox.nodes.styles import manager as style_manager
+    from houdini_toolbox.sohohooks.aovs import manager as aov_manager
+
+    if style_manager._STYLE_MANAGER is None:
+        profiler.time_call("STYLE_MANAGER", style_manager.get_style_manager)
+
+    else:
+        _logger.debug("Style manager already built, skipping")
+
+    if aov_manager._AOV_MANAGER is None:
+        profiler.time_call("AOV_MANAGER", aov_manager.get_aov_manager)
+
+    else:
+        _logger.debug("AOV manager already built, skipping")
+
+    _time_create_library(profiler)
+
+
+def _time_create_library(profiler: StartupProfiler) -> None:
+    """Time the creation of the inline C++ library.
+
+    The library is created when houdini_toolbox.inline.lib is imported so it
+    can only be timed if that has not already happened.
+
+    :param profiler: The profiler to record the time with.
+    :return:
+
+    """
+    if "houdini_toolbox.inline.lib" in sys.modules:
+        _logger.debug("Inline library already created, skipping")
+        return
+
+    try:
+        import inlinecpp  # pylint: disable=import-outside-toplevel
+
+    except ImportError:
+        _logger.debug("inlinecpp not available, skipping")
+        return
+
+    create_library = inlinecpp.createLibrary
+
+    def _timed_create_library(*args: Any, **kwargs: Any) -> Any:
+        return profiler.time_call(_CREATE_LIBRARY_NAME, create_library, *args, **kwargs)
+
+    inlinecpp.createLibrary = _timed_create_library
+
+    try:
+        importlib.import_module("houdini_toolbox.inline.lib")
+
+    finally:
+        inlinecpp.createLibrary = create_library
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+
+
+@contextlib.contextmanager
+def profile_imports(
+    path: Optional[str] = None,
+) -> Generator[StartupProfiler, None, None]:
+    """Context manager to profile any imports and the package singletons.
+
+    The report is logged when the block exits and optionally written to a JSON
+    file.
+
+    >>> with profile_imports("/tmp/startup.json"):
+    ...     import houdini_toolbox.events
+    ...
+
+    :param path: Optional path to write the JSON report to.
+    :return:
+
+    """
+    profiler = StartupProfiler()
+    profiler.start()
+
+    try:
+        yield profiler
+
+        _time_constructions(profiler)
+
+    finally:
+        profiler.stop()
+
+    _logger.info(profiler.format_report())
+
+    if path is not None:
+        profiler.write(path)
+
+
+def profile_startup(path: Optional[str] = None) -> dict:
+    """Profile importing the modules Houdini imports on startup.
+
+    Modules which have already been imported are not measured so this should
+    be run in a fresh hython session.
+
+    :param path: Optional path to write the JSON report to.
+    :return: The profile data.
+
+    """
+    with profile_imports(path) as profiler:
+        for module_name in _STARTUP_MODULES:
+            importlib.import_module(module_name)
+
+    return profiler.get_report()
+
+
+@contextlib.contextmanager
+def startup_profile() -> Generator[Optional[StartupProfiler], None, None]:
+    """Context manager to profile startup if HT_STARTUP_PROFILE is set.
+
+    If the variable is not set nothing is profiled.
+
+    :return:
+
+    """
+    path = os.environ.get(PROFILE_PATH_VAR)
+
+    if path is None:
+        yield None
+        return
+
+    with profile_imports(path) as profiler:
+        yield profiler
@@ -11,37 +11,146 @@ from __future__ import annotations
 
 # Standard Library
 import argparse
+import hashlib
 import importlib
 import json
 import logging
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Type
-
-if TYPE_CHECKING:
-    from houdini_toolbox.pyfilter.operations.operation import PyFilterOperation
+import os
+import sys
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+# Houdini Toolbox
+from houdini_toolbox.pyfilter.operations.operation import (
+    DECIDE_AFTER_ARGS,
+    PyFilterOperation,
+)
+from houdini_toolbox.pyfilter.profiling import StageProfiler
+from houdini_toolbox.pyfilter.property import cache_properties, get_property
 
 _logger = logging.getLogger(__name__)
 
+# Profiles are reported through the same logger as Mantra's output.
+_mantra_logger = logging.getLogger("mantra")
+
+# The prefix of the args used by the manager itself.
+_MANAGER_FLAGS = ("--pyfilter-",)
+
+# Image names which are not files so a profile can't be written next to them.
+_NON_FILE_IMAGES = ("", "ip", "md", "null:")
+
+# Environment variable containing the directory to cache the merged
+# operations files in.  A directory in the user's preferences, or their
+# ~/.cache directory, is used if it is not set and caching is disabled if it
+# is empty.
+REGISTRY_CACHE_DIR_VAR = "HT_PYFILTER_CACHE_DIR"
+
+# The version of the registry cache format.
+_REGISTRY_CACHE_VERSION = 2
+
+# The names of the stages Mantra runs operations for.
+STAGE_NAMES = (
+    "filter_camera",
+    "filter_camera_segment",
+    "filter_end_render",
+    "filter_error",
+    "filter_fog",
+    "filter_geometry",
+    "filter_instance",
+    "filter_light",
+    "filter_material",
+    "filter_output_assets",
+    "filter_plane",
+    "filter_quit",
+    "filter_render",
+)
+
 
 # =============================================================================
 # CLASSES
 # =============================================================================
 
 
+class _RunDecision:
+    """Cache the result of an operation's should_run() once it can't change.
+
+    Until decide() is called the operation is asked every time.
+
+    :param should_run: The operation's should_run() method.
+
+    """
+
+    __slots__ = ("_result", "_should_run")
+
+    def __init__(self, should_run: Callable[[], bool]) -> None:
+        self._result: Optional[bool] = None
+        self._should_run = should_run
+
+    # -------------------------------------------------------------------------
+    # SPECIAL METHODS
+    # -------------------------------------------------------------------------
+
+    def __call__(self) -> bool:
+        if self._result is None:
+            return self._should_run()
+
+        return self._result
+
+    # -------------------------------------------------------------------------
+    # PROPERTIES
+    # -------------------------------------------------------------------------
+
+    @property
+    def result(self) -> Optional[bool]:
+        """The cached decision, if it has been made."""
+        return self._result
+
+    # -------------------------------------------------------------------------
+    # METHODS
+    # -------------------------------------------------------------------------
+
+    def decide(self) -> None:
+        """Ask the operation whether it should run and cache the result.
+
+        :return:
+
+        """
+        self._result = bool(self._should_run())
+
+
 class PyFilterManager:
-    """Manager class for PyFilter operations."""
+    """Manager class for PyFilter operations.
 
-    def __init__(self) -> None:
+    :param operation_entries: Optional operation entries to register instead of those in the operations files.
+
+    """
+
+    def __init__(
+        self, operation_entries: Optional[List[Union[dict, List[str]]]] = None
+    ) -> None:
         self._data: dict = {}
+        self._operation_flags: Dict[PyFilterOperation, Optional[List[str]]] = {}
         self._operations: List[PyFilterOperation] = []
+        self._profile_mode: Optional[str] = None
+        self._profiler: Optional[StageProfiler] = None
+        self._run_checks: Dict[PyFilterOperation, Optional[Callable[[], bool]]] = {}
+        self._stage_decisions: Dict[str, List[_RunDecision]] = {}
+        self._stage_dispatch: Dict[
+            str, Tuple[Tuple[Optional[Callable[[], bool]], Callable], ...]
+        ] = {}
 
         # Populate the list of operations.
-        self._register_operations()
+        self._register_operations(operation_entries)
 
         # Build and parse any arguments.
         filter_args = self._get_parsed_args()
 
         self._process_parsed_args(filter_args)
 
+        # The run checks and stage functions only need to be looked up once the
+        # operations are configured.
+        self._build_run_checks()
+        self._build_stage_dispatch()
+
     # -------------------------------------------------------------------------
     # PROPERTIES
     # -------------------------------------------------------------------------
@@ -60,12 +169,66 @@ class PyFilterManager:
     # NON-PUBLIC METHODS
     # -------------------------------------------------------------------------
 
+    def _build_run_checks(self) -> None:
+        """Determine how to check whether each operation should run.
+
+        Operations which decide after the args are processed are asked now and
+        left out entirely if they won't run.  Operations which decide at a
+        stage are asked once when that stage starts.
+
+        :return:
+
+        """
+        self._run_checks = {}
+        self._stage_decisions = {}
+
+        for operation in self.operations:
+            decision_stage = operation.run_decision_stage
+
+            if decision_stage is None:
+                self._run_checks[operation] = operation.should_run
+
+            elif decision_stage == DECIDE_AFTER_ARGS:
+                if not operation.should_run():
+                    _logger.debug("%s will not run", operation)
+                    continue
+
+                # The operation always runs so nothing needs to be checked.
+                self._run_checks[operation] = None
+
+            else:
+                decision = _RunDecision(operation.should_run)
+
+                self._run_checks[operation] = decision
+                self._stage_decisions.setdefault(decision_stage, []).append(decision)
+
+    def _build_stage_dispatch(self) -> None:
+        """Build the dispatch tables for all the known stages.
+
+        :return:
+
+        """
+        self._stage_dispatch = {
+            stage_name: self._get_stage_functions(stage_name)
+            for stage_name in STAGE_NAMES
+        }
+
     def _get_parsed_args(self) -> argparse.Namespace:
         """Parse any args passed to PyFilter.
 
         :return: Parsed filter args.
 
         """
+        passed_args = sys.argv[1:]
+
+        # There is nothing to parse if none of the manager's or operations'
+        # flags were passed.
+        if not _flags_in_args(_MANAGER_FLAGS, passed_args) and not any(
+            self._operation_needs_args(operation, passed_args)
+            for operation in self.operations
+        ):
+            return argparse.Namespace()
+
         parser = _build_parser()
 
         self._register_parser_args(parser)
@@ -74,6 +237,61 @@ class PyFilterManager:
 
         return filter_args
 
+    def _get_stage_functions(
+        self, stage_name: str
+    ) -> Tuple[Tuple[Optional[Callable[[], bool]], Callable], ...]:
+        """Get the functions to call to run the operations for a stage.
+
+        Operations which do not implement the stage or will never run are
+        skipped.
+
+        :param stage_name: The name of the stage.
+        :return: The run check, if any, and stage method of each operation.
+
+        """
+        functions = []
+
+        for operation, run_check in self._run_checks.items():
+            func = getattr(operation, stage_name, None)
+
+            # Operation has no function for this stage so it never runs.
+            if func is None:
+                continue
+
+            if self._profiler is not None:
+                func = self._profiler.wrap(type(operation).__name__, stage_name, func)
+
+            functions.append((run_check, func))
+
+        return tuple(functions)
+
+    def _operation_needs_args(
+        self, operation: PyFilterOperation, filter_args: Sequence[str]
+    ) -> bool:
+        """Check whether an operation's args need to be parsed.
+
+        Operations which don't register any args never need them parsed.
+        Otherwise they are needed if any of the operation's flags were passed,
+        or always if the operation did not declare its flags.
+
+        :param operation: The operation to check.
+        :param filter_args: The args passed to the filter.
+        :return: Whether the operation's args need to be parsed.
+
+        """
+        if (
+            type(operation).register_parser_args
+            is PyFilterOperation.register_parser_args
+        ):
+            return False
+
+        flags = self._operation_flags.get(operation)
+
+        if flags is None:
+            return True
+
+        return _flags_in_args(flags, filter_args)
+
     def _process_parsed_args(self, filter_args: argparse.Namespace) -> None:
         """Allow operations to process any args that were parsed.
 
@@ -81,40 +299,57 @@ class PyFilterManager:
         :return:
 
         """
+        self._profile_mode = getattr(filter_args, "pyfilter_profile", None)
+
+        if self._profile_mode is not None:
+            self._profiler = StageProfiler()
+
         for operation in self.operations:
             operation.process_parsed_args(filter_args)
 
-    def _register_operations(self) -> None:
+    def _register_operations(
+        self, entries: Optional[List[Union[dict, List[str]]]] = None
+    ) -> None:
         """Register operations that should be run by the manager.
 
+        Operations which declare flag prefixes are only imported if one of
+        their flags was passed to the filter.
+
+        :param entries: Optional operation entries to use instead of those in the operations files.
         :return:
 
         """
-        files = _find_operation_files()
+        filter_args = sys.argv[1:]
 
-        for file_path in files:
-            data = _get_operation_data(file_path)
+        if entries is None:
+            entries = _get_operation_entries()
 
-            if "operations" not in data:
+        for entry in entries:
+            module_name, class_name, flags, always = _get_operation_entry(entry)
+
+            if (
+                not always
+                and flags is not None
+                and not _flags_in_args(flags, filter_args)
+            ):
+                _logger.debug("Skipping %s, no flags were passed", class_name)
                 continue
 
-            for operation in data["operations"]:
-                module_name, class_name = operation
+            # Import the operation class.
+            cls = _get_class(module_name, class_name)
 
-                # Import the operation class.
-                cls = _get_class(module_name, class_name)
+            if cls is None:
+                _logger.warning("Could not load %s from %s", class_name, module_name)
 
-                if cls is None:
-                    _logger.warning(
-                        "Could not load %s from %s", class_name, module_name
-                    )
+                continue
 
-                    continue
+            _logger.debug("Registering %s (%s)", class_name, module_name)
 
-                _logger.debug("Registering %s (%s)", class_name, module_name)
+            operation = cls(self)
 
-                # Add an instance of it to our operations list.
-                self.operations.append(cls(self))
+            # Add an instance of it to our operations list.
+            self.operations.append(operation)
+            self._operation_flags[operation] = flags
 
     def _register_parser_args(self, parser: argparse.ArgumentParser) -> None:
         """Register any necessary args with our parser.
@@ -129,6 +364,36 @@ class PyFilterManager:
         for operation in self.operations:
             operation.register_parser_args(parser)
 
+    def _report_profile(self) -> None:
+        """Log the profile and write it next to the image if requested.
+
+        :return:
+
+        """
+        profiler = self._profiler
+
+        if profiler is None:
+            return
+
+        _mantra_logger.info(profiler.format_summary())
+
+        if self._profile_mode != "json":
+            return
+
+        image_path = get_property("image:filename")
+
+        if not isinstance(image_path, str) or image_path in _NON_FILE_IMAGES:
+            _logger.warning("Not rendering to a file, cannot write profile")
+            return
+
+        profile_path = f"{os.path.splitext(image_path)[0]}.pyfilter_profile.json"
+
+        try:
+            profiler.write(profile_path)
+
+        except OSError:
+            _logger.warning("Could not write profile to %s", profile_path)
+
     # -------------------------------------------------------------------------
     # METHODS
     # -------------------------------------------------------------------------
@@ -144,25 +409,38 @@ class PyFilterManager:
         :return: Whether or any of the stage functions returned True.
 
         """
-        results = []
+        dispatch = self._stage_dispatch.get(stage_name)
 
-        for operation in self.operations:
-            # Skip operations that should not be run.
-            if not operation.should_run():
-                continue
+        # Stages which aren't known ahead of time are looked up the first time
+        # they are run.
+        if dispatch is None:
+            dispatch = self._get_stage_functions(stage_name)
+            self._stage_dispatch[stage_name] = dispatch
 
-            # Attempt to find the function for this stage.
-            try:
-                func = getattr(operation, stage_name)
+        decisions = self._stage_decisions.get(stage_name)
 
-            # Filter has no function for this stage so don't do anything.
-            except AttributeError:
-                continue
+        # Operations which decide whether to run at this stage do so now.
+        if decisions is not None:
+            for decision in decisions:
+                decision.decide()
+
+        result = False
+
+        # Properties read by multiple operations are only read once per stage.
+        with cache_properties():
+            for run_check, func in dispatch:
+                # Skip operations that should not be run.
+                if run_check is not None and not run_check():
+                    continue
+
+                # Run the filter.
+                if func(*args, **kwargs) is True:
+                    result = True
 
-            # Run the filter.
-            results.append(func(*args, **kwargs))
+        if stage_name == "filter_quit" and self._profiler is not None:
+            self._report_profile()
 
-        return True in results
+        return result
 
 
 # =============================================================================
@@ -178,6 +456,16 @@ def _build_parser() -> argparse.ArgumentParser:
     """
     parser = argparse.ArgumentParser()
 
+    # Record the time spent in each operation stage and log it when Mantra
+    # quits, optionally also writing it as json next to the image.
+    parser.add_argument(
+        "--pyfilter-profile",
+        nargs="?",
+        const="log",
+        choices=("json", "log"),
+        dest="pyfilter_profile",
+    )
+
     return parser
 
 
@@ -201,6 +489,19 @@ def _find_operation_files() -> Tuple[str]:
     return files
 
 
+def _flags_in_args(flags: Sequence[str], filter_args: Sequence[str]) -> bool:
+    """Check whether any of the filter args start with any of the flags.
+
+    :param flags: The flag prefixes to look for.
+    :param filter_args: The args passed to the filter.
+    :return: Whether any of the flags were passed.
+
+    """
+    prefixes = tuple(flags)
+
+    return any(arg.startswith(prefixes) for arg in filter_args)
+
+
 def _get_class(module_name: str, class_name: str) -> Optional[Type]:
     """Try to import class_name from module_name.
 
@@ -222,6 +523,92 @@ def _get_class(module_name: str, class_name: str) -> Optional[Type]:
     return cls
 
 
+def _get_mtimes(paths: Sequence[str]) -> List[List[Any]]:
+    """Get the modification times of paths.
+
+    :param paths: The paths to get the modification times of.
+    :return: Each path and its modification time, or None if it doesn't exist.
+
+    """
+    mtimes: List[List[Any]] = []
+
+    for path in paths:
+        try:
+            mtime: Optional[int] = os.stat(path).st_mtime_ns
+
+        except OSError:
+            mtime = None
+
+        mtimes.append([path, mtime])
+
+    return mtimes
+
+
+def _get_operation_entries() -> List[Union[dict, List[str]]]:
+    """Get the entries of all the operations files.
+
+    Finding and reading the files can be slow when the HOUDINI_PATH includes
+    network locations so the merged entries are cached.  The cache is keyed by
+    the directories searched for the files and is rebuilt when any of the
+    files are modified, or files are added to or removed from any of the
+    directories.
+
+    :return: The operation entries.
+
+    """
+    search_dirs = _get_search_dirs()
+
+    cache_path = _get_registry_cache_path(search_dirs)
+
+    if cache_path is not None:
+        entries = _read_registry_cache(cache_path, search_dirs)
+
+        if entries is not None:
+            return entries
+
+    files = _find_operation_files()
+
+    entries = []
+
+    for file_path in files:
+        data = _get_operation_data(file_path)
+
+        entries.extend(data.get("operations", ()))
+
+    if cache_path is not None:
+        _write_registry_cache(cache_path, search_dirs, files, entries)
+
+    return entries
+
+
+def _get_operation_entry(
+    entry: Union[dict, Sequence[str]],
+) -> Tuple[str, str, Optional[List[str]], bool]:
+    """Get the details of an operation from an operations file entry.
+
+    Entries are either a [module, class] pair, which is always loaded, or a
+    dictionary with "module" and "class" keys and optionally a list of
+    "flags" prefixes which cause the operation to be loaded when passed, and
+    an "always" flag to load it regardless.  The flags of operations which
+    are always loaded are used to skip parsing args when none were passed.
+
+    :param entry: The operations file entry.
+    :return: The module and class names, the flag prefixes, if any, and whether to always load it.
+
+    """
+    if isinstance(entry, dict):
+        return (
+            entry["module"],
+            entry["class"],
+            entry.get("flags"),
+            entry.get("always", False),
+        )
+
+    module_name, class_name = entry
+
+    return module_name, class_name, None, True
+
+
 def _get_operation_data(file_path: str) -> dict:
     """Get operation data from a file path.
 
@@ -240,3 +627,134 @@ def _get_operation_data(file_path: str) -> dict:
         data = {}
 
     return data
+
+
+def _get_registry_cache_dir() -> Optional[str]:
+    """Get the directory to write the registry cache to.
+
+    The directory is private to the user so that other users can't provide
+    the operations to load.
+
+    :return: The cache directory, if caching is enabled.
+
+    """
+    cache_dir = os.environ.get(REGISTRY_CACHE_DIR_VAR)
+
+    if cache_dir is not None:
+        return cache_dir or None
+
+    pref_dir = os.environ.get("HOUDINI_USER_PREF_DIR")
+
+    if pref_dir and os.path.isdir(pref_dir):
+        return os.path.join(pref_dir, "houdini_toolbox")
+
+    return os.path.join(os.path.expanduser("~"), ".cache", "houdini_toolbox")
+
+
+def _get_registry_cache_path(search_dirs: Sequence[str]) -> Optional[str]:
+    """Get the path of the registry cache file for the searched directories.
+
+    :param search_dirs: The directories searched for operations files.
+    :return: The cache file path, if caching is enabled.
+
+    """
+    cache_dir = _get_registry_cache_dir()
+
+    # Caching has been disabled.
+    if cache_dir is None:
+        return None
+
+    digest = hashlib.sha1("\n".join(search_dirs).encode("utf-8")).hexdigest()
+
+    return os.path.join(cache_dir, f"pyfilter_operations_{digest[:16]}.json")
+
+
+def _get_search_dirs() -> List[str]:
+    """Get the directories searched for operations files.
+
+    :return: The pyfilter directories on the HOUDINI_PATH.
+
+    """
+    import hou
+
+    return [os.path.join(path, "pyfilter") for path in hou.houdiniPath()]
+
+
+def _read_registry_cache(
+    cache_path: str, search_dirs: Sequence[str]
+) -> Optional[List[Union[dict, List[str]]]]:
+    """Read the operation entries from a registry cache file.
+
+    The cache is invalid if any of the searched directories, whose modification
+    times change when files are added or removed, or operations files have
+    been modified.
+
+    :param cache_path: The path of the cache file.
+    :param search_dirs: The directories searched for operations files.
+    :return: The cached entries, if the cache is valid.
+
+    """
+    try:
+        with open(cache_path, encoding="utf-8") as handle:
+            data = json.load(handle)
+
+        if data["version"] != _REGISTRY_CACHE_VERSION:
+            return None
+
+        if data["dirs"] != _get_mtimes(search_dirs):
+            _logger.debug("Operations files have been added or removed")
+            return None
+
+        for file_path, mtime in data["files"]:
+            if os.stat(file_path).st_mtime_ns != mtime:
+                _logger.debug("%s has been modified", file_path)
+                return None
+
+        entries = data["operations"]
+
+    # The cache doesn't exist, is invalid or one of the files no longer exists.
+    except (KeyError, OSError, TypeError, ValueError):
+        return None
+
+    if not isinstance(entries, list):
+        return None
+
+    return entries
+
+
+def _write_registry_cache(
+    cache_path: str,
+    search_dirs: Sequence[str],
+    files: Sequence[str],
+    entries: List[Union[dict, List[str]]],
+) -> None:
+    """Write operation entries to a registry cache file.
+
+    :param cache_path: The path of the cache file.
+    :param search_dirs: The directories searched for operations files.
+    :param files: The operations files the entries were read from.
+    :param entries: The operation entries.
+    :return:
+
+    """
+    try:
+        data = {
+            "dirs": _get_mtimes(search_dirs),
+            "files": [[path, os.stat(path).st_mtime_ns] for path in files],
+            "operations": entries,
+            "version": _REGISTRY_CACHE_VERSION,
+        }
+
+        os.makedirs(os.path.dirname(cache_path), mode=0o700, exist_ok=True)
+
+        # Write to a temporary file first so other renders never read a
+        # partially written cache.
+        temp_path = f"{cache_path}.{os.getpid()}"
+
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(data, handle)
+
+        os.replace(temp_path, cache_path)
+
+    except (OSError, TypeError, ValueError):
+        _logger.debug("Could not write operation registry cache %s", cache_path)
@@ -8,15 +8,20 @@
 from __future__ import annotations
 
 # Standard Library
+import logging
 import math
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 # Houdini Toolbox
 from houdini_toolbox.pyfilter.operations.operation import (
     PyFilterOperation,
     log_filter_call,
 )
-from houdini_toolbox.pyfilter.property import get_property, set_property
+from houdini_toolbox.pyfilter.property import (
+    get_property,
+    set_properties,
+    set_property,
+)
 from houdini_toolbox.pyfilter.utils import build_pyfilter_command
 
 if TYPE_CHECKING:
@@ -26,6 +31,23 @@ if TYPE_CHECKING:
 
     import hou
 
+_logger = logging.getLogger(__name__)
+
+# The post-render script which advances a node through the progressive ladder.
+_POST_RENDER_SCRIPT = "__import__('houdini_toolbox.pyfilter.operations', globals(), locals(), ['ipoverrides']).ipoverrides.advance_progressive_stage(hou.pwd())"  # noqa: 501
+
+# The images which render to an interactive renderer.
+_INTERACTIVE_IMAGES = ("ip", "md")
+
+# The resolution and pixel sample scales of each stage of progressive
+# rendering.  Each completed render from a node advances it to the next stage
+# until the final, full quality, stage is reached.
+PROGRESSIVE_LADDER = (
+    (0.25, 0.125),
+    (0.5, 0.5),
+    (1.0, 1.0),
+)
+
 
 # =============================================================================
 # CLASSES
@@ -39,6 +61,9 @@ class IpOverrides(PyFilterOperation):
 
     """
 
+    # Rendering to ip is known by the time the camera is filtered.
+    run_decision_stage = "filter_camera"
+
     def __init__(self, manager: PyFilterManager) -> None:
         super().__init__(manager)
 
@@ -50,8 +75,9 @@ class IpOverrides(PyFilterOperation):
         self._disable_matte = False
         self._disable_subd = False
         self._disable_tilecallback = False
-        self._res_scale = None
-        self._sample_scale = None
+        self._progressive_stage: Optional[int] = None
+        self._res_scale: Optional[float] = None
+        self._sample_scale: Optional[float] = None
         self._transparent_samples = None
 
     # -------------------------------------------------------------------------
@@ -98,6 +124,11 @@ class IpOverrides(PyFilterOperation):
         """Disable any tile callback."""
         return self._disable_tilecallback
 
+    @property
+    def progressive_stage(self) -> Optional[int]:
+        """The stage of the progressive ladder being rendered."""
+        return self._progressive_stage
+
     @property
     def res_scale(self) -> Optional[float]:
         """Amount to scale the image resolution by."""
@@ -130,6 +161,7 @@ class IpOverrides(PyFilterOperation):
         bucket_size: Optional[int] = None,
         transparent_samples: Optional[int] = None,
         disable_matte: bool = False,
+        progressive_stage: Optional[int] = None,
     ) -> str:
         """Build an argument string for this operation.
 
@@ -144,6 +176,7 @@ class IpOverrides(PyFilterOperation):
         :param bucket_size: Override the render bucket size.
         :param transparent_samples: Override the number of transparent samples.
         :param disable_matte: Whether to disable matte and phantom objects.
+        :param progressive_stage: The stage of the progressive ladder to render.
         :return: The constructed argument string.
 
         """
@@ -182,6 +215,9 @@ class IpOverrides(PyFilterOperation):
         if disable_matte:
             args.append("--ip-disable-matte")
 
+        if progressive_stage is not None:
+            args.append(f"--ip-progressive-stage={progressive_stage}")
+
         return " ".join(args)
 
     @staticmethod
@@ -250,6 +286,13 @@ class IpOverrides(PyFilterOperation):
             dest="ip_transparent_samples",
         )
 
+        parser.add_argument(
+            "--ip-progressive-stage",
+            default=None,
+            type=int,
+            dest="ip_progressive_stage",
+        )
+
     # -------------------------------------------------------------------------
     # METHODS
     # -------------------------------------------------------------------------
@@ -280,8 +323,7 @@ class IpOverrides(PyFilterOperation):
 
         # Set the blurquality values to 0 to disable blur.
         if self.disable_blur:
-            set_property("renderer:blurquality", 0)
-            set_property("renderer:rayblurquality", 0)
+            set_properties({"renderer:blurquality": 0, "renderer:rayblurquality": 0})
 
         # Set the deepresolver to have no args, thus stopping it from running.
         if self.disable_deep:
@@ -361,6 +403,15 @@ class IpOverrides(PyFilterOperation):
         if filter_args.ip_transparent_samples is not None:
             self._transparent_samples = filter_args.ip_transparent_samples
 
+        progressive_stage = getattr(filter_args, "ip_progressive_stage", None)
+
+        # The progressive ladder replaces any fixed scales.
+        if progressive_stage is not None:
+            self._progressive_stage = progressive_stage
+            self._res_scale, self._sample_scale = get_progressive_scales(
+                progressive_stage
+            )
+
     def should_run(self) -> bool:
         """Determine whether this filter should be run.
 
@@ -395,6 +446,57 @@ class IpOverrides(PyFilterOperation):
 # =============================================================================
 
 
+def _install_post_render_script(node: hou.RopNode) -> None:
+    """Set the post-render script of a node to advance the progressive ladder.
+
+    An existing post-render script is never replaced.
+
+    :param node: The node to set the script on.
+    :return:
+
+    """
+    script_parm = node.parm("postrender")
+
+    if script_parm.unexpandedString() not in ("", _POST_RENDER_SCRIPT):
+        _logger.warning(
+            "%s has a post-render script so progressive preview will not advance",
+            node.path(),
+        )
+        return
+
+    script_parm.set(_POST_RENDER_SCRIPT)
+    node.parm("lpostrender").set("python")
+
+
+def _remove_post_render_script(node: hou.RopNode) -> None:
+    """Remove the progressive ladder post-render script from a node.
+
+    Any other post-render script is left alone.
+
+    :param node: The node to remove the script from.
+    :return:
+
+    """
+    script_parm = node.parm("postrender")
+
+    if script_parm.unexpandedString() == _POST_RENDER_SCRIPT:
+        script_parm.set("")
+
+
+def _rendered_to_ip(node: hou.RopNode) -> bool:
+    """Check whether a node rendered to an interactive renderer.
+
+    :param node: The node to check.
+    :return: Whether the node rendered to an interactive renderer.
+
+    """
+    # Writing an IFD to disk does not render anything.
+    if node.evalParm("soho_outputmode"):
+        return False
+
+    return node.evalParm("vm_picture") in _INTERACTIVE_IMAGES
+
+
 def _scale_resolution(resolution: List[int], scale: float) -> List[int]:
     """Scale a resolution value.
 
@@ -420,6 +522,35 @@ def _scale_samples(samples: List[int], scale: float) -> List[int]:
 # =============================================================================
 
 
+def advance_progressive_stage(node: hou.RopNode) -> None:
+    """Advance a node to the next stage of the progressive ladder.
+
+    This is run as the node's post-render script so the next ip render uses
+    the next stage.  Renders which are not to ip leave the stage alone.  The
+    final stage is kept once it is reached.
+
+    :param node: The node to advance.
+    :return:
+
+    """
+    if not node.evalParm("enable_ip_override") or not node.evalParm("ip_progressive"):
+        return
+
+    if not _rendered_to_ip(node):
+        return
+
+    parm = node.parm("ip_progressive_stage")
+
+    stage = parm.eval()
+
+    if stage < len(PROGRESSIVE_LADDER) - 1:
+        import hou
+
+        # Advancing is a side effect of rendering so shouldn't be undoable.
+        with hou.undos.disabler():
+            parm.set(stage + 1)
+
+
 def build_arg_string_from_node(node: hou.RopNode) -> str:
     """Build an argument string from a Mantra node.
 
@@ -430,18 +561,27 @@ def build_arg_string_from_node(node: hou.RopNode) -> str:
     if not node.evalParm("enable_ip_override"):
         return ""
 
+    progressive_stage = None
     res_scale = None
+    sample_scale = None
     transparent_samples = None
 
-    if node.evalParm("ip_override_camerares"):
-        res_scale = node.evalParm("ip_res_fraction")
+    # The progressive ladder replaces the fixed scales.
+    if node.evalParm("ip_progressive"):
+        progressive_stage = node.evalParm("ip_progressive_stage")
+
+    else:
+        if node.evalParm("ip_override_camerares"):
+            res_scale = node.evalParm("ip_res_fraction")
+
+        sample_scale = node.evalParm("ip_sample_scale")
 
     if node.evalParm("ip_transparent"):
         transparent_samples = node.evalParm("ip_transparent_samples")
 
     return IpOverrides.build_arg_string(
         res_scale=res_scale,
-        sample_scale=node.evalParm("ip_sample_scale"),
+        sample_scale=sample_scale,
         disable_blur=node.evalParm("ip_disable_blur"),
         disable_aovs=node.evalParm("ip_disable_aovs"),
         disable_deep=node.evalParm("ip_disable_deep"),
@@ -451,6 +591,7 @@ def build_arg_string_from_node(node: hou.RopNode) -> str:
         bucket_size=node.evalParm("ip_bucket_size"),
         transparent_samples=transparent_samples,
         disable_matte=node.evalParm("ip_disable_matte"),
+        progressive_stage=progressive_stage,
     )
 
 
@@ -519,10 +660,43 @@ def build_pyfilter_command_from_node(node: hou.RopNode) -> str:
     return build_pyfilter_command(args.split())
 
 
+def get_progressive_scales(stage: int) -> Tuple[Optional[float], Optional[float]]:
+    """Get the resolution and pixel sample scales of a progressive stage.
+
+    Stages past the end of the ladder use the final stage.
+
+    :param stage: The stage index.
+    :return: The resolution and sample scales, or None if a value is not scaled.
+
+    """
+    stage = min(max(stage, 0), len(PROGRESSIVE_LADDER) - 1)
+
+    res_scale, sample_scale = PROGRESSIVE_LADDER[stage]
+
+    return (
+        res_scale if res_scale != 1.0 else None,
+        sample_scale if sample_scale != 1.0 else None,
+    )
+
+
+def reset_progressive_stage(node: hou.RopNode) -> None:
+    """Reset a node to the first stage of the progressive ladder.
+
+    :param node: The node to reset.
+    :return:
+
+    """
+    node.parm("ip_progressive_stage").set(0)
+
+
 def set_mantra_command(node: hou.RopNode) -> None:
     """Set the soho_pipecmd parameter to something that will render with our
     custom script and settings.
 
+    When progressive preview is enabled the post-render script is also set to
+    advance the node through the progressive ladder, unless the node already
+    has its own script.
+
     :param node: The node to set the command on.
     :return:
 
@@ -530,3 +704,25 @@ def set_mantra_command(node: hou.RopNode) -> None:
     cmd = "mantra `pythonexprs(\"__import__('houdini_toolbox.pyfilter.operations', globals(), locals(), ['ipoverrides']).ipoverrides.build_pyfilter_command_from_node(hou.pwd())\")`"  # noqa: 501
 
     node.parm("soho_pipecmd").set(cmd)
+
+    if node.evalParm("ip_progressive"):
+        _install_post_render_script(node)
+
+
+def toggle_progressive_preview(node: hou.RopNode) -> None:
+    """Update a node after progressive preview has been toggled.
+
+    The node is reset to the first stage of the progressive ladder and the
+    post-render script which advances it is installed or removed.
+
+    :param node: The node to update.
+    :return:
+
+    """
+    reset_progressive_stage(node)
+
+    if node.evalParm("ip_progressive"):
+        _install_post_render_script(node)
+
+    else:
+        _remove_post_render_script(node)
@@ -4,30 +4,361 @@
 # IMPORTS
 # =============================================================================
 
+# Future
+from __future__ import annotations
+
 # Standard Library
 import logging
+import logging.handlers
+import queue
+import time
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 
 # Houdini Toolbox
-from houdini_toolbox.pyfilter.operations.operation import PyFilterOperation
+from houdini_toolbox.pyfilter.operations.operation import (
+    DECIDE_AFTER_ARGS,
+    PyFilterOperation,
+)
+
+if TYPE_CHECKING:
+    import argparse
+
+    from houdini_toolbox.pyfilter.manager import PyFilterManager
 
 # Name the _logger 'mantra' since we're logging Mantra output.
 _logger = logging.getLogger("mantra")
 
+# The period, in seconds, rate limits are applied over.
+_RATE_LIMIT_INTERVAL = 1.0
+
 
 # =============================================================================
 # CLASSES
 # =============================================================================
 
 
-class LogOutput(PyFilterOperation):
-    """Operation to log Mantra output."""
+class MessageThrottle:
+    """Reduce the number of messages logged.
+
+    Consecutive repeats of a message are collapsed into a single count which
+    is logged when a different message arrives or the throttle is flushed.
+
+    If a rate limit is set then at most that many messages with the same
+    prefix are logged each second.  Errors are never rate limited.  The number
+    of suppressed messages is logged when the next period starts or the
+    throttle is flushed.
+
+    :param emit: The function to log messages with.
+    :param dedup: Whether to collapse repeated messages.
+    :param rate_limit: The maximum number of messages logged per prefix each second.
+
+    """
+
+    def __init__(
+        self,
+        emit: Callable[[int, str], None],
+        dedup: bool = True,
+        rate_limit: Optional[int] = None,
+    ) -> None:
+        self._dedup = dedup
+        self._emit = emit
+        self._last_emitted = False
+        self._last_level: Optional[int] = None
+        self._last_message: Optional[str] = None
+        self._last_prefix = ""
+        self._rate_limit = rate_limit
+        self._repeats = 0
+
+        # The start time, message count and suppressed message count of the
+        # current period of each prefix.
+        self._periods: Dict[str, List] = {}
+
+    # -------------------------------------------------------------------------
+    # SPECIAL METHODS
+    # -------------------------------------------------------------------------
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}: dedup={self._dedup}, "
+            f"rate_limit={self._rate_limit}>"
+        )
+
+    # -------------------------------------------------------------------------
+    # NON-PUBLIC METHODS
+    # -------------------------------------------------------------------------
+
+    def _check_rate(self, prefix: str) -> bool:
+        """Check whether a message with a prefix is within the rate limit.
+
+        :param prefix: The message prefix.
+        :return: Whether the message can be logged.
+
+        """
+        now = time.monotonic()
+
+        period = self._periods.get(prefix)
+
+        if period is None or now - period[0] >= _RATE_LIMIT_INTERVAL:
+            if period is not None:
+                self._emit_suppressed(prefix, period[2])
+
+            self._periods[prefix] = [now, 1, 0]
+
+            return True
+
+        if period[1] < self._rate_limit:  # type: ignore
+            period[1] += 1
+
+            return True
+
+        period[2] += 1
+
+        return False
+
+    def _emit_suppressed(self, prefix: str, count: int) -> None:
+        """Log the number of suppressed messages with a prefix.
+
+        :param prefix: The message prefix.
+        :param count: The number of suppressed messages.
+        :return:
+
+        """
+        if count:
+            self._emit(
+                logging.WARNING,
+                f"Suppressed {count} messages with prefix '{prefix}'",
+            )
+
+    def _flush_repeats(self) -> None:
+        """Log the number of times the last message was repeated.
+
+        Repeats of a message which was suppressed are counted as suppressed.
+
+        :return:
+
+        """
+        repeats = self._repeats
+
+        if not repeats:
+            return
+
+        self._repeats = 0
+
+        if self._last_emitted:
+            self._emit(
+                self._last_level,  # type: ignore
+                f"Message '{self._last_message}' repeated {repeats} times",
+            )
+
+        else:
+            self._periods[self._last_prefix][2] += repeats
+
+    # -------------------------------------------------------------------------
+    # PROPERTIES
+    # -------------------------------------------------------------------------
+
+    @property
+    def dedup(self) -> bool:
+        """Whether repeated messages are collapsed."""
+        return self._dedup
+
+    @property
+    def rate_limit(self) -> Optional[int]:
+        """The maximum number of messages logged per prefix each second."""
+        return self._rate_limit
 
     # -------------------------------------------------------------------------
     # METHODS
     # -------------------------------------------------------------------------
 
+    def flush(self) -> None:
+        """Log any pending repeat and suppressed message counts.
+
+        :return:
+
+        """
+        self._flush_repeats()
+
+        for prefix, period in self._periods.items():
+            self._emit_suppressed(prefix, period[2])
+
+        self._periods.clear()
+
+        self._last_level = None
+        self._last_message = None
+
+    def process(self, level: int, message: str, prefix: str) -> None:
+        """Process a message, logging it unless it is throttled.
+
+        :param level: The logging level of the message.
+        :param message: The message.
+        :param prefix: The message prefix.
+        :return:
+
+        """
+        if self._dedup:
+            if message == self._last_message and level == self._last_level:
+                self._repeats += 1
+                return
+
+            self._flush_repeats()
+
+            self._last_level = level
+            self._last_message = message
+            self._last_prefix = prefix
+
+        if (
+            self._rate_limit is not None
+            and level != logging.ERROR
+            and not self._check_rate(prefix)
+        ):
+            self._last_emitted = False
+            return
+
+        self._last_emitted = True
+        self._emit(level, message)
+
+
+class LogOutput(PyFilterOperation):
+    """Operation to log Mantra output.
+
+    By default every line is logged as it is received.  Passing --log-queue
+    hands the records to a listener thread which writes them to the 'mantra'
+    logger's handlers, and --log-dedup and --log-rate-limit reduce the number
+    of lines logged.  Any queued or pending messages are flushed at the quit
+    stage.
+
+    :param manager: The manager this operation is registered with.
+
+    """
+
+    # Whether to run only depends on the args.
+    run_decision_stage = DECIDE_AFTER_ARGS
+
+    def __init__(self, manager: PyFilterManager) -> None:
+        super().__init__(manager)
+
+        self._handlers: List[logging.Handler] = []
+        self._listener: Optional[logging.handlers.QueueListener] = None
+        self._throttle: Optional[MessageThrottle] = None
+
+    # -------------------------------------------------------------------------
+    # NON-PUBLIC METHODS
+    # -------------------------------------------------------------------------
+
+    def _start_listener(self) -> None:
+        """Replace the 'mantra' logger's handlers with a queue handler and
+        start a thread to pass the queued records to them.
+
+        :return:
+
+        """
+        handlers = list(_logger.handlers)
+
+        # With no handlers there is nothing to pass records on to.
+        if not handlers:
+            return
+
+        record_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+        self._handlers = handlers
+        self._listener = logging.handlers.QueueListener(
+            record_queue, *handlers, respect_handler_level=True
+        )
+
+        for handler in handlers:
+            _logger.removeHandler(handler)
+
+        _logger.addHandler(logging.handlers.QueueHandler(record_queue))
+
+        self._listener.start()
+
+    def _stop_listener(self) -> None:
+        """Log any queued records and restore the 'mantra' logger's handlers.
+
+        :return:
+
+        """
+        if self._listener is None:
+            return
+
+        for handler in list(_logger.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                _logger.removeHandler(handler)
+
+        # Stopping the listener waits for all the queued records to be handled.
+        self._listener.stop()
+        self._listener = None
+
+        for handler in self._handlers:
+            _logger.addHandler(handler)
+
+        self._handlers = []
+
+    # -------------------------------------------------------------------------
+    # PROPERTIES
+    # -------------------------------------------------------------------------
+
+    @property
+    def listener(self) -> Optional[logging.handlers.QueueListener]:
+        """The listener handling queued records, if queuing."""
+        return self._listener
+
+    @property
+    def throttle(self) -> Optional[MessageThrottle]:
+        """The throttle reducing the number of messages logged, if any."""
+        return self._throttle
+
+    # -------------------------------------------------------------------------
+    # STATIC METHODS
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def build_arg_string(  # pylint: disable=arguments-differ
+        log_queue: bool = False,
+        log_dedup: bool = False,
+        log_rate_limit: Optional[int] = None,
+    ) -> str:
+        """Build an argument string for this operation.
+
+        :param log_queue: Whether to log messages on a separate thread.
+        :param log_dedup: Whether to collapse repeated messages.
+        :param log_rate_limit: The maximum number of messages logged per prefix each second.
+        :return: The constructed argument string.
+
+        """
+        args = []
+
+        if log_queue:
+            args.append("--log-queue")
+
+        if log_dedup:
+            args.append("--log-dedup")
+
+        if log_rate_limit is not None:
+            args.append(f"--log-rate-limit={log_rate_limit}")
+
+        return " ".join(args)
+
     @staticmethod
-    def filter_error(level: int, message: str, prefix: str) -> bool:
+    def register_parser_args(parser: argparse.ArgumentParser) -> None:
+        """Register interested parser args for this operation.
+
+        :param parser: The argument parser to attach arguments to.
+        :return:
+
+        """
+        parser.add_argument("--log-queue", action="store_true", dest="log_queue")
+
+        parser.add_argument("--log-dedup", action="store_true", dest="log_dedup")
+
+        parser.add_argument("--log-rate-limit", type=int, dest="log_rate_limit")
+
+    # -------------------------------------------------------------------------
+    # METHODS
+    # -------------------------------------------------------------------------
+
+    def filter_error(self, level: int, message: str, prefix: str) -> bool:
         """Handle message outputting.
 
         :param level: The output level.
@@ -39,6 +370,16 @@ class LogOutput(PyFilterOperation):
         # Split message by newlines so we can log each line.
         messages = message.split("\n")
 
+        throttle = self._throttle
+
+        if throttle is not None:
+            log_level = _get_log_level(level, prefix)
+
+            for msg in messages:
+                throttle.process(log_level, msg, prefix)
+
+            return True
+
         for msg in messages:
             # Verbosity of 0 is always for errors.
             if level == 0:
@@ -60,3 +401,61 @@ class LogOutput(PyFilterOperation):
         # Return True to let Mantra know that we handled message output so it
         # will not output it itself.
         return True
+
+    def filter_quit(self) -> None:
+        """Flush any pending messages and stop the listener.
+
+        :return:
+
+        """
+        if self._throttle is not None:
+            self._throttle.flush()
+
+        self._stop_listener()
+
+    def process_parsed_args(self, filter_args: argparse.Namespace) -> None:
+        """Process any parsed args that the operation may be interested in.
+
+        :param filter_args: The argparse namespace containing processed args.
+        :return:
+
+        """
+        dedup = getattr(filter_args, "log_dedup", False)
+        rate_limit = getattr(filter_args, "log_rate_limit", None)
+
+        if dedup or rate_limit is not None:
+            self._throttle = MessageThrottle(
+                _logger.log, dedup=dedup, rate_limit=rate_limit
+            )
+
+        if getattr(filter_args, "log_queue", False):
+            self._start_listener()
+
+
+# =============================================================================
+# NON-PUBLIC FUNCTIONS
+# =============================================================================
+
+
+def _get_log_level(level: int, prefix: str) -> int:
+    """Get the logging level of a Mantra message.
+
+    :param level: The output level.
+    :param prefix: Message prefix.
+    :return: The logging level.
+
+    """
+    # Verbosity of 0 is always for errors.
+    if level == 0:
+        return logging.ERROR
+
+    # Mantra also only seems to set the prefix if the message is an
+    # error/warning.
+    if prefix:
+        return logging.WARNING
+
+    # Default verbosity level so we'll call that info.
+    if level == 1:
+        return logging.INFO
+
+    return logging.DEBUG
@@ -10,7 +10,7 @@ from __future__ import annotations
 # Standard Library
 import logging
 from functools import wraps
-from typing import TYPE_CHECKING, Any, Callable, Dict, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Union
 
 if TYPE_CHECKING:
     import argparse
@@ -19,6 +19,10 @@ if TYPE_CHECKING:
 
 _logger = logging.getLogger(__name__)
 
+# Value of PyFilterOperation.run_decision_stage for operations whose
+# should_run() only depends on the parsed args.
+DECIDE_AFTER_ARGS = "process_parsed_args"
+
 
 # =============================================================================
 # CLASSES
@@ -28,10 +32,20 @@ _logger = logging.getLogger(__name__)
 class PyFilterOperation:
     """Base class of operations for PyFilter.
 
+    The manager checks should_run() before every stage function is called
+    unless the operation declares when its decision stops changing by setting
+    run_decision_stage to either the name of a stage or DECIDE_AFTER_ARGS.
+    The decision is then made once, when that stage starts or after the args
+    are processed, and reused for the rest of the render.
+
     :param manager: The manager this operation is registered with.
 
     """
 
+    # When the result of should_run() can be cached. None means it is checked
+    # on every call.
+    run_decision_stage: Optional[str] = None
+
     def __init__(self, manager: PyFilterManager) -> None:
         self._data: Dict = {}
         self._manager = manager
@@ -0,0 +1,392 @@
+"""This module contains an operation to record the properties read and set
+during a render so it can be replayed without Mantra.
+
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import json
+import logging
+import sys
+from typing import IO, TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set
+
+# Houdini Toolbox
+from houdini_toolbox.pyfilter.operations.operation import (
+    DECIDE_AFTER_ARGS,
+    PyFilterOperation,
+)
+
+if TYPE_CHECKING:
+    import argparse
+
+    from houdini_toolbox.pyfilter.manager import PyFilterManager
+
+_logger = logging.getLogger(__name__)
+
+# The version of the recording format.
+RECORDING_VERSION = 1
+
+# The flag used to enable recording.
+_RECORD_FLAG = "--record-properties"
+
+
+# =============================================================================
+# CLASSES
+# =============================================================================
+
+
+class PropertyRecorder:
+    """Record the properties read and set by each PyFilter callback.
+
+    Calls to mantra.property() and mantra.setproperty() are recorded by
+    replacing the functions on the mantra module, and callbacks are delimited
+    by wrapping the manager's run_operations_for_stage().  Properties read
+    between callbacks, such as the object names ht-pyfilter.py reads for
+    logging, belong to the next callback.
+
+    The recording is a JSON lines file.  The first line contains the filter
+    args and operations and each following line contains a callback's stage,
+    args, the first value read of each property and the properties set.
+
+    :param path: The path to write the recording to.
+    :param args: The filter args to record.
+    :param operations: The operation entries to record.
+
+    """
+
+    def __init__(self, path: str, args: List[str], operations: List[dict]) -> None:
+        self._args = args
+        self._callbacks = 0
+        self._current: Optional[dict] = None
+        self._handle: Optional[IO[str]] = None
+        self._manager: Optional[PyFilterManager] = None
+        self._mantra: Any = None
+        self._operations = operations
+        self._path = path
+        self._pending_reads: Dict[str, Any] = {}
+        self._property: Optional[Callable] = None
+        self._run_operations_for_stage: Optional[Callable] = None
+        self._set_names: Set[str] = set()
+        self._setproperty: Optional[Callable] = None
+
+    # -------------------------------------------------------------------------
+    # SPECIAL METHODS
+    # -------------------------------------------------------------------------
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self.path}>"
+
+    # -------------------------------------------------------------------------
+    # NON-PUBLIC METHODS
+    # -------------------------------------------------------------------------
+
+    def _begin_callback(self, stage_name: str, args: tuple) -> None:
+        """Start recording a callback.
+
+        :param stage_name: The name of the stage being run.
+        :param args: The args passed to the stage.
+        :return:
+
+        """
+        self._current = {
+            "stage": stage_name,
+            "args": list(args),
+            "reads": self._pending_reads,
+            "sets": [],
+        }
+
+        self._pending_reads = {}
+        self._set_names = set()
+
+    def _end_callback(self) -> None:
+        """Write the current callback.
+
+        :return:
+
+        """
+        if self._current is not None and self._handle is not None:
+            self._write(self._current)
+            self._callbacks += 1
+
+        self._current = None
+
+    def _get_property(self, name: str) -> Any:
+        """Get a property value from Mantra, recording the value.
+
+        :param name: The property name.
+        :return: The property value.
+
+        """
+        values = self._property(name)  # type: ignore
+
+        reads = self._pending_reads if self._current is None else self._current["reads"]
+
+        # Only the values before any are set in the callback are needed.
+        if name not in reads and name not in self._set_names:
+            reads[name] = list(values) if isinstance(values, tuple) else values
+
+        return values
+
+    def _run_stage(self, stage_name: str, *args: Any, **kwargs: Any) -> bool:
+        """Run the operations for a stage, recording the callback.
+
+        :param stage_name: The name of the stage to run.
+        :param args: Positional arguments passed to the stage function.
+        :param kwargs: Keyword args passed to the stage function.
+        :return: Whether or any of the stage functions returned True.
+
+        """
+        self._begin_callback(stage_name, args)
+
+        try:
+            return self._run_operations_for_stage(  # type: ignore
+                stage_name, *args, **kwargs
+            )
+
+        finally:
+            self._end_callback()
+
+            # Mantra exits after the quit stage.
+            if stage_name == "filter_quit":
+                self.stop()
+
+    def _set_property(self, name: str, value: Any) -> None:
+        """Set a property value in Mantra, recording the value.
+
+        :param name: The property name.
+        :param value: The value to set.
+        :return:
+
+        """
+        if self._current is not None:
+            self._current["sets"].append([name, value])
+            self._set_names.add(name)
+
+        self._setproperty(name, value)  # type: ignore
+
+    def _write(self, record: dict) -> None:
+        """Write a record to the recording.
+
+        :param record: The record to write.
+        :return:
+
+        """
+        self._handle.write(json.dumps(record, default=str) + "\n")  # type: ignore
+
+    # -------------------------------------------------------------------------
+    # PROPERTIES
+    # -------------------------------------------------------------------------
+
+    @property
+    def callbacks(self) -> int:
+        """The number of callbacks recorded."""
+        return self._callbacks
+
+    @property
+    def path(self) -> str:
+        """The path the recording is written to."""
+        return self._path
+
+    @property
+    def recording(self) -> bool:
+        """Whether callbacks are being recorded."""
+        return self._handle is not None
+
+    # -------------------------------------------------------------------------
+    # METHODS
+    # -------------------------------------------------------------------------
+
+    def start(self, manager: PyFilterManager) -> None:
+        """Start recording the callbacks run by a manager.
+
+        :param manager: The manager running the callbacks.
+        :return:
+
+        """
+        import mantra  # type: ignore
+
+        self._handle = open(  # pylint: disable=consider-using-with
+            self._path, "w", encoding="utf-8"
+        )
+
+        self._write(
+            {
+                "version": RECORDING_VERSION,
+                "args": self._args,
+                "operations": self._operations,
+            }
+        )
+
+        self._mantra = mantra
+        self._property = mantra.property
+        self._setproperty = mantra.setproperty
+
+        mantra.property = self._get_property
+        mantra.setproperty = self._set_property
+
+        # Shadow the manager's method so that every callback is delimited,
+        # whichever operations are run.
+        self._manager = manager
+        self._run_operations_for_stage = manager.run_operations_for_stage
+
+        manager.run_operations_for_stage = self._run_stage  # type: ignore
+
+    def stop(self) -> None:
+        """Stop recording and close the recording.
+
+        :return:
+
+        """
+        if self._handle is None:
+            return
+
+        self._mantra.property = self._property
+        self._mantra.setproperty = self._setproperty
+
+        vars(self._manager).pop("run_operations_for_stage", None)
+
+        self._handle.close()
+        self._handle = None
+
+        _logger.info("Recorded %s callbacks to %s", self._callbacks, self._path)
+
+
+class RecordProperties(PyFilterOperation):
+    """Operation to record the properties read and set by all the operations.
+
+    The recording can be replayed with houdini_toolbox.pyfilter.replay.
+
+    :param manager: The manager this operation is registered with.
+
+    """
+
+    # Whether to run only depends on the args.
+    run_decision_stage = DECIDE_AFTER_ARGS
+
+    def __init__(self, manager: PyFilterManager) -> None:
+        super().__init__(manager)
+
+        self._recorder: Optional[PropertyRecorder] = None
+
+    # -------------------------------------------------------------------------
+    # PROPERTIES
+    # -------------------------------------------------------------------------
+
+    @property
+    def recorder(self) -> Optional[PropertyRecorder]:
+        """The recorder, if recording."""
+        return self._recorder
+
+    # -------------------------------------------------------------------------
+    # STATIC METHODS
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def build_arg_string(  # pylint: disable=arguments-differ
+        record_properties: Optional[str] = None,
+    ) -> str:
+        """Build an argument string for this operation.
+
+        :param record_properties: The path to write a recording to.
+        :return: The constructed argument string.
+
+        """
+        args = []
+
+        if record_properties is not None:
+            args.append(f"{_RECORD_FLAG}={record_properties}")
+
+        return " ".join(args)
+
+    @staticmethod
+    def register_parser_args(parser: argparse.ArgumentParser) -> None:
+        """Register interested parser args for this operation.
+
+        :param parser: The argument parser to attach arguments to.
+        :return:
+
+        """
+        parser.add_argument(_RECORD_FLAG, dest="record_properties")
+
+    # -------------------------------------------------------------------------
+    # METHODS
+    # -------------------------------------------------------------------------
+
+    def process_parsed_args(self, filter_args: argparse.Namespace) -> None:
+        """Process any parsed args that the operation may be interested in.
+
+        :param filter_args: The argparse namespace containing processed args.
+        :return:
+
+        """
+        path = getattr(filter_args, "record_properties", None)
+
+        if path is None:
+            return
+
+        operations = [
+            {"module": type(operation).__module__, "class": type(operation).__name__}
+            for operation in self.manager.operations
+            if not isinstance(operation, RecordProperties)
+        ]
+
+        recorder = PropertyRecorder(path, strip_record_args(sys.argv[1:]), operations)
+
+        try:
+            recorder.start(self.manager)
+
+        except OSError:
+            _logger.warning("Could not record properties to %s", path)
+
+            return
+
+        self._recorder = recorder
+
+    def should_run(self) -> bool:
+        """Determine whether this filter should be run.
+
+        This operation will run if it is recording.
+
+        :return: Whether this operation should run.
+
+        """
+        return self._recorder is not None
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+
+
+def strip_record_args(args: List[str]) -> List[str]:
+    """Remove the recording args from a list of filter args.
+
+    :param args: The filter args.
+    :return: The args without any recording args.
+
+    """
+    stripped = []
+
+    skip_next = False
+
+    for arg in args:
+        if skip_next:
+            skip_next = False
+            continue
+
+        if arg == _RECORD_FLAG:
+            skip_next = True
+            continue
+
+        if arg.startswith(f"{_RECORD_FLAG}="):
+            continue
+
+        stripped.append(arg)
+
+    return stripped
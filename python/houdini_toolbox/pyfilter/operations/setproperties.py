@@ -0,0 +1,673 @@
+"""This module contains an operation to set properties from a file of rules."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import json
+import logging
+import os
+import re
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Pattern, Set, Tuple
+
+# Houdini Toolbox
+from houdini_toolbox.pyfilter.operations.operation import (
+    DECIDE_AFTER_ARGS,
+    PyFilterOperation,
+    log_filter_call,
+)
+from houdini_toolbox.pyfilter.property import get_property, set_properties
+
+if TYPE_CHECKING:
+    import argparse
+
+    from houdini_toolbox.pyfilter.manager import PyFilterManager
+
+_logger = logging.getLogger(__name__)
+
+# The stages rules can be matched in and the properties matched against.
+_MATCH_PROPERTIES = {
+    "fog": "object:name",
+    "instance": "object:name",
+    "light": "object:name",
+    "plane": "plane:variable",
+}
+
+# The stage of rules which are applied without matching.
+_CAMERA_STAGE = "camera"
+
+# Characters which make a name a glob pattern.
+_GLOB_CHARS = frozenset("*?[")
+
+# The prefix of the group names used to identify patterns in combined
+# expressions.
+_GROUP_PREFIX = "_ht_rule_"
+
+# The flags of a regular expression without any inline global flags.
+_DEFAULT_REGEX_FLAGS = re.compile("").flags
+
+# The maximum number of match results to cache.
+_MAX_CACHED_RESULTS = 10000
+
+# References to groups in a regular expression, which refer to the wrong
+# groups once the expression is combined with others.
+_REGEX_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+# Characters which may be repeated or made optional by the next character of a
+# regular expression.
+_REGEX_QUANTIFIERS = ("*", "+", "?", "{")
+
+# The leading literal characters of a regular expression.
+_REGEX_LITERAL_PREFIX = re.compile(r"[\w/:\-]*")
+
+# File extensions of YAML rules files.
+_YAML_EXTENSIONS = (".yaml", ".yml")
+
+
+# =============================================================================
+# CLASSES
+# =============================================================================
+
+
+class RuleMatcher:
+    """Find the properties to set for names.
+
+    Rules for plain names are stored in a dictionary.  Glob and regex patterns
+    are grouped by their literal prefix, such as "/obj/tree_" for
+    "/obj/tree_*", and compile() combines each group into a single expression.
+    Finding the properties for a name is then one dictionary lookup per
+    distinct prefix length and a regex match only for the groups whose prefix
+    matches, no matter how many rules there are.  Regular expressions which
+    can't be combined with others are matched separately.  The results of the
+    most recently matched names are cached.
+
+    Rules for the same name or pattern are merged, with later rules taking
+    precedence.  When several patterns match a name only the first one added
+    is used.  The properties of a plain name rule take precedence over those of
+    a matching pattern.
+
+    """
+
+    def __init__(self) -> None:
+        self._groups: List[Tuple[int, Dict[str, Pattern]]] = []
+        self._is_compiled = True
+        self._names: Dict[str, Dict[str, Any]] = {}
+        self._pattern_properties: List[Dict[str, Any]] = []
+        self._patterns: Dict[str, Dict[str, Any]] = {}
+        self._prefixes: Dict[str, str] = {}
+        self._results: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._separate: List[Tuple[int, str, Pattern]] = []
+        self._separate_patterns: Set[str] = set()
+
+    # -------------------------------------------------------------------------
+    # SPECIAL METHODS
+    # -------------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._names) + len(self._patterns)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {len(self)} rules>"
+
+    # -------------------------------------------------------------------------
+    # NON-PUBLIC METHODS
+    # -------------------------------------------------------------------------
+
+    def _add_pattern(
+        self, pattern: str, prefix: str, properties: dict, combine: bool = True
+    ) -> None:
+        """Add the properties of a pattern.
+
+        :param pattern: The regular expression.
+        :param prefix: The literal prefix all names matching the pattern start with.
+        :param properties: The properties to set.
+        :param combine: Whether the pattern can be combined with others.
+        :return:
+
+        """
+        self._patterns.setdefault(pattern, {}).update(properties)
+        self._prefixes.setdefault(pattern, prefix)
+
+        if not combine:
+            self._separate_patterns.add(pattern)
+
+    # -------------------------------------------------------------------------
+    # METHODS
+    # -------------------------------------------------------------------------
+
+    def add_rule(
+        self,
+        properties: Dict[str, Any],
+        name: Optional[str] = None,
+        regex: Optional[str] = None,
+    ) -> None:
+        """Add a rule.
+
+        Regular expressions must match the entire name.  Expressions using
+        global flags such as (?i), named groups or references to groups can't
+        be combined with others so are matched separately.
+
+        :param properties: The properties to set.
+        :param name: A name or glob pattern to match.
+        :param regex: A regular expression to match.
+        :return:
+
+        """
+        if (name is None) == (regex is None):
+            raise ValueError("Rules must have either a name or a regex")
+
+        if name is not None:
+            if _GLOB_CHARS.isdisjoint(name):
+                self._names.setdefault(name, {}).update(properties)
+
+            else:
+                self._add_pattern(
+                    _glob_to_regex(name), _get_glob_prefix(name), properties
+                )
+
+        else:
+            try:
+                combine = _can_combine_regex(regex)  # type: ignore
+
+            except re.error as inst:
+                raise ValueError(f"Invalid regex '{regex}': {inst}") from inst
+
+            self._add_pattern(
+                regex, _get_regex_prefix(regex), properties, combine  # type: ignore
+            )
+
+        self._is_compiled = False
+        self._results.clear()
+
+    def compile(self) -> None:
+        """Combine the patterns with the same prefix into single expressions.
+
+        :return:
+
+        """
+        grouped: Dict[int, Dict[str, List[str]]] = {}
+        separate = []
+
+        for index, (pattern, prefix) in enumerate(self._prefixes.items()):
+            if pattern in self._separate_patterns:
+                separate.append((index, prefix, re.compile(pattern)))
+                continue
+
+            patterns = grouped.setdefault(len(prefix), {}).setdefault(prefix, [])
+            patterns.append(f"(?P<{_GROUP_PREFIX}{index}>{pattern})")
+
+        self._groups = [
+            (
+                length,
+                {
+                    prefix: re.compile("|".join(patterns))
+                    for prefix, patterns in grouped[length].items()
+                },
+            )
+            for length in sorted(grouped)
+        ]
+
+        self._separate = separate
+
+        self._pattern_properties = list(self._patterns.values())
+
+        self._is_compiled = True
+        self._results.clear()
+
+    def match(self, name: str) -> Optional[Dict[str, Any]]:
+        """Find the properties to set for a name.
+
+        The returned dictionary is shared and must not be modified.
+
+        :param name: The name to match.
+        :return: The properties to set, if any rules match.
+
+        """
+        try:
+            return self._results[name]
+
+        except KeyError:
+            pass
+
+        if not self._is_compiled:
+            self.compile()
+
+        first_index = None
+
+        for length, patterns in self._groups:
+            pattern = patterns.get(name[:length])
+
+            if pattern is None:
+                continue
+
+            match = pattern.fullmatch(name)
+
+            # The outer group of each pattern is always the last one to close
+            # so it identifies which pattern matched.
+            if match is not None:
+                index = int(match.lastgroup.rpartition("_")[2])  # type: ignore
+
+                if first_index is None or index < first_index:
+                    first_index = index
+
+        # The separate patterns are in the order they were added so only the
+        # first match needs to be found, and only if it was added earlier.
+        for index, prefix, pattern in self._separate:
+            if first_index is not None and index > first_index:
+                break
+
+            if name.startswith(prefix) and pattern.fullmatch(name) is not None:
+                first_index = index
+                break
+
+        result = self._names.get(name)
+
+        if first_index is not None:
+            properties = self._pattern_properties[first_index]
+
+            result = properties if result is None else {**properties, **result}
+
+        # Discard the oldest result so the cache doesn't grow with every name.
+        if len(self._results) >= _MAX_CACHED_RESULTS:
+            del self._results[next(iter(self._results))]
+
+        self._results[name] = result
+
+        return result
+
+
+class SetProperties(PyFilterOperation):
+    """Operation to set properties from files of rules.
+
+    Rules files are JSON, or YAML if PyYAML is available, and contain a list
+    of rules, optionally under a "rules" key.  Each rule has a "stage", a
+    dictionary of "properties" to set and, except for camera rules, either a
+    "name" or "regex" to match against:
+
+        [
+            {
+                "stage": "instance",
+                "name": "/obj/tree_*",
+                "properties": {"object:phantom": true}
+            },
+            {
+                "stage": "plane",
+                "regex": "N|P",
+                "properties": {"plane:quantize": "float"}
+            }
+        ]
+
+    Instance, light and fog rules match the object name and plane rules match
+    the plane variable.
+
+    :param manager: The manager this operation is registered with.
+
+    """
+
+    # Whether to run only depends on the args.
+    run_decision_stage = DECIDE_AFTER_ARGS
+
+    def __init__(self, manager: PyFilterManager) -> None:
+        super().__init__(manager)
+
+        self._camera_properties: Dict[str, Any] = {}
+        self._matchers: Dict[str, RuleMatcher] = {}
+
+    # -------------------------------------------------------------------------
+    # NON-PUBLIC METHODS
+    # -------------------------------------------------------------------------
+
+    def _apply_matching(self, stage: str) -> None:
+        """Set the properties of any rules matching the current object or plane.
+
+        :param stage: The stage of the rules to match.
+        :return:
+
+        """
+        matcher = self._matchers.get(stage)
+
+        if matcher is None:
+            return
+
+        name = get_property(_MATCH_PROPERTIES[stage])
+
+        if not isinstance(name, str):
+            return
+
+        properties = matcher.match(name)
+
+        if properties:
+            set_properties(properties)
+
+    # -------------------------------------------------------------------------
+    # PROPERTIES
+    # -------------------------------------------------------------------------
+
+    @property
+    def camera_properties(self) -> Dict[str, Any]:
+        """The properties to set at the camera stage."""
+        return self._camera_properties
+
+    @property
+    def matchers(self) -> Dict[str, RuleMatcher]:
+        """The rule matchers of each stage."""
+        return self._matchers
+
+    # -------------------------------------------------------------------------
+    # STATIC METHODS
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def build_arg_string(  # pylint: disable=arguments-differ
+        set_properties_file: Optional[str] = None,
+    ) -> str:
+        """Build an argument string for this operation.
+
+        :param set_properties_file: The path of a rules file.
+        :return: The constructed argument string.
+
+        """
+        args = []
+
+        if set_properties_file is not None:
+            args.append(f"--set-properties-file={set_properties_file}")
+
+        return " ".join(args)
+
+    @staticmethod
+    def register_parser_args(parser: argparse.ArgumentParser) -> None:
+        """Register interested parser args for this operation.
+
+        :param parser: The argument parser to attach arguments to.
+        :return:
+
+        """
+        parser.add_argument(
+            "--set-properties-file", action="append", dest="set_properties_files"
+        )
+
+    # -------------------------------------------------------------------------
+    # METHODS
+    # -------------------------------------------------------------------------
+
+    def add_rules(self, rules: List[dict]) -> None:
+        """Add a list of rules.
+
+        The matchers are compiled by process_parsed_args(), or the first time
+        they are used.
+
+        :param rules: The rules to add.
+        :return:
+
+        """
+        for index, rule in enumerate(rules):
+            if not isinstance(rule, dict):
+                raise ValueError(f"Rule {index} is not a dictionary")
+
+            stage = rule.get("stage")
+            properties = rule.get("properties")
+
+            if not isinstance(properties, dict):
+                raise ValueError(f"Rule {index} has no properties")
+
+            if stage == _CAMERA_STAGE:
+                self._camera_properties.update(properties)
+                continue
+
+            if stage not in _MATCH_PROPERTIES:
+                raise ValueError(f"Rule {index} has invalid stage '{stage}'")
+
+            matcher = self._matchers.setdefault(stage, RuleMatcher())
+
+            try:
+                matcher.add_rule(
+                    properties, name=rule.get("name"), regex=rule.get("regex")
+                )
+
+            except ValueError as inst:
+                raise ValueError(f"Rule {index}: {inst}") from inst
+
+    @log_filter_call
+    def filter_camera(self) -> None:
+        """Apply camera properties.
+
+        :return:
+
+        """
+        if self._camera_properties:
+            set_properties(self._camera_properties)
+
+    # The per object stages are not decorated with log_filter_call as they
+    # can be run for hundreds of thousands of objects.
+
+    def filter_fog(self) -> None:
+        """Apply fog properties.
+
+        :return:
+
+        """
+        self._apply_matching("fog")
+
+    def filter_instance(self) -> None:
+        """Apply instance properties.
+
+        :return:
+
+        """
+        self._apply_matching("instance")
+
+    def filter_light(self) -> None:
+        """Apply light properties.
+
+        :return:
+
+        """
+        self._apply_matching("light")
+
+    def filter_plane(self) -> None:
+        """Apply plane properties.
+
+        :return:
+
+        """
+        self._apply_matching("plane")
+
+    def process_parsed_args(self, filter_args: argparse.Namespace) -> None:
+        """Process any parsed args that the operation may be interested in.
+
+        :param filter_args: The argparse namespace containing processed args.
+        :return:
+
+        """
+        paths = getattr(filter_args, "set_properties_files", None)
+
+        if not paths:
+            return
+
+        for path in paths:
+            _logger.debug("Loading property rules from %s", path)
+            self.add_rules(load_rules_file(path))
+
+        for matcher in self._matchers.values():
+            matcher.compile()
+
+    def should_run(self) -> bool:
+        """Determine whether this filter should be run.
+
+        This operation will run if any rules were loaded.
+
+        :return: Whether this operation should run.
+
+        """
+        return bool(self._camera_properties or self._matchers)
+
+
+# =============================================================================
+# NON-PUBLIC FUNCTIONS
+# =============================================================================
+
+
+def _can_combine_regex(regex: str) -> bool:
+    """Check whether a regular expression can be combined with others.
+
+    Combined expressions are each wrapped in a named group and joined.  Global
+    flags such as (?i) would apply to the whole joined expression, or fail to
+    compile on newer versions of Python, named groups may clash and any
+    references would refer to the wrong groups.
+
+    :param regex: The regular expression.
+    :return: Whether the expression can be combined.
+
+    """
+    compiled = re.compile(regex)
+
+    if compiled.flags != _DEFAULT_REGEX_FLAGS:
+        return False
+
+    if compiled.groupindex or (
+        compiled.groups and _REGEX_GROUP_REFERENCE.search(regex) is not None
+    ):
+        return False
+
+    try:
+        re.compile(f"(?P<{_GROUP_PREFIX}0>{regex})")
+
+    except re.error:
+        return False
+
+    return True
+
+
+def _get_glob_prefix(pattern: str) -> str:
+    """Get the literal prefix of a glob pattern.
+
+    :param pattern: The glob pattern.
+    :return: The characters before the first wildcard.
+
+    """
+    for index, char in enumerate(pattern):
+        if char in _GLOB_CHARS:
+            return pattern[:index]
+
+    return pattern
+
+
+def _get_regex_prefix(regex: str) -> str:
+    """Get a literal prefix all strings matching a regular expression start with.
+
+    This is conservative and returns an empty string for alternations.
+
+    :param regex: The regular expression.
+    :return: The literal prefix.
+
+    """
+    if "|" in regex:
+        return ""
+
+    prefix = _REGEX_LITERAL_PREFIX.match(regex).group()  # type: ignore
+
+    # The last character of the prefix is not literal if it is quantified.
+    if regex.startswith(_REGEX_QUANTIFIERS, len(prefix)):
+        prefix = prefix[:-1]
+
+    return prefix
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Convert a glob pattern to a regular expression.
+
+    Unlike fnmatch.translate() the expression contains no groups so it can be
+    combined with others.
+
+    :param pattern: The glob pattern.
+    :return: The equivalent regular expression.
+
+    """
+    parts = []
+
+    index = 0
+    length = len(pattern)
+
+    while index < length:
+        char = pattern[index]
+        index += 1
+
+        if char == "*":
+            parts.append(".*")
+
+        elif char == "?":
+            parts.append(".")
+
+        elif char == "[":
+            end = index
+
+            if end < length and pattern[end] == "!":
+                end += 1
+
+            if end < length and pattern[end] == "]":
+                end += 1
+
+            end = pattern.find("]", end)
+
+            # An unclosed bracket is a literal.
+            if end == -1:
+                parts.append(re.escape(char))
+                continue
+
+            content = pattern[index:end].replace("\\", "\\\\")
+            index = end + 1
+
+            if content.startswith("!"):
+                content = "^" + content[1:]
+
+            elif content.startswith(("^", "[")):
+                content = "\\" + content
+
+            parts.append(f"[{content}]")
+
+        else:
+            parts.append(re.escape(char))
+
+    return "".join(parts)
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+
+
+def load_rules_file(path: str) -> List[dict]:
+    """Load the rules in a rules file.
+
+    YAML files require PyYAML.
+
+    :param path: The path of the JSON or YAML file.
+    :return: The loaded rules.
+
+    """
+    with open(path, encoding="utf-8") as handle:
+        if os.path.splitext(path)[1].lower() in _YAML_EXTENSIONS:
+            try:
+                import yaml  # pylint: disable=import-outside-toplevel
+
+            except ImportError as inst:
+                raise ValueError(
+                    f"PyYAML is required to load YAML rules file {path}"
+                ) from inst
+
+            data = yaml.safe_load(handle)
+
+        else:
+            data = json.load(handle)
+
+    if isinstance(data, dict):
+        data = data.get("rules")
+
+    if not isinstance(data, list):
+        raise ValueError(f"No list of rules found in {path}")
+
+    return data
@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING, Optional
 
 # Houdini Toolbox
 from houdini_toolbox.pyfilter.operations.operation import (
+    DECIDE_AFTER_ARGS,
     PyFilterOperation,
     log_filter_call,
 )
@@ -34,6 +35,9 @@ class SetTileCallback(PyFilterOperation):
 
     """
 
+    # Whether to run only depends on the args.
+    run_decision_stage = DECIDE_AFTER_ARGS
+
     def __init__(self, manager: PyFilterManager) -> None:
         super().__init__(manager)
 
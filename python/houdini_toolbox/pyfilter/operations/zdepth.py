@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING
 
 # Houdini Toolbox
 from houdini_toolbox.pyfilter.operations.operation import (
+    DECIDE_AFTER_ARGS,
     PyFilterOperation,
     log_filter_call,
 )
@@ -40,6 +41,9 @@ class ZDepthPass(PyFilterOperation):
 
     CONST_SHADER = "opdef:/Shop/v_constant clr 0 0 0"
 
+    # Whether to run only depends on the args.
+    run_decision_stage = DECIDE_AFTER_ARGS
+
     def __init__(self, manager: PyFilterManager) -> None:
         super().__init__(manager)
 
@@ -0,0 +1,149 @@
+"""This module contains a class for profiling the time spent running PyFilter
+operations.
+
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import json
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+# =============================================================================
+# CLASSES
+# =============================================================================
+
+
+class StageProfiler:
+    """Record call counts and times of operation stage functions.
+
+    Functions are wrapped with wrap() and every call of the wrapped function
+    is timed.  Times are recorded in nanoseconds.  Functions which are never
+    called are left out of the report.
+
+    """
+
+    def __init__(self) -> None:
+        # The call count, cumulative time and maximum time of each operation
+        # and stage.
+        self._stats: Dict[Tuple[str, str], List[int]] = {}
+
+    # -------------------------------------------------------------------------
+    # SPECIAL METHODS
+    # -------------------------------------------------------------------------
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {len(self._stats)} stages>"
+
+    # -------------------------------------------------------------------------
+    # PROPERTIES
+    # -------------------------------------------------------------------------
+
+    @property
+    def stats(self) -> Dict[Tuple[str, str], Tuple[int, int, int]]:
+        """The call count, cumulative time and maximum time of each operation
+        and stage.
+
+        """
+        return {
+            key: (stats[0], stats[1], stats[2]) for key, stats in self._stats.items()
+        }
+
+    @property
+    def total_time(self) -> int:
+        """The total time, in nanoseconds, spent in all the stage functions."""
+        return sum(stats[1] for stats in self._stats.values())
+
+    # -------------------------------------------------------------------------
+    # METHODS
+    # -------------------------------------------------------------------------
+
+    def format_summary(self) -> str:
+        """Format the stats as a summary sorted by decreasing cumulative time.
+
+        :return: The formatted summary.
+
+        """
+        lines = [f"PyFilter profile: {self.total_time / 1e6:0.3f}ms"]
+
+        for entry in self.get_report()["stages"]:
+            lines.append(
+                f"\t{entry['operation']}.{entry['stage']}: {entry['calls']} calls, "
+                f"{entry['total_ms']:0.3f}ms total, {entry['max_ms']:0.3f}ms max"
+            )
+
+        return "\n".join(lines)
+
+    def get_report(self) -> dict:
+        """Get the stats as a dictionary.
+
+        Stages are sorted by decreasing cumulative time.  Stages which were
+        never called are skipped.
+
+        :return: The profile data.
+
+        """
+        stats = sorted(
+            (item for item in self._stats.items() if item[1][0]),
+            key=lambda item: (-item[1][1], item[0]),
+        )
+
+        return {
+            "total_ms": self.total_time / 1e6,
+            "stages": [
+                {
+                    "operation": operation_name,
+                    "stage": stage_name,
+                    "calls": calls,
+                    "total_ms": total / 1e6,
+                    "max_ms": maximum / 1e6,
+                }
+                for (operation_name, stage_name), (calls, total, maximum) in stats
+            ],
+        }
+
+    def wrap(self, operation_name: str, stage_name: str, func: Callable) -> Callable:
+        """Wrap a stage function so that its calls are recorded.
+
+        :param operation_name: The name of the operation the function belongs to.
+        :param stage_name: The name of the stage.
+        :param func: The stage function.
+        :return: The wrapped function.
+
+        """
+        stats = self._stats.setdefault((operation_name, stage_name), [0, 0, 0])
+
+        perf_counter_ns = time.perf_counter_ns
+
+        def _profiled(*args: Any, **kwargs: Any) -> Any:
+            start = perf_counter_ns()
+
+            try:
+                return func(*args, **kwargs)
+
+            finally:
+                elapsed = perf_counter_ns() - start
+
+                stats[0] += 1
+                stats[1] += elapsed
+
+                if elapsed > stats[2]:
+                    stats[2] = elapsed
+
+        return _profiled
+
+    def write(self, path: str) -> None:
+        """Write the stats to a JSON file.
+
+        :param path: The path to write the stats to.
+        :return:
+
+        """
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(self.get_report(), handle, indent=4)
@@ -6,15 +6,124 @@
 
 # Standard Library
 import contextlib
+import functools
 import json
 from collections.abc import Iterable
-from typing import Any, List, Optional, Union
+from typing import Any, Dict, Generator, List, Optional, Union
+
+# The property values read during the current callback, if caching.
+_CACHE_STACK: List[Dict[str, Any]] = []
+
+# Marker for missing values, such as properties which have not been cached.
+_MISSING = object()
+
+# The number of decoded strings to cache.
+_DECODE_CACHE_SIZE = 512
+
+# Characters JSON allows around values.
+_JSON_WHITESPACE = " \t\n\r"
+
+# The characters JSON arrays, numbers, objects and strings start with.
+_JSON_START_CHARS = frozenset('"-0123456789[{')
+
+# The JSON literals and the values they decode to.
+_JSON_LITERALS = {
+    "Infinity": float("inf"),
+    "NaN": float("nan"),
+    "false": False,
+    "null": None,
+    "true": True,
+}
 
 # =============================================================================
 # NON-PUBLIC FUNCTIONS
 # =============================================================================
 
 
+def _copy_container(value: Any) -> Any:
+    """Copy a decoded value, including any nested lists and dictionaries.
+
+    :param value: The value to copy.
+    :return: The copied value.
+
+    """
+    if isinstance(value, dict):
+        return {key: _copy_container(val) for key, val in value.items()}
+
+    if isinstance(value, list):
+        return [_copy_container(val) for val in value]
+
+    return value
+
+
+@functools.lru_cache(maxsize=_DECODE_CACHE_SIZE)
+def _decode_string(value: str) -> Any:
+    """Decode a single string property value.
+
+    Strings which are valid JSON are decoded, otherwise they are processed by
+    _parse_plain_string().  Results are cached as the same strings, such as
+    shader names, are often read many times.  Cached lists and dictionaries
+    must not be modified.
+
+    :param value: The value to decode.
+    :return: The decoded value.
+
+    """
+    result = _loads(value)
+
+    if result is _MISSING:
+        result = _parse_plain_string(value)
+
+    return result
+
+
+@functools.lru_cache(maxsize=_DECODE_CACHE_SIZE)
+def _loads(value: str) -> Any:
+    """Decode a JSON string.
+
+    The string is classified by its first character so strings which cannot
+    be JSON, like shader paths, are rejected without trying to parse them.
+    Results are cached so cached lists and dictionaries must not be modified.
+
+    :param value: The value to decode.
+    :return: The decoded value, or _MISSING if the value is not valid JSON.
+
+    """
+    stripped = value.strip(_JSON_WHITESPACE)
+
+    result = _JSON_LITERALS.get(stripped, _MISSING)
+
+    if result is not _MISSING or stripped[:1] not in _JSON_START_CHARS:
+        return result
+
+    try:
+        return json.loads(value)
+
+    except ValueError:
+        return _MISSING
+
+
+def _parse_plain_string(value: str) -> Union[bool, dict, str]:
+    """Process a string value which is not JSON.
+
+    Strings with more than two space separated components are converted to a
+    dictionary of pairs, otherwise string booleans are converted to booleans.
+
+    :param value: The value to parse.
+    :return: The processed value.
+
+    """
+    # Split the string.
+    value_components = value.split()
+
+    # If there are multiple values we want to build a dictionary out of pairs.
+    if len(value_components) > 2:
+        return dict(tuple(zip(*[iter(value_components)] * 2)))
+
+    # Not multiple values so perform additional processing.
+    return _parse_string_for_bool(value)
+
+
 def _parse_string_for_bool(value: str) -> Union[bool, str]:
     """Process a string value, converting string booleans to real booleans.
 
@@ -84,35 +193,43 @@ def _transform_values(values: Optional[List[Any]]) -> Any:
         value = values[0]
 
         if isinstance(value, str):
-            # Try to decode the string as a json object.
+            value = _decode_string(value)
+
+            # Containers are copied so the cached value can't be modified by
+            # the caller.
+            if isinstance(value, (dict, list)):
+                value = _copy_container(value)
+
+        return value
+
+    # The value is a multiple item list.  Try to convert all the items from
+    # json, using the values as-is if that is not possible.
+    decoded = []
+
+    for val in values:
+        if isinstance(val, str):
+            result = _loads(val)
+
+            if isinstance(result, (dict, list)):
+                result = _copy_container(result)
+
+        # json can also decode bytes.
+        elif isinstance(val, (bytes, bytearray)):
             try:
-                value = json.loads(value)
+                result = json.loads(val)
 
-            # It can't be converted to an object so we'll process it manually.
             except ValueError:
-                # Split the string.
-                value_components = value.split()
+                result = _MISSING
 
-                # If there are multiple values we want to build a
-                # dictionary out of pairs.
-                if len(value_components) > 2:
-                    value = dict(tuple(zip(*[iter(value_components)] * 2)))
+        else:
+            result = _MISSING
 
-                # Not multiple values so perform additional processing.
-                else:
-                    value = _parse_string_for_bool(value)
+        if result is _MISSING:
+            return values
 
-    # The value is a multiple item list.
-    else:
-        # Try to convert all the items to json.
-        try:
-            value = [json.loads(val) for val in values]
+        decoded.append(result)
 
-        # If that is not possible, use the values as-is.
-        except (TypeError, ValueError):
-            value = values
-
-    return value
+    return decoded
 
 
 # =============================================================================
@@ -120,6 +237,28 @@ def _transform_values(values: Optional[List[Any]]) -> Any:
 # =============================================================================
 
 
+@contextlib.contextmanager
+def cache_properties() -> Generator[None, None, None]:
+    """Context manager to cache property values read with get_property().
+
+    Any values read inside the block are only read from Mantra once.  Setting
+    a property removes it from the cache and the cache is discarded when the
+    outermost block exits.  Cached values are shared between readers so should
+    not be modified.
+
+    :return:
+
+    """
+    # Nested blocks share the cache of the outer block.
+    _CACHE_STACK.append(_CACHE_STACK[-1] if _CACHE_STACK else {})
+
+    try:
+        yield
+
+    finally:
+        _CACHE_STACK.pop()
+
+
 def get_property(name: str) -> Any:
     """Get a property value.
 
@@ -127,11 +266,24 @@ def get_property(name: str) -> Any:
     :return: The value.
 
     """
+    if _CACHE_STACK:
+        cache = _CACHE_STACK[-1]
+
+        value = cache.get(name, _MISSING)
+
+        if value is not _MISSING:
+            return value
+
     import mantra  # type: ignore
 
     values = mantra.property(name)
 
-    return _transform_values(values)
+    value = _transform_values(values)
+
+    if _CACHE_STACK:
+        cache[name] = value
+
+    return value
 
 
 def set_property(name: str, value: Any) -> None:
@@ -147,3 +299,27 @@ def set_property(name: str, value: Any) -> None:
     value = _prep_value_to_set(value)
 
     mantra.setproperty(name, value)
+
+    if _CACHE_STACK:
+        _CACHE_STACK[-1].pop(name, None)
+
+
+def set_properties(values: Dict[str, Any]) -> None:
+    """Set multiple property values.
+
+    :param values: The property names and values to set.
+    :return:
+
+    """
+    import mantra  # type: ignore
+
+    prepared = [(name, _prep_value_to_set(value)) for name, value in values.items()]
+
+    for name, value in prepared:
+        mantra.setproperty(name, value)
+
+    if _CACHE_STACK:
+        cache = _CACHE_STACK[-1]
+
+        for name, _ in prepared:
+            cache.pop(name, None)
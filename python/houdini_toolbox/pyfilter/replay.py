@@ -0,0 +1,401 @@
+"""This module contains functions to replay recorded PyFilter callbacks
+against a PyFilterManager without running Mantra.
+
+Recordings are made by passing --record-properties=<path> to PyFilter.  A
+recording can be replayed from the command line:
+
+    python -m houdini_toolbox.pyfilter.replay recording.jsonl --repeat 5
+
+Different args and operations can be used to test other operations against
+the same scene:
+
+    python -m houdini_toolbox.pyfilter.replay recording.jsonl --args="--zdepth" \\
+        --operation=houdini_toolbox.pyfilter.operations.zdepth:ZDepthPass
+
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import argparse
+import collections
+import contextlib
+import json
+import shlex
+import sys
+import time
+from typing import Any, Dict, Generator, List, Optional, Tuple, Union
+
+# Houdini Toolbox
+from houdini_toolbox.pyfilter.manager import PyFilterManager
+from houdini_toolbox.pyfilter.operations.recordproperties import (
+    RECORDING_VERSION,
+    strip_record_args,
+)
+
+# =============================================================================
+# CLASSES
+# =============================================================================
+
+
+class ReplayMantra:
+    """Stand-in for the mantra module which serves recorded property values.
+
+    Property values persist between callbacks so values read in one callback
+    are available to operations which only read them in another.
+
+    """
+
+    def __init__(self) -> None:
+        self._sets: List[list] = []
+        self._values: Dict[str, Any] = {}
+
+    # -------------------------------------------------------------------------
+    # SPECIAL METHODS
+    # -------------------------------------------------------------------------
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {len(self._values)} properties>"
+
+    # -------------------------------------------------------------------------
+    # PROPERTIES
+    # -------------------------------------------------------------------------
+
+    @property
+    def sets(self) -> List[list]:
+        """The properties set during the current callback."""
+        return self._sets
+
+    # -------------------------------------------------------------------------
+    # METHODS
+    # -------------------------------------------------------------------------
+
+    def begin_callback(self, reads: Dict[str, Any]) -> None:
+        """Start a callback.
+
+        :param reads: The property values read during the recorded callback.
+        :return:
+
+        """
+        self._values.update(reads)
+        self._sets = []
+
+    def property(self, name: str) -> Any:
+        """Get a property value.
+
+        :param name: The property name.
+        :return: The property value, or None if it was never recorded or set.
+
+        """
+        return self._values.get(name)
+
+    def setproperty(self, name: str, value: Any) -> None:
+        """Set a property value.
+
+        :param name: The property name.
+        :param value: The value to set.
+        :return:
+
+        """
+        self._values[name] = value
+        self._sets.append([name, value])
+
+
+class ReplayResult:
+    """The result of replaying a recording.
+
+    :param callbacks: The number of callbacks replayed.
+    :param elapsed: The time, in seconds, spent running the callbacks.
+    :param mismatches: The number of callbacks which set different properties than were recorded.
+    :param stage_counts: The number of callbacks replayed for each stage.
+
+    """
+
+    def __init__(
+        self,
+        callbacks: int,
+        elapsed: float,
+        mismatches: int,
+        stage_counts: Dict[str, int],
+    ) -> None:
+        self._callbacks = callbacks
+        self._elapsed = elapsed
+        self._mismatches = mismatches
+        self._stage_counts = stage_counts
+
+    # -------------------------------------------------------------------------
+    # SPECIAL METHODS
+    # -------------------------------------------------------------------------
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}: {self.callbacks} callbacks, "
+            f"{self.callbacks_per_second:0.0f}/s>"
+        )
+
+    # -------------------------------------------------------------------------
+    # PROPERTIES
+    # -------------------------------------------------------------------------
+
+    @property
+    def callbacks(self) -> int:
+        """The number of callbacks replayed."""
+        return self._callbacks
+
+    @property
+    def callbacks_per_second(self) -> float:
+        """The number of callbacks run per second."""
+        if not self._elapsed:
+            return 0.0
+
+        return self._callbacks / self._elapsed
+
+    @property
+    def elapsed(self) -> float:
+        """The time, in seconds, spent running the callbacks."""
+        return self._elapsed
+
+    @property
+    def mismatches(self) -> int:
+        """The number of callbacks which set different properties than were
+        recorded.
+
+        """
+        return self._mismatches
+
+    @property
+    def stage_counts(self) -> Dict[str, int]:
+        """The number of callbacks replayed for each stage."""
+        return self._stage_counts
+
+    # -------------------------------------------------------------------------
+    # METHODS
+    # -------------------------------------------------------------------------
+
+    def format_summary(self) -> str:
+        """Format the result as a summary.
+
+        :return: The formatted summary.
+
+        """
+        lines = [
+            f"Replayed {self.callbacks} callbacks in {self.elapsed * 1000:0.3f}ms "
+            f"({self.callbacks_per_second:0.0f} callbacks/s)",
+            f"Callbacks setting different properties: {self.mismatches}",
+        ]
+
+        for stage_name, count in sorted(self.stage_counts.items()):
+            lines.append(f"\t{stage_name}: {count}")
+
+        return "\n".join(lines)
+
+
+# =============================================================================
+# NON-PUBLIC FUNCTIONS
+# =============================================================================
+
+
+def _build_manager(
+    args: List[str], operations: List[Union[dict, List[str]]]
+) -> PyFilterManager:
+    """Build a manager as if PyFilter was run with the args.
+
+    :param args: The filter args.
+    :param operations: The operation entries to register.
+    :return: The built manager.
+
+    """
+    argv = sys.argv
+
+    sys.argv = [argv[0] if argv else "ht-pyfilter.py"] + args
+
+    try:
+        return PyFilterManager(operation_entries=operations)
+
+    finally:
+        sys.argv = argv
+
+
+@contextlib.contextmanager
+def _install_mantra(stand_in: ReplayMantra) -> Generator[None, None, None]:
+    """Context manager to install a stand-in as the mantra module.
+
+    :param stand_in: The stand-in module.
+    :return:
+
+    """
+    original = sys.modules.get("mantra")
+
+    sys.modules["mantra"] = stand_in  # type: ignore
+
+    try:
+        yield
+
+    finally:
+        if original is None:
+            del sys.modules["mantra"]
+
+        else:
+            sys.modules["mantra"] = original
+
+
+def _normalize(value: Any) -> Any:
+    """Normalize a value so recorded and replayed values can be compared.
+
+    :param value: The value to normalize.
+    :return: The value as it would be read from a recording.
+
+    """
+    return json.loads(json.dumps(value, default=str))
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+
+
+def load_recording(path: str) -> Tuple[dict, List[dict]]:
+    """Load a recording.
+
+    :param path: The path of the recording.
+    :return: The recording header and callbacks.
+
+    """
+    with open(path, encoding="utf-8") as handle:
+        header = json.loads(handle.readline())
+
+        if header.get("version") != RECORDING_VERSION:
+            raise ValueError(f"Unsupported recording version in {path}")
+
+        callbacks = [json.loads(line) for line in handle if line.strip()]
+
+    return header, callbacks
+
+
+def replay_recording(
+    header: dict,
+    callbacks: List[dict],
+    args: Optional[List[str]] = None,
+    operations: Optional[List[Union[dict, List[str]]]] = None,
+    repeat: int = 1,
+) -> ReplayResult:
+    """Replay recorded callbacks against a PyFilterManager.
+
+    A new manager is built for each repeat and only the time spent running
+    the callbacks is measured.  The properties set during the first repeat are
+    compared to those recorded, which is only meaningful when replaying with
+    the recorded args and operations.
+
+    :param header: The recording header.
+    :param callbacks: The recorded callbacks.
+    :param args: Optional filter args to use instead of the recorded args.
+    :param operations: Optional operation entries to use instead of the recorded operations.
+    :param repeat: The number of times to replay the callbacks.
+    :return: The replay result.
+
+    """
+    if args is None:
+        args = header["args"]
+
+    if operations is None:
+        operations = header["operations"]
+
+    args = strip_record_args(args)
+
+    stand_in = ReplayMantra()
+
+    elapsed = 0.0
+    replayed_sets: List[List[list]] = []
+
+    with _install_mantra(stand_in):
+        for index in range(repeat):
+            manager = _build_manager(args, operations)
+            run = manager.run_operations_for_stage
+
+            sets: List[List[list]] = []
+
+            start = time.perf_counter()
+
+            for callback in callbacks:
+                stand_in.begin_callback(callback["reads"])
+                run(callback["stage"], *callback["args"])
+                sets.append(stand_in.sets)
+
+            elapsed += time.perf_counter() - start
+
+            if not index:
+                replayed_sets = sets
+
+    mismatches = sum(
+        _normalize(replayed) != callback["sets"]
+        for replayed, callback in zip(replayed_sets, callbacks)
+    )
+
+    stage_counts = collections.Counter(callback["stage"] for callback in callbacks)
+
+    return ReplayResult(
+        callbacks=len(callbacks) * repeat,
+        elapsed=elapsed,
+        mismatches=mismatches,
+        stage_counts={name: count * repeat for name, count in stage_counts.items()},
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Replay a recording from the command line and print the result.
+
+    :param argv: Optional command line args to use instead of sys.argv.
+    :return:
+
+    """
+    parser = argparse.ArgumentParser(description="Replay a PyFilter recording.")
+    parser.add_argument("recording", help="The path of the recording.")
+    parser.add_argument(
+        "--args", dest="filter_args", help="Filter args to replace the recorded args."
+    )
+    parser.add_argument(
+        "--operation",
+        action="append",
+        dest="operations",
+        help="An operation to register, as module:Class, instead of the recorded operations.",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="The number of times to replay."
+    )
+
+    parsed = parser.parse_args(argv)
+
+    header, callbacks = load_recording(parsed.recording)
+
+    filter_args = (
+        shlex.split(parsed.filter_args) if parsed.filter_args is not None else None
+    )
+
+    operations: Optional[List[Union[dict, List[str]]]] = None
+
+    if parsed.operations is not None:
+        operations = [
+            dict(zip(("module", "class"), operation.split(":", 1)))
+            for operation in parsed.operations
+        ]
+
+    result = replay_recording(
+        header,
+        callbacks,
+        args=filter_args,
+        operations=operations,
+        repeat=parsed.repeat,
+    )
+
+    print(result.format_summary())
+
+
+# =============================================================================
+
+if __name__ == "__main__":
+    main()
@@ -30,6 +30,9 @@ if TYPE_CHECKING:
 
     import soho  # type: ignore
 
+# The AOV manager, which is built when first requested by get_aov_manager().
+_AOV_MANAGER: Optional[AOVManager] = None
+
 
 # =============================================================================
 # CLASSES
@@ -639,6 +642,21 @@ def _get_aov_path_folders() -> Tuple[str, ...]:
 # =============================================================================
 
 
+def add_aovs_to_ifd(wrangler: Any, cam: soho.SohoObject, now: float) -> None:
+    """Add auto_aovs to the ifd using the AOV manager.
+
+    This can be registered as a soho hook without building the manager until
+    it is actually needed.
+
+    :param wrangler: A SOHO wrangler.
+    :param cam: A SOHO camera.
+    :param now: The evaluation time.
+    :return:
+
+    """
+    get_aov_manager().add_aovs_to_ifd(wrangler, cam, now)
+
+
 def build_menu_script() -> Tuple[str, ...]:
     """Build a menu script for choosing AOVs and groups.
 
@@ -647,13 +665,15 @@ def build_menu_script() -> Tuple[str, ...]:
     """
     menu = []
 
-    if AOV_MANAGER.groups:
-        for group in sorted(AOV_MANAGER.groups.keys()):
+    manager = get_aov_manager()
+
+    if manager.groups:
+        for group in sorted(manager.groups.keys()):
             menu.extend([f"@{group}", group])
 
         menu.extend(["_separator_", ""])
 
-    for aov in sorted(AOV_MANAGER.aovs.keys()):
+    for aov in sorted(manager.aovs.keys()):
         menu.extend([aov, aov])
 
     return tuple(menu)
@@ -678,6 +698,23 @@ def flatten_aov_items(items: Tuple[Union[AOV, AOVGroup], ...]) -> Tuple[AOV, ...
     return tuple(aovs)
 
 
+def get_aov_manager() -> AOVManager:
+    """Get the AOV manager.
+
+    The manager is only built the first time it is needed since building it
+    requires finding and parsing all the AOV files.
+
+    :return: The AOV manager.
+
+    """
+    global _AOV_MANAGER  # pylint: disable=global-statement
+
+    if _AOV_MANAGER is None:
+        _AOV_MANAGER = AOVManager()
+
+    return _AOV_MANAGER
+
+
 def load_json_files() -> None:
     """Load .json files into the manager.
 
@@ -694,9 +731,4 @@ def load_json_files() -> None:
         path = os.path.expandvars(path)
 
         if os.path.exists(path):
-            AOV_MANAGER.load(path)
-
-
-# =============================================================================
-
-AOV_MANAGER = AOVManager()
+            get_aov_manager().load(path)
@@ -594,8 +594,10 @@ class AOVSelectModel(BaseAOVTreeModel):
         groups_node = FolderNode("Groups", self.root)
         aovs_node = FolderNode("AOVs", self.root)
 
-        if manager.AOV_MANAGER.groups:
-            groups = manager.AOV_MANAGER.groups
+        aov_manager = manager.get_aov_manager()
+
+        if aov_manager.groups:
+            groups = aov_manager.groups
 
             for group in list(groups.values()):
                 if isinstance(group, IntrinsicAOVGroup):
@@ -603,8 +605,8 @@ class AOVSelectModel(BaseAOVTreeModel):
                 else:
                     AOVGroupNode(group, groups_node)
 
-        if manager.AOV_MANAGER.aovs:
-            aovs = manager.AOV_MANAGER.aovs
+        if aov_manager.aovs:
+            aovs = aov_manager.aovs
 
             for aov in list(aovs.values()):
                 AOVNode(aov, aovs_node)
@@ -933,7 +935,7 @@ class AOVGroupEditListModel(QtCore.QAbstractListModel):
         super().__init__(parent)
 
         # Grab all the possible AOVs at time of creation.
-        self._aovs = list(manager.AOV_MANAGER.aovs.values())
+        self._aovs = list(manager.get_aov_manager().aovs.values())
 
         # List containing the checked state of each AOV
         self._checked = [False] * len(self._aovs)
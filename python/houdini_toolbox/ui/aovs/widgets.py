@@ -78,17 +78,19 @@ class AOVManagerWidget(QtWidgets.QWidget):
         )
 
         # Really need a signal?  Maybe just refresh everything?
-        manager.AOV_MANAGER.attach_interface(utils.AOVViewerInterface())
-        manager.AOV_MANAGER.interface.aov_added_signal.connect(
+        aov_manager = manager.get_aov_manager()
+
+        aov_manager.attach_interface(utils.AOVViewerInterface())
+        aov_manager.interface.aov_added_signal.connect(
             self.select_widget.aov_tree.insert_aov
         )
-        manager.AOV_MANAGER.interface.aov_removed_signal.connect(
+        aov_manager.interface.aov_removed_signal.connect(
             self.select_widget.aov_tree.remove_aov
         )
-        manager.AOV_MANAGER.interface.group_added_signal.connect(
+        aov_manager.interface.group_added_signal.connect(
             self.select_widget.aov_tree.insert_group
         )
-        manager.AOV_MANAGER.interface.group_removed_signal.connect(
+        aov_manager.interface.group_removed_signal.connect(
             self.select_widget.aov_tree.remove_group
         )
 
@@ -259,7 +261,7 @@ class AOVSelectTreeWidget(
                     ext = os.path.splitext(path)[-1]
 
                     if ext == ".json":
-                        manager.AOV_MANAGER.load(path)
+                        manager.get_aov_manager().load(path)
 
         # Process paths, looking for nodes.  Any file paths represented by
         # urls that were handled above will also be in this list because they
@@ -1079,7 +1081,7 @@ class AOVsToAddTreeWidget(QtWidgets.QTreeView):
                     if names:
                         value = f"{value} {' '.join(names)}"
 
-                    aovs = manager.AOV_MANAGER.get_aovs_from_string(value)
+                    aovs = manager.get_aov_manager().get_aovs_from_string(value)
 
                     if aovs:
                         new_data.extend(aovs)
@@ -1390,7 +1392,7 @@ class AOVsToAddToolBar(AOVViewerToolBar):
             if names:
                 value = f"{value} {' '.join(names)}"
 
-            items.extend(manager.AOV_MANAGER.get_aovs_from_string(value))
+            items.extend(manager.get_aov_manager().get_aovs_from_string(value))
 
         if items:
             self.install_signal.emit(items)
@@ -0,0 +1,121 @@
+"""Benchmark firing an event using the dispatch plan vs sorting on each run.
+
+Requires hou, so run from the repository root using hython:
+
+    PYTHONPATH=python hython -m tests.python.events.bench_event
+
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+# Standard Library
+import time
+
+# Houdini Toolbox
+from houdini_toolbox.events.event import HoudiniEvent
+from houdini_toolbox.events.item import HoudiniEventItem
+from houdini_toolbox.events.stats import HoudiniEventStats
+
+# =============================================================================
+# GLOBALS
+# =============================================================================
+
+# Number of times to fire the event.
+_NUMBER = 1_000_000
+
+# The priorities of the registered items.
+_PRIORITIES = (1, 5, 10, 15)
+
+
+# =============================================================================
+# NON-PUBLIC CLASSES
+# =============================================================================
+
+
+class _NoopItem(HoudiniEventItem):
+    """Item which does nothing so only the dispatching is measured."""
+
+    def run(self, scriptargs: dict) -> None:
+        """Do nothing.
+
+        :param scriptargs: Arguments passed to the event from the caller.
+        :return:
+
+        """
+
+
+# =============================================================================
+# NON-PUBLIC FUNCTIONS
+# =============================================================================
+
+
+def _run_sorted(event: HoudiniEvent, scriptargs: dict) -> None:
+    """Run an event by sorting the item priorities on each call.
+
+    This mirrors the implementation of HoudiniEvent.run() prior to the
+    introduction of the dispatch plan.
+
+    :param event: The event to run.
+    :param scriptargs: Arguments passed to the event from the caller.
+    :return:
+
+    """
+    if not event.enabled:
+        return
+
+    scriptargs["_event_"] = event
+
+    for priority in sorted(event.item_map.keys(), reverse=True):
+        for item in event.item_map[priority]:
+            item.run(scriptargs)
+
+    del scriptargs["_event_"]
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+
+
+def main() -> None:
+    """Time firing the event both ways and print the results.
+
+    :return:
+
+    """
+    # Remove the stats overhead so only the dispatching is measured.
+    HoudiniEventStats.enabled = False
+
+    event = HoudiniEvent("benchmark")
+
+    for priority in _PRIORITIES:
+        event.register_item(_NoopItem((print,), priority=priority))
+
+    scriptargs: dict = {}
+
+    start = time.perf_counter()
+
+    for _ in range(_NUMBER):
+        _run_sorted(event, scriptargs)
+
+    sorted_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+
+    for _ in range(_NUMBER):
+        event.run(scriptargs)
+
+    plan_time = time.perf_counter() - start
+
+    print(f"{'method':<10}{'total':>10}{'per run':>12}")
+    print(f"{'sorted':<10}{sorted_time:>9.3f}s{sorted_time / _NUMBER * 1e9:>10.0f}ns")
+    print(f"{'plan':<10}{plan_time:>9.3f}s{plan_time / _NUMBER * 1e9:>10.0f}ns")
+    print(f"speedup: {sorted_time / plan_time:0.1f}x")
+
+
+# =============================================================================
+
+if __name__ == "__main__":
+    main()
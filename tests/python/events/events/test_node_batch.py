@@ -0,0 +1,129 @@
+"""Tests for houdini_toolbox.events.events.node_batch module."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+# Third Party
+import pytest
+
+# Houdini Toolbox
+import houdini_toolbox.events.events.node_batch
+from houdini_toolbox.events.item import HoudiniEventItem
+from houdini_toolbox.events.manager import HoudiniEventManager
+from houdini_toolbox.events.types import HipFileEvents, NodeEvents
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+@pytest.fixture
+def init_group(mocker):
+    """Fixture to initialize an event group."""
+    mocker.patch.object(
+        houdini_toolbox.events.events.node_batch.NodeEventBatchGroup,
+        "__init__",
+        lambda x: None,
+    )
+
+    def _create():
+        return houdini_toolbox.events.events.node_batch.NodeEventBatchGroup()
+
+    return _create
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+class Test_NodeEventBatchGroup:
+    """Test houdini_toolbox.events.events.node_batch.NodeEventBatchGroup class."""
+
+    def test___init__(self, mocker):
+        """Test object initialization."""
+        mock_super_init = mocker.patch.object(
+            houdini_toolbox.events.events.node_batch.HoudiniEventGroup, "__init__"
+        )
+
+        event_map = {}
+        mocker.patch.object(
+            houdini_toolbox.events.events.node_batch.NodeEventBatchGroup,
+            "event_map",
+            event_map,
+        )
+
+        group = houdini_toolbox.events.events.node_batch.NodeEventBatchGroup()
+
+        mock_super_init.assert_called()
+
+        assert group._names == (NodeEvents.OnCreated, NodeEvents.OnLoaded)
+
+        begin_item = HoudiniEventItem((group.begin_batch,))
+        end_item = HoudiniEventItem((group.end_batch,), priority=100)
+
+        expected_map = {
+            HipFileEvents.BeforeLoad: begin_item,
+            HipFileEvents.BeforeMerge: begin_item,
+            HipFileEvents.AfterLoad: end_item,
+            HipFileEvents.AfterMerge: end_item,
+        }
+
+        assert event_map == expected_map
+
+    def test___init____names(self, mocker):
+        """Test object initialization with specific event names."""
+        mocker.patch.object(
+            houdini_toolbox.events.events.node_batch.HoudiniEventGroup, "__init__"
+        )
+        mocker.patch.object(
+            houdini_toolbox.events.events.node_batch.NodeEventBatchGroup,
+            "event_map",
+            {},
+        )
+
+        group = houdini_toolbox.events.events.node_batch.NodeEventBatchGroup(
+            [NodeEvents.OnLoaded]
+        )
+
+        assert group._names == (NodeEvents.OnLoaded,)
+
+    # Properties
+
+    def test_names(self, init_group, mocker):
+        """Test the 'names' property."""
+        mock_names = mocker.MagicMock(spec=tuple)
+
+        group = init_group()
+        group._names = mock_names
+
+        assert group.names == mock_names
+
+    # Methods
+
+    def test_begin_batch(self, init_group, mocker):
+        """Test beginning the batch."""
+        mock_names = mocker.patch.object(
+            houdini_toolbox.events.events.node_batch.NodeEventBatchGroup,
+            "names",
+            new_callable=mocker.PropertyMock,
+        )
+
+        mock_manager = mocker.MagicMock(spec=HoudiniEventManager)
+
+        group = init_group()
+
+        group.begin_batch({"_manager_": mock_manager})
+
+        mock_manager.begin_batch.assert_called_with(mock_names.return_value)
+
+    def test_end_batch(self, init_group, mocker):
+        """Test ending the batch."""
+        mock_manager = mocker.MagicMock(spec=HoudiniEventManager)
+
+        group = init_group()
+
+        group.end_batch({"_manager_": mock_manager})
+
+        mock_manager.end_batch.assert_called_once()
@@ -9,6 +9,8 @@ import pytest
 
 # Houdini Toolbox
 import houdini_toolbox.events.events.rop_render
+import houdini_toolbox.events.telemetry
+import houdini_toolbox.events.verification
 from houdini_toolbox.events.item import HoudiniEventItem
 from houdini_toolbox.events.types import RopEvents
 
@@ -46,13 +48,59 @@ def mock_logger(mocker):
 # =============================================================================
 
 
+class Test__RopRenderInfo:
+    """Test houdini_toolbox.events.events.rop_render._RopRenderInfo class."""
+
+    def test___init__(self, mocker):
+        """Test object initialization."""
+        mock_get_range = mocker.patch(
+            "houdini_toolbox.events.events.rop_render._get_frame_range"
+        )
+        mock_get_parm = mocker.patch(
+            "houdini_toolbox.events.events.rop_render._get_target_parm"
+        )
+
+        mock_node = mocker.MagicMock(spec=hou.RopNode)
+
+        info = houdini_toolbox.events.events.rop_render._RopRenderInfo(mock_node)
+
+        assert info.frame_range == mock_get_range.return_value
+        assert info.target_parm == mock_get_parm.return_value
+
+        mock_get_range.assert_called_with(mock_node)
+        mock_get_parm.assert_called_with(mock_node)
+
+    def test_get_target_file(self, mocker):
+        """Test evaluating the target file."""
+        mocker.patch("houdini_toolbox.events.events.rop_render._get_frame_range")
+        mocker.patch("houdini_toolbox.events.events.rop_render._get_target_parm")
+
+        info = houdini_toolbox.events.events.rop_render._RopRenderInfo(
+            mocker.MagicMock(spec=hou.RopNode)
+        )
+
+        assert info.get_target_file() == info.target_parm.eval.return_value
+
+        info.target_parm = None
+
+        assert info.get_target_file() is None
+
+
 class Test_RopRenderEvent:
     """Test houdini_toolbox.events.events.rop_render.RopRenderEvent class."""
 
     def test___init__(self, mocker):
         """Test object initialization."""
         mock_super_init = mocker.patch.object(
-            houdini_toolbox.events.rop_render.HoudiniEventGroup, "__init__"
+            houdini_toolbox.events.events.rop_render.HoudiniEventGroup, "__init__"
+        )
+
+        mock_get_writer = mocker.patch(
+            "houdini_toolbox.events.events.rop_render.get_telemetry_writer",
+            return_value=None,
+        )
+        mock_get_verifier = mocker.patch(
+            "houdini_toolbox.events.events.rop_render.get_output_verifier"
         )
 
         event_map = {}
@@ -68,6 +116,11 @@ class Test_RopRenderEvent:
 
         assert event._frame_start is None
         assert event._render_start is None
+        assert event._rss_sampler is None
+        assert event._telemetry is None
+        assert event._verifier == mock_get_verifier.return_value
+
+        mock_get_writer.assert_called()
 
         expected_map = {
             RopEvents.PreRender: HoudiniEventItem((event.pre_render,)),
@@ -79,12 +132,111 @@ class Test_RopRenderEvent:
 
         assert event_map == expected_map
 
+    def test___init____telemetry(self, mocker):
+        """Test object initialization when telemetry is enabled."""
+        mocker.patch.object(
+            houdini_toolbox.events.events.rop_render.HoudiniEventGroup, "__init__"
+        )
+        mock_get_writer = mocker.patch(
+            "houdini_toolbox.events.events.rop_render.get_telemetry_writer"
+        )
+        mock_sampler = mocker.patch(
+            "houdini_toolbox.events.events.rop_render.PeakRssSampler", autospec=True
+        )
+        mocker.patch("houdini_toolbox.events.events.rop_render.get_output_verifier")
+
+        mocker.patch.object(
+            houdini_toolbox.events.events.rop_render.RopRenderEvent, "event_map", {}
+        )
+
+        event = houdini_toolbox.events.events.rop_render.RopRenderEvent()
+
+        assert event._rss_sampler == mock_sampler.return_value
+        assert event._telemetry == mock_get_writer.return_value
+
+    # Non-Public Methods
+
+    def test__write_frame_telemetry(self, init_event, mocker, tmp_path):
+        """Test writing a frame telemetry record."""
+        mock_hostname = mocker.patch(
+            "houdini_toolbox.events.events.rop_render.socket.gethostname"
+        )
+        mock_getpid = mocker.patch("houdini_toolbox.events.events.rop_render.os.getpid")
+
+        path = tmp_path / "output.bgeo"
+        path.write_text("data")
+
+        mock_node = mocker.MagicMock(spec=hou.RopNode)
+
+        event = init_event()
+        event._frame_start = 10.0
+        event._rss_sampler = mocker.MagicMock(
+            spec=houdini_toolbox.events.events.rop_render.PeakRssSampler
+        )
+        event._telemetry = mocker.MagicMock(
+            spec=houdini_toolbox.events.telemetry.TelemetryWriter
+        )
+
+        scriptargs = {"frame": 3, "node": mock_node, "path": str(path), "time": 12.5}
+
+        event._write_frame_telemetry(scriptargs)
+
+        event._telemetry.write.assert_called_with(
+            {
+                "frame": 3,
+                "host": mock_hostname.return_value,
+                "node": mock_node.path.return_value,
+                "path": str(path),
+                "peak_rss": event._rss_sampler.stop.return_value,
+                "pid": mock_getpid.return_value,
+                "size": 4,
+                "start": 10.0,
+                "wall_time": 2.5,
+            }
+        )
+
+    def test__write_frame_telemetry__no_data(self, init_event, mocker):
+        """Test writing a frame telemetry record when data is unavailable."""
+        mocker.patch("houdini_toolbox.events.events.rop_render.socket.gethostname")
+        mocker.patch("houdini_toolbox.events.events.rop_render.os.getpid")
+
+        event = init_event()
+        event._frame_start = None
+        event._rss_sampler = None
+        event._telemetry = mocker.MagicMock(
+            spec=houdini_toolbox.events.telemetry.TelemetryWriter
+        )
+
+        event._write_frame_telemetry({"frame": 3, "path": "/does/not/exist"})
+
+        record = event._telemetry.write.call_args[0][0]
+
+        assert record["node"] is None
+        assert record["peak_rss"] is None
+        assert record["size"] is None
+        assert record["wall_time"] is None
+
+    def test__write_frame_telemetry__no_writer(self, init_event, mocker):
+        """Test nothing is written when there is no telemetry writer."""
+        mock_sampler = mocker.MagicMock(
+            spec=houdini_toolbox.events.telemetry.PeakRssSampler
+        )
+
+        event = init_event()
+        event._rss_sampler = mock_sampler
+        event._telemetry = None
+
+        event._write_frame_telemetry({"frame": 3})
+
+        mock_sampler.stop.assert_not_called()
+
     # pre_frame
 
     def test_pre_frame(self, init_event, mocker, mock_logger):
         """Test pre-frame action."""
         event = init_event()
         event._frame_start = None
+        event._rss_sampler = None
 
         mock_frame = mocker.MagicMock(spec=int)
         mock_time = mocker.MagicMock(spec=float)
@@ -97,11 +249,23 @@ class Test_RopRenderEvent:
 
         mock_logger.info.assert_called_with("Starting Frame: %s", mock_frame)
 
+    def test_pre_frame__telemetry(self, init_event, mocker, mock_logger):
+        """Test pre-frame action when telemetry is enabled."""
+        event = init_event()
+        event._rss_sampler = mocker.MagicMock(
+            spec=houdini_toolbox.events.events.rop_render.PeakRssSampler
+        )
+
+        event.pre_frame({"time": 1.0, "frame": 1})
+
+        event._rss_sampler.start.assert_called()
+
     # pre_render
 
     def test_pre_render__with_frame_range(self, init_event, mocker, mock_logger):
         """Test when a frame range is passed."""
         event = init_event()
+        event._verifier = None
         event._render_start = None
 
         mock_time = mocker.MagicMock(spec=float)
@@ -123,9 +287,127 @@ class Test_RopRenderEvent:
             "Starting render: %s-%s:%s", mock_start, mock_end, mock_inc
         )
 
+    def test_pre_render__node(self, init_event, mocker, mock_logger):
+        """Test the node information is cached for the render."""
+        mock_info = mocker.patch(
+            "houdini_toolbox.events.events.rop_render._RopRenderInfo"
+        )
+        cache = {}
+        mocker.patch.object(
+            houdini_toolbox.events.events.rop_render, "_RENDER_INFO_CACHE", cache
+        )
+
+        mock_node = mocker.MagicMock(spec=hou.RopNode)
+        mock_info.return_value.frame_range = None
+
+        event = init_event()
+        event._verifier = None
+
+        scriptargs = {"node": mock_node, "time": 1.0, "frame_range": None}
+
+        event.pre_render(scriptargs)
+
+        assert cache == {mock_node.sessionId.return_value: mock_info.return_value}
+
+        assert scriptargs["path"] == mock_info.return_value.get_target_file.return_value
+
+        mock_info.assert_called_with(mock_node)
+
+    def test_pre_render__node_stale(self, init_event, mocker, mock_logger):
+        """Test a stale entry left by an aborted render is replaced."""
+        mock_info = mocker.patch(
+            "houdini_toolbox.events.events.rop_render._RopRenderInfo"
+        )
+
+        mock_node = mocker.MagicMock(spec=hou.RopNode)
+        mock_stale = mocker.MagicMock()
+
+        cache = {mock_node.sessionId.return_value: mock_stale}
+        mocker.patch.object(
+            houdini_toolbox.events.events.rop_render, "_RENDER_INFO_CACHE", cache
+        )
+
+        mock_info.return_value.frame_range = (1, 10, 1)
+
+        event = init_event()
+        event._verifier = None
+
+        scriptargs = {
+            "node": mock_node,
+            "time": 1.0,
+            "frame_range": mock_stale.frame_range,
+            "path": mock_stale.get_target_file.return_value,
+        }
+
+        event.pre_render(scriptargs)
+
+        assert cache == {mock_node.sessionId.return_value: mock_info.return_value}
+
+        assert scriptargs["frame_range"] == (1, 10, 1)
+        assert scriptargs["path"] == mock_info.return_value.get_target_file.return_value
+
+        mock_logger.info.assert_called_with("Starting render: %s-%s:%s", 1, 10, 1)
+
+    def test_pre_render__node_error(self, init_event, mocker, mock_logger):
+        """Test a stale entry is removed when the information cannot be built."""
+        mocker.patch(
+            "houdini_toolbox.events.events.rop_render._RopRenderInfo",
+            side_effect=hou.OperationFailed,
+        )
+
+        mock_node = mocker.MagicMock(spec=hou.RopNode)
+
+        cache = {mock_node.sessionId.return_value: mocker.MagicMock()}
+        mocker.patch.object(
+            houdini_toolbox.events.events.rop_render, "_RENDER_INFO_CACHE", cache
+        )
+
+        event = init_event()
+        event._verifier = None
+
+        with pytest.raises(hou.OperationFailed):
+            event.pre_render({"node": mock_node, "time": 1.0, "frame_range": None})
+
+        assert cache == {}
+
+    def test_pre_render__verifier(self, init_event, mocker, mock_logger):
+        """Test files left by an aborted render are collected before the render."""
+        mock_report = mocker.patch(
+            "houdini_toolbox.events.events.rop_render._report_verification_failures"
+        )
+
+        event = init_event()
+        event._verifier = mocker.MagicMock(
+            spec=houdini_toolbox.events.verification.OutputVerifier
+        )
+        event._verifier.pending = 2
+
+        event.pre_render({"time": 1.0, "frame_range": None})
+
+        event._verifier.finish.assert_called()
+        mock_report.assert_called_with(event._verifier.finish.return_value)
+
+    def test_pre_render__verifier_empty(self, init_event, mocker, mock_logger):
+        """Test nothing is collected when no files are pending."""
+        mock_report = mocker.patch(
+            "houdini_toolbox.events.events.rop_render._report_verification_failures"
+        )
+
+        event = init_event()
+        event._verifier = mocker.MagicMock(
+            spec=houdini_toolbox.events.verification.OutputVerifier
+        )
+        event._verifier.pending = 0
+
+        event.pre_render({"time": 1.0, "frame_range": None})
+
+        event._verifier.finish.assert_not_called()
+        mock_report.assert_not_called()
+
     def test_pre_render__no_frame_range(self, init_event, mocker, mock_logger):
         """Test with no frame range."""
         event = init_event()
+        event._verifier = None
         event._render_start = None
 
         mock_time = mocker.MagicMock(spec=float)
@@ -148,6 +430,7 @@ class Test_RopRenderEvent:
 
         event = init_event()
         event._frame_start = mocker.MagicMock(spec=float)
+        event._telemetry = None
 
         mock_time = mocker.MagicMock(spec=float)
         mock_frame = mocker.MagicMock(spec=int)
@@ -173,6 +456,7 @@ class Test_RopRenderEvent:
 
         event = init_event()
         event._frame_start = None
+        event._telemetry = None
 
         mock_frame = mocker.MagicMock(spec=int)
 
@@ -184,12 +468,34 @@ class Test_RopRenderEvent:
 
         mock_logger.info.assert_called_with("Completed Frame: %s", mock_frame)
 
+    def test_post_frame__telemetry(self, init_event, mocker, mock_logger):
+        """Test post-frame action when telemetry is enabled."""
+        mocker.patch("houdini_toolbox.events.events.rop_render._print_frame_write")
+        mock_write = mocker.patch.object(
+            houdini_toolbox.events.events.rop_render.RopRenderEvent,
+            "_write_frame_telemetry",
+        )
+
+        event = init_event()
+        event._frame_start = None
+        event._telemetry = mocker.MagicMock(
+            spec=houdini_toolbox.events.telemetry.TelemetryWriter
+        )
+
+        scriptargs = {"frame": mocker.MagicMock(spec=int)}
+
+        event.post_frame(scriptargs)
+
+        mock_write.assert_called_with(scriptargs)
+
     # post_render
 
     def test_post_render__valid_start_time(self, init_event, mocker, mock_logger):
         """Test when a start time exists."""
         event = init_event()
         event._render_start = mocker.MagicMock(spec=float)
+        event._telemetry = None
+        event._verifier = None
 
         mock_time = mocker.MagicMock(spec=float)
 
@@ -205,16 +511,70 @@ class Test_RopRenderEvent:
         """Test when no start time is known."""
         event = init_event()
         event._render_start = None
+        event._telemetry = None
+        event._verifier = None
 
         event.post_render({})
 
         mock_logger.info.assert_called_with("Completed Render")
 
+    def test_post_render__node(self, init_event, mocker, mock_logger):
+        """Test the cached node information is removed after the render."""
+        mock_node = mocker.MagicMock(spec=hou.RopNode)
+        mock_info = mocker.MagicMock(
+            spec=houdini_toolbox.events.events.rop_render._RopRenderInfo
+        )
+
+        cache = {mock_node.sessionId.return_value: mock_info}
+        mocker.patch.object(
+            houdini_toolbox.events.events.rop_render, "_RENDER_INFO_CACHE", cache
+        )
+
+        event = init_event()
+        event._render_start = None
+        event._telemetry = None
+        event._verifier = None
+
+        event.post_render({"node": mock_node})
+
+        assert cache == {}
+
+    def test_post_render__telemetry(self, init_event, mocker, mock_logger):
+        """Test buffered telemetry is written when the render completes."""
+        event = init_event()
+        event._render_start = None
+        event._telemetry = mocker.MagicMock(
+            spec=houdini_toolbox.events.telemetry.TelemetryWriter
+        )
+        event._verifier = None
+
+        event.post_render({})
+
+        event._telemetry.flush.assert_called()
+
+    def test_post_render__verifier(self, init_event, mocker, mock_logger):
+        """Test verification failures are reported when the render completes."""
+        mock_report = mocker.patch(
+            "houdini_toolbox.events.events.rop_render._report_verification_failures"
+        )
+
+        event = init_event()
+        event._render_start = None
+        event._telemetry = None
+        event._verifier = mocker.MagicMock(
+            spec=houdini_toolbox.events.verification.OutputVerifier
+        )
+
+        event.post_render({})
+
+        mock_report.assert_called_with(event._verifier.finish.return_value)
+
     # post_write
 
     def test_post_write__valid_path(self, init_event, mocker, mock_logger):
         """Test when the output path is known."""
         event = init_event()
+        event._verifier = None
 
         mock_frame = mocker.MagicMock(spec=int)
         mock_path = mocker.MagicMock(spec=str)
@@ -227,6 +587,19 @@ class Test_RopRenderEvent:
             "Wrote frame %s to %s", mock_frame, mock_path
         )
 
+    def test_post_write__verifier(self, init_event, mocker, mock_logger):
+        """Test the written file is submitted for verification."""
+        event = init_event()
+        event._verifier = mocker.MagicMock(
+            spec=houdini_toolbox.events.verification.OutputVerifier
+        )
+
+        mock_frame = mocker.MagicMock(spec=int)
+
+        event.post_write({"frame": mock_frame, "path": "/path/to/file.exr"})
+
+        event._verifier.submit.assert_called_with("/path/to/file.exr", mock_frame)
+
     def test_post_write__no_path(self, init_event, mocker, mock_logger):
         """Test when the output path is unknown."""
         event = init_event()
@@ -242,41 +615,77 @@ class Test_RopRenderEvent:
         mock_logger.info.assert_called()
 
 
+class Test__get_frame_range:
+    """Test houdini_toolbox.events.events.rop_render._get_frame_range."""
+
+    def test_no_trange(self, mocker):
+        """Test where there is no 'trange' parm."""
+        mock_node = mocker.MagicMock(spec=hou.RopNode)
+        mock_node.parm.return_value = None
+
+        assert (
+            houdini_toolbox.events.events.rop_render._get_frame_range(mock_node) is None
+        )
+
+        mock_node.parm.assert_called_with("trange")
+
+    def test_trange_off(self, mocker):
+        """Test where we can't get a frame range because it is off."""
+        mock_parm = mocker.MagicMock(spec=hou.Parm)
+        mock_parm.evalAsString.return_value = "off"
+
+        mock_node = mocker.MagicMock(spec=hou.RopNode)
+        mock_node.parm.return_value = mock_parm
+
+        assert (
+            houdini_toolbox.events.events.rop_render._get_frame_range(mock_node) is None
+        )
+
+    def test_found_frame_range(self, mocker):
+        """Test where we actually get a frame range."""
+        mock_node = mocker.MagicMock(spec=hou.RopNode)
+
+        result = houdini_toolbox.events.events.rop_render._get_frame_range(mock_node)
+
+        assert result == mock_node.evalParmTuple.return_value
+
+        mock_node.evalParmTuple.assert_called_with("f")
+
+
 @pytest.mark.parametrize(
-    "type_name, return_value, expected",
+    "type_name, output_mode, expected",
     [
-        ("geometry", None, ("sopoutput",)),
-        ("rop_geometry", None, ("sopoutput",)),
-        ("alembic", None, ("filename",)),
-        ("rop_alembic", None, ("filename",)),
-        ("ifd", True, ("soho_outputmode", "soho_diskfile")),
-        ("ifd", False, ("vm_picture",)),
+        ("geometry", None, "sopoutput"),
+        ("rop_geometry", None, "sopoutput"),
+        ("alembic", None, "filename"),
+        ("rop_alembic", None, "filename"),
+        ("ifd", True, "soho_diskfile"),
+        ("ifd", False, "vm_picture"),
         (None, None, None),
     ],
 )
-def test__get_target_file(mocker, type_name, return_value, expected):
-    """Test houdini_toolbox.events.events.rop_render._get_target_file."""
+def test__get_target_parm(mocker, type_name, output_mode, expected):
+    """Test houdini_toolbox.events.events.rop_render._get_target_parm."""
     mock_type = mocker.MagicMock(spec=hou.NodeType)
     mock_type.name.return_value = type_name
 
-    mock_type = mocker.MagicMock(spec=hou.NodeType)
-    mock_type.name.return_value = type_name
-
-    mock_node = mocker.MagicMock(spec=hou.Node)
-    mock_node.evalParm.return_value = return_value
+    mock_node = mocker.MagicMock(spec=hou.RopNode)
+    mock_node.evalParm.return_value = output_mode
     mock_node.type.return_value = mock_type
 
-    result = houdini_toolbox.events.events.rop_render._get_target_file(mock_node)
+    result = houdini_toolbox.events.events.rop_render._get_target_parm(mock_node)
 
     if expected:
-        assert result == mock_node.evalParm.return_value
+        assert result == mock_node.parm.return_value
 
-        calls = [mocker.call(value) for value in expected]
-        mock_node.evalParm.assert_has_calls(calls)
+        mock_node.parm.assert_called_with(expected)
 
     else:
         assert result is None
 
+    if type_name == "ifd":
+        mock_node.evalParm.assert_called_with("soho_outputmode")
+
 
 class Test__print_frame_write:
     """Test houdini_toolbox.events.events.rop_render._print_frame_write."""
@@ -326,132 +735,119 @@ class Test__print_frame_write:
         mock_logger.info.assert_called()
 
 
-class Test_build_scriptargs:
-    """Test houdini_toolbox.events.events.rop_render.build_scriptargs."""
-
-    def test_no_args(self, mocker):
-        """Test where there all args are default."""
-        mock_time = mocker.patch("houdini_toolbox.events.events.rop_render.time.time")
-        mock_frame = mocker.patch("houdini_toolbox.events.events.rop_render.hou.frame")
-        mock_get = mocker.patch(
-            "houdini_toolbox.events.events.rop_render._get_target_file"
-        )
+class Test__report_verification_failures:
+    """Test houdini_toolbox.events.events.rop_render._report_verification_failures."""
 
-        result = houdini_toolbox.events.events.rop_render.build_scriptargs()
-
-        expected = {
-            "node": None,
-            "frame": mock_frame.return_value,
-            "frame_range": None,
-            "time": mock_time.return_value,
-        }
+    def test_no_failures(self, mock_logger):
+        """Test when there are no failures."""
+        houdini_toolbox.events.events.rop_render._report_verification_failures([])
 
-        assert result == expected
+        mock_logger.error.assert_not_called()
 
-        mock_get.assert_not_called()
+    def test_failures(self, mocker, mock_logger):
+        """Test reporting failures."""
+        failure = {"frame": 1, "path": "/path/to/file.exr", "error": "File is empty"}
 
-    def test_no_trange(self, mocker):
-        """Test where there is no 'trange' parm."""
-        mock_time = mocker.patch("houdini_toolbox.events.events.rop_render.time.time")
-        mock_frame = mocker.patch("houdini_toolbox.events.events.rop_render.hou.frame")
-        mock_get = mocker.patch(
-            "houdini_toolbox.events.events.rop_render._get_target_file"
+        houdini_toolbox.events.events.rop_render._report_verification_failures(
+            [failure]
         )
 
-        mock_node = mocker.MagicMock(spec=hou.Node)
-        mock_node.parm.return_value = None
-
-        result = houdini_toolbox.events.events.rop_render.build_scriptargs(mock_node)
-
-        expected = {
-            "node": mock_node,
-            "frame": mock_frame.return_value,
-            "frame_range": None,
-            "time": mock_time.return_value,
-            "path": mock_get.return_value,
-        }
+        mock_logger.error.assert_has_calls(
+            [
+                mocker.call(
+                    "Output verification failed for frame %s: %s (%s)",
+                    1,
+                    "/path/to/file.exr",
+                    "File is empty",
+                ),
+                mocker.call("%s output files failed verification", 1),
+            ]
+        )
 
-        assert result == expected
 
-        mock_get.assert_called_with(mock_node)
+class Test_build_scriptargs:
+    """Test houdini_toolbox.events.events.rop_render.build_scriptargs."""
 
-    def test_trange_off(self, mocker):
-        """Test where we can't get a frame range because it is off."""
+    def test_no_args(self, mocker):
+        """Test where there all args are default."""
         mock_time = mocker.patch("houdini_toolbox.events.events.rop_render.time.time")
         mock_frame = mocker.patch("houdini_toolbox.events.events.rop_render.hou.frame")
-        mock_get = mocker.patch(
-            "houdini_toolbox.events.events.rop_render._get_target_file"
+        mock_info = mocker.patch(
+            "houdini_toolbox.events.events.rop_render._RopRenderInfo"
         )
 
-        mock_parm = mocker.MagicMock(spec=hou.Parm)
-        mock_parm.evalAsString.return_value = "off"
-
-        mock_node = mocker.MagicMock(spec=hou.Node)
-        mock_node.parm.return_value = mock_parm
-
-        result = houdini_toolbox.events.events.rop_render.build_scriptargs(mock_node)
+        result = houdini_toolbox.events.events.rop_render.build_scriptargs()
 
         expected = {
-            "node": mock_node,
+            "node": None,
             "frame": mock_frame.return_value,
             "frame_range": None,
             "time": mock_time.return_value,
-            "path": mock_get.return_value,
         }
 
         assert result == expected
 
-        mock_get.assert_called_with(mock_node)
+        mock_info.assert_not_called()
 
-    def test_found_frame_range(self, mocker):
-        """Test where we actually get a frame range."""
+    def test_not_rendering(self, mocker):
+        """Test when the node information is not cached."""
         mock_time = mocker.patch("houdini_toolbox.events.events.rop_render.time.time")
         mock_frame = mocker.patch("houdini_toolbox.events.events.rop_render.hou.frame")
-        mock_get = mocker.patch(
-            "houdini_toolbox.events.events.rop_render._get_target_file"
+        mock_info = mocker.patch(
+            "houdini_toolbox.events.events.rop_render._RopRenderInfo"
+        )
+        mocker.patch.dict(
+            houdini_toolbox.events.events.rop_render._RENDER_INFO_CACHE, clear=True
         )
 
-        mock_node = mocker.MagicMock(spec=hou.Node)
+        mock_node = mocker.MagicMock(spec=hou.RopNode)
 
         result = houdini_toolbox.events.events.rop_render.build_scriptargs(mock_node)
 
         expected = {
             "node": mock_node,
             "frame": mock_frame.return_value,
-            "frame_range": mock_node.evalParmTuple.return_value,
+            "frame_range": mock_info.return_value.frame_range,
             "time": mock_time.return_value,
-            "path": mock_get.return_value,
+            "path": mock_info.return_value.get_target_file.return_value,
         }
 
         assert result == expected
 
-        mock_node.evalParmTuple.assert_called_with("f")
-        mock_get.assert_called_with(mock_node)
+        mock_info.assert_called_with(mock_node)
 
-    def test_no_path(self, mocker):
-        """Test where we actually get a frame range."""
+        # Information is only cached by the render event.
+        assert houdini_toolbox.events.events.rop_render._RENDER_INFO_CACHE == {}
+
+    def test_rendering(self, mocker):
+        """Test when the node information is cached."""
         mock_time = mocker.patch("houdini_toolbox.events.events.rop_render.time.time")
         mock_frame = mocker.patch("houdini_toolbox.events.events.rop_render.hou.frame")
-        mock_get = mocker.patch(
-            "houdini_toolbox.events.events.rop_render._get_target_file",
-            return_value=None,
+        mock_node = mocker.MagicMock(spec=hou.RopNode)
+        mock_info = mocker.MagicMock(
+            spec=houdini_toolbox.events.events.rop_render._RopRenderInfo
         )
 
-        mock_node = mocker.MagicMock(spec=hou.Node)
+        mock_info_cls = mocker.patch(
+            "houdini_toolbox.events.events.rop_render._RopRenderInfo"
+        )
 
-        mock_get.return_value = None
+        mocker.patch.dict(
+            houdini_toolbox.events.events.rop_render._RENDER_INFO_CACHE,
+            {mock_node.sessionId.return_value: mock_info},
+            clear=True,
+        )
 
         result = houdini_toolbox.events.events.rop_render.build_scriptargs(mock_node)
 
         expected = {
             "node": mock_node,
             "frame": mock_frame.return_value,
-            "frame_range": mock_node.evalParmTuple.return_value,
+            "frame_range": mock_info.frame_range,
             "time": mock_time.return_value,
-            "path": mock_get.return_value,
+            "path": mock_info.get_target_file.return_value,
         }
 
         assert result == expected
 
-        mock_node.evalParmTuple.assert_called_with("f")
-        mock_get.assert_called_with(mock_node)
+        mock_info_cls.assert_not_called()
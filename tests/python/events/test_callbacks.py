@@ -18,10 +18,12 @@ from houdini_toolbox.events import SceneEvents, callbacks
 def test_atexit_callback(mocker):
     """Test houdini_toolbox.events.callbacks._atexit_callback."""
     mock_run = mocker.patch("houdini_toolbox.events.callbacks.run_event")
+    mock_runner = mocker.patch("houdini_toolbox.events.callbacks.DEFERRED_RUNNER")
 
     callbacks._atexit_callback()
 
     mock_run.assert_called_with(SceneEvents.Exit)
+    mock_runner.shutdown.assert_called_once()
 
 
 def test_emit_ui_available(mocker):
@@ -0,0 +1,53 @@
+"""Tests for houdini_toolbox.events.context module."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+# Houdini Toolbox
+import houdini_toolbox.events.context
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+class Test_EventContext:
+    """Test houdini_toolbox.events.context.EventContext class."""
+
+    def test___init__(self, mocker):
+        """Test object initialization."""
+        mock_manager = mocker.MagicMock()
+        mock_event = mocker.MagicMock()
+        mock_item = mocker.MagicMock()
+
+        context = houdini_toolbox.events.context.EventContext(
+            mock_manager, mock_event, mock_item
+        )
+
+        assert context.event == mock_event
+        assert context.item == mock_item
+        assert context.manager == mock_manager
+
+    def test___init____defaults(self):
+        """Test object initialization with no values."""
+        context = houdini_toolbox.events.context.EventContext()
+
+        assert context.event is None
+        assert context.item is None
+        assert context.manager is None
+
+    # Methods
+
+    def test_copy(self, mocker):
+        """Test copying the context."""
+        context = houdini_toolbox.events.context.EventContext(
+            mocker.MagicMock(), mocker.MagicMock(), mocker.MagicMock()
+        )
+
+        result = context.copy()
+
+        assert result is not context
+        assert result.event == context.event
+        assert result.item == context.item
+        assert result.manager == context.manager
@@ -0,0 +1,316 @@
+"""Tests for houdini_toolbox.events.deferred module."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+# Standard Library
+import concurrent.futures
+import threading
+
+# Third Party
+import pytest
+
+# Houdini Toolbox
+import houdini_toolbox.events.deferred
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+@pytest.fixture
+def init_runner(mocker):
+    """Fixture to initialize a runner."""
+    mocker.patch.object(
+        houdini_toolbox.events.deferred.DeferredRunner, "__init__", lambda x: None
+    )
+
+    def _create():
+        return houdini_toolbox.events.deferred.DeferredRunner()
+
+    return _create
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+class Test_DeferredRunner:
+    """Test houdini_toolbox.events.deferred.DeferredRunner class."""
+
+    def test___init__(self, mocker):
+        """Test object initialization."""
+        mock_semaphore = mocker.patch(
+            "houdini_toolbox.events.deferred.threading.BoundedSemaphore"
+        )
+
+        runner = houdini_toolbox.events.deferred.DeferredRunner(4, 10)
+
+        assert runner._executor is None
+        assert runner._futures == set()
+        assert not runner._idle_queue
+        assert runner._max_workers == 4
+        assert runner._slots == mock_semaphore.return_value
+        assert isinstance(runner._worker_state, threading.local)
+
+        mock_semaphore.assert_called_with(10)
+
+    # Non-Public Methods
+
+    def test__init_worker(self, init_runner):
+        """Test marking a thread as a worker thread."""
+        runner = init_runner()
+        runner._worker_state = threading.local()
+
+        runner._init_worker()
+
+        assert runner._worker_state.is_worker
+
+    def test__on_future_done(self, init_runner, mocker):
+        """Test releasing the slot of a completed future."""
+        mock_future = mocker.MagicMock(spec=concurrent.futures.Future)
+
+        runner = init_runner()
+        runner._futures = {mock_future}
+        runner._slots = mocker.MagicMock(spec=threading.BoundedSemaphore)
+
+        runner._on_future_done(mock_future)
+
+        assert runner._futures == set()
+        runner._slots.release.assert_called_once()
+
+    def test__run_next_idle(self, init_runner, mocker):
+        """Test running the next idle callable."""
+        mock_run = mocker.patch("houdini_toolbox.events.deferred._run_callable")
+
+        mock_func1 = mocker.MagicMock()
+        mock_args1 = mocker.MagicMock(spec=dict)
+        mock_func2 = mocker.MagicMock()
+        mock_args2 = mocker.MagicMock(spec=dict)
+
+        runner = init_runner()
+        runner._idle_queue = houdini_toolbox.events.deferred.collections.deque(
+            [(mock_func1, mock_args1), (mock_func2, mock_args2)]
+        )
+
+        runner._run_next_idle()
+
+        mock_run.assert_called_once_with(mock_func1, mock_args1)
+        assert list(runner._idle_queue) == [(mock_func2, mock_args2)]
+
+    def test__run_next_idle__empty(self, init_runner, mocker):
+        """Test running the next idle callable when the queue was flushed."""
+        mock_run = mocker.patch("houdini_toolbox.events.deferred._run_callable")
+
+        runner = init_runner()
+        runner._idle_queue = houdini_toolbox.events.deferred.collections.deque()
+
+        runner._run_next_idle()
+
+        mock_run.assert_not_called()
+
+    def test__submit_to_pool(self, init_runner, mocker):
+        """Test submitting a callable to the worker threads."""
+        mock_executor_cls = mocker.patch(
+            "houdini_toolbox.events.deferred.concurrent.futures.ThreadPoolExecutor"
+        )
+        mock_executor = mock_executor_cls.return_value
+        mock_future = mock_executor.submit.return_value
+
+        mock_func = mocker.MagicMock()
+        mock_args = mocker.MagicMock(spec=dict)
+
+        runner = init_runner()
+        runner._executor = None
+        runner._futures = set()
+        runner._max_workers = 2
+        runner._slots = mocker.MagicMock(spec=threading.BoundedSemaphore)
+        runner._worker_state = threading.local()
+
+        runner._submit_to_pool(mock_func, mock_args)
+
+        runner._slots.acquire.assert_called_once()
+
+        mock_executor_cls.assert_called_with(
+            max_workers=2,
+            thread_name_prefix="houdini_toolbox",
+            initializer=runner._init_worker,
+        )
+        mock_executor.submit.assert_called_with(
+            houdini_toolbox.events.deferred._run_callable, mock_func, mock_args
+        )
+        mock_future.add_done_callback.assert_called_with(runner._on_future_done)
+
+        assert runner._executor == mock_executor
+        assert runner._futures == {mock_future}
+
+    def test__submit_to_pool__worker(self, init_runner, mocker):
+        """Test submitting a callable from a worker thread runs it immediately."""
+        mock_run = mocker.patch("houdini_toolbox.events.deferred._run_callable")
+
+        mock_func = mocker.MagicMock()
+        mock_args = mocker.MagicMock(spec=dict)
+
+        runner = init_runner()
+        runner._executor = None
+        runner._slots = mocker.MagicMock(spec=threading.BoundedSemaphore)
+        runner._worker_state = threading.local()
+        runner._worker_state.is_worker = True
+
+        runner._submit_to_pool(mock_func, mock_args)
+
+        mock_run.assert_called_once_with(mock_func, mock_args)
+
+        # The worker should never wait for a slot.
+        runner._slots.acquire.assert_not_called()
+        assert runner._executor is None
+
+    # Properties
+
+    def test_pending(self, init_runner, mocker):
+        """Test the 'pending' property."""
+        runner = init_runner()
+        runner._idle_queue = houdini_toolbox.events.deferred.collections.deque(
+            [mocker.MagicMock()]
+        )
+        runner._futures = {mocker.MagicMock(), mocker.MagicMock()}
+
+        assert runner.pending == 3
+
+    # Methods
+
+    def test_flush(self, init_runner, mocker):
+        """Test completing all pending callables."""
+        mock_wait = mocker.patch(
+            "houdini_toolbox.events.deferred.concurrent.futures.wait"
+        )
+
+        mock_func = mocker.MagicMock()
+        mock_args = mocker.MagicMock(spec=dict)
+        mock_future = mocker.MagicMock(spec=concurrent.futures.Future)
+
+        runner = init_runner()
+        runner._idle_queue = houdini_toolbox.events.deferred.collections.deque(
+            [(mock_func, mock_args)]
+        )
+        runner._futures = {mock_future}
+
+        runner.flush()
+
+        mock_func.assert_called_with(mock_args)
+        assert not runner._idle_queue
+
+        mock_wait.assert_called_with([mock_future])
+
+    def test_shutdown(self, init_runner, mocker):
+        """Test shutting down the runner."""
+        mock_flush = mocker.patch.object(
+            houdini_toolbox.events.deferred.DeferredRunner, "flush"
+        )
+
+        mock_executor = mocker.MagicMock(spec=concurrent.futures.ThreadPoolExecutor)
+
+        runner = init_runner()
+        runner._executor = mock_executor
+
+        runner.shutdown()
+
+        mock_flush.assert_called_once()
+        mock_executor.shutdown.assert_called_with(wait=True)
+
+        assert runner._executor is None
+
+    def test_submit__ui(self, init_runner, mocker, mock_hdefereval, mock_ui_available):
+        """Test submitting a callable in a graphical session."""
+        mock_submit = mocker.patch.object(
+            houdini_toolbox.events.deferred.DeferredRunner, "_submit_to_pool"
+        )
+
+        mock_func = mocker.MagicMock()
+        mock_args = mocker.MagicMock(spec=dict)
+
+        runner = init_runner()
+        runner._idle_queue = houdini_toolbox.events.deferred.collections.deque()
+
+        runner.submit(mock_func, mock_args)
+
+        assert list(runner._idle_queue) == [(mock_func, mock_args)]
+        mock_hdefereval.executeDeferred.assert_called_with(runner._run_next_idle)
+
+        mock_submit.assert_not_called()
+
+    def test_submit__no_ui(self, init_runner, mocker, mock_ui_unavailable):
+        """Test submitting a callable when there is no graphical session."""
+        mock_submit = mocker.patch.object(
+            houdini_toolbox.events.deferred.DeferredRunner, "_submit_to_pool"
+        )
+
+        mock_func = mocker.MagicMock()
+        mock_args = mocker.MagicMock(spec=dict)
+
+        runner = init_runner()
+
+        runner.submit(mock_func, mock_args)
+
+        mock_submit.assert_called_with(mock_func, mock_args)
+
+    def test_submit__pool(self, mocker, mock_ui_unavailable):
+        """Test callables are run on the worker threads."""
+        results = []
+
+        runner = houdini_toolbox.events.deferred.DeferredRunner(max_pending=2)
+
+        for value in range(5):
+            runner.submit(results.append, value)
+
+        runner.shutdown()
+
+        assert results == list(range(5))
+        assert runner.pending == 0
+
+    def test_submit__pool_nested(self, mocker, mock_ui_unavailable):
+        """Test callables submitting more callables while the pool is full."""
+        results = []
+
+        runner = houdini_toolbox.events.deferred.DeferredRunner(max_pending=1)
+
+        def _submit_more(value):
+            results.append(value)
+
+            if value < 3:
+                runner.submit(_submit_more, value + 1)
+
+        runner.submit(_submit_more, 0)
+
+        thread = threading.Thread(target=runner.shutdown, daemon=True)
+        thread.start()
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert results == [0, 1, 2, 3]
+
+
+class Test__run_callable:
+    """Test houdini_toolbox.events.deferred._run_callable."""
+
+    def test(self, mocker):
+        """Test running a callable."""
+        mock_func = mocker.MagicMock()
+        mock_args = mocker.MagicMock(spec=dict)
+
+        houdini_toolbox.events.deferred._run_callable(mock_func, mock_args)
+
+        mock_func.assert_called_with(mock_args)
+
+    def test_error(self, mocker):
+        """Test an error is logged."""
+        mock_logger = mocker.patch("houdini_toolbox.events.deferred._logger")
+
+        mock_func = mocker.MagicMock(side_effect=RuntimeError)
+        mock_args = mocker.MagicMock(spec=dict)
+
+        houdini_toolbox.events.deferred._run_callable(mock_func, mock_args)
+
+        mock_logger.exception.assert_called()
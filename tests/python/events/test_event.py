@@ -102,16 +102,141 @@ class Test_HoudiniEvent:
 
         event = houdini_toolbox.events.event.HoudiniEvent(mock_name)
 
+        assert event._batch_dispatch_plan is None
+        assert event._batch_queue is None
+        assert event._context.event == event
         assert event._data == {}
+        assert event._dispatch_plan is None
         assert event._enabled
         assert event._item_map == {}
         assert event._name == mock_name
+        assert event._needs_scriptargs_keys is None
         assert event._stats == mock_stats.return_value
 
         mock_stats.assert_called_with(mock_name)
 
+    # Non-Public Methods
+
+    def test__build_dispatch_plan(self, init_event, mocker):
+        """Test building the flattened, priority ordered dispatch plan."""
+        mock_item_map = mocker.patch.object(
+            houdini_toolbox.events.event.HoudiniEvent,
+            "item_map",
+            new_callable=mocker.PropertyMock,
+        )
+
+        mock_item1 = mocker.MagicMock(spec=houdini_toolbox.events.item.HoudiniEventItem)
+        mock_item1.time_budget = None
+        mock_item2 = mocker.MagicMock(spec=houdini_toolbox.events.item.HoudiniEventItem)
+        mock_item2.time_budget = None
+        mock_item3 = mocker.MagicMock(spec=houdini_toolbox.events.item.HoudiniEventItem)
+        mock_item3.time_budget = None
+
+        # Items which should not be run have no run method.
+        mock_item4 = mocker.MagicMock(spec=houdini_toolbox.events.item.HoudiniEventItem)
+        mock_item4.get_run_method.return_value = None
+
+        mock_item_map.return_value = {
+            0: [mock_item3],
+            15: [mock_item1, mock_item4, mock_item2],
+        }
+
+        event = init_event()
+        event._context = mocker.MagicMock(
+            spec=houdini_toolbox.events.event.EventContext
+        )
+
+        result = event._build_dispatch_plan()
+
+        assert result == (
+            mock_item1.get_run_method.return_value,
+            mock_item2.get_run_method.return_value,
+            mock_item3.get_run_method.return_value,
+        )
+
+        mock_item1.get_run_method.assert_called_with(
+            batch=False, context=event._context
+        )
+
+        event._build_dispatch_plan(batch=True)
+
+        mock_item1.get_run_method.assert_called_with(batch=True, context=event._context)
+
+    def test__build_dispatch_plan__time_budget(self, init_event, mocker):
+        """Test items with time budgets are run against their budgets."""
+        mock_item_map = mocker.patch.object(
+            houdini_toolbox.events.event.HoudiniEvent,
+            "item_map",
+            new_callable=mocker.PropertyMock,
+        )
+
+        mock_item = mocker.MagicMock(spec=houdini_toolbox.events.item.HoudiniEventItem)
+        mock_item.time_budget = 0.1
+
+        mock_item_map.return_value = {1: [mock_item]}
+
+        event = init_event()
+        event._context = mocker.MagicMock(
+            spec=houdini_toolbox.events.event.EventContext
+        )
+
+        result = event._build_dispatch_plan()
+
+        mock_args = mocker.MagicMock(spec=dict)
+
+        result[0](mock_args)
+
+        mock_item.run_against_budget.assert_called_with(
+            mock_item.get_run_method.return_value, mock_args
+        )
+
+        result = event._build_dispatch_plan(batch=True)
+
+        mock_args_list = [mock_args]
+
+        result[0](mock_args_list)
+
+        mock_item.run_batch_against_budget.assert_called_with(
+            mock_item.get_run_method.return_value, mock_args_list
+        )
+
     # Properties
 
+    def test_batch_dispatch_plan(self, init_event, mocker):
+        """Test 'batch_dispatch_plan' property."""
+        mock_build = mocker.patch.object(
+            houdini_toolbox.events.event.HoudiniEvent, "_build_dispatch_plan"
+        )
+
+        event = init_event()
+        event._batch_dispatch_plan = None
+
+        assert event.batch_dispatch_plan == mock_build.return_value
+
+        # The cached plan should be reused.
+        assert event.batch_dispatch_plan == mock_build.return_value
+
+        mock_build.assert_called_once_with(batch=True)
+
+    def test_batching(self, init_event):
+        """Test 'batching' property."""
+        event = init_event()
+        event._batch_queue = None
+
+        assert not event.batching
+
+        event._batch_queue = []
+
+        assert event.batching
+
+    def test_context(self, init_event, mocker):
+        """Test 'context' property."""
+        mock_value = mocker.MagicMock(spec=houdini_toolbox.events.event.EventContext)
+
+        event = init_event()
+        event._context = mock_value
+        assert event.context == mock_value
+
     def test_data(self, init_event, mocker):
         """Test 'data' property."""
         mock_value = mocker.MagicMock(spec=dict)
@@ -129,10 +254,33 @@ class Test_HoudiniEvent:
         event._enabled = mock_value1
         assert event.enabled == mock_value1
 
+        mock_invalidate = mocker.patch.object(
+            houdini_toolbox.events.event.HoudiniEvent, "invalidate_dispatch_plans"
+        )
+
         mock_value2 = mocker.MagicMock(spec=bool)
         event.enabled = mock_value2
         assert event.enabled == mock_value2
 
+        # Changing the enabled state invalidates the dispatch plans.
+        mock_invalidate.assert_called_once()
+
+    def test_dispatch_plan(self, init_event, mocker):
+        """Test 'dispatch_plan' property."""
+        mock_build = mocker.patch.object(
+            houdini_toolbox.events.event.HoudiniEvent, "_build_dispatch_plan"
+        )
+
+        event = init_event()
+        event._dispatch_plan = None
+
+        assert event.dispatch_plan == mock_build.return_value
+
+        # The cached plan should be reused.
+        assert event.dispatch_plan == mock_build.return_value
+
+        mock_build.assert_called_once()
+
     def test_item_map(self, init_event, mocker):
         """Test 'item_map' property."""
         mock_value = mocker.MagicMock(spec=dict)
@@ -149,6 +297,30 @@ class Test_HoudiniEvent:
         event._name = mock_value
         assert event.name == mock_value
 
+    @pytest.mark.parametrize("uses_context, expected", ((False, True), (True, False)))
+    def test_needs_scriptargs_keys(self, init_event, mocker, uses_context, expected):
+        """Test 'needs_scriptargs_keys' property."""
+        mock_item_map = mocker.patch.object(
+            houdini_toolbox.events.event.HoudiniEvent,
+            "item_map",
+            new_callable=mocker.PropertyMock,
+        )
+
+        mock_item = mocker.MagicMock(spec=houdini_toolbox.events.item.HoudiniEventItem)
+        mock_item.uses_context = uses_context
+
+        mock_item_map.return_value = {1: [mock_item]}
+
+        event = init_event()
+        event._needs_scriptargs_keys = None
+
+        assert event.needs_scriptargs_keys == expected
+
+        # The value should be cached.
+        mock_item_map.return_value = {}
+
+        assert event.needs_scriptargs_keys == expected
+
     def test_stats(self, init_event, mocker):
         """Test 'stats' property."""
         mock_stats = mocker.MagicMock(
@@ -162,6 +334,75 @@ class Test_HoudiniEvent:
 
     # Functions
 
+    # begin_batch
+
+    def test_begin_batch(self, init_event):
+        """Test beginning a batch."""
+        event = init_event()
+        event._batch_queue = None
+
+        event.begin_batch()
+
+        assert event._batch_queue == []
+
+    def test_begin_batch__existing(self, init_event, mocker):
+        """Test beginning a batch when already batching."""
+        mock_queue = [mocker.MagicMock(spec=dict)]
+
+        event = init_event()
+        event._batch_queue = mock_queue
+
+        event.begin_batch()
+
+        assert event._batch_queue is mock_queue
+
+    # end_batch
+
+    def test_end_batch__empty(self, init_event, mocker):
+        """Test ending a batch where nothing was queued."""
+        mock_run_batch = mocker.patch.object(
+            houdini_toolbox.events.event.HoudiniEvent, "run_batch"
+        )
+
+        event = init_event()
+        event._batch_queue = []
+
+        event.end_batch()
+
+        assert event._batch_queue is None
+
+        mock_run_batch.assert_not_called()
+
+    def test_end_batch(self, init_event, mocker):
+        """Test ending a batch with queued args."""
+        mock_run_batch = mocker.patch.object(
+            houdini_toolbox.events.event.HoudiniEvent, "run_batch"
+        )
+
+        mock_queue = [mocker.MagicMock(spec=dict)]
+
+        event = init_event()
+        event._batch_queue = mock_queue
+
+        event.end_batch()
+
+        assert event._batch_queue is None
+
+        mock_run_batch.assert_called_with(mock_queue)
+
+    def test_invalidate_dispatch_plans(self, init_event, mocker):
+        """Test invalidating the dispatch plans."""
+        event = init_event()
+        event._batch_dispatch_plan = mocker.MagicMock(spec=tuple)
+        event._dispatch_plan = mocker.MagicMock(spec=tuple)
+        event._needs_scriptargs_keys = mocker.MagicMock(spec=bool)
+
+        event.invalidate_dispatch_plans()
+
+        assert event._batch_dispatch_plan is None
+        assert event._dispatch_plan is None
+        assert event._needs_scriptargs_keys is None
+
     # register_item
 
     def test_register_item__non_item(self, init_event):
@@ -185,22 +426,26 @@ class Test_HoudiniEvent:
         # test is more reliable vs mocking houdini_toolbox.events.item.HoudiniEventItem
         mock_item = mocker.MagicMock(spec=houdini_toolbox.events.event.HoudiniEventItem)
 
+        mock_invalidate = mocker.patch.object(
+            houdini_toolbox.events.event.HoudiniEvent, "invalidate_dispatch_plans"
+        )
+
         event = init_event()
         event.register_item(mock_item)
 
         assert mock_map == {mock_item.priority: [mock_item]}
 
+        mock_item.on_registered.assert_called_with(event)
+
+        # Registering an item invalidates the dispatch plans.
+        mock_invalidate.assert_called_once()
+
     # run
 
     def test_run__not_enabled(self, init_event, mocker):
         """Test running an event that is disabled."""
-        mocker.patch.object(
-            houdini_toolbox.events.event.HoudiniEvent,
-            "enabled",
-            new_callable=mocker.PropertyMock(return_value=False),
-        )
-
         event = init_event()
+        event._enabled = False
 
         scriptargs = {"key": "value"}
         event.run(scriptargs)
@@ -210,25 +455,34 @@ class Test_HoudiniEvent:
         expected_scriptargs = {"key": "value"}
         assert scriptargs == expected_scriptargs
 
+    def test_run__batching(self, init_event, mocker):
+        """Test running an event that is batching."""
+        mock_stats = mocker.MagicMock(
+            spec=houdini_toolbox.events.stats.HoudiniEventStats
+        )
+
+        event = init_event()
+        event._batch_queue = []
+        event._enabled = True
+        event._stats = mock_stats
+
+        scriptargs = {"key": "value"}
+        event.run(scriptargs)
+
+        # The args should be queued unchanged and nothing run.
+        assert event._batch_queue == [{"key": "value"}]
+
+        mock_stats.__enter__.assert_not_called()
+
     def test_run(self, init_event, mocker):
         """Test running all items in an event."""
-        mocker.patch.object(
-            houdini_toolbox.events.event.HoudiniEvent,
-            "enabled",
-            new_callable=mocker.PropertyMock(return_value=True),
-        )
-        mock_stats = mocker.patch.object(
-            houdini_toolbox.events.event.HoudiniEvent,
-            "stats",
-            new_callable=mocker.PropertyMock,
-        )
         mock_item_map = mocker.patch.object(
             houdini_toolbox.events.event.HoudiniEvent,
             "item_map",
             new_callable=mocker.PropertyMock,
         )
 
-        mock_stats.return_value = mocker.MagicMock(
+        mock_stats = mocker.MagicMock(
             spec=houdini_toolbox.events.stats.HoudiniEventStats
         )
 
@@ -236,15 +490,35 @@ class Test_HoudiniEvent:
         mock_item_map.return_value = mock_map
 
         event = init_event()
+        event._batch_queue = None
+        event._context = houdini_toolbox.events.event.EventContext(event=event)
+        event._dispatch_plan = None
+        event._enabled = True
+        event._needs_scriptargs_keys = None
+        event._stats = mock_stats
 
-        mock_item1 = mocker.MagicMock(spec=houdini_toolbox.events.item.HoudiniEventItem)
-        mock_item1.run.side_effect = lambda sa: sa["order"].append(mock_item1)
+        # Record the event passed in the args during the run.
+        run_events = []
 
-        mock_item2 = mocker.MagicMock(spec=houdini_toolbox.events.item.HoudiniEventItem)
-        mock_item2.run.side_effect = lambda sa: sa["order"].append(mock_item2)
+        def _create_item():
+            mock_item = mocker.MagicMock(
+                spec=houdini_toolbox.events.item.HoudiniEventItem
+            )
+            mock_item.time_budget = None
+            mock_item.uses_context = False
 
-        mock_item3 = mocker.MagicMock(spec=houdini_toolbox.events.item.HoudiniEventItem)
-        mock_item3.run.side_effect = lambda sa: sa["order"].append(mock_item3)
+            def _run(scriptargs):
+                scriptargs["order"].append(mock_item)
+                run_events.append(scriptargs["_event_"])
+
+            mock_item.run.side_effect = _run
+            mock_item.get_run_method.return_value = mock_item.run
+
+            return mock_item
+
+        mock_item1 = _create_item()
+        mock_item2 = _create_item()
+        mock_item3 = _create_item()
 
         # Assign objects to event map with priorities.
         mock_map[0] = [mock_item2]
@@ -268,7 +542,159 @@ class Test_HoudiniEvent:
         mock_item3.run.assert_called_once()
 
         assert scriptargs == expected_scriptargs
+        assert run_events == [event, event, event]
 
         # Ensure the context manager was called.
+        mock_stats.__enter__.assert_called_once()
+        mock_stats.__exit__.assert_called_once()
+
+    def test_run__context_items(self, init_event, mocker):
+        """Test running an event whose items are all context aware."""
+        mock_run_item = mocker.MagicMock()
+
+        event = init_event()
+        event._batch_queue = None
+        event._dispatch_plan = (mock_run_item,)
+        event._enabled = True
+        event._needs_scriptargs_keys = False
+        event._stats = mocker.MagicMock(
+            spec=houdini_toolbox.events.stats.HoudiniEventStats
+        )
+
+        # Record the args passed during the run.
+        run_args = []
+        mock_run_item.side_effect = lambda sa: run_args.append(dict(sa))
+
+        scriptargs = {"key": "value"}
+
+        event.run(scriptargs)
+
+        # The args should never have been modified.
+        assert run_args == [{"key": "value"}]
+        assert scriptargs == {"key": "value"}
+
+    def test_run__stats_disabled(self, init_event, mocker):
+        """Test running all items in an event when the stats are disabled."""
+        mock_stats = mocker.MagicMock(
+            spec=houdini_toolbox.events.stats.HoudiniEventStats
+        )
+        mock_stats.enabled = False
+
+        mock_run_item = mocker.MagicMock()
+
+        event = init_event()
+        event._batch_queue = None
+        event._dispatch_plan = (mock_run_item,)
+        event._enabled = True
+        event._needs_scriptargs_keys = True
+        event._stats = mock_stats
+
+        scriptargs = {"key": "value"}
+
+        event.run(scriptargs)
+
+        mock_run_item.assert_called_once()
+
+        mock_stats.__enter__.assert_not_called()
+
+        assert scriptargs == {"key": "value"}
+
+    # run_batch
+
+    def test_run_batch__not_enabled(self, init_event, mocker):
+        """Test running a batch for an event that is disabled."""
+        mocker.patch.object(
+            houdini_toolbox.events.event.HoudiniEvent,
+            "enabled",
+            new_callable=mocker.PropertyMock(return_value=False),
+        )
+        mock_plan = mocker.patch.object(
+            houdini_toolbox.events.event.HoudiniEvent,
+            "batch_dispatch_plan",
+            new_callable=mocker.PropertyMock,
+        )
+
+        event = init_event()
+
+        scriptargs_list = [{"key": "value"}]
+        event.run_batch(scriptargs_list)
+
+        assert scriptargs_list == [{"key": "value"}]
+
+        mock_plan.assert_not_called()
+
+    def test_run_batch(self, init_event, mocker):
+        """Test running all items with a batch of args."""
+        mocker.patch.object(
+            houdini_toolbox.events.event.HoudiniEvent,
+            "enabled",
+            new_callable=mocker.PropertyMock(return_value=True),
+        )
+        mock_stats = mocker.patch.object(
+            houdini_toolbox.events.event.HoudiniEvent,
+            "stats",
+            new_callable=mocker.PropertyMock,
+        )
+        mock_plan = mocker.patch.object(
+            houdini_toolbox.events.event.HoudiniEvent,
+            "batch_dispatch_plan",
+            new_callable=mocker.PropertyMock,
+        )
+        mocker.patch.object(
+            houdini_toolbox.events.event.HoudiniEvent,
+            "needs_scriptargs_keys",
+            new_callable=mocker.PropertyMock(return_value=True),
+        )
+
+        mock_stats.return_value = mocker.MagicMock(
+            spec=houdini_toolbox.events.stats.HoudiniEventStats
+        )
+
+        event = init_event()
+
+        # Record the event passed in the args during the run.
+        run_events = []
+
+        def _run_item_batch(scriptargs_list):
+            run_events.extend(scriptargs["_event_"] for scriptargs in scriptargs_list)
+
+        mock_plan.return_value = (_run_item_batch,)
+
+        scriptargs_list = [{"key": "value1"}, {"key": "value2"}]
+
+        event.run_batch(scriptargs_list)
+
+        assert run_events == [event, event]
+
+        # The event should be removed after running.
+        assert scriptargs_list == [{"key": "value1"}, {"key": "value2"}]
+
         mock_stats.return_value.__enter__.assert_called_once()
         mock_stats.return_value.__exit__.assert_called_once()
+
+
+def test_run__dispatch_plan_order():
+    """Test the dispatch plan runs real items in decreasing priority order."""
+    event = houdini_toolbox.events.event.HoudiniEvent("plan_order")
+
+    order = []
+
+    def _create_item(name, priority):
+        return houdini_toolbox.events.item.HoudiniEventItem(
+            (lambda scriptargs: order.append(name),), priority=priority
+        )
+
+    for name, priority in (("low", 1), ("high", 15), ("mid", 5), ("mid2", 5)):
+        event.register_item(_create_item(name, priority))
+
+    event.run({})
+
+    assert order == ["high", "mid", "mid2", "low"]
+
+    # Registering a new item should rebuild the plan with the item in place.
+    event.register_item(_create_item("highest", 20))
+
+    order.clear()
+    event.run({})
+
+    assert order == ["highest", "high", "mid", "mid2", "low"]
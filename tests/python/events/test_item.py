@@ -13,12 +13,43 @@ import pytest
 # Houdini Toolbox
 import houdini_toolbox.events.item
 import houdini_toolbox.events.stats
+from houdini_toolbox.events.context import EventContext
 
 # =============================================================================
 # FIXTURES
 # =============================================================================
 
 
+@pytest.fixture
+def init_batch_item(mocker):
+    """Fixture to initialize a batch item."""
+    mocker.patch.object(
+        houdini_toolbox.events.item.BatchHoudiniEventItem,
+        "__init__",
+        lambda x, y: None,
+    )
+
+    def _create():
+        return houdini_toolbox.events.item.BatchHoudiniEventItem(None)
+
+    return _create
+
+
+@pytest.fixture
+def init_context_item(mocker):
+    """Fixture to initialize a context item."""
+    mocker.patch.object(
+        houdini_toolbox.events.item.ContextHoudiniEventItem,
+        "__init__",
+        lambda x, y: None,
+    )
+
+    def _create():
+        return houdini_toolbox.events.item.ContextHoudiniEventItem(None)
+
+    return _create
+
+
 @pytest.fixture
 def init_exclusive_item(mocker):
     """Fixture to initialize an exclusive item."""
@@ -66,13 +97,28 @@ class Test_HoudiniEventItem:
         mock_priority = mocker.MagicMock(spec=int)
         mock_tags = mocker.MagicMock(spec=list)
 
+        mock_deferred = mocker.MagicMock(spec=bool)
+        mock_budget = mocker.MagicMock(spec=float)
+        mock_defer_over_budget = mocker.MagicMock(spec=bool)
+
         item = houdini_toolbox.events.item.HoudiniEventItem(
-            callables, mock_name, mock_priority, mock_tags
+            callables,
+            mock_name,
+            mock_priority,
+            mock_tags,
+            mock_deferred,
+            mock_budget,
+            mock_defer_over_budget,
         )
 
         mock_stats.assert_called_with(mock_name, tags=mock_tags)
 
+        assert item._budget_average_ns == 0.0
+        assert item._budget_run_count == 0
         assert item._callables == list(callables)
+        assert item._defer_over_budget == mock_defer_over_budget
+        assert item._deferred == mock_deferred
+        assert item._time_budget == mock_budget
         assert item._name == mock_name
         assert item._priority == mock_priority
         assert item._data == {}
@@ -156,6 +202,22 @@ class Test_HoudiniEventItem:
 
     # Properties
 
+    def test_budget_average(self, init_item):
+        """Test the 'budget_average' property."""
+        item = init_item()
+
+        item._budget_average_ns = 2_500_000.0
+        assert item.budget_average == 0.0025
+
+    def test_budget_run_count(self, init_item, mocker):
+        """Test the 'budget_run_count' property."""
+        mock_value = mocker.MagicMock(spec=int)
+
+        item = init_item()
+
+        item._budget_run_count = mock_value
+        assert item.budget_run_count == mock_value
+
     def test_callables(self, init_item, mocker):
         """Test the 'callables' property."""
         mock_value = mocker.MagicMock(spec=list)
@@ -174,6 +236,29 @@ class Test_HoudiniEventItem:
         item._data = mock_value
         assert item.data == mock_value
 
+    def test_defer_over_budget(self, init_item, mocker):
+        """Test the 'defer_over_budget' property."""
+        mock_value = mocker.MagicMock(spec=bool)
+
+        item = init_item()
+
+        item._defer_over_budget = mock_value
+        assert item.defer_over_budget == mock_value
+
+    def test_deferred(self, init_item, mocker):
+        """Test the 'deferred' property."""
+        mock_value = mocker.MagicMock(spec=bool)
+
+        item = init_item()
+
+        item._deferred = mock_value
+        assert item.deferred == mock_value
+
+        mock_new_value = mocker.MagicMock(spec=bool)
+        item.deferred = mock_new_value
+
+        assert item._deferred == mock_new_value
+
     def test_name(self, init_item, mocker):
         """Test 'name' property."""
         mock_value = mocker.MagicMock(spec=str)
@@ -202,28 +287,56 @@ class Test_HoudiniEventItem:
         item._stats = mock_stats
         assert item.stats == mock_stats
 
+    def test_time_budget(self, init_item, mocker):
+        """Test the 'time_budget' property."""
+        mock_value = mocker.MagicMock(spec=float)
+
+        item = init_item()
+
+        item._time_budget = mock_value
+        assert item.time_budget == mock_value
+
     # Methods
 
-    def test_run(self, init_item, mocker):
-        """Test running an item."""
-        mock_stats = mocker.patch.object(
-            houdini_toolbox.events.item.HoudiniEventItem,
-            "stats",
-            new_callable=mocker.PropertyMock,
-        )
-        mock_callables = mocker.patch.object(
-            houdini_toolbox.events.item.HoudiniEventItem,
-            "callables",
-            new_callable=mocker.PropertyMock,
+    @pytest.mark.parametrize(
+        "deferred, batch, expected",
+        (
+            (False, False, "run"),
+            (False, True, "run_batch"),
+            (True, False, "run_deferred"),
+            (True, True, "run_batch_deferred"),
+        ),
+    )
+    def test_get_run_method(self, init_item, mocker, deferred, batch, expected):
+        """Test getting the method to run the item."""
+        item = init_item()
+        item._deferred = deferred
+
+        assert item.get_run_method(batch=batch) == getattr(item, expected)
+
+        # The context is not used by regular items.
+        mock_context = mocker.MagicMock(spec=EventContext)
+
+        assert item.get_run_method(batch=batch, context=mock_context) == getattr(
+            item, expected
         )
 
+    def test_on_registered(self, init_item, mocker):
+        """Test being notified of registration to an event."""
+        item = init_item()
+
+        # Regular items do not need to know which events they are registered to.
+        item.on_registered(mocker.MagicMock())
+
+    def test_run(self, init_item, mocker):
+        """Test running an item."""
         item = init_item()
 
         stats = mocker.MagicMock(
             spec=houdini_toolbox.events.stats.HoudiniEventItemStats
         )
 
-        mock_stats.return_value = stats
+        item._stats = stats
 
         # To ensure that the callables are called with the HoudiniEventItem in the scriptargs
         # as _item_ we need to record the call data ourselves because Mock just
@@ -237,7 +350,7 @@ class Test_HoudiniEventItem:
         mock_func2 = mocker.MagicMock()
         mock_func2.side_effect = lambda sa: real_call_args.append(copy.copy(sa))
 
-        mock_callables.return_value = [mock_func1, mock_func2]
+        item._callables = [mock_func1, mock_func2]
 
         scriptargs = {"key": "value"}
         run_args = {"key": "value", "_item_": item}
@@ -248,10 +361,9 @@ class Test_HoudiniEventItem:
         stats.__enter__.assert_called_once()
         stats.__exit__.assert_called_once()
 
-        # Ensure time_child was called with the functions.  Do it this way since
-        # the calls list is confusing due to the contextmanager decorator.
-        stats.time_function.assert_any_call(mock_func1)
-        stats.time_function.assert_any_call(mock_func2)
+        # Ensure the run times of the functions were recorded.
+        stats.add_function_time.assert_any_call(mock_func1, mocker.ANY, mocker.ANY)
+        stats.add_function_time.assert_any_call(mock_func2, mocker.ANY, mocker.ANY)
 
         # Ensure the functions were called with the real args.
         assert real_call_args[0] == run_args
@@ -260,6 +372,399 @@ class Test_HoudiniEventItem:
         # Ensure we removed the item.
         assert scriptargs == {"key": "value"}
 
+    def test_run__stats_disabled(self, init_item, mocker):
+        """Test running an item when the stats are disabled."""
+        item = init_item()
+
+        stats = mocker.MagicMock(
+            spec=houdini_toolbox.events.stats.HoudiniEventItemStats
+        )
+        stats.enabled = False
+
+        item._stats = stats
+
+        mock_func = mocker.MagicMock()
+        item._callables = [mock_func]
+
+        scriptargs = {"key": "value"}
+
+        item.run(scriptargs)
+
+        mock_func.assert_called_once()
+
+        # Nothing should be timed.
+        stats.__enter__.assert_not_called()
+        stats.add_function_time.assert_not_called()
+
+        assert scriptargs == {"key": "value"}
+
+    def test_run_against_budget(self, init_item, mocker):
+        """Test running an item and recording its run time against its budget."""
+        mocker.patch("time.perf_counter_ns", side_effect=(0, 1000, 5000, 7000))
+
+        mock_run = mocker.MagicMock()
+        mock_args = mocker.MagicMock(spec=dict)
+
+        item = init_item()
+        item._budget_average_ns = 0.0
+        item._budget_run_count = 0
+
+        # The first run sets the average directly.
+        item.run_against_budget(mock_run, mock_args)
+
+        mock_run.assert_called_with(mock_args)
+
+        assert item._budget_average_ns == 1000
+        assert item._budget_run_count == 1
+
+        # Later runs move the average towards the new run time.
+        item.run_against_budget(mock_run, mock_args)
+
+        expected = (
+            1000 + (2000 - 1000) * houdini_toolbox.events.item._BUDGET_AVERAGE_WEIGHT
+        )
+
+        assert item._budget_average_ns == pytest.approx(expected)
+        assert item._budget_run_count == 2
+
+    def test_run_against_budget__error(self, init_item, mocker):
+        """Test the run time is recorded when running the item fails."""
+        mocker.patch("time.perf_counter_ns", side_effect=(0, 1000))
+
+        mock_run = mocker.MagicMock(side_effect=RuntimeError)
+
+        item = init_item()
+        item._budget_average_ns = 0.0
+        item._budget_run_count = 0
+
+        with pytest.raises(RuntimeError):
+            item.run_against_budget(mock_run, {})
+
+        assert item._budget_average_ns == 1000
+        assert item._budget_run_count == 1
+
+    def test_run_batch_against_budget(self, init_item, mocker):
+        """Test a batch run time is averaged over the args."""
+        mocker.patch("time.perf_counter_ns", side_effect=(0, 4000))
+
+        mock_run = mocker.MagicMock()
+        scriptargs_list = [{}, {}, {}, {}]
+
+        item = init_item()
+        item._budget_average_ns = 0.0
+        item._budget_run_count = 0
+
+        item.run_batch_against_budget(mock_run, scriptargs_list)
+
+        mock_run.assert_called_with(scriptargs_list)
+
+        assert item._budget_average_ns == 1000
+        assert item._budget_run_count == 1
+
+    def test_run_batch_against_budget__empty(self, init_item, mocker):
+        """Test the run time of an empty batch is recorded."""
+        mocker.patch("time.perf_counter_ns", side_effect=(0, 1000))
+
+        mock_run = mocker.MagicMock()
+
+        item = init_item()
+        item._budget_average_ns = 0.0
+        item._budget_run_count = 0
+
+        item.run_batch_against_budget(mock_run, [])
+
+        assert item._budget_average_ns == 1000
+        assert item._budget_run_count == 1
+
+    def test_run_batch(self, init_item, mocker):
+        """Test running an item with a batch of args."""
+        mock_run = mocker.patch.object(
+            houdini_toolbox.events.item.HoudiniEventItem, "run"
+        )
+
+        mock_scriptargs1 = mocker.MagicMock(spec=dict)
+        mock_scriptargs2 = mocker.MagicMock(spec=dict)
+
+        item = init_item()
+
+        item.run_batch([mock_scriptargs1, mock_scriptargs2])
+
+        mock_run.assert_has_calls(
+            [mocker.call(mock_scriptargs1), mocker.call(mock_scriptargs2)]
+        )
+
+    def test_run_batch_deferred(self, init_item, mocker):
+        """Test deferring running an item with a batch of args."""
+        mock_runner = mocker.patch("houdini_toolbox.events.item.DEFERRED_RUNNER")
+
+        scriptargs1 = {"key": "value1"}
+        scriptargs2 = {"key": "value2"}
+
+        item = init_item()
+
+        item.run_batch_deferred([scriptargs1, scriptargs2])
+
+        mock_runner.submit.assert_called_with(
+            item.run_batch, [scriptargs1, scriptargs2]
+        )
+
+        # The args should have been copied.
+        submitted = mock_runner.submit.call_args[0][1]
+        assert submitted[0] is not scriptargs1
+        assert submitted[1] is not scriptargs2
+
+    def test_run_deferred(self, init_item, mocker):
+        """Test deferring running an item."""
+        mock_runner = mocker.patch("houdini_toolbox.events.item.DEFERRED_RUNNER")
+
+        scriptargs = {"key": "value"}
+
+        item = init_item()
+
+        item.run_deferred(scriptargs)
+
+        mock_runner.submit.assert_called_with(item.run, scriptargs)
+
+        # The args should have been copied.
+        assert mock_runner.submit.call_args[0][1] is not scriptargs
+
+
+class Test_BatchHoudiniEventItem:
+    """Test houdini_toolbox.events.item.BatchHoudiniEventItem class."""
+
+    def test_run(self, init_batch_item, mocker):
+        """Test running an item with a single args."""
+        mock_run_batch = mocker.patch.object(
+            houdini_toolbox.events.item.BatchHoudiniEventItem, "run_batch"
+        )
+
+        mock_scriptargs = mocker.MagicMock(spec=dict)
+
+        item = init_batch_item()
+
+        item.run(mock_scriptargs)
+
+        mock_run_batch.assert_called_with([mock_scriptargs])
+
+    def test_run_batch(self, init_batch_item, mocker):
+        """Test running an item with a batch of args."""
+        mock_super_run = mocker.patch.object(
+            houdini_toolbox.events.item.HoudiniEventItem, "run"
+        )
+
+        mock_node1 = mocker.MagicMock()
+        mock_node2 = mocker.MagicMock()
+
+        scriptargs_list = [{"node": mock_node1}, {"key": "value"}, {"node": mock_node2}]
+
+        item = init_batch_item()
+
+        item.run_batch(scriptargs_list)
+
+        mock_super_run.assert_called_with(
+            {"batch": scriptargs_list, "nodes": [mock_node1, mock_node2]}
+        )
+
+    def test_run_batch__event_data(self, init_batch_item, mocker):
+        """Test the manager and event are passed on with the batch."""
+        mock_super_run = mocker.patch.object(
+            houdini_toolbox.events.item.HoudiniEventItem, "run"
+        )
+
+        mock_manager = mocker.MagicMock()
+        mock_event = mocker.MagicMock()
+
+        scriptargs_list = [
+            {"_manager_": mock_manager, "_event_": mock_event},
+            {"_manager_": mock_manager, "_event_": mock_event},
+        ]
+
+        item = init_batch_item()
+
+        item.run_batch(scriptargs_list)
+
+        mock_super_run.assert_called_with(
+            {
+                "batch": scriptargs_list,
+                "nodes": [],
+                "_manager_": mock_manager,
+                "_event_": mock_event,
+            }
+        )
+
+    def test_run_batch__empty(self, init_batch_item, mocker):
+        """Test running an item with an empty batch."""
+        mock_super_run = mocker.patch.object(
+            houdini_toolbox.events.item.HoudiniEventItem, "run"
+        )
+
+        item = init_batch_item()
+
+        item.run_batch([])
+
+        mock_super_run.assert_called_with({"batch": [], "nodes": []})
+
+
+class Test_ContextHoudiniEventItem:
+    """Test houdini_toolbox.events.item.ContextHoudiniEventItem class."""
+
+    def test_uses_context(self):
+        """Test the 'uses_context' attribute."""
+        assert houdini_toolbox.events.item.ContextHoudiniEventItem.uses_context
+        assert not houdini_toolbox.events.item.HoudiniEventItem.uses_context
+
+    # Methods
+
+    def test_get_run_method__no_context(self, init_context_item):
+        """Test getting the method to run the item without a context."""
+        item = init_context_item()
+        item._deferred = False
+
+        assert item.get_run_method() == item.run
+        assert item.get_run_method(batch=True) == item.run_batch
+
+    @pytest.mark.parametrize(
+        "deferred, batch, expected",
+        (
+            (False, False, "run_in_context"),
+            (False, True, "run_batch_in_context"),
+            (True, False, "run_deferred_in_context"),
+            (True, True, "run_batch_deferred_in_context"),
+        ),
+    )
+    def test_get_run_method(self, init_context_item, mocker, deferred, batch, expected):
+        """Test getting the method to run the item with a context."""
+        mock_context = mocker.MagicMock(spec=EventContext)
+
+        item = init_context_item()
+        item._deferred = deferred
+
+        result = item.get_run_method(batch=batch, context=mock_context)
+
+        assert result.func == getattr(item, expected)
+        assert result.args == (mock_context,)
+
+    def test_run(self, init_context_item, mocker):
+        """Test running the item outside of an event context."""
+        mock_run = mocker.patch.object(
+            houdini_toolbox.events.item.ContextHoudiniEventItem, "run_in_context"
+        )
+
+        mock_manager = mocker.MagicMock()
+        mock_event = mocker.MagicMock()
+
+        scriptargs = {"_manager_": mock_manager, "_event_": mock_event}
+
+        item = init_context_item()
+
+        item.run(scriptargs)
+
+        context = mock_run.call_args[0][0]
+
+        assert context.manager == mock_manager
+        assert context.event == mock_event
+        mock_run.assert_called_with(context, scriptargs)
+
+    def test_run_batch_deferred_in_context(self, init_context_item, mocker):
+        """Test deferring running the item with a batch of args."""
+        mock_runner = mocker.patch("houdini_toolbox.events.item.DEFERRED_RUNNER")
+
+        mock_context = mocker.MagicMock(spec=EventContext)
+        scriptargs = {"key": "value"}
+
+        item = init_context_item()
+
+        item.run_batch_deferred_in_context(mock_context, [scriptargs])
+
+        func, args = mock_runner.submit.call_args[0]
+
+        assert func.func == item.run_batch_in_context
+        assert func.args == (mock_context.copy.return_value,)
+
+        assert args == [scriptargs]
+        assert args[0] is not scriptargs
+
+    def test_run_batch_in_context(self, init_context_item, mocker):
+        """Test running the item with a batch of args."""
+        mock_run = mocker.patch.object(
+            houdini_toolbox.events.item.ContextHoudiniEventItem, "run_in_context"
+        )
+
+        mock_context = mocker.MagicMock(spec=EventContext)
+        mock_scriptargs1 = mocker.MagicMock(spec=dict)
+        mock_scriptargs2 = mocker.MagicMock(spec=dict)
+
+        item = init_context_item()
+
+        item.run_batch_in_context(mock_context, [mock_scriptargs1, mock_scriptargs2])
+
+        mock_run.assert_has_calls(
+            [
+                mocker.call(mock_context, mock_scriptargs1),
+                mocker.call(mock_context, mock_scriptargs2),
+            ]
+        )
+
+    def test_run_deferred_in_context(self, init_context_item, mocker):
+        """Test deferring running the item."""
+        mock_runner = mocker.patch("houdini_toolbox.events.item.DEFERRED_RUNNER")
+
+        mock_context = mocker.MagicMock(spec=EventContext)
+        scriptargs = {"key": "value"}
+
+        item = init_context_item()
+
+        item.run_deferred_in_context(mock_context, scriptargs)
+
+        func, args = mock_runner.submit.call_args[0]
+
+        assert func.func == item.run_in_context
+        assert func.args == (mock_context.copy.return_value,)
+
+        assert args == scriptargs
+        assert args is not scriptargs
+
+    @pytest.mark.parametrize("stats_enabled", (True, False))
+    def test_run_in_context(self, init_context_item, mocker, stats_enabled):
+        """Test running the item with a context."""
+        stats = mocker.MagicMock(
+            spec=houdini_toolbox.events.stats.HoudiniEventItemStats
+        )
+        stats.enabled = stats_enabled
+
+        mock_previous = mocker.MagicMock()
+        context = EventContext(item=mock_previous)
+
+        item = init_context_item()
+
+        # Record the item set on the context during the run.
+        run_items = []
+
+        mock_func = mocker.MagicMock()
+        mock_func.side_effect = lambda sa, ctx: run_items.append(ctx.item)
+
+        item._callables = [mock_func]
+        item._stats = stats
+
+        scriptargs = {"key": "value"}
+
+        item.run_in_context(context, scriptargs)
+
+        mock_func.assert_called_with(scriptargs, context)
+        assert run_items == [item]
+
+        # The args are never modified and the previous item is restored.
+        assert scriptargs == {"key": "value"}
+        assert context.item == mock_previous
+
+        if stats_enabled:
+            stats.add_function_time.assert_called_with(
+                mock_func, mocker.ANY, mocker.ANY
+            )
+
+        else:
+            stats.add_function_time.assert_not_called()
+
 
 class Test_ExclusiveHoudiniEventItem:
     """Test houdini_toolbox.events.item.ExclusiveHoudiniEventItem class."""
@@ -268,42 +773,45 @@ class Test_ExclusiveHoudiniEventItem:
 
     def test___init__(self, mocker):
         """Test object initialization."""
-        mock_priority = mocker.patch.object(
-            houdini_toolbox.events.item.ExclusiveHoudiniEventItem,
-            "priority",
-            new_callable=mocker.PropertyMock,
-        )
-
         mock_super_init = mocker.patch.object(
             houdini_toolbox.events.item.HoudiniEventItem, "__init__"
         )
+        mock_supersede = mocker.patch.object(
+            houdini_toolbox.events.item.ExclusiveHoudiniEventItem, "_supersede"
+        )
+
+        mapping = {}
 
-        mock_map = mocker.patch.object(
+        mocker.patch.object(
             houdini_toolbox.events.item.ExclusiveHoudiniEventItem,
             "_exclusive_map",
-            new_callable=mocker.PropertyMock,
+            mapping,
         )
 
         mock_callables = (mocker.MagicMock(),)
         mock_name = mocker.MagicMock(spec=str)
-        priority = 3
+        mock_priority = mocker.MagicMock(spec=int)
         mock_stat_tags = mocker.MagicMock(spec=list)
-
-        mock_priority.return_value = priority
-
-        mock_map.return_value = {}
+        mock_deferred = mocker.MagicMock(spec=bool)
 
         item = houdini_toolbox.events.item.ExclusiveHoudiniEventItem(
-            mock_callables, mock_name, priority, mock_stat_tags
+            mock_callables, mock_name, mock_priority, mock_stat_tags, mock_deferred
         )
 
         mock_super_init.assert_called_with(
-            mock_callables, mock_name, priority, mock_stat_tags
+            mock_callables,
+            mock_name,
+            mock_priority,
+            mock_stat_tags,
+            mock_deferred,
+            None,
+            False,
         )
 
-        assert houdini_toolbox.events.item.ExclusiveHoudiniEventItem._exclusive_map == {
-            mock_name: item
-        }
+        assert item._events == []
+        assert mapping == {mock_name: item}
+
+        mock_supersede.assert_not_called()
 
     def test___init__replace(self, mocker):
         """Test initialization when replacing an existing item."""
@@ -315,10 +823,8 @@ class Test_ExclusiveHoudiniEventItem:
         mock_super_init = mocker.patch.object(
             houdini_toolbox.events.item.HoudiniEventItem, "__init__"
         )
-        mock_map = mocker.patch.object(
-            houdini_toolbox.events.item.ExclusiveHoudiniEventItem,
-            "_exclusive_map",
-            new_callable=mocker.PropertyMock,
+        mock_supersede = mocker.patch.object(
+            houdini_toolbox.events.item.ExclusiveHoudiniEventItem, "_supersede"
         )
 
         mock_existing = mocker.MagicMock(
@@ -334,74 +840,251 @@ class Test_ExclusiveHoudiniEventItem:
         mock_priority.return_value = 3
 
         mapping = {mock_name: mock_existing}
-        mock_map.return_value = mapping
+
+        mocker.patch.object(
+            houdini_toolbox.events.item.ExclusiveHoudiniEventItem,
+            "_exclusive_map",
+            mapping,
+        )
 
         item = houdini_toolbox.events.item.ExclusiveHoudiniEventItem(
             mock_callables, mock_name, priority, mock_stat_tags
         )
 
         mock_super_init.assert_called_with(
-            mock_callables, mock_name, priority, mock_stat_tags
+            mock_callables, mock_name, priority, mock_stat_tags, False, None, False
         )
 
         assert mapping == {mock_name: item}
 
+        mock_existing._supersede.assert_called_once()
+        mock_supersede.assert_not_called()
+
+    def test___init__superseded(self, mocker):
+        """Test initialization when an existing item has a higher priority."""
+        mock_priority = mocker.patch.object(
+            houdini_toolbox.events.item.ExclusiveHoudiniEventItem,
+            "priority",
+            new_callable=mocker.PropertyMock,
+        )
+        mocker.patch.object(houdini_toolbox.events.item.HoudiniEventItem, "__init__")
+        mock_supersede = mocker.patch.object(
+            houdini_toolbox.events.item.ExclusiveHoudiniEventItem, "_supersede"
+        )
+
+        mock_existing = mocker.MagicMock(
+            spec=houdini_toolbox.events.item.ExclusiveHoudiniEventItem
+        )
+        mock_existing.priority = 3
+
+        mock_name = mocker.MagicMock(spec=str)
+
+        # Items of equal priority do not replace the existing item.
+        mock_priority.return_value = 3
+
+        mapping = {mock_name: mock_existing}
+
+        mocker.patch.object(
+            houdini_toolbox.events.item.ExclusiveHoudiniEventItem,
+            "_exclusive_map",
+            mapping,
+        )
+
+        houdini_toolbox.events.item.ExclusiveHoudiniEventItem(
+            (mocker.MagicMock(),), mock_name
+        )
+
+        assert mapping == {mock_name: mock_existing}
+
+        mock_supersede.assert_called_once()
+        mock_existing._supersede.assert_not_called()
+
+    # Non-Public Methods
+
+    def test__supersede(self, init_exclusive_item, mocker):
+        """Test marking an item as superseded."""
+        mock_name = mocker.MagicMock(spec=str)
+        mock_other = mocker.MagicMock(
+            spec=houdini_toolbox.events.item.ExclusiveHoudiniEventItem
+        )
+
+        mapping = {mock_name: [mock_other]}
+
+        mocker.patch.object(
+            houdini_toolbox.events.item.ExclusiveHoudiniEventItem,
+            "_superseded_map",
+            mapping,
+        )
+
+        mock_event = mocker.MagicMock()
+
+        item = init_exclusive_item()
+        item._events = [mock_event]
+        item._name = mock_name
+
+        item._supersede()
+
+        assert mapping == {mock_name: [mock_other, item]}
+
+        mock_event.invalidate_dispatch_plans.assert_called_once()
+
+    # Class Methods
+
+    def test_get_superseded_items(self, mocker):
+        """Test getting the superseded items."""
+        mock_item1 = mocker.MagicMock(
+            spec=houdini_toolbox.events.item.ExclusiveHoudiniEventItem
+        )
+        mock_item2 = mocker.MagicMock(
+            spec=houdini_toolbox.events.item.ExclusiveHoudiniEventItem
+        )
+        mock_item3 = mocker.MagicMock(
+            spec=houdini_toolbox.events.item.ExclusiveHoudiniEventItem
+        )
+
+        mocker.patch.object(
+            houdini_toolbox.events.item.ExclusiveHoudiniEventItem,
+            "_superseded_map",
+            {"name1": [mock_item1, mock_item2], "name2": [mock_item3]},
+        )
+
+        cls = houdini_toolbox.events.item.ExclusiveHoudiniEventItem
+
+        assert cls.get_superseded_items() == (mock_item1, mock_item2, mock_item3)
+        assert cls.get_superseded_items("name1") == (mock_item1, mock_item2)
+        assert cls.get_superseded_items("name3") == ()
+
+    # Properties
+
+    def test_events(self, init_exclusive_item, mocker):
+        """Test the 'events' property."""
+        mock_event = mocker.MagicMock()
+
+        item = init_exclusive_item()
+        item._events = [mock_event]
+
+        assert item.events == (mock_event,)
+
+    def test_superseded(self, init_exclusive_item, mocker):
+        """Test the 'superseded' property."""
+        mock_name = mocker.MagicMock(spec=str)
+
+        mapping = {}
+
+        mocker.patch.object(
+            houdini_toolbox.events.item.ExclusiveHoudiniEventItem,
+            "_exclusive_map",
+            mapping,
+        )
+
+        item = init_exclusive_item()
+        item._name = mock_name
+
+        mapping[mock_name] = item
+
+        assert not item.superseded
+
+        # An equal, but different, item is still a different item.
+        mapping[mock_name] = mocker.MagicMock(
+            spec=houdini_toolbox.events.item.ExclusiveHoudiniEventItem,
+            __eq__=lambda x, y: True,
+        )
+
+        assert item.superseded
+
     # Methods
 
+    def test_get_run_method__superseded(self, init_exclusive_item, mocker):
+        """Test getting the run method of a superseded item."""
+        mocker.patch.object(
+            houdini_toolbox.events.item.ExclusiveHoudiniEventItem,
+            "superseded",
+            new_callable=mocker.PropertyMock(return_value=True),
+        )
+
+        item = init_exclusive_item()
+
+        assert item.get_run_method() is None
+
+    def test_get_run_method(self, init_exclusive_item, mocker):
+        """Test getting the run method of the exclusive item."""
+        mocker.patch.object(
+            houdini_toolbox.events.item.ExclusiveHoudiniEventItem,
+            "superseded",
+            new_callable=mocker.PropertyMock(return_value=False),
+        )
+        mock_super = mocker.patch.object(
+            houdini_toolbox.events.item.HoudiniEventItem, "get_run_method"
+        )
+
+        mock_batch = mocker.MagicMock(spec=bool)
+        mock_context = mocker.MagicMock(spec=EventContext)
+
+        item = init_exclusive_item()
+
+        assert item.get_run_method(mock_batch, mock_context) == mock_super.return_value
+
+        mock_super.assert_called_with(mock_batch, mock_context)
+
+    def test_on_registered(self, init_exclusive_item, mocker):
+        """Test recording the events the item is registered to."""
+        mock_event = mocker.MagicMock()
+
+        item = init_exclusive_item()
+        item._events = []
+
+        item.on_registered(mock_event)
+
+        assert item._events == [mock_event]
+
     # run
 
     def test_run__no_run(self, init_exclusive_item, mocker):
         """Test when the event item is not the exclusive item."""
-        mocker.patch(
-            "houdini_toolbox.events.item.ExclusiveHoudiniEventItem.__eq__",
-            return_value=False,
-        )
         mock_super_run = mocker.patch.object(
             houdini_toolbox.events.item.HoudiniEventItem, "run"
         )
-        mock_map = mocker.patch.object(
+
+        mock_name = mocker.MagicMock(spec=str)
+
+        mocker.patch.object(
             houdini_toolbox.events.item.ExclusiveHoudiniEventItem,
             "_exclusive_map",
-            new_callable=mocker.PropertyMock,
-        )
-        mock_name = mocker.patch.object(
-            houdini_toolbox.events.item.ExclusiveHoudiniEventItem,
-            "name",
-            new_callable=mocker.PropertyMock,
+            {
+                mock_name: mocker.MagicMock(
+                    spec=houdini_toolbox.events.item.ExclusiveHoudiniEventItem
+                )
+            },
         )
 
         item = init_exclusive_item()
-
-        mock_map.return_value = {mock_name.return_value: item}
+        item._name = mock_name
 
         scriptargs = {"key": "value"}
 
         item.run(scriptargs)
         mock_super_run.assert_not_called()
 
-    def test__run(self, init_exclusive_item, mocker):
+    def test_run(self, init_exclusive_item, mocker):
         """Test when the event item is the exclusive item."""
-        mocker.patch(
-            "houdini_toolbox.events.item.ExclusiveHoudiniEventItem.__eq__",
-            return_value=True,
-        )
         mock_super_run = mocker.patch.object(
             houdini_toolbox.events.item.HoudiniEventItem, "run"
         )
-        mock_map = mocker.patch.object(
+
+        mock_name = mocker.MagicMock(spec=str)
+
+        mapping = {}
+
+        mocker.patch.object(
             houdini_toolbox.events.item.ExclusiveHoudiniEventItem,
             "_exclusive_map",
-            new_callable=mocker.PropertyMock,
-        )
-        mock_name = mocker.patch.object(
-            houdini_toolbox.events.item.ExclusiveHoudiniEventItem,
-            "name",
-            new_callable=mocker.PropertyMock,
+            mapping,
         )
 
         item = init_exclusive_item()
+        item._name = mock_name
 
-        mock_map.return_value = {mock_name.return_value: item}
+        mapping[mock_name] = item
 
         mock_scriptargs = mocker.MagicMock(spec=dict)
 
@@ -0,0 +1,221 @@
+"""Tests for houdini_toolbox.events.lazy module."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+# Third Party
+import pytest
+
+# Houdini Toolbox
+import houdini_toolbox.events.lazy
+from houdini_toolbox.events.group import HoudiniEventGroup
+from houdini_toolbox.events.manager import HoudiniEventManager
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+@pytest.fixture
+def init_registration(mocker):
+    """Fixture to initialize a registration."""
+    mocker.patch.object(
+        houdini_toolbox.events.lazy.LazyRegistration,
+        "__init__",
+        lambda x, y, z, w: None,
+    )
+
+    def _create():
+        return houdini_toolbox.events.lazy.LazyRegistration(None, None, None)
+
+    return _create
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+class Test_LazyRegistration:
+    """Test houdini_toolbox.events.lazy.LazyRegistration class."""
+
+    def test___init__(self, mocker):
+        """Test object initialization."""
+        mock_module_name = mocker.MagicMock(spec=str)
+        mock_attribute = mocker.MagicMock(spec=str)
+        mock_name1 = mocker.MagicMock(spec=str)
+        mock_name2 = mocker.MagicMock(spec=str)
+
+        registration = houdini_toolbox.events.lazy.LazyRegistration(
+            mock_module_name, mock_attribute, [mock_name1, mock_name2]
+        )
+
+        assert registration._attribute == mock_attribute
+        assert not registration._loaded
+        assert registration._module_name == mock_module_name
+        assert registration._names == (mock_name1, mock_name2)
+
+    # Properties
+
+    def test_attribute(self, init_registration, mocker):
+        """Test the 'attribute' property."""
+        mock_value = mocker.MagicMock(spec=str)
+
+        registration = init_registration()
+        registration._attribute = mock_value
+
+        assert registration.attribute == mock_value
+
+    def test_loaded(self, init_registration, mocker):
+        """Test the 'loaded' property."""
+        mock_value = mocker.MagicMock(spec=bool)
+
+        registration = init_registration()
+        registration._loaded = mock_value
+
+        assert registration.loaded == mock_value
+
+    def test_module_name(self, init_registration, mocker):
+        """Test the 'module_name' property."""
+        mock_value = mocker.MagicMock(spec=str)
+
+        registration = init_registration()
+        registration._module_name = mock_value
+
+        assert registration.module_name == mock_value
+
+    def test_names(self, init_registration, mocker):
+        """Test the 'names' property."""
+        mock_value = mocker.MagicMock(spec=tuple)
+
+        registration = init_registration()
+        registration._names = mock_value
+
+        assert registration.names == mock_value
+
+    # Methods
+
+    def test_load__loaded(self, init_registration, mocker):
+        """Test loading a handler which has already been loaded."""
+        mock_import = mocker.patch(
+            "houdini_toolbox.events.lazy.importlib.import_module"
+        )
+
+        mock_manager = mocker.MagicMock(spec=HoudiniEventManager)
+
+        registration = init_registration()
+        registration._loaded = True
+
+        assert registration.load(mock_manager)
+
+        mock_import.assert_not_called()
+
+    def test_load__import_error(self, init_registration, mocker):
+        """Test loading a handler which can't be imported."""
+        mock_logger = mocker.patch("houdini_toolbox.events.lazy._logger")
+        mocker.patch(
+            "houdini_toolbox.events.lazy.importlib.import_module",
+            side_effect=ImportError,
+        )
+
+        mock_manager = mocker.MagicMock(spec=HoudiniEventManager)
+
+        registration = init_registration()
+        registration._attribute = "test_func"
+        registration._loaded = False
+        registration._module_name = "test_module"
+
+        assert not registration.load(mock_manager)
+
+        # The handler can be loaded again later.
+        assert not registration._loaded
+
+        mock_logger.exception.assert_called()
+        mock_manager.register_event_group.assert_not_called()
+        mock_manager.register_item.assert_not_called()
+
+    def test_load__missing_attribute(self, init_registration, mocker):
+        """Test loading a handler which doesn't exist in its module."""
+        mock_logger = mocker.patch("houdini_toolbox.events.lazy._logger")
+        mocker.patch(
+            "houdini_toolbox.events.lazy.importlib.import_module",
+            return_value=object(),
+        )
+
+        mock_manager = mocker.MagicMock(spec=HoudiniEventManager)
+
+        registration = init_registration()
+        registration._attribute = "test_func"
+        registration._loaded = False
+        registration._module_name = "test_module"
+
+        assert not registration.load(mock_manager)
+        assert not registration._loaded
+
+        mock_logger.exception.assert_called()
+
+    def test_load__event_group(self, init_registration, mocker):
+        """Test loading an event group."""
+        mock_import = mocker.patch(
+            "houdini_toolbox.events.lazy.importlib.import_module"
+        )
+
+        class _TestGroup(HoudiniEventGroup):
+            pass
+
+        mock_import.return_value.TestGroup = _TestGroup
+
+        mock_manager = mocker.MagicMock(spec=HoudiniEventManager)
+
+        registration = init_registration()
+        registration._attribute = "TestGroup"
+        registration._loaded = False
+        registration._module_name = "test_module"
+
+        assert registration.load(mock_manager)
+
+        assert registration._loaded
+
+        mock_import.assert_called_with("test_module")
+
+        group = mock_manager.register_event_group.call_args[0][0]
+        assert isinstance(group, _TestGroup)
+
+        mock_manager.register_item.assert_not_called()
+
+    def test_load__function(self, init_registration, mocker):
+        """Test loading a function."""
+        mock_item = mocker.patch(
+            "houdini_toolbox.events.lazy.HoudiniEventItem", autospec=True
+        )
+        mock_import = mocker.patch(
+            "houdini_toolbox.events.lazy.importlib.import_module"
+        )
+
+        mock_func = mock_import.return_value.test_func
+
+        mock_name1 = mocker.MagicMock(spec=str)
+        mock_name2 = mocker.MagicMock(spec=str)
+
+        mock_manager = mocker.MagicMock(spec=HoudiniEventManager)
+
+        registration = init_registration()
+        registration._attribute = "test_func"
+        registration._loaded = False
+        registration._module_name = "test_module"
+        registration._names = (mock_name1, mock_name2)
+
+        assert registration.load(mock_manager)
+
+        assert registration._loaded
+
+        mock_item.assert_called_with((mock_func,))
+
+        mock_manager.register_item.assert_has_calls(
+            [
+                mocker.call(mock_item.return_value, mock_name1),
+                mocker.call(mock_item.return_value, mock_name2),
+            ]
+        )
+        mock_manager.register_event_group.assert_not_called()
@@ -12,6 +12,8 @@ import houdini_toolbox.events.manager
 from houdini_toolbox.events.event import HoudiniEvent
 from houdini_toolbox.events.group import HoudiniEventGroup
 from houdini_toolbox.events.item import HoudiniEventItem
+from houdini_toolbox.events.lazy import LazyRegistration
+from houdini_toolbox.events.types import NodeEvents
 
 # =============================================================================
 # FIXTURES
@@ -43,9 +45,14 @@ class Test_HoudiniEventManager:
         """Test object initialization."""
         manager = houdini_toolbox.events.manager.HoudiniEventManager()
 
+        assert manager._batched_events == []
+        assert manager._budgeted_items == {}
         assert manager._data == {}
+        assert manager._disabling is False
+        assert manager._disabling_names is None
         assert manager._events == {}
         assert manager._event_states == {}
+        assert manager._lazy_registrations == {}
 
     # Properties
 
@@ -68,6 +75,145 @@ class Test_HoudiniEventManager:
 
     # Methods
 
+    # _check_time_budgets
+
+    def test__check_time_budgets__within_budget(self, init_manager, mocker):
+        """Test checking items which have not exceeded their budgets."""
+        mock_event = mocker.MagicMock(spec=HoudiniEvent)
+
+        # Too few runs to be checked.
+        mock_item1 = mocker.MagicMock(spec=HoudiniEventItem)
+        mock_item1.budget_run_count = 1
+        mock_item1.budget_average = 1.0
+        mock_item1.time_budget = 0.1
+
+        # Under budget.
+        mock_item2 = mocker.MagicMock(spec=HoudiniEventItem)
+        mock_item2.budget_run_count = 10
+        mock_item2.budget_average = 0.05
+        mock_item2.time_budget = 0.1
+
+        items = [mock_item1, mock_item2]
+
+        manager = init_manager()
+
+        manager._check_time_budgets(mock_event, items)
+
+        assert items == [mock_item1, mock_item2]
+        mock_event.invalidate_dispatch_plans.assert_not_called()
+
+    def test__check_time_budgets__over_budget(self, init_manager, mocker):
+        """Test checking an item which has exceeded its budget."""
+        mock_logger = mocker.patch("houdini_toolbox.events.manager._logger")
+
+        mock_event = mocker.MagicMock(spec=HoudiniEvent)
+
+        mock_item = mocker.MagicMock(spec=HoudiniEventItem)
+        mock_item.budget_run_count = 10
+        mock_item.budget_average = 0.5
+        mock_item.time_budget = 0.1
+        mock_item.defer_over_budget = False
+        mock_item.deferred = False
+
+        items = [mock_item]
+
+        manager = init_manager()
+
+        manager._check_time_budgets(mock_event, items)
+
+        # The item should only be reported once.
+        assert items == []
+        mock_logger.warning.assert_called_once()
+
+        assert not mock_item.deferred
+        mock_event.invalidate_dispatch_plans.assert_not_called()
+
+    def test__check_time_budgets__defer(self, init_manager, mocker):
+        """Test checking an item which is deferred when over budget."""
+        mocker.patch("houdini_toolbox.events.manager._logger")
+
+        mock_event = mocker.MagicMock(spec=HoudiniEvent)
+
+        mock_item = mocker.MagicMock(spec=HoudiniEventItem)
+        mock_item.budget_run_count = 10
+        mock_item.budget_average = 0.5
+        mock_item.time_budget = 0.1
+        mock_item.defer_over_budget = True
+        mock_item.deferred = False
+
+        items = [mock_item]
+
+        manager = init_manager()
+
+        manager._check_time_budgets(mock_event, items)
+
+        assert items == []
+
+        assert mock_item.deferred
+        mock_event.invalidate_dispatch_plans.assert_called_once()
+
+    def test__check_time_budgets__shared_stats(self, mocker):
+        """Test items sharing stats are checked against their own run times."""
+        mocker.patch("houdini_toolbox.events.manager._logger")
+
+        clock = [0]
+
+        mocker.patch("time.perf_counter_ns", side_effect=lambda: clock[0])
+
+        def _slow(scriptargs):  # pylint: disable=unused-argument
+            clock[0] += 20_000_000
+
+        manager = houdini_toolbox.events.manager.HoudiniEventManager()
+
+        # Neither item is named so they share the same stats.
+        fast_item = HoudiniEventItem(
+            (lambda scriptargs: None,), time_budget=0.005, defer_over_budget=True
+        )
+        slow_item = HoudiniEventItem((_slow,))
+
+        manager.register_item(fast_item, NodeEvents.OnCreated)
+        manager.register_item(slow_item, NodeEvents.OnCreated)
+
+        for _ in range(10):
+            manager.run_event(NodeEvents.OnCreated)
+
+        assert fast_item.budget_run_count == 10
+        assert fast_item.budget_average == 0
+        assert not fast_item.deferred
+
+    def test__check_time_budgets__batch(self, mocker):
+        """Test items run in batches are checked against their run time per args."""
+        mocker.patch("houdini_toolbox.events.manager._logger")
+
+        clock = [0]
+
+        mocker.patch("time.perf_counter_ns", side_effect=lambda: clock[0])
+
+        def _run(scriptargs):  # pylint: disable=unused-argument
+            clock[0] += 2_000_000
+
+        manager = houdini_toolbox.events.manager.HoudiniEventManager()
+
+        item = HoudiniEventItem((_run,), time_budget=0.005, defer_over_budget=True)
+
+        manager.register_item(item, NodeEvents.OnCreated)
+
+        event = manager.events[NodeEvents.OnCreated]
+
+        # Each batch takes well over the budget but each args is within it.
+        for _ in range(houdini_toolbox.events.manager._BUDGET_MIN_RUNS):
+            with manager.batch_events([NodeEvents.OnCreated]):
+                for _ in range(10):
+                    manager.run_event(NodeEvents.OnCreated)
+
+        manager._check_time_budgets(
+            event, manager._budgeted_items[NodeEvents.OnCreated]
+        )
+
+        assert item.budget_average == pytest.approx(0.002)
+        assert not item.deferred
+        assert item in manager._budgeted_items[NodeEvents.OnCreated]
+
     # _disable_events
 
     def test__disable_events__all(self, init_manager, mocker):
@@ -98,6 +244,9 @@ class Test_HoudiniEventManager:
 
         manager._disable_events()
 
+        assert manager._disabling
+        assert manager._disabling_names is None
+
         # Each event should have it's enabled property accessed twice:
         # once to store the current value and then to set the value to False
         mock_enabled1.assert_has_calls([mocker.call(), mocker.call(False)])
@@ -134,6 +283,9 @@ class Test_HoudiniEventManager:
 
         manager._disable_events(names=[mock_event2.name])
 
+        assert manager._disabling
+        assert manager._disabling_names == [mock_event2.name]
+
         # Event 1's enabled property should not have been accessed.
         mock_enabled1.assert_not_called()
 
@@ -144,6 +296,79 @@ class Test_HoudiniEventManager:
         assert manager._event_states[mock_event2.name]
         assert len(manager._event_states) == 1
 
+    def test__load_lazy_registrations(self, init_manager, mocker):
+        """Test loading the handlers waiting for an event."""
+        mock_event_name1 = mocker.MagicMock(spec=str)
+        mock_event_name2 = mocker.MagicMock(spec=str)
+        mock_event_name3 = mocker.MagicMock(spec=str)
+
+        mock_registration1 = mocker.MagicMock(spec=LazyRegistration)
+        mock_registration1.names = (mock_event_name1, mock_event_name2)
+
+        mock_registration2 = mocker.MagicMock(spec=LazyRegistration)
+        mock_registration2.names = (mock_event_name2, mock_event_name3)
+
+        manager = init_manager()
+        manager._lazy_registrations = {
+            mock_event_name1: [mock_registration1],
+            mock_event_name2: [mock_registration1, mock_registration2],
+            mock_event_name3: [mock_registration2],
+        }
+
+        manager._load_lazy_registrations(mock_event_name1)
+
+        assert manager._lazy_registrations == {
+            mock_event_name2: [mock_registration2],
+            mock_event_name3: [mock_registration2],
+        }
+
+        mock_registration1.load.assert_called_with(manager)
+        mock_registration2.load.assert_not_called()
+
+    def test__load_lazy_registrations__last_event(self, init_manager, mocker):
+        """Test loading a handler removes it from all its events."""
+        mock_event_name1 = mocker.MagicMock(spec=str)
+        mock_event_name2 = mocker.MagicMock(spec=str)
+
+        mock_registration = mocker.MagicMock(spec=LazyRegistration)
+        mock_registration.names = (mock_event_name1, mock_event_name2)
+
+        manager = init_manager()
+        manager._lazy_registrations = {
+            mock_event_name1: [mock_registration],
+            mock_event_name2: [mock_registration],
+        }
+
+        manager._load_lazy_registrations(mock_event_name2)
+
+        assert manager._lazy_registrations == {}
+
+        mock_registration.load.assert_called_with(manager)
+
+    def test__load_lazy_registrations__failed(self, init_manager, mocker):
+        """Test a handler which fails to load is left waiting for its events."""
+        mock_event_name1 = mocker.MagicMock(spec=str)
+        mock_event_name2 = mocker.MagicMock(spec=str)
+
+        mock_registration = mocker.MagicMock(spec=LazyRegistration)
+        mock_registration.names = (mock_event_name1, mock_event_name2)
+        mock_registration.load.return_value = False
+
+        manager = init_manager()
+        manager._lazy_registrations = {
+            mock_event_name1: [mock_registration],
+            mock_event_name2: [mock_registration],
+        }
+
+        manager._load_lazy_registrations(mock_event_name1)
+
+        assert manager._lazy_registrations == {
+            mock_event_name1: [mock_registration],
+            mock_event_name2: [mock_registration],
+        }
+
+        mock_registration.load.assert_called_with(manager)
+
     def test__restore_events(self, init_manager, mocker):
         """Test restoring disabled events."""
         mock_events = mocker.patch.object(
@@ -160,26 +385,121 @@ class Test_HoudiniEventManager:
         mock_enabled2 = mocker.PropertyMock(return_value=False)
         type(mock_event2).enabled = mock_enabled2
 
+        # Events which were not disabled are left alone.
+        mock_event3 = mocker.MagicMock(spec=HoudiniEvent)
+        mock_enabled3 = mocker.PropertyMock(return_value=True)
+        type(mock_event3).enabled = mock_enabled3
+
+        # Events are stored by their enum which differs from their name.
         mock_events.return_value = {
-            mock_event1.name: mock_event1,
-            mock_event2.name: mock_event2,
+            mocker.MagicMock(spec=str): mock_event1,
+            mocker.MagicMock(spec=str): mock_event2,
+            mocker.MagicMock(spec=str): mock_event3,
         }
 
-        mock_states = mocker.MagicMock(spec=dict)
-
-        states = {mock_event1.name: False, mock_event2.name: True}
-        mock_states.items.return_value = list(states.items())
-
         manager = init_manager()
-        manager._event_states = mock_states
+        manager._disabling = True
+        manager._disabling_names = mocker.MagicMock(spec=list)
+        manager._event_states = {mock_event1.name: False, mock_event2.name: True}
 
         manager._restore_events()
 
         # Event 1's enable should have been set to False, 2's True
         mock_enabled1.assert_has_calls([mocker.call(False)])
         mock_enabled2.assert_has_calls([mocker.call(True)])
+        mock_enabled3.assert_not_called()
+
+        assert manager._event_states == {}
+        assert not manager._disabling
+        assert manager._disabling_names is None
+
+    # _track_time_budget
+
+    def test__track_time_budget(self, init_manager, mocker):
+        """Test tracking an item with a time budget."""
+        mock_event_name = mocker.MagicMock(spec=str)
 
-        mock_states.clear.assert_called_once()
+        mock_item = mocker.MagicMock(spec=HoudiniEventItem)
+        mock_item.time_budget = 0.1
+
+        manager = init_manager()
+        manager._budgeted_items = {}
+
+        manager._track_time_budget(mock_item, mock_event_name)
+
+        assert manager._budgeted_items == {mock_event_name: [mock_item]}
+
+    def test__track_time_budget__no_budget(self, init_manager, mocker):
+        """Test tracking an item without a time budget."""
+        mock_item = mocker.MagicMock(spec=HoudiniEventItem)
+        mock_item.time_budget = None
+
+        manager = init_manager()
+        manager._budgeted_items = {}
+
+        manager._track_time_budget(mock_item, mocker.MagicMock(spec=str))
+
+        assert manager._budgeted_items == {}
+
+    def test_batch_events(self, init_manager, mocker):
+        """Test the batch_events context manager."""
+        mock_begin = mocker.patch.object(
+            houdini_toolbox.events.manager.HoudiniEventManager, "begin_batch"
+        )
+        mock_end = mocker.patch.object(
+            houdini_toolbox.events.manager.HoudiniEventManager, "end_batch"
+        )
+
+        manager = init_manager()
+
+        mock_names = mocker.MagicMock(spec=tuple)
+
+        with manager.batch_events(mock_names):
+            mock_end.assert_not_called()
+
+        mock_begin.assert_called_with(mock_names)
+        mock_end.assert_called_once()
+
+    def test_begin_batch(self, init_manager, mocker):
+        """Test beginning to batch events."""
+        mock_events = mocker.patch.object(
+            houdini_toolbox.events.manager.HoudiniEventManager,
+            "events",
+            new_callable=mocker.PropertyMock,
+        )
+
+        mock_event1 = mocker.MagicMock(spec=HoudiniEvent)
+        mock_event1.batching = False
+
+        mock_event2 = mocker.MagicMock(spec=HoudiniEvent)
+        mock_event2.batching = True
+
+        mock_name1 = mocker.MagicMock(spec=str)
+        mock_name2 = mocker.MagicMock(spec=str)
+        mock_name3 = mocker.MagicMock(spec=str)
+
+        mock_events.return_value = {mock_name1: mock_event1, mock_name2: mock_event2}
+
+        mock_create = mocker.patch.object(
+            houdini_toolbox.events.manager.HoudiniEventManager, "create_event"
+        )
+        mock_create.return_value.batching = False
+
+        manager = init_manager()
+        manager._batched_events = []
+
+        manager.begin_batch([mock_name1, mock_name2, mock_name3])
+
+        mock_event1.begin_batch.assert_called_once()
+
+        # The event is already batching so it should not be started again.
+        mock_event2.begin_batch.assert_not_called()
+
+        # Events which don't exist yet are created so they are batched too.
+        mock_create.assert_called_once_with(mock_name3)
+        mock_create.return_value.begin_batch.assert_called_once()
+
+        assert manager._batched_events == [mock_event1, mock_create.return_value]
 
     def test_create_event(self, init_manager, mocker):
         """Test creating an event."""
@@ -199,6 +519,7 @@ class Test_HoudiniEventManager:
         mock_events.return_value = events
 
         manager = init_manager()
+        manager._disabling = False
 
         mock_name = mocker.MagicMock(spec=str)
 
@@ -206,8 +527,77 @@ class Test_HoudiniEventManager:
 
         assert result == mock_event
         assert mock_event in list(events.values())
+        assert mock_event.context.manager == manager
         mock_factory.get_event_type.assert_called_with(mock_name)
 
+    @pytest.mark.parametrize(
+        "names, disabled",
+        (
+            (None, True),
+            (["name"], True),
+            (["other"], False),
+        ),
+    )
+    def test_create_event__disabling(self, init_manager, mocker, names, disabled):
+        """Test creating an event while events are being disabled."""
+        mocker.patch.object(
+            houdini_toolbox.events.manager.HoudiniEventManager,
+            "events",
+            new_callable=mocker.PropertyMock,
+            return_value={},
+        )
+        mock_factory = mocker.patch(
+            "houdini_toolbox.events.manager.HoudiniEventFactory"
+        )
+
+        mock_event = mocker.MagicMock(spec=HoudiniEvent)
+        mock_event.enabled = True
+        mock_event.name = "name"
+        mock_factory.get_event_type.return_value = mock_event
+
+        manager = init_manager()
+        manager._disabling = True
+        manager._disabling_names = names
+        manager._event_states = {}
+
+        manager.create_event(mocker.MagicMock(spec=str))
+
+        assert mock_event.enabled is not disabled
+        assert manager._event_states == ({"name": True} if disabled else {})
+
+    def test_event_disabler__created_events(self, mocker):
+        """Test events created while disabling are disabled and then restored."""
+        mock_func = mocker.MagicMock()
+        mock_func.__name__ = "func"
+
+        manager = houdini_toolbox.events.manager.HoudiniEventManager()
+
+        with manager.event_disabler():
+            manager.register_item(HoudiniEventItem((mock_func,)), NodeEvents.OnCreated)
+
+            manager.run_event(NodeEvents.OnCreated, {})
+
+            assert not manager.events[NodeEvents.OnCreated].enabled
+
+        mock_func.assert_not_called()
+
+        assert manager.events[NodeEvents.OnCreated].enabled
+
+    def test_end_batch(self, init_manager, mocker):
+        """Test ending the batching of events."""
+        mock_event1 = mocker.MagicMock(spec=HoudiniEvent)
+        mock_event2 = mocker.MagicMock(spec=HoudiniEvent)
+
+        manager = init_manager()
+        manager._batched_events = [mock_event1, mock_event2]
+
+        manager.end_batch()
+
+        mock_event1.end_batch.assert_called_once()
+        mock_event2.end_batch.assert_called_once()
+
+        assert manager._batched_events == []
+
     def test_event_disabler(self, init_manager, mocker):
         """Test the event_disabler context manager."""
 
@@ -250,6 +640,9 @@ class Test_HoudiniEventManager:
         mock_create = mocker.patch.object(
             houdini_toolbox.events.manager.HoudiniEventManager, "create_event"
         )
+        mock_track = mocker.patch.object(
+            houdini_toolbox.events.manager.HoudiniEventManager, "_track_time_budget"
+        )
 
         mock_item1 = mocker.MagicMock(spec=HoudiniEventItem)
         mock_item2 = mocker.MagicMock(spec=HoudiniEventItem)
@@ -280,6 +673,13 @@ class Test_HoudiniEventManager:
         mock_event1.register_item.assert_called_with(mock_item1)
         mock_event2.register_item.assert_called_with(mock_item2)
 
+        mock_track.assert_has_calls(
+            [
+                mocker.call(mock_item1, mock_event_name1),
+                mocker.call(mock_item2, mock_event_name2),
+            ]
+        )
+
     def test_register_event_group__item_lists(self, init_manager, mocker):
         """Test registering a group where no event of that name has been created."""
         mock_events = mocker.patch.object(
@@ -290,6 +690,9 @@ class Test_HoudiniEventManager:
         mock_create = mocker.patch.object(
             houdini_toolbox.events.manager.HoudiniEventManager, "create_event"
         )
+        mock_track = mocker.patch.object(
+            houdini_toolbox.events.manager.HoudiniEventManager, "_track_time_budget"
+        )
 
         mock_item1 = mocker.MagicMock(spec=HoudiniEventItem)
         mock_item2 = mocker.MagicMock(spec=HoudiniEventItem)
@@ -322,6 +725,13 @@ class Test_HoudiniEventManager:
         mock_event1.register_item.assert_called_with(mock_item1)
         mock_event2.register_item.assert_called_with(mock_item2)
 
+        mock_track.assert_has_calls(
+            [
+                mocker.call(mock_item1, mock_event_name1),
+                mocker.call(mock_item2, mock_event_name2),
+            ]
+        )
+
     # register_item
 
     def test_register_item__invalid_type(self, init_manager, mocker):
@@ -342,6 +752,9 @@ class Test_HoudiniEventManager:
         mock_create = mocker.patch.object(
             houdini_toolbox.events.manager.HoudiniEventManager, "create_event"
         )
+        mock_track = mocker.patch.object(
+            houdini_toolbox.events.manager.HoudiniEventManager, "_track_time_budget"
+        )
 
         mock_event_name = mocker.MagicMock(spec=str)
 
@@ -361,6 +774,7 @@ class Test_HoudiniEventManager:
 
         mock_create.assert_called_with(mock_event_name)
         mock_event.register_item.assert_called_with(mock_item)
+        mock_track.assert_called_with(mock_item, mock_event_name)
 
     def test_register_item__existing_event(self, init_manager, mocker):
         """Test registering an item to an existing event."""
@@ -372,6 +786,9 @@ class Test_HoudiniEventManager:
         mock_create = mocker.patch.object(
             houdini_toolbox.events.manager.HoudiniEventManager, "create_event"
         )
+        mock_track = mocker.patch.object(
+            houdini_toolbox.events.manager.HoudiniEventManager, "_track_time_budget"
+        )
 
         mock_event_name = mocker.MagicMock(spec=str)
 
@@ -387,24 +804,48 @@ class Test_HoudiniEventManager:
 
         mock_create.assert_not_called()
         mock_event.register_item.assert_called_with(mock_item)
+        mock_track.assert_called_with(mock_item, mock_event_name)
+
+    # register_lazy
+
+    def test_register_lazy__invalid_type(self, init_manager):
+        """Test registering a non-LazyRegistration."""
+        manager = init_manager()
+
+        with pytest.raises(TypeError):
+            manager.register_lazy(None)
+
+    def test_register_lazy(self, init_manager, mocker):
+        """Test registering a lazy handler for multiple events."""
+        mock_event_name1 = mocker.MagicMock(spec=str)
+        mock_event_name2 = mocker.MagicMock(spec=str)
+
+        mock_existing = mocker.MagicMock(spec=LazyRegistration)
+
+        mock_registration = mocker.MagicMock(spec=LazyRegistration)
+        mock_registration.names = (mock_event_name1, mock_event_name2)
+
+        manager = init_manager()
+        manager._lazy_registrations = {mock_event_name1: [mock_existing]}
+
+        manager.register_lazy(mock_registration)
+
+        assert manager._lazy_registrations == {
+            mock_event_name1: [mock_existing, mock_registration],
+            mock_event_name2: [mock_registration],
+        }
 
     # run_event
 
     def test_run_event__no_event(self, init_manager, mocker):
         """Test running an event where there are no matching events."""
-        mock_events = mocker.patch.object(
-            houdini_toolbox.events.manager.HoudiniEventManager,
-            "events",
-            new_callable=mocker.PropertyMock,
-        )
-
         mock_event_name = mocker.MagicMock(spec=str)
 
-        mock_events.return_value = {}
-
         scriptargs = {}
 
         manager = init_manager()
+        manager._events = {}
+        manager._lazy_registrations = {}
 
         manager.run_event(mock_event_name, scriptargs)
 
@@ -412,19 +853,15 @@ class Test_HoudiniEventManager:
 
     def test_run_event__no_scriptargs(self, init_manager, mocker):
         """Test running an event with no particular args."""
-        mock_events = mocker.patch.object(
-            houdini_toolbox.events.manager.HoudiniEventManager,
-            "events",
-            new_callable=mocker.PropertyMock,
-        )
-
         mock_event_name = mocker.MagicMock(spec=str)
 
         mock_event = mocker.MagicMock(spec=HoudiniEvent)
-
-        mock_events.return_value = {mock_event_name: mock_event}
+        mock_event.needs_scriptargs_keys = True
 
         manager = init_manager()
+        manager._budgeted_items = {}
+        manager._events = {mock_event_name: mock_event}
+        manager._lazy_registrations = {}
 
         manager.run_event(mock_event_name)
 
@@ -434,19 +871,15 @@ class Test_HoudiniEventManager:
 
     def test_run_event__scriptargs(self, init_manager, mocker):
         """Test running an event while passing in args."""
-        mock_events = mocker.patch.object(
-            houdini_toolbox.events.manager.HoudiniEventManager,
-            "events",
-            new_callable=mocker.PropertyMock,
-        )
-
         mock_event_name = mocker.MagicMock(spec=str)
 
         mock_event = mocker.MagicMock(spec=HoudiniEvent)
-
-        mock_events.return_value = {mock_event_name: mock_event}
+        mock_event.needs_scriptargs_keys = True
 
         manager = init_manager()
+        manager._budgeted_items = {}
+        manager._events = {mock_event_name: mock_event}
+        manager._lazy_registrations = {}
 
         scriptargs = {"key": "value"}
 
@@ -458,6 +891,78 @@ class Test_HoudiniEventManager:
 
         assert scriptargs == expected_scriptargs
 
+    def test_run_event__context_items(self, init_manager, mocker):
+        """Test running an event whose items do not need the manager in the args."""
+        mock_event_name = mocker.MagicMock(spec=str)
+
+        mock_event = mocker.MagicMock(spec=HoudiniEvent)
+        mock_event.needs_scriptargs_keys = False
+
+        manager = init_manager()
+        manager._budgeted_items = {}
+        manager._events = {mock_event_name: mock_event}
+        manager._lazy_registrations = {}
+
+        scriptargs = {"key": "value"}
+
+        manager.run_event(mock_event_name, scriptargs)
+
+        mock_event.run.assert_called_with({"key": "value"})
+
+    def test_run_event__events_dict(self, mocker):
+        """Test running an event added directly to the events dict."""
+        mock_event = mocker.MagicMock(spec=HoudiniEvent)
+        mock_event.needs_scriptargs_keys = False
+
+        manager = houdini_toolbox.events.manager.HoudiniEventManager()
+        manager.events[NodeEvents.OnCreated] = mock_event
+
+        manager.run_event(NodeEvents.OnCreated, {})
+
+        mock_event.run.assert_called_with({})
+
+    def test_run_event__budgeted_items(self, init_manager, mocker):
+        """Test running an event with items which have time budgets."""
+        mock_check = mocker.patch.object(
+            houdini_toolbox.events.manager.HoudiniEventManager, "_check_time_budgets"
+        )
+
+        mock_event_name = mocker.MagicMock(spec=str)
+
+        mock_event = mocker.MagicMock(spec=HoudiniEvent)
+        mock_event.needs_scriptargs_keys = True
+
+        items = [mocker.MagicMock(spec=HoudiniEventItem)]
+
+        manager = init_manager()
+        manager._budgeted_items = {mock_event_name: items}
+        manager._events = {mock_event_name: mock_event}
+        manager._lazy_registrations = {}
+
+        manager.run_event(mock_event_name)
+
+        mock_event.run.assert_called()
+        mock_check.assert_called_with(mock_event, items)
+
+    def test_run_event__lazy_registrations(self, init_manager, mocker):
+        """Test running an event which has handlers waiting to be loaded."""
+        mock_load = mocker.patch.object(
+            houdini_toolbox.events.manager.HoudiniEventManager,
+            "_load_lazy_registrations",
+        )
+
+        mock_event_name = mocker.MagicMock(spec=str)
+
+        mock_registration = mocker.MagicMock(spec=LazyRegistration)
+
+        manager = init_manager()
+        manager._events = {}
+        manager._lazy_registrations = {mock_event_name: [mock_registration]}
+
+        manager.run_event(mock_event_name, {})
+
+        mock_load.assert_called_with(mock_event_name)
+
 
 def test_register_event_group(mocker):
     """Test houdini_toolbox.events.manager.register_event_group."""
@@ -499,13 +1004,29 @@ class Test_register_function:
         mock_item_name = mocker.MagicMock(spec=str)
         mock_priority = mocker.MagicMock(spec=int)
         mock_tags = mocker.MagicMock(spec=list)
+        mock_deferred = mocker.MagicMock(spec=bool)
+        mock_budget = mocker.MagicMock(spec=float)
+        mock_defer_over_budget = mocker.MagicMock(spec=bool)
 
         houdini_toolbox.events.manager.register_function(
-            mock_func, mock_event_name, mock_item_name, mock_priority, mock_tags
+            mock_func,
+            mock_event_name,
+            mock_item_name,
+            mock_priority,
+            mock_tags,
+            mock_deferred,
+            mock_budget,
+            mock_defer_over_budget,
         )
 
         mock_cls.assert_called_with(
-            (mock_func,), mock_item_name, mock_priority, stat_tags=mock_tags
+            (mock_func,),
+            mock_item_name,
+            mock_priority,
+            stat_tags=mock_tags,
+            deferred=mock_deferred,
+            time_budget=mock_budget,
+            defer_over_budget=mock_defer_over_budget,
         )
 
         mock_register_item.assert_called_with(mock_cls.return_value, mock_event_name)
@@ -534,6 +1055,25 @@ class Test_register_item:
         mock_manager.register_item.assert_called_with(mock_item, mock_event_name)
 
 
+def test_register_lazy(mocker):
+    """Test houdini_toolbox.events.manager.register_lazy."""
+    mock_manager = mocker.patch("houdini_toolbox.events.manager.EVENT_MANAGER")
+    mock_cls = mocker.patch(
+        "houdini_toolbox.events.manager.LazyRegistration", autospec=True
+    )
+
+    mock_module_name = mocker.MagicMock(spec=str)
+    mock_attribute = mocker.MagicMock(spec=str)
+    mock_event_names = mocker.MagicMock(spec=list)
+
+    houdini_toolbox.events.manager.register_lazy(
+        mock_module_name, mock_attribute, mock_event_names
+    )
+
+    mock_cls.assert_called_with(mock_module_name, mock_attribute, mock_event_names)
+    mock_manager.register_lazy.assert_called_with(mock_cls.return_value)
+
+
 def test_run_event(mocker):
     """Test houdini_toolbox.events.manager.run_event."""
     mock_manager = mocker.patch("houdini_toolbox.events.manager.EVENT_MANAGER")
@@ -5,6 +5,8 @@
 # =============================================================================
 
 # Standard Library
+import json
+import threading
 from collections import OrderedDict
 
 # Third Party
@@ -28,7 +30,11 @@ def init_item_stats(mocker):
     )
 
     def _create():
-        return houdini_toolbox.events.stats.HoudiniEventItemStats(None)
+        stats = houdini_toolbox.events.stats.HoudiniEventItemStats(None)
+        stats._local = threading.local()
+        stats._lock = threading.Lock()
+
+        return stats
 
     return _create
 
@@ -41,7 +47,11 @@ def init_stats(mocker):
     )
 
     def _create():
-        return houdini_toolbox.events.stats.HoudiniEventStats(None)
+        stats = houdini_toolbox.events.stats.HoudiniEventStats(None)
+        stats._local = threading.local()
+        stats._lock = threading.Lock()
+
+        return stats
 
     return _create
 
@@ -171,6 +181,235 @@ class Test__StatsMeta:
         assert inst1 is inst2
 
 
+class Test_CallableStats:
+    """Test houdini_toolbox.events.stats.CallableStats class."""
+
+    def test___init__(self):
+        """Test object initialization."""
+        stats = houdini_toolbox.events.stats.CallableStats()
+
+        assert stats.run_count == 0
+        assert stats.total_time_ns == 0
+
+        # The stats are slotted so no other attributes can be set.
+        with pytest.raises(AttributeError):
+            stats.foo = 1
+
+    def test_total_time(self):
+        """Test the 'total_time' property."""
+        stats = houdini_toolbox.events.stats.CallableStats()
+        stats.total_time_ns = 500_000_000
+
+        assert stats.total_time == 0.5
+
+
+class Test_EventTracer:
+    """Test houdini_toolbox.events.stats.EventTracer class."""
+
+    def test___init__(self):
+        """Test object initialization."""
+        tracer = houdini_toolbox.events.stats.EventTracer(5)
+
+        assert tracer._spans.maxlen == 5
+        assert not tracer._spans
+
+    # Methods
+
+    def test_clear(self):
+        """Test removing all recorded spans."""
+        tracer = houdini_toolbox.events.stats.EventTracer()
+        tracer.record("event", "name", 0, 1)
+
+        tracer.clear()
+
+        assert not tracer._spans
+
+    def test_get_trace_events(self, mocker):
+        """Test getting the spans as Chrome trace events."""
+        mocker.patch("os.getpid", return_value=123)
+
+        tracer = houdini_toolbox.events.stats.EventTracer()
+
+        # Spans are recorded as they end, so the contained spans come first.
+        tracer._spans.append(("callable", "func", 2000, 1000, 1))
+        tracer._spans.append(("item", "item", 1000, 3000, 1))
+        tracer._spans.append(("event", "event", 1000, 5000, 1))
+
+        result = tracer.get_trace_events()
+
+        assert result == [
+            {
+                "name": "event",
+                "cat": "event",
+                "ph": "X",
+                "ts": 1.0,
+                "dur": 5.0,
+                "pid": 123,
+                "tid": 1,
+            },
+            {
+                "name": "item",
+                "cat": "item",
+                "ph": "X",
+                "ts": 1.0,
+                "dur": 3.0,
+                "pid": 123,
+                "tid": 1,
+            },
+            {
+                "name": "func",
+                "cat": "callable",
+                "ph": "X",
+                "ts": 2.0,
+                "dur": 1.0,
+                "pid": 123,
+                "tid": 1,
+            },
+        ]
+
+    def test_record(self, mocker):
+        """Test recording spans into the ring buffer."""
+        mocker.patch("threading.get_ident", return_value=1)
+
+        tracer = houdini_toolbox.events.stats.EventTracer(2)
+
+        tracer.record("event", "name1", 0, 1)
+        tracer.record("item", None, 1, 2)
+        tracer.record("callable", "name3", 2, 3)
+
+        # The oldest span should be discarded.
+        assert list(tracer._spans) == [
+            ("item", "None", 1, 2, 1),
+            ("callable", "name3", 2, 3, 1),
+        ]
+
+    def test_write(self, mocker, tmp_path):
+        """Test writing the spans to a trace file."""
+        mock_get = mocker.patch.object(
+            houdini_toolbox.events.stats.EventTracer,
+            "get_trace_events",
+            return_value=[{"name": "name"}],
+        )
+
+        path = tmp_path / "trace.json"
+
+        tracer = houdini_toolbox.events.stats.EventTracer()
+        tracer.write(str(path))
+
+        mock_get.assert_called_once()
+
+        with open(path, encoding="utf-8") as handle:
+            assert json.load(handle) == {
+                "traceEvents": [{"name": "name"}],
+                "displayTimeUnit": "ms",
+            }
+
+
+class Test_LatencyHistogram:
+    """Test houdini_toolbox.events.stats.LatencyHistogram class."""
+
+    def test___init__(self):
+        """Test object initialization."""
+        histogram = houdini_toolbox.events.stats.LatencyHistogram()
+
+        assert not any(histogram._counts)
+        assert histogram._max_value == 0
+        assert histogram._total_count == 0
+
+    # Properties
+
+    def test_count(self):
+        """Test the 'count' property."""
+        histogram = houdini_toolbox.events.stats.LatencyHistogram()
+        histogram._total_count = 3
+
+        assert histogram.count == 3
+
+    def test_max(self):
+        """Test the 'max' property."""
+        histogram = houdini_toolbox.events.stats.LatencyHistogram()
+        histogram._max_value = 1_500_000_000
+
+        assert histogram.max == 1.5
+
+    # Methods
+
+    def test_percentile__empty(self):
+        """Test getting a percentile when no values have been recorded."""
+        histogram = houdini_toolbox.events.stats.LatencyHistogram()
+
+        assert histogram.percentile(50) == 0.0
+
+    def test_percentile(self):
+        """Test getting percentiles from recorded values."""
+        histogram = houdini_toolbox.events.stats.LatencyHistogram()
+
+        # 98 fast runs of 1ms and 2 slow spikes of 500ms.
+        for _ in range(98):
+            histogram.record(1_000_000)
+
+        histogram.record(500_000_000)
+        histogram.record(500_000_000)
+
+        assert histogram.percentile(50) == pytest.approx(0.001, rel=0.125)
+        assert histogram.percentile(95) == pytest.approx(0.001, rel=0.125)
+
+        # The largest bucket is limited to the max recorded value.
+        assert histogram.percentile(99) == 0.5
+        assert histogram.percentile(100) == 0.5
+
+    def test_record(self):
+        """Test recording values."""
+        histogram = houdini_toolbox.events.stats.LatencyHistogram()
+
+        histogram.record(5)
+        histogram.record(3)
+
+        assert histogram._counts[5] == 1
+        assert histogram._counts[3] == 1
+        assert histogram._max_value == 5
+        assert histogram._total_count == 2
+
+    def test_record__max(self):
+        """Test recording a value larger than the max trackable value."""
+        histogram = houdini_toolbox.events.stats.LatencyHistogram()
+
+        value = houdini_toolbox.events.stats._HISTOGRAM_MAX_VALUE * 2
+
+        histogram.record(value)
+
+        assert histogram._counts[-1] == 1
+        assert histogram._max_value == value
+
+    def test_reset(self):
+        """Test clearing recorded values."""
+        histogram = houdini_toolbox.events.stats.LatencyHistogram()
+
+        histogram.record(5)
+        histogram.reset()
+
+        assert not any(histogram._counts)
+        assert histogram._max_value == 0
+        assert histogram._total_count == 0
+
+    def test_summary(self, mocker):
+        """Test getting a summary of the recorded values."""
+        mock_percentile = mocker.patch.object(
+            houdini_toolbox.events.stats.LatencyHistogram,
+            "percentile",
+            side_effect=lambda percent: percent / 100,
+        )
+
+        histogram = houdini_toolbox.events.stats.LatencyHistogram()
+        histogram._max_value = 2_000_000_000
+
+        result = histogram.summary()
+
+        assert result == {"p50": 0.5, "p95": 0.95, "p99": 0.99, "max": 2.0}
+
+        assert mock_percentile.call_count == 3
+
+
 class Test_HoudiniEventStats:
     """Test houdini_toolbox.events.stats.HoudiniEventStats class."""
 
@@ -182,12 +421,16 @@ class Test_HoudiniEventStats:
             mock_name, post_report=True
         )
 
-        assert stats._last_run_time == 0
-        assert stats._last_started == 0
+        assert isinstance(
+            stats._histogram, houdini_toolbox.events.stats.LatencyHistogram
+        )
+        assert stats._last_run_time_ns == 0
+        assert stats._last_started_ns == 0
         assert stats._name == mock_name
         assert stats._post_report
+        assert stats._rolling_average_ns == 0
         assert stats._run_count == 0
-        assert stats._total_time == 0
+        assert stats._total_time_ns == 0
 
         assert stats._tags == []
 
@@ -199,23 +442,35 @@ class Test_HoudiniEventStats:
             mock_name, tags=mock_tags, post_report=True
         )
 
-        assert stats._last_run_time == 0
-        assert stats._last_started == 0
+        assert isinstance(
+            stats._histogram, houdini_toolbox.events.stats.LatencyHistogram
+        )
+        assert stats._last_run_time_ns == 0
+        assert stats._last_started_ns == 0
         assert stats._name == mock_name
         assert stats._post_report
+        assert stats._rolling_average_ns == 0
         assert stats._run_count == 0
-        assert stats._total_time == 0
+        assert stats._total_time_ns == 0
         assert stats._tags == mock_tags
 
     # Properties
 
+    def test_histogram(self, init_stats, mocker):
+        """Test the 'histogram' property."""
+        mock_value = mocker.MagicMock(
+            spec=houdini_toolbox.events.stats.LatencyHistogram
+        )
+
+        stats = init_stats()
+        stats._histogram = mock_value
+        assert stats.histogram == mock_value
+
     def test_last_run_time(self, init_stats, mocker):
         """Test the 'last_run_time' property."""
-        mock_value = mocker.MagicMock(spec=float)
-
         stats = init_stats()
-        stats._last_run_time = mock_value
-        assert stats.last_run_time == mock_value
+        stats._last_run_time_ns = 1_500_000_000
+        assert stats.last_run_time == 1.5
 
     def test_name(self, init_stats, mocker):
         """Test the 'name' property."""
@@ -233,6 +488,12 @@ class Test_HoudiniEventStats:
         stats._post_report = mock_value
         assert stats.post_report == mock_value
 
+    def test_rolling_average(self, init_stats):
+        """Test the 'rolling_average' property."""
+        stats = init_stats()
+        stats._rolling_average_ns = 2_500_000_000.0
+        assert stats.rolling_average == 2.5
+
     def test_run_count(self, init_stats, mocker):
         """Test the 'last_run_time' property."""
         mock_value = mocker.MagicMock(spec=int)
@@ -251,34 +512,35 @@ class Test_HoudiniEventStats:
 
     def test_total_time(self, init_stats, mocker):
         """Test the 'total_time' property."""
-        mock_value = mocker.MagicMock(spec=float)
-
         stats = init_stats()
-        stats._total_time = mock_value
-        assert stats.total_time == mock_value
+        stats._total_time_ns = 2_250_000_000
+        assert stats.total_time == 2.25
 
     # Methods
 
     def test___enter__(self, init_stats, mocker):
         """Test the __enter__ method."""
-        mock_time = mocker.patch("time.time")
+        mock_time = mocker.patch("time.perf_counter_ns")
 
         stats = init_stats()
 
         stats.__enter__()
 
-        assert stats._last_started == mock_time.return_value
+        assert stats._local.started_ns == mock_time.return_value
 
     @pytest.mark.parametrize("print_report", [True, False])
     def test___exit___with_report(self, init_stats, mocker, print_report):
         """Test __exit__."""
-        mock_time = mocker.patch("time.time")
+        mock_time = mocker.patch("time.perf_counter_ns")
         mock_print = mocker.patch.object(
             houdini_toolbox.events.stats.HoudiniEventStats, "print_report"
         )
 
         stats = init_stats()
 
+        stats._histogram = mocker.MagicMock(
+            spec=houdini_toolbox.events.stats.LatencyHistogram
+        )
         stats._post_report = print_report
 
         mock_run_time = mocker.MagicMock(spec=int)
@@ -289,9 +551,10 @@ class Test_HoudiniEventStats:
         mock_last_started = mocker.MagicMock(spec=int)
         mock_run_count = mocker.MagicMock(spec=int)
 
-        stats._last_run_time = mock_last_run_time
-        stats._total_time = mock_total_time
-        stats._last_started = mock_last_started
+        stats._last_run_time_ns = mock_last_run_time
+        stats._total_time_ns = mock_total_time
+        stats._local.started_ns = mock_last_started
+        stats._rolling_average_ns = 0.0
         stats._run_count = mock_run_count
 
         exc_type = mocker.MagicMock()
@@ -302,43 +565,131 @@ class Test_HoudiniEventStats:
 
         run_time = mock_run_time - mock_last_started
 
-        assert stats._last_run_time == run_time
-        assert stats._total_time == mock_total_time + run_time
+        assert stats._last_run_time_ns == run_time
+        assert stats._total_time_ns == mock_total_time + run_time
         assert stats._run_count == mock_run_count + 1
 
+        stats._histogram.record.assert_called_with(run_time)
+
+        # Not tracing so the tracer is not available.
+        assert stats.tracer is None
+
         if print_report:
             mock_print.assert_called_once()
 
         else:
             mock_print.assert_not_called()
 
+    def test___exit___tracer(self, init_stats, mocker):
+        """Test __exit__ while tracing."""
+        mocker.patch("time.perf_counter_ns", return_value=300)
+        mock_tracer = mocker.patch.object(
+            houdini_toolbox.events.stats.HoudiniEventStats,
+            "tracer",
+            mocker.MagicMock(spec=houdini_toolbox.events.stats.EventTracer),
+        )
+
+        stats = init_stats()
+
+        stats._histogram = houdini_toolbox.events.stats.LatencyHistogram()
+        stats._local.started_ns = 100
+        stats._name = "name"
+        stats._post_report = False
+        stats._run_count = 0
+        stats._total_time_ns = 0
+
+        stats.__exit__(None, None, None)
+
+        mock_tracer.record.assert_called_with("event", "name", 100, 200)
+
+    def test___exit___rolling_average(self, init_stats, mocker):
+        """Test __exit__ updates the rolling average."""
+        mock_time = mocker.patch("time.perf_counter_ns")
+
+        stats = init_stats()
+
+        stats._histogram = houdini_toolbox.events.stats.LatencyHistogram()
+        stats._local.started_ns = 0
+        stats._post_report = False
+        stats._rolling_average_ns = 0.0
+        stats._run_count = 0
+        stats._total_time_ns = 0
+
+        # The first run sets the average directly.
+        mock_time.return_value = 1000
+        stats.__exit__(None, None, None)
+
+        assert stats._rolling_average_ns == 1000
+
+        # Later runs move the average towards the new run time.
+        mock_time.return_value = 2000
+        stats.__exit__(None, None, None)
+
+        expected = (
+            1000 + (2000 - 1000) * houdini_toolbox.events.stats._ROLLING_AVERAGE_WEIGHT
+        )
+
+        assert stats._rolling_average_ns == pytest.approx(expected)
+
+    def test___exit___threads(self, reset_meta_instances):
+        """Test timing runs on multiple threads at once."""
+        stats = houdini_toolbox.events.stats.HoudiniEventStats("threads")
+
+        barrier = threading.Barrier(4)
+
+        def _run():
+            barrier.wait()
+
+            for _ in range(1000):
+                with stats:
+                    pass
+
+        threads = [threading.Thread(target=_run) for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        assert stats.run_count == 4000
+        assert stats.histogram.count == 4000
+
     def test_print_report(self, init_stats, mocker):
         """Test printing a report."""
         mock_logger = mocker.patch("houdini_toolbox.events.stats._logger")
 
         stats = init_stats()
 
-        stats._last_run_time = 3.123456
+        stats._histogram = houdini_toolbox.events.stats.LatencyHistogram()
+        stats._last_run_time_ns = 3123456000
         stats._run_count = 2
         stats._name = "name"
 
         stats.print_report()
 
-        assert mock_logger.info.call_count == 3
+        assert mock_logger.info.call_count == 4
 
     def test_reset(self, init_stats, mocker):
         """Test resetting internal data."""
         stats = init_stats()
 
-        stats._last_run_time = mocker.MagicMock(spec=float)
+        stats._histogram = mocker.MagicMock(
+            spec=houdini_toolbox.events.stats.LatencyHistogram
+        )
+        stats._last_run_time_ns = mocker.MagicMock(spec=int)
+        stats._rolling_average_ns = mocker.MagicMock(spec=float)
         stats._run_count = mocker.MagicMock(spec=int)
-        stats._total_time = mocker.MagicMock(spec=float)
+        stats._total_time_ns = mocker.MagicMock(spec=int)
 
         stats.reset()
 
-        assert stats._last_run_time == 0
+        assert stats._last_run_time_ns == 0
+        assert stats._rolling_average_ns == 0
         assert stats._run_count == 0
-        assert stats._total_time == 0
+        assert stats._total_time_ns == 0
+
+        stats._histogram.reset.assert_called_once()
 
 
 class Test_HoudiniEventItemStats:
@@ -377,19 +728,23 @@ class Test_HoudiniEventItemStats:
         """Test printing a report."""
         mock_logger = mocker.patch("houdini_toolbox.events.stats._logger")
 
+        callable_stats = houdini_toolbox.events.stats.CallableStats()
+        callable_stats.total_time_ns = 123456789
+
         item_stats = OrderedDict()
-        item_stats["stat name"] = 123.456789
+        item_stats["stat name"] = callable_stats
 
         stats = init_item_stats()
 
         stats._run_count = 2
         stats._name = "name"
+        stats._histogram = houdini_toolbox.events.stats.LatencyHistogram()
         stats._item_stats = item_stats
-        stats._last_run_time = 456.12345678
+        stats._last_run_time_ns = 456123456780
 
         stats.print_report()
 
-        assert mock_logger.info.call_count == 5
+        assert mock_logger.info.call_count == 6
 
     def test_reset(self, init_item_stats, mocker):
         """Test resetting internal data."""
@@ -410,48 +765,99 @@ class Test_HoudiniEventItemStats:
         mock_item_stats.return_value.clear.assert_called_once()
 
     @pytest.mark.parametrize("has_existing", (False, True))
-    def test_time_function(self, init_item_stats, mocker, has_existing):
-        """Test timing a function."""
-        mock_item_stats = mocker.patch.object(
-            houdini_toolbox.events.stats.HoudiniEventItemStats,
-            "item_stats",
-            new_callable=mocker.PropertyMock,
-        )
-        mock_time = mocker.patch("time.time")
+    def test_add_function_time(self, init_item_stats, mocker, has_existing):
+        """Test adding a function run time."""
+        mock_func = mocker.MagicMock()
+        mock_func.__name__ = "func_name"
 
-        mock_start1 = mocker.MagicMock(spec=int)
-        mock_start2 = mocker.MagicMock(spec=int)
-        mock_end1 = mocker.MagicMock(spec=int)
-        mock_end2 = mocker.MagicMock(spec=int)
+        odict = OrderedDict()
 
-        mock_time.side_effect = (mock_start1, mock_end1, mock_start2, mock_end2)
+        if has_existing:
+            existing = houdini_toolbox.events.stats.CallableStats()
+            existing.run_count = 2
+            existing.total_time_ns = 100
 
-        mock_func1 = mocker.MagicMock()
-        mock_func1.__name__ = mocker.MagicMock(spec=str)
+            odict["func_name"] = existing
 
-        mock_func2 = mocker.MagicMock()
-        mock_func2.__name__ = mocker.MagicMock(spec=str)
+        stats = init_item_stats()
+        stats._item_stats = odict
 
-        odict = OrderedDict()
+        stats.add_function_time(mock_func, 50, 10)
+
+        result = stats._item_stats["func_name"]
 
         if has_existing:
-            odict[mock_func1.__name__] = 1
+            assert result is existing
+            assert result.run_count == 3
+            assert result.total_time_ns == 150
 
-        mock_item_stats.return_value = odict
+        else:
+            assert result.run_count == 1
+            assert result.total_time_ns == 50
+
+    def test_add_function_time__tracer(self, init_item_stats, mocker):
+        """Test adding a function run time while tracing."""
+        mock_tracer = mocker.patch.object(
+            houdini_toolbox.events.stats.HoudiniEventStats,
+            "tracer",
+            mocker.MagicMock(spec=houdini_toolbox.events.stats.EventTracer),
+        )
+
+        mock_func = mocker.MagicMock()
+        mock_func.__name__ = "func_name"
 
         stats = init_item_stats()
+        stats._item_stats = OrderedDict()
 
-        with stats.time_function(mock_func1):
-            pass
+        stats.add_function_time(mock_func, 50, 10)
 
-        with stats.time_function(mock_func2):
+        mock_tracer.record.assert_called_with("callable", "func_name", 10, 50)
+
+    def test_time_function(self, init_item_stats, mocker):
+        """Test timing a function."""
+        mock_add = mocker.patch.object(
+            houdini_toolbox.events.stats.HoudiniEventItemStats, "add_function_time"
+        )
+        mocker.patch("time.perf_counter_ns", side_effect=(100, 350))
+
+        mock_func = mocker.MagicMock()
+
+        stats = init_item_stats()
+
+        with stats.time_function(mock_func):
             pass
 
-        expected = OrderedDict()
-        expected[mock_func1.__name__] = 0 + (mock_end1 - mock_start1)
-        expected[mock_func2.__name__] = 0 + (mock_end2 - mock_start2)
+        mock_add.assert_called_with(mock_func, 250, 100)
+
 
-        assert stats.item_stats == expected
+@pytest.mark.parametrize("value", (0, 7, 15, 16, 31, 1000, 123456789, 2**39 + 1))
+def test__get_bucket_index(value):
+    """Test houdini_toolbox.events.stats._get_bucket_index."""
+    index = houdini_toolbox.events.stats._get_bucket_index(value)
+
+    # The value must lie within its bucket.
+    assert houdini_toolbox.events.stats._get_bucket_upper_bound(index) >= value
+
+    if index:
+        assert houdini_toolbox.events.stats._get_bucket_upper_bound(index - 1) < value
+
+
+@pytest.mark.parametrize(
+    "index, expected", ((0, 0), (15, 15), (16, 17), (23, 31), (24, 35))
+)
+def test__get_bucket_upper_bound(index, expected):
+    """Test houdini_toolbox.events.stats._get_bucket_upper_bound."""
+    assert houdini_toolbox.events.stats._get_bucket_upper_bound(index) == expected
+
+
+def test__get_latencies(mocker):
+    """Test houdini_toolbox.events.stats._get_latencies."""
+    mock_stats = mocker.MagicMock(spec=houdini_toolbox.events.stats.HoudiniEventStats)
+    mock_stats.name = "name"
+
+    result = houdini_toolbox.events.stats._get_latencies((mock_stats,))
+
+    assert result == {"name": mock_stats.histogram.summary.return_value}
 
 
 def test__get_matching_stats(mocker):
@@ -472,6 +878,35 @@ def test__get_matching_stats(mocker):
     assert result == (mock_stats1,)
 
 
+def test__start_env_trace(mocker):
+    """Test houdini_toolbox.events.stats._start_env_trace."""
+    mock_start = mocker.patch("houdini_toolbox.events.stats.start_trace")
+    mock_register = mocker.patch("atexit.register")
+    mocker.patch.dict("os.environ", {"HT_EVENT_TRACE": "/path/to/trace.json"})
+
+    houdini_toolbox.events.stats._start_env_trace()
+
+    mock_start.assert_called_once()
+    mock_register.assert_called_with(
+        mock_start.return_value.write, "/path/to/trace.json"
+    )
+
+
+def test_get_event_latencies(mocker):
+    """Test houdini_toolbox.events.stats.get_event_latencies."""
+    mock_get_stats = mocker.patch("houdini_toolbox.events.stats.get_event_stats")
+    mock_get_latencies = mocker.patch("houdini_toolbox.events.stats._get_latencies")
+
+    mock_tags = mocker.MagicMock(spec=list)
+
+    result = houdini_toolbox.events.stats.get_event_latencies(mock_tags)
+
+    assert result == mock_get_latencies.return_value
+
+    mock_get_stats.assert_called_with(mock_tags)
+    mock_get_latencies.assert_called_with(mock_get_stats.return_value)
+
+
 class Test_get_event_stats:
     """Test houdini_toolbox.events.stats.get_event_stats."""
 
@@ -542,6 +977,21 @@ class Test_get_event_stats:
         mock_matching.assert_called_with([mock_stats], [mock_tag])
 
 
+def test_get_item_latencies(mocker):
+    """Test houdini_toolbox.events.stats.get_item_latencies."""
+    mock_get_stats = mocker.patch("houdini_toolbox.events.stats.get_item_stats")
+    mock_get_latencies = mocker.patch("houdini_toolbox.events.stats._get_latencies")
+
+    mock_tags = mocker.MagicMock(spec=list)
+
+    result = houdini_toolbox.events.stats.get_item_latencies(mock_tags)
+
+    assert result == mock_get_latencies.return_value
+
+    mock_get_stats.assert_called_with(mock_tags)
+    mock_get_latencies.assert_called_with(mock_get_stats.return_value)
+
+
 class Test_get_item_stats:
     """Test houdini_toolbox.events.stats.get_item_stats."""
 
@@ -608,3 +1058,80 @@ class Test_get_item_stats:
         assert result == mock_matching.return_value
 
         mock_matching.assert_called_with([mock_stats], [mock_tag])
+
+
+def test_set_stats_enabled(mocker):
+    """Test houdini_toolbox.events.stats.set_stats_enabled."""
+    mocker.patch.object(houdini_toolbox.events.stats.HoudiniEventStats, "enabled", True)
+
+    houdini_toolbox.events.stats.set_stats_enabled(False)
+
+    assert not houdini_toolbox.events.stats.HoudiniEventStats.enabled
+    assert not houdini_toolbox.events.stats.HoudiniEventItemStats.enabled
+
+
+def test_start_trace(mocker):
+    """Test houdini_toolbox.events.stats.start_trace."""
+    mocker.patch.object(houdini_toolbox.events.stats.HoudiniEventStats, "tracer", None)
+
+    result = houdini_toolbox.events.stats.start_trace(10)
+
+    assert isinstance(result, houdini_toolbox.events.stats.EventTracer)
+    assert result._spans.maxlen == 10
+    assert houdini_toolbox.events.stats.HoudiniEventStats.tracer is result
+
+
+def test_stop_trace(mocker):
+    """Test houdini_toolbox.events.stats.stop_trace."""
+    mock_tracer = mocker.MagicMock(spec=houdini_toolbox.events.stats.EventTracer)
+    mocker.patch.object(
+        houdini_toolbox.events.stats.HoudiniEventStats, "tracer", mock_tracer
+    )
+
+    result = houdini_toolbox.events.stats.stop_trace()
+
+    assert result is mock_tracer
+    assert houdini_toolbox.events.stats.HoudiniEventStats.tracer is None
+
+
+class Test_trace_events:
+    """Test houdini_toolbox.events.stats.trace_events."""
+
+    def test_no_path(self, mocker):
+        """Test tracing without writing a file."""
+        mock_previous = mocker.MagicMock(spec=houdini_toolbox.events.stats.EventTracer)
+        mocker.patch.object(
+            houdini_toolbox.events.stats.HoudiniEventStats, "tracer", mock_previous
+        )
+        mock_write = mocker.patch.object(
+            houdini_toolbox.events.stats.EventTracer, "write"
+        )
+
+        with houdini_toolbox.events.stats.trace_events(buffer_size=5) as tracer:
+            assert houdini_toolbox.events.stats.HoudiniEventStats.tracer is tracer
+            assert tracer._spans.maxlen == 5
+
+        # The previous tracer should be restored.
+        assert houdini_toolbox.events.stats.HoudiniEventStats.tracer is mock_previous
+
+        mock_write.assert_not_called()
+
+    def test_path(self, mocker):
+        """Test tracing and writing a file."""
+        mocker.patch.object(
+            houdini_toolbox.events.stats.HoudiniEventStats, "tracer", None
+        )
+        mock_write = mocker.patch.object(
+            houdini_toolbox.events.stats.EventTracer, "write"
+        )
+
+        mock_path = mocker.MagicMock(spec=str)
+
+        with pytest.raises(RuntimeError):
+            with houdini_toolbox.events.stats.trace_events(mock_path):
+                raise RuntimeError()
+
+        assert houdini_toolbox.events.stats.HoudiniEventStats.tracer is None
+
+        # The trace should still be written.
+        mock_write.assert_called_with(mock_path)
@@ -0,0 +1,461 @@
+"""Tests for houdini_toolbox.events.telemetry module."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+# Standard Library
+import json
+import socket
+import threading
+
+# Third Party
+import pytest
+
+# Houdini Toolbox
+import houdini_toolbox.events.telemetry
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+@pytest.fixture
+def init_sampler(mocker):
+    """Fixture to initialize a sampler."""
+    mocker.patch.object(
+        houdini_toolbox.events.telemetry.PeakRssSampler, "__init__", lambda x: None
+    )
+
+    def _create():
+        return houdini_toolbox.events.telemetry.PeakRssSampler()
+
+    return _create
+
+
+@pytest.fixture
+def init_writer(mocker):
+    """Fixture to initialize a writer."""
+    mocker.patch.object(
+        houdini_toolbox.events.telemetry.TelemetryWriter, "__init__", lambda x: None
+    )
+
+    def _create():
+        return houdini_toolbox.events.telemetry.TelemetryWriter()
+
+    return _create
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+class Test_PeakRssSampler:
+    """Test houdini_toolbox.events.telemetry.PeakRssSampler class."""
+
+    def test___init__(self, mocker):
+        """Test object initialization."""
+        mock_interval = mocker.MagicMock(spec=float)
+
+        sampler = houdini_toolbox.events.telemetry.PeakRssSampler(mock_interval)
+
+        assert sampler._interval == mock_interval
+        assert sampler._peak is None
+        assert isinstance(sampler._stop_event, threading.Event)
+        assert sampler._thread is None
+
+    # Non-Public Methods
+
+    @pytest.mark.parametrize(
+        "peak, rss, expected",
+        ((None, 10, 10), (5, 10, 10), (15, 10, 15), (15, None, 15)),
+    )
+    def test__sample(self, init_sampler, mocker, peak, rss, expected):
+        """Test sampling the current memory."""
+        mocker.patch(
+            "houdini_toolbox.events.telemetry._get_current_rss", return_value=rss
+        )
+
+        sampler = init_sampler()
+        sampler._peak = peak
+
+        sampler._sample()
+
+        assert sampler._peak == expected
+
+    # Properties
+
+    def test_peak(self, init_sampler, mocker):
+        """Test the 'peak' property."""
+        mock_value = mocker.MagicMock(spec=int)
+
+        sampler = init_sampler()
+        sampler._peak = mock_value
+
+        assert sampler.peak == mock_value
+
+    def test_running(self, init_sampler, mocker):
+        """Test the 'running' property."""
+        sampler = init_sampler()
+        sampler._thread = None
+
+        assert not sampler.running
+
+        sampler._thread = mocker.MagicMock(spec=threading.Thread)
+
+        assert sampler.running
+
+    # Methods
+
+    def test_start_stop(self, mocker):
+        """Test sampling on the background thread."""
+        samples = iter((10, 30))
+
+        mocker.patch(
+            "houdini_toolbox.events.telemetry._get_current_rss",
+            side_effect=lambda: next(samples, 20),
+        )
+
+        sampler = houdini_toolbox.events.telemetry.PeakRssSampler(0.001)
+        sampler._peak = 100
+
+        sampler.start()
+
+        assert sampler.running
+
+        # Starting again does nothing.
+        sampler.start()
+
+        # Wait for a background sample.
+        while sampler._peak == 10:
+            sampler._thread.join(0.001)
+
+        assert sampler.stop() == 30
+        assert not sampler.running
+
+    def test_stop__no_samples(self, init_sampler, mocker):
+        """Test stopping when the current memory could not be sampled."""
+        mock_max = mocker.patch("houdini_toolbox.events.telemetry._get_max_rss")
+
+        sampler = init_sampler()
+        sampler._peak = None
+        sampler._thread = None
+
+        assert sampler.stop() == mock_max.return_value
+
+
+class Test_TelemetryWriter:
+    """Test houdini_toolbox.events.telemetry.TelemetryWriter class."""
+
+    def test___init__(self, mocker):
+        """Test object initialization."""
+        mock_target = mocker.MagicMock(spec=str)
+        mock_batch_size = mocker.MagicMock(spec=int)
+
+        writer = houdini_toolbox.events.telemetry.TelemetryWriter(
+            mock_target, mock_batch_size
+        )
+
+        assert writer._batch_size == mock_batch_size
+        assert writer._buffer == []
+        assert not writer._disabled
+        assert writer._handle is None
+        assert writer._socket is None
+        assert writer._target == mock_target
+
+    # Non-Public Methods
+
+    def test__send__file(self, init_writer, tmp_path):
+        """Test writing to a file."""
+        path = tmp_path / "telemetry.jsonl"
+        path.write_text("existing\n")
+
+        writer = init_writer()
+        writer._handle = None
+        writer._target = str(path)
+
+        writer._send("data1\n")
+        writer._send("data2\n")
+
+        assert path.read_text() == "existing\ndata1\ndata2\n"
+
+        writer._handle.close()
+
+    def test__send__socket(self, init_writer, mocker):
+        """Test writing to a socket."""
+        mock_create = mocker.patch(
+            "houdini_toolbox.events.telemetry.socket.create_connection"
+        )
+
+        writer = init_writer()
+        writer._socket = None
+        writer._target = "tcp://farmhost:9000"
+
+        writer._send("data1\n")
+        writer._send("data2\n")
+
+        mock_create.assert_called_once_with(
+            ("farmhost", 9000),
+            timeout=houdini_toolbox.events.telemetry._SOCKET_TIMEOUT,
+        )
+
+        mock_create.return_value.sendall.assert_has_calls(
+            [mocker.call(b"data1\n"), mocker.call(b"data2\n")]
+        )
+
+    # Properties
+
+    def test_batch_size(self, init_writer, mocker):
+        """Test the 'batch_size' property."""
+        mock_value = mocker.MagicMock(spec=int)
+
+        writer = init_writer()
+        writer._batch_size = mock_value
+
+        assert writer.batch_size == mock_value
+
+    def test_disabled(self, init_writer, mocker):
+        """Test the 'disabled' property."""
+        mock_value = mocker.MagicMock(spec=bool)
+
+        writer = init_writer()
+        writer._disabled = mock_value
+
+        assert writer.disabled == mock_value
+
+    def test_pending(self, init_writer):
+        """Test the 'pending' property."""
+        writer = init_writer()
+        writer._buffer = ["data1\n", "data2\n"]
+
+        assert writer.pending == 2
+
+    def test_target(self, init_writer, mocker):
+        """Test the 'target' property."""
+        mock_value = mocker.MagicMock(spec=str)
+
+        writer = init_writer()
+        writer._target = mock_value
+
+        assert writer.target == mock_value
+
+    # Methods
+
+    def test_close(self, init_writer, mocker):
+        """Test closing the writer."""
+        mock_flush = mocker.patch.object(
+            houdini_toolbox.events.telemetry.TelemetryWriter, "flush"
+        )
+
+        mock_handle = mocker.MagicMock()
+        mock_socket = mocker.MagicMock(spec=socket.socket)
+
+        writer = init_writer()
+        writer._handle = mock_handle
+        writer._socket = mock_socket
+
+        writer.close()
+
+        mock_flush.assert_called()
+        mock_handle.close.assert_called()
+        mock_socket.close.assert_called()
+
+        assert writer._handle is None
+        assert writer._socket is None
+
+    def test_flush__empty(self, init_writer, mocker):
+        """Test flushing when nothing is buffered."""
+        mock_send = mocker.patch.object(
+            houdini_toolbox.events.telemetry.TelemetryWriter, "_send"
+        )
+
+        writer = init_writer()
+        writer._buffer = []
+
+        writer.flush()
+
+        mock_send.assert_not_called()
+
+    def test_flush(self, init_writer, mocker):
+        """Test writing the buffered records."""
+        mock_send = mocker.patch.object(
+            houdini_toolbox.events.telemetry.TelemetryWriter, "_send"
+        )
+
+        writer = init_writer()
+        writer._buffer = ["data1\n", "data2\n"]
+        writer._disabled = False
+
+        writer.flush()
+
+        mock_send.assert_called_once_with("data1\ndata2\n")
+
+        assert writer._buffer == []
+
+    def test_flush__disabled(self, init_writer, mocker):
+        """Test buffered records are dropped when the writer is disabled."""
+        mock_send = mocker.patch.object(
+            houdini_toolbox.events.telemetry.TelemetryWriter, "_send"
+        )
+
+        writer = init_writer()
+        writer._buffer = ["data1\n"]
+        writer._disabled = True
+
+        writer.flush()
+
+        mock_send.assert_not_called()
+
+        assert writer._buffer == []
+
+    @pytest.mark.parametrize("error", (OSError, socket.timeout))
+    def test_flush__error(self, init_writer, mocker, error):
+        """Test a failed write is logged and the writer disabled."""
+        mocker.patch.object(
+            houdini_toolbox.events.telemetry.TelemetryWriter,
+            "_send",
+            side_effect=error,
+        )
+        mock_logger = mocker.patch("houdini_toolbox.events.telemetry._logger")
+
+        mock_socket = mocker.MagicMock(spec=socket.socket)
+
+        writer = init_writer()
+        writer._buffer = ["data1\n"]
+        writer._disabled = False
+        writer._socket = mock_socket
+        writer._target = "tcp://farmhost:9000"
+
+        writer.flush()
+
+        assert writer._buffer == []
+        assert writer._disabled
+        assert writer._socket is None
+
+        mock_socket.close.assert_called()
+        mock_logger.warning.assert_called()
+
+    def test_write(self, init_writer, mocker):
+        """Test buffering records."""
+        mock_flush = mocker.patch.object(
+            houdini_toolbox.events.telemetry.TelemetryWriter, "flush"
+        )
+
+        writer = init_writer()
+        writer._batch_size = 2
+        writer._buffer = []
+        writer._disabled = False
+
+        writer.write({"frame": 1, "node": "/out/rop"})
+
+        assert [json.loads(line) for line in writer._buffer] == [
+            {"frame": 1, "node": "/out/rop"}
+        ]
+        mock_flush.assert_not_called()
+
+        writer.write({"frame": 2, "node": "/out/rop"})
+
+        mock_flush.assert_called_once()
+
+    def test_write__disabled(self, init_writer, mocker):
+        """Test records are not buffered when the writer is disabled."""
+        mock_flush = mocker.patch.object(
+            houdini_toolbox.events.telemetry.TelemetryWriter, "flush"
+        )
+
+        writer = init_writer()
+        writer._batch_size = 1
+        writer._buffer = []
+        writer._disabled = True
+
+        writer.write({"frame": 1, "node": "/out/rop"})
+
+        assert writer._buffer == []
+        mock_flush.assert_not_called()
+
+
+class Test__get_current_rss:
+    """Test houdini_toolbox.events.telemetry._get_current_rss."""
+
+    def test(self, mocker):
+        """Test reading the current memory."""
+        mocker.patch("builtins.open", mocker.mock_open(read_data="100 25 10 1 0 5 0"))
+        mocker.patch("houdini_toolbox.events.telemetry.os.sysconf", return_value=4096)
+
+        assert houdini_toolbox.events.telemetry._get_current_rss() == 25 * 4096
+
+    def test_unavailable(self, mocker):
+        """Test when the current memory cannot be read."""
+        mocker.patch("builtins.open", side_effect=OSError)
+
+        assert houdini_toolbox.events.telemetry._get_current_rss() is None
+
+
+class Test__get_max_rss:
+    """Test houdini_toolbox.events.telemetry._get_max_rss."""
+
+    @pytest.mark.parametrize("platform, expected", (("linux", 2048), ("darwin", 2)))
+    def test(self, mocker, platform, expected):
+        """Test getting the peak memory."""
+        mock_resource = mocker.MagicMock()
+        mock_resource.getrusage.return_value.ru_maxrss = 2
+
+        mocker.patch.dict("sys.modules", {"resource": mock_resource})
+        mocker.patch("houdini_toolbox.events.telemetry.sys.platform", platform)
+
+        assert houdini_toolbox.events.telemetry._get_max_rss() == expected
+
+        mock_resource.getrusage.assert_called_with(mock_resource.RUSAGE_SELF)
+
+    def test_unavailable(self, mocker):
+        """Test when the resource module is unavailable."""
+        mocker.patch.dict("sys.modules", {"resource": None})
+
+        assert houdini_toolbox.events.telemetry._get_max_rss() is None
+
+
+class Test_get_telemetry_writer:
+    """Test houdini_toolbox.events.telemetry.get_telemetry_writer."""
+
+    def test_existing(self, mocker):
+        """Test getting the writer when it has already been created."""
+        mock_writer = mocker.MagicMock(
+            spec=houdini_toolbox.events.telemetry.TelemetryWriter
+        )
+
+        mocker.patch("houdini_toolbox.events.telemetry._TELEMETRY_WRITER", mock_writer)
+
+        assert houdini_toolbox.events.telemetry.get_telemetry_writer() == mock_writer
+
+    def test_no_target(self, mocker):
+        """Test when no target is set."""
+        mocker.patch("houdini_toolbox.events.telemetry._TELEMETRY_WRITER", None)
+
+        mocker.patch.dict(houdini_toolbox.events.telemetry.os.environ, {}, clear=True)
+
+        assert houdini_toolbox.events.telemetry.get_telemetry_writer() is None
+
+    def test_new(self, mocker):
+        """Test creating the writer."""
+        mock_cls = mocker.patch(
+            "houdini_toolbox.events.telemetry.TelemetryWriter", autospec=True
+        )
+        mock_register = mocker.patch("houdini_toolbox.events.telemetry.atexit.register")
+
+        mocker.patch("houdini_toolbox.events.telemetry._TELEMETRY_WRITER", None)
+
+        mocker.patch.dict(
+            houdini_toolbox.events.telemetry.os.environ,
+            {houdini_toolbox.events.telemetry.TELEMETRY_TARGET_VAR: "/path/to/file"},
+        )
+
+        result = houdini_toolbox.events.telemetry.get_telemetry_writer()
+
+        assert result == mock_cls.return_value
+        assert (
+            houdini_toolbox.events.telemetry._TELEMETRY_WRITER == mock_cls.return_value
+        )
+
+        mock_cls.assert_called_with("/path/to/file")
+        mock_register.assert_called_with(mock_cls.return_value.close)
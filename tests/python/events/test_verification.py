@@ -0,0 +1,328 @@
+"""Tests for houdini_toolbox.events.verification module."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+# Standard Library
+import concurrent.futures
+import hashlib
+import json
+
+# Third Party
+import pytest
+
+# Houdini Toolbox
+import houdini_toolbox.events.verification
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+@pytest.fixture
+def init_verifier(mocker):
+    """Fixture to initialize a verifier."""
+    mocker.patch.object(
+        houdini_toolbox.events.verification.OutputVerifier, "__init__", lambda x: None
+    )
+
+    def _create():
+        return houdini_toolbox.events.verification.OutputVerifier()
+
+    return _create
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+class Test_OutputVerifier:
+    """Test houdini_toolbox.events.verification.OutputVerifier class."""
+
+    def test___init__(self, mocker):
+        """Test object initialization."""
+        mock_path = mocker.MagicMock(spec=str)
+
+        verifier = houdini_toolbox.events.verification.OutputVerifier(mock_path, 2)
+
+        assert verifier._executor is None
+        assert verifier._futures == []
+        assert verifier._manifest_path == mock_path
+        assert verifier._max_workers == 2
+
+    # Non-Public Methods
+
+    def test__write_manifest(self, init_verifier, tmp_path):
+        """Test appending results to the manifest."""
+        path = tmp_path / "manifest.jsonl"
+        path.write_text('{"existing": true}\n')
+
+        verifier = init_verifier()
+
+        verifier._write_manifest(str(path), [{"path": "file1"}, {"path": "file2"}])
+
+        assert [json.loads(line) for line in path.read_text().splitlines()] == [
+            {"existing": True},
+            {"path": "file1"},
+            {"path": "file2"},
+        ]
+
+    def test__write_manifest__error(self, init_verifier, mocker, tmp_path):
+        """Test a manifest which cannot be written."""
+        mock_logger = mocker.patch("houdini_toolbox.events.verification._logger")
+
+        verifier = init_verifier()
+
+        verifier._write_manifest(
+            str(tmp_path / "missing" / "manifest.jsonl"), [{"path": "file1"}]
+        )
+
+        mock_logger.warning.assert_called()
+
+    # Properties
+
+    def test_manifest_path(self, init_verifier, mocker):
+        """Test the 'manifest_path' property."""
+        mock_value = mocker.MagicMock(spec=str)
+
+        verifier = init_verifier()
+        verifier._manifest_path = mock_value
+
+        assert verifier.manifest_path == mock_value
+
+    def test_pending(self, init_verifier, mocker):
+        """Test the 'pending' property."""
+        verifier = init_verifier()
+        verifier._futures = [mocker.MagicMock(spec=concurrent.futures.Future)]
+
+        assert verifier.pending == 1
+
+    # Methods
+
+    def test_finish(self, init_verifier, mocker):
+        """Test collecting the results."""
+        mock_write = mocker.patch.object(
+            houdini_toolbox.events.verification.OutputVerifier, "_write_manifest"
+        )
+
+        result1 = {"path": "file1", "error": None}
+        result2 = {"path": "file2", "error": "File is empty"}
+
+        mock_future1 = mocker.MagicMock(spec=concurrent.futures.Future)
+        mock_future1.result.return_value = result1
+        mock_future2 = mocker.MagicMock(spec=concurrent.futures.Future)
+        mock_future2.result.return_value = result2
+
+        verifier = init_verifier()
+        verifier._futures = [mock_future1, mock_future2]
+        verifier._manifest_path = mocker.MagicMock(spec=str)
+
+        assert verifier.finish() == [result2]
+        assert verifier._futures == []
+
+        mock_write.assert_called_with(verifier._manifest_path, [result1, result2])
+
+    def test_finish__no_manifest(self, init_verifier, mocker):
+        """Test collecting the results when there is no manifest."""
+        mock_write = mocker.patch.object(
+            houdini_toolbox.events.verification.OutputVerifier, "_write_manifest"
+        )
+
+        mock_future = mocker.MagicMock(spec=concurrent.futures.Future)
+        mock_future.result.return_value = {"path": "file1", "error": None}
+
+        verifier = init_verifier()
+        verifier._futures = [mock_future]
+        verifier._manifest_path = None
+
+        assert verifier.finish() == []
+
+        mock_write.assert_not_called()
+
+    def test_shutdown(self, init_verifier, mocker):
+        """Test stopping the worker threads."""
+        mock_executor = mocker.MagicMock(spec=concurrent.futures.ThreadPoolExecutor)
+
+        verifier = init_verifier()
+        verifier._executor = mock_executor
+
+        verifier.shutdown()
+
+        mock_executor.shutdown.assert_called_with(wait=True)
+        assert verifier._executor is None
+
+    def test_submit(self, init_verifier, mocker):
+        """Test submitting a file."""
+        mock_executor_cls = mocker.patch(
+            "houdini_toolbox.events.verification.concurrent.futures.ThreadPoolExecutor"
+        )
+        mock_executor = mock_executor_cls.return_value
+
+        mock_path = mocker.MagicMock(spec=str)
+        mock_frame = mocker.MagicMock(spec=float)
+
+        verifier = init_verifier()
+        verifier._executor = None
+        verifier._futures = []
+        verifier._max_workers = 3
+
+        verifier.submit(mock_path, mock_frame)
+
+        mock_executor_cls.assert_called_with(
+            max_workers=3, thread_name_prefix="houdini_toolbox_verify"
+        )
+        mock_executor.submit.assert_called_with(
+            houdini_toolbox.events.verification.verify_output, mock_path, mock_frame
+        )
+
+        assert verifier._futures == [mock_executor.submit.return_value]
+
+    def test_submit__pool(self, tmp_path):
+        """Test files are verified on the worker threads."""
+        path = tmp_path / "file.exr"
+        path.write_bytes(b"\x76\x2f\x31\x01data")
+
+        verifier = houdini_toolbox.events.verification.OutputVerifier()
+
+        verifier.submit(str(path), 1)
+        verifier.submit(str(tmp_path / "missing.exr"), 2)
+
+        failures = verifier.finish()
+        verifier.shutdown()
+
+        assert [failure["frame"] for failure in failures] == [2]
+
+
+def test__check_file(tmp_path, mocker):
+    """Test houdini_toolbox.events.verification._check_file."""
+    mocker.patch("houdini_toolbox.events.verification._CHUNK_SIZE", 4)
+    mocker.patch("houdini_toolbox.events.verification._MAGIC_SIZE", 3)
+
+    data = b"0123456789"
+
+    path = tmp_path / "file"
+    path.write_bytes(data)
+
+    result = houdini_toolbox.events.verification._check_file(str(path))
+
+    assert result == (10, hashlib.sha256(data).hexdigest(), b"012")
+
+
+@pytest.mark.parametrize(
+    "path, header, expected",
+    (
+        ("/path/to/file.bgeo", b"data", None),
+        ("/path/to/file.EXR", b"\x76\x2f\x31\x01data", True),
+        ("/path/to/file.exr", b"data", False),
+        ("/path/to/file.tif", b"MM\x00*data", True),
+    ),
+)
+def test__is_header_valid(path, header, expected):
+    """Test houdini_toolbox.events.verification._is_header_valid."""
+    assert (
+        houdini_toolbox.events.verification._is_header_valid(path, header) == expected
+    )
+
+
+class Test_get_output_verifier:
+    """Test houdini_toolbox.events.verification.get_output_verifier."""
+
+    def test_not_set(self, mocker):
+        """Test when verification is not enabled."""
+        mocker.patch.dict(
+            houdini_toolbox.events.verification.os.environ, {}, clear=True
+        )
+
+        assert houdini_toolbox.events.verification.get_output_verifier() is None
+
+    def test_set(self, mocker):
+        """Test when verification is enabled."""
+        mock_cls = mocker.patch(
+            "houdini_toolbox.events.verification.OutputVerifier", autospec=True
+        )
+        mock_register = mocker.patch(
+            "houdini_toolbox.events.verification.atexit.register"
+        )
+
+        mocker.patch.dict(
+            houdini_toolbox.events.verification.os.environ,
+            {houdini_toolbox.events.verification.VERIFY_MANIFEST_VAR: "/path/to/file"},
+        )
+
+        result = houdini_toolbox.events.verification.get_output_verifier()
+
+        assert result == mock_cls.return_value
+        mock_cls.assert_called_with("/path/to/file")
+        mock_register.assert_called_with(mock_cls.return_value.shutdown)
+
+
+class Test_verify_output:
+    """Test houdini_toolbox.events.verification.verify_output."""
+
+    def test_missing(self, tmp_path):
+        """Test verifying a file which does not exist."""
+        path = str(tmp_path / "missing.exr")
+
+        result = houdini_toolbox.events.verification.verify_output(path, 1)
+
+        assert result == {
+            "checksum": None,
+            "error": "File does not exist",
+            "frame": 1,
+            "header_valid": None,
+            "path": path,
+            "size": None,
+        }
+
+    def test_unreadable(self, tmp_path, mocker):
+        """Test verifying a file which cannot be read."""
+        mocker.patch(
+            "houdini_toolbox.events.verification._check_file", side_effect=OSError
+        )
+
+        path = tmp_path / "file.exr"
+        path.write_bytes(b"data")
+
+        result = houdini_toolbox.events.verification.verify_output(str(path))
+
+        assert result["error"].startswith("Could not read file")
+
+    def test_empty(self, tmp_path):
+        """Test verifying an empty file."""
+        path = tmp_path / "file.exr"
+        path.write_bytes(b"")
+
+        result = houdini_toolbox.events.verification.verify_output(str(path))
+
+        assert result["error"] == "File is empty"
+        assert result["size"] == 0
+
+    def test_invalid_header(self, tmp_path):
+        """Test verifying an image with an invalid header."""
+        path = tmp_path / "file.exr"
+        path.write_bytes(b"data")
+
+        result = houdini_toolbox.events.verification.verify_output(str(path))
+
+        assert result["error"] == "Invalid image header"
+        assert not result["header_valid"]
+
+    def test_valid(self, tmp_path):
+        """Test verifying a valid image."""
+        data = b"\x89PNG\r\n\x1a\ndata"
+
+        path = tmp_path / "file.png"
+        path.write_bytes(data)
+
+        result = houdini_toolbox.events.verification.verify_output(str(path), 2)
+
+        assert result == {
+            "checksum": hashlib.sha256(data).hexdigest(),
+            "error": None,
+            "frame": 2,
+            "header_valid": True,
+            "path": str(path),
+            "size": len(data),
+        }
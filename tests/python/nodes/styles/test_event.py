@@ -17,9 +17,8 @@ import hou
 
 def test_style_node_by_name(mocker):
     """Test styling a node by name."""
-    mock_manager = mocker.patch(
-        "houdini_toolbox.nodes.styles.event.STYLE_MANAGER", autospec=True
-    )
+    mock_get = mocker.patch("houdini_toolbox.nodes.styles.event.get_style_manager")
+    mock_manager = mock_get.return_value
 
     mock_node = mocker.MagicMock(spec=hou.Node)
 
@@ -32,9 +31,8 @@ def test_style_node_by_name(mocker):
 
 def test_style_node_on_creation(mocker):
     """Test styling a node on creation."""
-    mock_manager = mocker.patch(
-        "houdini_toolbox.nodes.styles.event.STYLE_MANAGER", autospec=True
-    )
+    mock_get = mocker.patch("houdini_toolbox.nodes.styles.event.get_style_manager")
+    mock_manager = mock_get.return_value
 
     mock_node = mocker.MagicMock(spec=hou.Node)
 
@@ -43,3 +41,17 @@ def test_style_node_on_creation(mocker):
     houdini_toolbox.nodes.styles.event.style_node_on_creation(scriptargs)
 
     mock_manager.style_node.assert_called_with(mock_node)
+
+
+def test_style_nodes_on_creation(mocker):
+    """Test styling a batch of nodes on creation."""
+    mock_get = mocker.patch("houdini_toolbox.nodes.styles.event.get_style_manager")
+    mock_manager = mock_get.return_value
+
+    mock_nodes = [mocker.MagicMock(spec=hou.Node), mocker.MagicMock(spec=hou.Node)]
+
+    scriptargs = {"batch": [], "nodes": mock_nodes}
+
+    houdini_toolbox.nodes.styles.event.style_nodes_on_creation(scriptargs)
+
+    mock_manager.style_nodes.assert_called_with(mock_nodes)
@@ -1059,6 +1059,42 @@ class Test_StyleManager:
 
     # style_node_by_name
 
+    def test_style_nodes(self, init_manager, mocker):
+        """Style a list of nodes, only looking up the style once per type."""
+        mock_get_style = mocker.patch.object(manager.StyleManager, "_get_style")
+
+        mock_style = mocker.MagicMock(spec=manager.StyleRule)
+
+        mock_type1 = mocker.MagicMock(spec=hou.NodeType)
+        mock_type2 = mocker.MagicMock(spec=hou.NodeType)
+
+        mock_get_style.side_effect = lambda node_type: (
+            mock_style if node_type == mock_type1 else None
+        )
+
+        mock_node1 = mocker.MagicMock(spec=hou.Node)
+        mock_node1.type.return_value = mock_type1
+
+        mock_node2 = mocker.MagicMock(spec=hou.Node)
+        mock_node2.type.return_value = mock_type2
+
+        mock_node3 = mocker.MagicMock(spec=hou.Node)
+        mock_node3.type.return_value = mock_type1
+
+        mgr = init_manager()
+
+        mgr.style_nodes([mock_node1, mock_node2, mock_node3])
+
+        mock_get_style.assert_has_calls(
+            [mocker.call(mock_type1), mocker.call(mock_type2)]
+        )
+        assert mock_get_style.call_count == 2
+
+        mock_style.apply_to_node.assert_has_calls(
+            [mocker.call(mock_node1), mocker.call(mock_node3)]
+        )
+        assert mock_style.apply_to_node.call_count == 2
+
     def test_style_node_by_name(self, init_manager, mocker):
         """Style a node by its name."""
         mock_get_name = mocker.patch.object(manager.StyleManager, "_get_name_style")
@@ -1455,3 +1491,28 @@ class Test__get_tool_menu_locations:
         mock_default_name.assert_called_with(
             mock_category.name.return_value, mock_type.name.return_value
         )
+
+
+class Test_get_style_manager:
+    """Test houdini_toolbox.nodes.styles.manager.get_style_manager."""
+
+    def test_existing(self, mocker):
+        """Test getting the manager when it has already been built."""
+        mock_manager = mocker.MagicMock(spec=manager.StyleManager)
+
+        mocker.patch("houdini_toolbox.nodes.styles.manager._STYLE_MANAGER", mock_manager)
+
+        assert manager.get_style_manager() == mock_manager
+
+    def test_new(self, mocker):
+        """Test building the manager the first time it is requested."""
+        mock_cls = mocker.patch(
+            "houdini_toolbox.nodes.styles.manager.StyleManager", autospec=True
+        )
+
+        mocker.patch("houdini_toolbox.nodes.styles.manager._STYLE_MANAGER", None)
+
+        result = manager.get_style_manager()
+
+        assert result == mock_cls.return_value
+        assert manager._STYLE_MANAGER == mock_cls.return_value
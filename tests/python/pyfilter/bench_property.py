@@ -0,0 +1,72 @@
+"""Microbenchmark of houdini_toolbox.pyfilter.property._transform_values.
+
+Compares the current decoding against decoding every string with
+json.loads().  Run from the repository root:
+
+    PYTHONPATH=python python -m tests.python.pyfilter.bench_property
+
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+# Standard Library
+import timeit
+
+# Houdini Toolbox
+from houdini_toolbox.pyfilter import property as prop
+
+from .property_reference import transform_values_with_json
+
+# =============================================================================
+# GLOBALS
+# =============================================================================
+
+# Typical property values read while filtering.
+_CASES = {
+    "shader path": ["opdef:/Shop/v_constant clr 0 0 0"],
+    "object name": ["/obj/geo1"],
+    "plane variable": ["Cf+Af"],
+    "bool string": ["true"],
+    "number string": ["1"],
+    "json dict": ['{"key": [1, 2]}'],
+    "numbers": [1920, 1080],
+    "number strings": ["1", "2", "3"],
+}
+
+# The number of times to transform each value.
+_NUMBER = 100000
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+
+
+def main() -> None:
+    """Time transforming each of the cases and print the results.
+
+    :return:
+
+    """
+    print(f"{'case':<16}{'json.loads':>14}{'current':>14}{'speedup':>10}")
+
+    for name, values in _CASES.items():
+        reference = timeit.timeit(
+            lambda values=values: transform_values_with_json(values), number=_NUMBER
+        )
+        current = timeit.timeit(
+            lambda values=values: prop._transform_values(values), number=_NUMBER
+        )
+
+        print(
+            f"{name:<16}{reference / _NUMBER * 1e9:>12.0f}ns"
+            f"{current / _NUMBER * 1e9:>12.0f}ns{reference / current:>9.1f}x"
+        )
+
+
+# =============================================================================
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""Benchmark PyFilter operations by replaying synthetic scenes.
+
+Recordings of scenes with different numbers of planes and instances are
+built and replayed against IpOverrides, ZDepthPass and SetDeepImage without
+Mantra.  Run from the repository root:
+
+    PYTHONPATH=python python -m tests.python.pyfilter.bench_replay
+
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+# Standard Library
+import logging
+from typing import List, Tuple
+
+# Houdini Toolbox
+from houdini_toolbox.pyfilter.operations.recordproperties import RECORDING_VERSION
+from houdini_toolbox.pyfilter.replay import replay_recording
+
+# =============================================================================
+# GLOBALS
+# =============================================================================
+
+# The operations to benchmark and the args to run them with.
+_OPERATIONS = {
+    "IpOverrides": (
+        "houdini_toolbox.pyfilter.operations.ipoverrides",
+        [
+            "--ip-res-scale=0.5",
+            "--ip-sample-scale=0.5",
+            "--ip-disable-aovs",
+            "--ip-disable-matte",
+            "--ip-disable-subd",
+        ],
+    ),
+    "ZDepthPass": ("houdini_toolbox.pyfilter.operations.zdepth", ["--zdepth"]),
+    "SetDeepImage": (
+        "houdini_toolbox.pyfilter.operations.deepimage",
+        ["--deep-image-path=/var/tmp/deep.exr", "--deep-resolver=camera"],
+    ),
+}
+
+# Scene shapes as the number of planes and instances.
+_SCENES = {
+    "small": (4, 100),
+    "aov heavy": (40, 1000),
+    "instance heavy": (8, 100000),
+}
+
+# The number of times to replay each scene.
+_REPEAT = 3
+
+
+# =============================================================================
+# NON-PUBLIC FUNCTIONS
+# =============================================================================
+
+
+def _build_callbacks(num_planes: int, num_instances: int) -> List[dict]:
+    """Build the callbacks of a synthetic scene.
+
+    :param num_planes: The number of image planes.
+    :param num_instances: The number of object instances.
+    :return: The scene callbacks.
+
+    """
+    callbacks = [
+        {
+            "stage": "filter_camera",
+            "args": [],
+            "reads": {
+                "image:deepresolver": [],
+                "image:filename": ["ip"],
+                "image:resolution": [1920, 1080],
+                "image:samples": [6, 6],
+                "renderer:rendertype": ["beauty"],
+            },
+            "sets": [],
+        }
+    ]
+
+    for index in range(num_planes):
+        variable = "Cf+Af" if not index else f"aov{index}"
+
+        callbacks.append(
+            {
+                "stage": "filter_plane",
+                "args": [],
+                "reads": {"plane:channel": [variable], "plane:variable": [variable]},
+                "sets": [],
+            }
+        )
+
+    for index in range(num_instances):
+        callbacks.append(
+            {
+                "stage": "filter_instance",
+                "args": [],
+                "reads": {
+                    "object:matte": [int(not index % 10)],
+                    "object:name": [f"/obj/geo{index}"],
+                    "object:phantom": [0],
+                    "object:surface": ["opdef:/Shop/v_plastic"],
+                },
+                "sets": [],
+            }
+        )
+
+    callbacks.append({"stage": "filter_quit", "args": [], "reads": {}, "sets": []})
+
+    return callbacks
+
+
+def _replay_scene(
+    callbacks: List[dict], module_name: str, class_name: str, args: List[str]
+) -> Tuple[float, float]:
+    """Replay a scene against an operation.
+
+    :param callbacks: The scene callbacks.
+    :param module_name: The name of the operation's module.
+    :param class_name: The operation class name.
+    :param args: The filter args.
+    :return: The callbacks per second and total time in milliseconds.
+
+    """
+    header = {
+        "version": RECORDING_VERSION,
+        "args": args,
+        "operations": [{"module": module_name, "class": class_name}],
+    }
+
+    result = replay_recording(header, callbacks, repeat=_REPEAT)
+
+    return result.callbacks_per_second, result.elapsed * 1000 / _REPEAT
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+
+
+def main() -> None:
+    """Replay each scene against each operation and print the results.
+
+    :return:
+
+    """
+    # Don't benchmark writing log messages.
+    logging.disable(logging.CRITICAL)
+
+    print(f"{'operation':<16}{'scene':<16}{'callbacks/s':>14}{'time':>14}")
+
+    for scene_name, (num_planes, num_instances) in _SCENES.items():
+        callbacks = _build_callbacks(num_planes, num_instances)
+
+        for class_name, (module_name, args) in _OPERATIONS.items():
+            rate, elapsed = _replay_scene(callbacks, module_name, class_name, args)
+
+            print(f"{class_name:<16}{scene_name:<16}{rate:>14.0f}{elapsed:>12.1f}ms")
+
+
+# =============================================================================
+
+if __name__ == "__main__":
+    main()
@@ -27,6 +27,7 @@ _DEFAULTS = {
     "disable_matte": False,
     "disable_subd": False,
     "disable_tilecallback": False,
+    "progressive_stage": None,
     "res_scale": None,
     "sample_scale": None,
     "transparent_samples": None,
@@ -90,6 +91,9 @@ def properties(mocker):
     _mock_set = mocker.patch(
         "houdini_toolbox.pyfilter.operations.ipoverrides.set_property"
     )
+    _mock_set_multiple = mocker.patch(
+        "houdini_toolbox.pyfilter.operations.ipoverrides.set_properties"
+    )
 
     class Properties:
         """Fake class for accessing and setting properties."""
@@ -104,6 +108,11 @@ def properties(mocker):
             """Access set_property."""
             return _mock_set
 
+        @property
+        def mock_set_multiple(self):
+            """Access set_properties."""
+            return _mock_set_multiple
+
     return Properties()
 
 
@@ -132,6 +141,7 @@ class Test_IpOverrides:
         assert not op._disable_displacement
         assert not op._disable_matte
         assert not op._disable_subd
+        assert op._progressive_stage is None
         assert op._res_scale is None
         assert op._sample_scale is None
         assert op._transparent_samples is None
@@ -198,6 +208,13 @@ class Test_IpOverrides:
 
         assert op.disable_tilecallback == mock_value
 
+    def test_progressive_stage(self, init_operation, mocker):
+        """Test the 'progressive_stage' property."""
+        mock_value = mocker.MagicMock(spec=int)
+
+        op = init_operation({"progressive_stage": mock_value})
+        assert op.progressive_stage == mock_value
+
     def test_res_scale(self, init_operation, mocker):
         """Test the 'res_scale' property."""
         mock_value = mocker.MagicMock(spec=float)
@@ -283,6 +300,11 @@ class Test_IpOverrides:
 
         assert result == "--ip-transparent-samples=3"
 
+        # Set the progressive stage
+        result = ipoverrides.IpOverrides.build_arg_string(progressive_stage=1)
+
+        assert result == "--ip-progressive-stage=1"
+
     def test_register_parser_args(self, mocker):
         """Test registering all the argument parser args."""
         mock_parser = mocker.MagicMock(spec=argparse.ArgumentParser)
@@ -337,6 +359,12 @@ class Test_IpOverrides:
                 action="store",
                 dest="ip_transparent_samples",
             ),
+            mocker.call(
+                "--ip-progressive-stage",
+                default=None,
+                type=int,
+                dest="ip_progressive_stage",
+            ),
         ]
         mock_parser.add_argument.assert_has_calls(calls)
 
@@ -391,18 +419,15 @@ class Test_IpOverrides:
         properties.mock_set.assert_called_with("image:bucket", op.bucket_size)
 
     def test_filter_camera__disable_blur(
-        self, init_operation, properties, patch_operation_logger, mocker
+        self, init_operation, properties, patch_operation_logger
     ):
         """Test 'filter_camera' when disabling motion blur."""
         op = init_operation({"disable_blur": True}, as_properties=True)
 
         op.filter_camera()
 
-        properties.mock_set.has_calls(
-            [
-                mocker.call("renderer:blurquality", 0),
-                mocker.call("renderer:rayblurquality", 0),
-            ]
+        properties.mock_set_multiple.assert_called_with(
+            {"renderer:blurquality": 0, "renderer:rayblurquality": 0}
         )
 
     def test_filter_camera__disable_deep(
@@ -664,6 +689,7 @@ class Test_IpOverrides:
         namespace.ip_sample_scale = None
         namespace.ip_bucket_size = None
         namespace.ip_transparent_samples = None
+        namespace.ip_progressive_stage = None
         namespace.ip_disable_aovs = False
         namespace.ip_disable_blur = False
         namespace.ip_disable_deep = False
@@ -692,6 +718,37 @@ class Test_IpOverrides:
         assert op._sample_scale == 0.75
         assert op._bucket_size == 16
         assert op._transparent_samples == 3
+        assert op._progressive_stage is None
+
+    @pytest.mark.parametrize(
+        "stage, expected_res, expected_samples",
+        [(0, 0.25, 0.125), (1, 0.5, 0.5), (2, None, None)],
+    )
+    def test_process_parsed_args__progressive(
+        self, init_operation, stage, expected_res, expected_samples
+    ):
+        """Test processing parsed args when a progressive stage is set."""
+        namespace = argparse.Namespace()
+        namespace.ip_res_scale = 0.75
+        namespace.ip_sample_scale = 0.75
+        namespace.ip_bucket_size = None
+        namespace.ip_transparent_samples = None
+        namespace.ip_progressive_stage = stage
+        namespace.ip_disable_aovs = False
+        namespace.ip_disable_blur = False
+        namespace.ip_disable_deep = False
+        namespace.ip_disable_displacement = False
+        namespace.ip_disable_matte = False
+        namespace.ip_disable_subd = False
+        namespace.ip_disable_tilecallback = False
+
+        op = init_operation()
+
+        op.process_parsed_args(namespace)
+
+        assert op._progressive_stage == stage
+        assert op._res_scale == expected_res
+        assert op._sample_scale == expected_samples
 
     # should_run
 
@@ -732,6 +789,91 @@ class Test_IpOverrides:
             assert op.should_run()
 
 
+class Test__install_post_render_script:
+    """Test the houdini_toolbox.pyfilter.operations.ipoverrides._install_post_render_script."""
+
+    @pytest.mark.parametrize("script", ["", ipoverrides._POST_RENDER_SCRIPT])
+    def test(self, mocker, script):
+        """Test setting the post-render script."""
+        mock_script_parm = mocker.MagicMock(spec=hou.Parm)
+        mock_script_parm.unexpandedString.return_value = script
+        mock_language_parm = mocker.MagicMock(spec=hou.Parm)
+
+        parms = {"postrender": mock_script_parm, "lpostrender": mock_language_parm}
+
+        mock_node = mocker.MagicMock(spec=hou.RopNode)
+        mock_node.parm.side_effect = parms.get
+
+        ipoverrides._install_post_render_script(mock_node)
+
+        mock_script_parm.set.assert_called_with(
+            "__import__('houdini_toolbox.pyfilter.operations', globals(), locals(), ['ipoverrides']).ipoverrides.advance_progressive_stage(hou.pwd())"
+        )
+        mock_language_parm.set.assert_called_with("python")
+
+    def test_existing_script(self, mocker):
+        """Test that an existing post-render script is not replaced."""
+        mock_logger = mocker.patch(
+            "houdini_toolbox.pyfilter.operations.ipoverrides._logger"
+        )
+
+        mock_script_parm = mocker.MagicMock(spec=hou.Parm)
+        mock_script_parm.unexpandedString.return_value = "print('done')"
+        mock_language_parm = mocker.MagicMock(spec=hou.Parm)
+
+        parms = {"postrender": mock_script_parm, "lpostrender": mock_language_parm}
+
+        mock_node = mocker.MagicMock(spec=hou.RopNode)
+        mock_node.parm.side_effect = parms.get
+
+        ipoverrides._install_post_render_script(mock_node)
+
+        mock_script_parm.set.assert_not_called()
+        mock_language_parm.set.assert_not_called()
+        mock_logger.warning.assert_called()
+
+
+@pytest.mark.parametrize(
+    "script, expected_set",
+    [
+        (ipoverrides._POST_RENDER_SCRIPT, True),
+        ("print('done')", False),
+        ("", False),
+    ],
+)
+def test__remove_post_render_script(mocker, script, expected_set):
+    """Test the houdini_toolbox.pyfilter.operations.ipoverrides._remove_post_render_script."""
+    mock_node = mocker.MagicMock(spec=hou.RopNode)
+    mock_node.parm.return_value.unexpandedString.return_value = script
+
+    ipoverrides._remove_post_render_script(mock_node)
+
+    mock_node.parm.assert_called_with("postrender")
+
+    if expected_set:
+        mock_node.parm.return_value.set.assert_called_with("")
+
+    else:
+        mock_node.parm.return_value.set.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "parm_data, expected",
+    [
+        ({"soho_outputmode": 0, "vm_picture": "ip"}, True),
+        ({"soho_outputmode": 0, "vm_picture": "md"}, True),
+        ({"soho_outputmode": 0, "vm_picture": "$HIP/render/image.exr"}, False),
+        ({"soho_outputmode": 1, "vm_picture": "ip"}, False),
+    ],
+)
+def test__rendered_to_ip(mocker, parm_data, expected):
+    """Test the houdini_toolbox.pyfilter.operations.ipoverrides._rendered_to_ip."""
+    mock_node = mocker.MagicMock(spec=hou.RopNode)
+    mock_node.evalParm.side_effect = lambda name: parm_data[name]
+
+    assert ipoverrides._rendered_to_ip(mock_node) == expected
+
+
 @pytest.mark.parametrize(
     "resolution,scale,expected",
     [
@@ -754,6 +896,80 @@ def test__scale_sample_value(samples, scale, expected):
     assert ipoverrides._scale_samples(samples, scale) == expected
 
 
+class Test_advance_progressive_stage:
+    """Test the houdini_toolbox.pyfilter.operations.ipoverrides.advance_progressive_stage."""
+
+    def test(self, mocker):
+        """Test advancing to the next stage."""
+        mocker.patch.object(hou.undos, "disabler", create=True)
+        mock_rendered = mocker.patch(
+            "houdini_toolbox.pyfilter.operations.ipoverrides._rendered_to_ip",
+            return_value=True,
+        )
+
+        mock_node = mocker.MagicMock(spec=hou.RopNode)
+        mock_node.evalParm.return_value = 1
+        mock_node.parm.return_value.eval.return_value = 0
+
+        ipoverrides.advance_progressive_stage(mock_node)
+
+        mock_rendered.assert_called_with(mock_node)
+        mock_node.parm.assert_called_with("ip_progressive_stage")
+        mock_node.parm.return_value.set.assert_called_with(1)
+
+    def test_final_stage(self, mocker):
+        """Test advancing when the final stage has been reached."""
+        mocker.patch(
+            "houdini_toolbox.pyfilter.operations.ipoverrides._rendered_to_ip",
+            return_value=True,
+        )
+
+        mock_node = mocker.MagicMock(spec=hou.RopNode)
+        mock_node.evalParm.return_value = 1
+        mock_node.parm.return_value.eval.return_value = (
+            len(ipoverrides.PROGRESSIVE_LADDER) - 1
+        )
+
+        ipoverrides.advance_progressive_stage(mock_node)
+
+        mock_node.parm.return_value.set.assert_not_called()
+
+    def test_not_ip(self, mocker):
+        """Test advancing after a render which was not to ip."""
+        mocker.patch(
+            "houdini_toolbox.pyfilter.operations.ipoverrides._rendered_to_ip",
+            return_value=False,
+        )
+
+        mock_node = mocker.MagicMock(spec=hou.RopNode)
+        mock_node.evalParm.return_value = 1
+
+        ipoverrides.advance_progressive_stage(mock_node)
+
+        mock_node.parm.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "parm_data",
+        [
+            {"enable_ip_override": 0, "ip_progressive": 1},
+            {"enable_ip_override": 1, "ip_progressive": 0},
+        ],
+    )
+    def test_not_progressive(self, mocker, parm_data):
+        """Test advancing when the node is not rendering progressively."""
+        mock_rendered = mocker.patch(
+            "houdini_toolbox.pyfilter.operations.ipoverrides._rendered_to_ip"
+        )
+
+        mock_node = mocker.MagicMock(spec=hou.RopNode)
+        mock_node.evalParm.side_effect = lambda name: parm_data[name]
+
+        ipoverrides.advance_progressive_stage(mock_node)
+
+        mock_rendered.assert_not_called()
+        mock_node.parm.assert_not_called()
+
+
 class Test_build_arg_string_from_node:
     """Test the houdini_toolbox.pyfilter.operations.ipoverrides.build_arg_string_from_node."""
 
@@ -770,6 +986,7 @@ class Test_build_arg_string_from_node:
 
         parm_data = {
             "enable_ip_override": 1,
+            "ip_progressive": 0,
             "ip_override_camerares": 1,
             "ip_res_fraction": 0.5,
             "ip_transparent": 1,
@@ -803,6 +1020,7 @@ class Test_build_arg_string_from_node:
             disable_tilecallback=parm_data["ip_disable_tilecallback"],
             bucket_size=parm_data["ip_bucket_size"],
             transparent_samples=parm_data["ip_transparent_samples"],
+            progressive_stage=None,
         )
 
     def test_no_scales(self, mocker):
@@ -818,6 +1036,7 @@ class Test_build_arg_string_from_node:
 
         parm_data = {
             "enable_ip_override": 1,
+            "ip_progressive": 0,
             "ip_override_camerares": 0,
             "ip_transparent": 0,
             "ip_sample_scale": 0.5,
@@ -849,6 +1068,50 @@ class Test_build_arg_string_from_node:
             bucket_size=parm_data["ip_bucket_size"],
             transparent_samples=None,
             disable_matte=parm_data["ip_disable_matte"],
+            progressive_stage=None,
+        )
+
+    def test_progressive(self, mocker):
+        """Test with progressive preview enabled."""
+        mock_build = mocker.patch(
+            "houdini_toolbox.pyfilter.operations.ipoverrides.IpOverrides.build_arg_string"
+        )
+
+        parm_data = {
+            "enable_ip_override": 1,
+            "ip_progressive": 1,
+            "ip_progressive_stage": 1,
+            "ip_transparent": 0,
+            "ip_disable_blur": 1,
+            "ip_disable_aovs": 1,
+            "ip_disable_deep": 1,
+            "ip_disable_displacement": 1,
+            "ip_disable_matte": 1,
+            "ip_disable_subd": 1,
+            "ip_disable_tilecallback": 1,
+            "ip_bucket_size": 16,
+        }
+
+        mock_node = mocker.MagicMock()
+        mock_node.evalParm.side_effect = lambda name: parm_data[name]
+
+        assert (
+            ipoverrides.build_arg_string_from_node(mock_node) == mock_build.return_value
+        )
+
+        mock_build.assert_called_with(
+            res_scale=None,
+            sample_scale=None,
+            disable_blur=parm_data["ip_disable_blur"],
+            disable_aovs=parm_data["ip_disable_aovs"],
+            disable_deep=parm_data["ip_disable_deep"],
+            disable_displacement=parm_data["ip_disable_displacement"],
+            disable_subd=parm_data["ip_disable_subd"],
+            disable_tilecallback=parm_data["ip_disable_tilecallback"],
+            bucket_size=parm_data["ip_bucket_size"],
+            transparent_samples=None,
+            disable_matte=parm_data["ip_disable_matte"],
+            progressive_stage=parm_data["ip_progressive_stage"],
         )
 
 
@@ -998,15 +1261,110 @@ def test_build_pyfilter_command_from_node(mocker):
     )
 
 
-def test_set_mantra_command(mocker):
-    """Test the houdini_toolbox.pyfilter.operations.ipoverrides.set_mantra_command."""
+@pytest.mark.parametrize(
+    "stage, expected",
+    [
+        (0, (0.25, 0.125)),
+        (1, (0.5, 0.5)),
+        (2, (None, None)),
+        (5, (None, None)),
+        (-1, (0.25, 0.125)),
+    ],
+)
+def test_get_progressive_scales(stage, expected):
+    """Test the houdini_toolbox.pyfilter.operations.ipoverrides.get_progressive_scales."""
+    assert ipoverrides.get_progressive_scales(stage) == expected
 
+
+def test_reset_progressive_stage(mocker):
+    """Test the houdini_toolbox.pyfilter.operations.ipoverrides.reset_progressive_stage."""
     mock_node = mocker.MagicMock(spec=hou.RopNode)
 
-    ipoverrides.set_mantra_command(mock_node)
+    ipoverrides.reset_progressive_stage(mock_node)
 
-    mock_node.parm.return_value.set.assert_called_with(
-        "mantra `pythonexprs(\"__import__('houdini_toolbox.pyfilter.operations', globals(), locals(), ['ipoverrides']).ipoverrides.build_pyfilter_command_from_node(hou.pwd())\")`"
-    )
+    mock_node.parm.assert_called_with("ip_progressive_stage")
+    mock_node.parm.return_value.set.assert_called_with(0)
+
+
+class Test_set_mantra_command:
+    """Test the houdini_toolbox.pyfilter.operations.ipoverrides.set_mantra_command."""
+
+    def test(self, mocker):
+        """Test setting the command when progressive preview is disabled."""
+        mock_install = mocker.patch(
+            "houdini_toolbox.pyfilter.operations.ipoverrides._install_post_render_script"
+        )
+
+        mock_node = mocker.MagicMock(spec=hou.RopNode)
+        mock_node.evalParm.return_value = 0
+
+        ipoverrides.set_mantra_command(mock_node)
+
+        mock_node.parm.return_value.set.assert_called_with(
+            "mantra `pythonexprs(\"__import__('houdini_toolbox.pyfilter.operations', globals(), locals(), ['ipoverrides']).ipoverrides.build_pyfilter_command_from_node(hou.pwd())\")`"
+        )
+
+        mock_node.parm.assert_called_with("soho_pipecmd")
+        mock_node.evalParm.assert_called_with("ip_progressive")
+        mock_install.assert_not_called()
+
+    def test_progressive(self, mocker):
+        """Test setting the command when progressive preview is enabled."""
+        mock_install = mocker.patch(
+            "houdini_toolbox.pyfilter.operations.ipoverrides._install_post_render_script"
+        )
+
+        mock_node = mocker.MagicMock(spec=hou.RopNode)
+        mock_node.evalParm.return_value = 1
+
+        ipoverrides.set_mantra_command(mock_node)
+
+        mock_node.parm.assert_called_with("soho_pipecmd")
+        mock_install.assert_called_with(mock_node)
+
+
+class Test_toggle_progressive_preview:
+    """Test the houdini_toolbox.pyfilter.operations.ipoverrides.toggle_progressive_preview."""
+
+    def test_enabled(self, mocker):
+        """Test enabling progressive preview."""
+        mock_reset = mocker.patch(
+            "houdini_toolbox.pyfilter.operations.ipoverrides.reset_progressive_stage"
+        )
+        mock_install = mocker.patch(
+            "houdini_toolbox.pyfilter.operations.ipoverrides._install_post_render_script"
+        )
+        mock_remove = mocker.patch(
+            "houdini_toolbox.pyfilter.operations.ipoverrides._remove_post_render_script"
+        )
+
+        mock_node = mocker.MagicMock(spec=hou.RopNode)
+        mock_node.evalParm.return_value = 1
+
+        ipoverrides.toggle_progressive_preview(mock_node)
+
+        mock_reset.assert_called_with(mock_node)
+        mock_node.evalParm.assert_called_with("ip_progressive")
+        mock_install.assert_called_with(mock_node)
+        mock_remove.assert_not_called()
+
+    def test_disabled(self, mocker):
+        """Test disabling progressive preview."""
+        mock_reset = mocker.patch(
+            "houdini_toolbox.pyfilter.operations.ipoverrides.reset_progressive_stage"
+        )
+        mock_install = mocker.patch(
+            "houdini_toolbox.pyfilter.operations.ipoverrides._install_post_render_script"
+        )
+        mock_remove = mocker.patch(
+            "houdini_toolbox.pyfilter.operations.ipoverrides._remove_post_render_script"
+        )
+
+        mock_node = mocker.MagicMock(spec=hou.RopNode)
+        mock_node.evalParm.return_value = 0
+
+        ipoverrides.toggle_progressive_preview(mock_node)
 
-    mock_node.parm.assert_called_with("soho_pipecmd")
+        mock_reset.assert_called_with(mock_node)
+        mock_install.assert_not_called()
+        mock_remove.assert_called_with(mock_node)
@@ -4,10 +4,16 @@
 # IMPORTS
 # =============================================================================
 
+# Standard Library
+import argparse
+import logging
+import logging.handlers
+
 # Third Party
 import pytest
 
 # Houdini Toolbox
+from houdini_toolbox.pyfilter.manager import PyFilterManager
 from houdini_toolbox.pyfilter.operations import logoutput
 
 # =============================================================================
@@ -21,7 +27,10 @@ def init_operation(mocker):
     mocker.patch.object(logoutput.LogOutput, "__init__", lambda x, y: None)
 
     def _create():
-        return logoutput.LogOutput(None)
+        op = logoutput.LogOutput(None)
+        op._throttle = None
+
+        return op
 
     return _create
 
@@ -42,8 +51,146 @@ def patch_logger(mocker):
 class Test_LogOutput:
     """Test the houdini_toolbox.pyfilter.operations.logoutput.LogOutput object."""
 
+    def test___init__(self, mocker):
+        """Test object initialization."""
+        mock_super_init = mocker.patch.object(logoutput.PyFilterOperation, "__init__")
+
+        mock_manager = mocker.MagicMock(spec=PyFilterManager)
+
+        op = logoutput.LogOutput(mock_manager)
+
+        mock_super_init.assert_called_with(mock_manager)
+
+        assert op._handlers == []
+        assert op._listener is None
+        assert op._throttle is None
+
+    # Non-Public Methods
+
+    def test__start_listener__no_handlers(self, init_operation, mocker):
+        """Test starting the listener when the logger has no handlers."""
+        mock_logger = mocker.patch(
+            "houdini_toolbox.pyfilter.operations.logoutput._logger",
+            logging.getLogger("test_logoutput_no_handlers"),
+        )
+
+        op = init_operation()
+        op._listener = None
+
+        op._start_listener()
+
+        assert op._listener is None
+        assert not mock_logger.handlers
+
+    def test__start_listener(self, init_operation, mocker):
+        """Test queuing records and restoring the handlers."""
+        test_logger = logging.getLogger("test_logoutput_queue")
+        test_logger.propagate = False
+        test_logger.setLevel(logging.DEBUG)
+
+        mocker.patch(
+            "houdini_toolbox.pyfilter.operations.logoutput._logger", test_logger
+        )
+
+        records = []
+
+        handler = logging.Handler()
+        handler.emit = records.append
+        test_logger.addHandler(handler)
+
+        op = init_operation()
+        op._handlers = []
+        op._listener = None
+
+        op._start_listener()
+
+        try:
+            assert op.listener is not None
+            assert len(test_logger.handlers) == 1
+            assert isinstance(test_logger.handlers[0], logging.handlers.QueueHandler)
+
+            test_logger.info("message")
+
+        finally:
+            op._stop_listener()
+
+        assert [record.getMessage() for record in records] == ["message"]
+        assert test_logger.handlers == [handler]
+        assert op.listener is None
+
+        test_logger.removeHandler(handler)
+
+    def test__stop_listener__not_running(self, init_operation):
+        """Test stopping the listener when it isn't running."""
+        op = init_operation()
+        op._listener = None
+
+        op._stop_listener()
+
+    # Properties
+
+    def test_listener(self, init_operation, mocker):
+        """Test the 'listener' property."""
+        mock_value = mocker.MagicMock(spec=logging.handlers.QueueListener)
+
+        op = init_operation()
+        op._listener = mock_value
+
+        assert op.listener == mock_value
+
+    def test_throttle(self, init_operation, mocker):
+        """Test the 'throttle' property."""
+        mock_value = mocker.MagicMock(spec=logoutput.MessageThrottle)
+
+        op = init_operation()
+        op._throttle = mock_value
+
+        assert op.throttle == mock_value
+
+    # Static Methods
+
+    def test_build_arg_string(self):
+        """Test arg string construction."""
+        assert logoutput.LogOutput.build_arg_string() == ""
+
+        result = logoutput.LogOutput.build_arg_string(
+            log_queue=True, log_dedup=True, log_rate_limit=100
+        )
+
+        assert result == "--log-queue --log-dedup --log-rate-limit=100"
+
+    def test_register_parser_args(self, mocker):
+        """Test registering all the argument parser args."""
+        mock_parser = mocker.MagicMock(spec=argparse.ArgumentParser)
+
+        logoutput.LogOutput.register_parser_args(mock_parser)
+
+        calls = [
+            mocker.call("--log-queue", action="store_true", dest="log_queue"),
+            mocker.call("--log-dedup", action="store_true", dest="log_dedup"),
+            mocker.call("--log-rate-limit", type=int, dest="log_rate_limit"),
+        ]
+        mock_parser.add_argument.assert_has_calls(calls)
+
     # Methods
 
+    def test_filter_error__throttle(self, init_operation, patch_logger, mocker):
+        """Filter messages through a throttle."""
+        mock_throttle = mocker.MagicMock(spec=logoutput.MessageThrottle)
+
+        op = init_operation()
+        op._throttle = mock_throttle
+
+        assert op.filter_error(0, "line1\nline2", "prefix")
+
+        mock_throttle.process.assert_has_calls(
+            [
+                mocker.call(logging.ERROR, "line1", "prefix"),
+                mocker.call(logging.ERROR, "line2", "prefix"),
+            ]
+        )
+        patch_logger.error.assert_not_called()
+
     def test_filter_error__level_0(self, init_operation, patch_logger, mocker):
         """Filter an error with level=0."""
         level = 0
@@ -117,3 +264,167 @@ class Test_LogOutput:
         mock_message.split.assert_called_with("\n")
 
         patch_logger.debug.assert_called_with(mock_message)
+
+    # filter_quit
+
+    def test_filter_quit(self, init_operation, mocker):
+        """Test flushing messages at the quit stage."""
+        mock_stop = mocker.patch.object(logoutput.LogOutput, "_stop_listener")
+
+        mock_throttle = mocker.MagicMock(spec=logoutput.MessageThrottle)
+
+        op = init_operation()
+        op._throttle = mock_throttle
+
+        op.filter_quit()
+
+        mock_throttle.flush.assert_called()
+        mock_stop.assert_called()
+
+    def test_filter_quit__no_throttle(self, init_operation, mocker):
+        """Test the quit stage without a throttle."""
+        mock_stop = mocker.patch.object(logoutput.LogOutput, "_stop_listener")
+
+        op = init_operation()
+
+        op.filter_quit()
+
+        mock_stop.assert_called()
+
+    # process_parsed_args
+
+    def test_process_parsed_args__noop(self, init_operation, mocker):
+        """Test processing parsed args when no args are set."""
+        mock_start = mocker.patch.object(logoutput.LogOutput, "_start_listener")
+
+        op = init_operation()
+
+        op.process_parsed_args(argparse.Namespace())
+
+        assert op.throttle is None
+        mock_start.assert_not_called()
+
+    def test_process_parsed_args__all(self, init_operation, patch_logger, mocker):
+        """Test processing parsed args when all args are set."""
+        mock_start = mocker.patch.object(logoutput.LogOutput, "_start_listener")
+
+        namespace = argparse.Namespace(
+            log_queue=True, log_dedup=True, log_rate_limit=10
+        )
+
+        op = init_operation()
+
+        op.process_parsed_args(namespace)
+
+        assert op.throttle.dedup
+        assert op.throttle.rate_limit == 10
+        mock_start.assert_called()
+
+
+class Test_MessageThrottle:
+    """Test the houdini_toolbox.pyfilter.operations.logoutput.MessageThrottle object."""
+
+    def test_dedup(self):
+        """Test collapsing repeated messages."""
+        emitted = []
+
+        throttle = logoutput.MessageThrottle(
+            lambda level, message: emitted.append((level, message))
+        )
+
+        for _ in range(5):
+            throttle.process(logging.INFO, "message", "")
+
+        throttle.process(logging.INFO, "other", "")
+        throttle.process(logging.INFO, "other", "")
+        throttle.process(logging.WARNING, "other", "")
+
+        throttle.flush()
+
+        assert emitted == [
+            (logging.INFO, "message"),
+            (logging.INFO, "Message 'message' repeated 4 times"),
+            (logging.INFO, "other"),
+            (logging.INFO, "Message 'other' repeated 1 times"),
+            (logging.WARNING, "other"),
+        ]
+
+    def test_rate_limit(self, mocker):
+        """Test rate limiting messages with the same prefix."""
+        mock_time = mocker.patch(
+            "houdini_toolbox.pyfilter.operations.logoutput.time.monotonic",
+            return_value=0.0,
+        )
+
+        emitted = []
+
+        throttle = logoutput.MessageThrottle(
+            lambda level, message: emitted.append((level, message)),
+            dedup=False,
+            rate_limit=2,
+        )
+
+        for index in range(5):
+            throttle.process(logging.WARNING, f"warning{index}", "vex")
+
+        throttle.process(logging.WARNING, "other", "other")
+        throttle.process(logging.ERROR, "error", "vex")
+
+        mock_time.return_value = 1.0
+
+        throttle.process(logging.WARNING, "warning5", "vex")
+        throttle.process(logging.WARNING, "warning6", "vex")
+        throttle.process(logging.WARNING, "warning7", "vex")
+
+        throttle.flush()
+
+        assert emitted == [
+            (logging.WARNING, "warning0"),
+            (logging.WARNING, "warning1"),
+            (logging.WARNING, "other"),
+            (logging.ERROR, "error"),
+            (logging.WARNING, "Suppressed 3 messages with prefix 'vex'"),
+            (logging.WARNING, "warning5"),
+            (logging.WARNING, "warning6"),
+            (logging.WARNING, "Suppressed 1 messages with prefix 'vex'"),
+        ]
+
+    def test_rate_limit__repeats(self, mocker):
+        """Test that repeats of suppressed messages are counted as suppressed."""
+        mocker.patch(
+            "houdini_toolbox.pyfilter.operations.logoutput.time.monotonic",
+            return_value=0.0,
+        )
+
+        emitted = []
+
+        throttle = logoutput.MessageThrottle(
+            lambda level, message: emitted.append((level, message)), rate_limit=1
+        )
+
+        throttle.process(logging.WARNING, "first", "vex")
+
+        for _ in range(3):
+            throttle.process(logging.WARNING, "second", "vex")
+
+        throttle.flush()
+
+        assert emitted == [
+            (logging.WARNING, "first"),
+            (logging.WARNING, "Suppressed 3 messages with prefix 'vex'"),
+        ]
+
+
+@pytest.mark.parametrize(
+    "level, prefix, expected",
+    [
+        (0, "", logging.ERROR),
+        (0, "prefix", logging.ERROR),
+        (2, "prefix", logging.WARNING),
+        (1, "", logging.INFO),
+        (2, "", logging.DEBUG),
+    ],
+)
+def test__get_log_level(level, prefix, expected):
+    """Test houdini_toolbox.pyfilter.operations.logoutput._get_log_level."""
+    assert logoutput._get_log_level(level, prefix) == expected
@@ -47,6 +47,9 @@ class Test_PyFilterOperation:
         assert op._data == {}
         assert op._manager == mock_manager
 
+        # Operations check whether to run on every call by default.
+        assert op.run_decision_stage is None
+
     # Properties
 
     def test_data(self, init_operation, mocker):
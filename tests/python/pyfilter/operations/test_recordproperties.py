@@ -0,0 +1,279 @@
+"""Test the houdini_toolbox.pyfilter.operations.recordproperties module."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+# Standard Library
+import argparse
+import json
+import sys
+import types
+
+# Third Party
+import pytest
+
+# Houdini Toolbox
+from houdini_toolbox.pyfilter.manager import PyFilterManager
+from houdini_toolbox.pyfilter.operations import recordproperties
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+@pytest.fixture
+def init_operation(mocker):
+    """Fixture to initialize an operation."""
+    mocker.patch.object(
+        recordproperties.RecordProperties, "__init__", lambda x, y: None
+    )
+
+    def _create():
+        return recordproperties.RecordProperties(None)
+
+    return _create
+
+
+@pytest.fixture
+def stand_in_mantra(monkeypatch):
+    """Install a simple mantra module storing property values in a dict."""
+    values = {}
+
+    module = types.ModuleType("mantra")
+    module.property = values.get
+    module.setproperty = values.__setitem__
+    module.values = values
+
+    monkeypatch.setitem(sys.modules, "mantra", module)
+
+    yield module
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+class Test_PropertyRecorder:
+    """Test the houdini_toolbox.pyfilter.operations.recordproperties.PropertyRecorder object."""
+
+    def test_record(self, stand_in_mantra, mocker, tmp_path):
+        """Test recording callbacks."""
+        path = tmp_path / "recording.jsonl"
+
+        stand_in_mantra.values.update(
+            {"image:filename": ["ip"], "object:name": ["/obj/geo1"]}
+        )
+
+        class _Manager:
+            def run_operations_for_stage(self, stage_name, *args):
+                import mantra
+
+                if stage_name == "filter_camera":
+                    mantra.property("image:filename")
+                    mantra.setproperty("image:filename", ["null:"])
+                    mantra.property("image:filename")
+
+                elif stage_name == "filter_error":
+                    return True
+
+                return False
+
+        mgr = _Manager()
+
+        recorder = recordproperties.PropertyRecorder(
+            str(path), ["--zdepth"], [{"module": "module", "class": "Class"}]
+        )
+        recorder.start(mgr)
+
+        assert recorder.recording
+
+        mgr.run_operations_for_stage("filter_camera")
+
+        # Read before the callback is run, such as when logging.
+        stand_in_mantra.property("object:name")
+        mgr.run_operations_for_stage("filter_instance")
+
+        assert mgr.run_operations_for_stage("filter_error", 1, "message", "")
+        mgr.run_operations_for_stage("filter_quit")
+
+        assert not recorder.recording
+        assert recorder.callbacks == 4
+        assert "run_operations_for_stage" not in vars(mgr)
+        assert stand_in_mantra.property == stand_in_mantra.values.get
+
+        with open(path, encoding="utf-8") as handle:
+            records = [json.loads(line) for line in handle]
+
+        assert records == [
+            {
+                "version": recordproperties.RECORDING_VERSION,
+                "args": ["--zdepth"],
+                "operations": [{"module": "module", "class": "Class"}],
+            },
+            {
+                "stage": "filter_camera",
+                "args": [],
+                "reads": {"image:filename": ["ip"]},
+                "sets": [["image:filename", ["null:"]]],
+            },
+            {
+                "stage": "filter_instance",
+                "args": [],
+                "reads": {"object:name": ["/obj/geo1"]},
+                "sets": [],
+            },
+            {
+                "stage": "filter_error",
+                "args": [1, "message", ""],
+                "reads": {},
+                "sets": [],
+            },
+            {"stage": "filter_quit", "args": [], "reads": {}, "sets": []},
+        ]
+
+    def test_stop__not_recording(self, tmp_path):
+        """Test stopping when not recording."""
+        recorder = recordproperties.PropertyRecorder(
+            str(tmp_path / "recording.jsonl"), [], []
+        )
+
+        recorder.stop()
+
+        assert not recorder.recording
+
+    # Properties
+
+    def test_path(self):
+        """Test the 'path' property."""
+        recorder = recordproperties.PropertyRecorder("/path/to/recording", [], [])
+
+        assert recorder.path == "/path/to/recording"
+
+
+class Test_RecordProperties:
+    """Test the houdini_toolbox.pyfilter.operations.recordproperties.RecordProperties object."""
+
+    def test___init__(self, mocker):
+        """Test object initialization."""
+        mock_super_init = mocker.patch.object(
+            recordproperties.PyFilterOperation, "__init__"
+        )
+
+        mock_manager = mocker.MagicMock(spec=PyFilterManager)
+
+        op = recordproperties.RecordProperties(mock_manager)
+
+        mock_super_init.assert_called_with(mock_manager)
+
+        assert op._recorder is None
+
+    # Properties
+
+    def test_recorder(self, init_operation, mocker):
+        """Test the 'recorder' property."""
+        mock_value = mocker.MagicMock(spec=recordproperties.PropertyRecorder)
+
+        op = init_operation()
+        op._recorder = mock_value
+
+        assert op.recorder == mock_value
+
+    # Static Methods
+
+    def test_build_arg_string(self):
+        """Test arg string construction."""
+        result = recordproperties.RecordProperties.build_arg_string()
+        assert result == ""
+
+        result = recordproperties.RecordProperties.build_arg_string(
+            record_properties="/path/to/recording.jsonl"
+        )
+        assert result == "--record-properties=/path/to/recording.jsonl"
+
+    def test_register_parser_args(self, mocker):
+        """Test registering all the argument parser args."""
+        mock_parser = mocker.MagicMock(spec=argparse.ArgumentParser)
+
+        recordproperties.RecordProperties.register_parser_args(mock_parser)
+
+        mock_parser.add_argument.assert_called_with(
+            "--record-properties", dest="record_properties"
+        )
+
+    # Methods
+
+    # process_parsed_args
+
+    def test_process_parsed_args__noop(self, init_operation, mocker):
+        """Test processing parsed args when not recording."""
+        mock_recorder = mocker.patch.object(recordproperties, "PropertyRecorder")
+
+        op = init_operation()
+        op._recorder = None
+
+        op.process_parsed_args(argparse.Namespace(record_properties=None))
+
+        mock_recorder.assert_not_called()
+        assert not op.should_run()
+
+    def test_process_parsed_args(self, init_operation, mocker):
+        """Test processing parsed args when recording."""
+        mock_recorder = mocker.patch.object(recordproperties, "PropertyRecorder")
+        mocker.patch.object(
+            sys, "argv", ["ht-pyfilter.py", "--record-properties=/path", "--zdepth"]
+        )
+
+        mock_manager = mocker.MagicMock(spec=PyFilterManager)
+
+        op = init_operation()
+        op._manager = mock_manager
+        op._recorder = None
+
+        other = mocker.MagicMock()
+        mock_manager.operations = [op, other]
+
+        op.process_parsed_args(argparse.Namespace(record_properties="/path"))
+
+        mock_recorder.assert_called_with(
+            "/path",
+            ["--zdepth"],
+            [{"module": type(other).__module__, "class": type(other).__name__}],
+        )
+        mock_recorder.return_value.start.assert_called_with(mock_manager)
+
+        assert op.recorder == mock_recorder.return_value
+        assert op.should_run()
+
+    def test_process_parsed_args__error(self, init_operation, mocker):
+        """Test processing parsed args when the recording can't be written."""
+        mock_recorder = mocker.patch.object(recordproperties, "PropertyRecorder")
+        mock_recorder.return_value.start.side_effect = OSError
+        mock_logger = mocker.patch.object(recordproperties, "_logger")
+
+        mock_manager = mocker.MagicMock(spec=PyFilterManager)
+        mock_manager.operations = []
+
+        op = init_operation()
+        op._manager = mock_manager
+        op._recorder = None
+
+        op.process_parsed_args(argparse.Namespace(record_properties="/path"))
+
+        mock_logger.warning.assert_called()
+        assert op.recorder is None
+
+
+@pytest.mark.parametrize(
+    "args, expected",
+    [
+        ([], []),
+        (["--zdepth"], ["--zdepth"]),
+        (["--record-properties=/path", "--zdepth"], ["--zdepth"]),
+        (["--record-properties", "/path", "--zdepth"], ["--zdepth"]),
+    ],
+)
+def test_strip_record_args(args, expected):
+    """Test houdini_toolbox.pyfilter.operations.recordproperties.strip_record_args."""
+    assert recordproperties.strip_record_args(args) == expected
@@ -0,0 +1,637 @@
+"""Test the houdini_toolbox.pyfilter.operations.setproperties module."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+# Standard Library
+import argparse
+import fnmatch
+import json
+import re
+
+# Third Party
+import pytest
+
+# Houdini Toolbox
+from houdini_toolbox.pyfilter.manager import PyFilterManager
+from houdini_toolbox.pyfilter.operations import setproperties
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+@pytest.fixture
+def init_operation(mocker):
+    """Fixture to initialize an operation."""
+    mocker.patch.object(setproperties.SetProperties, "__init__", lambda x, y: None)
+
+    def _create():
+        return setproperties.SetProperties(None)
+
+    return _create
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+class Test_RuleMatcher:
+    """Test the houdini_toolbox.pyfilter.operations.setproperties.RuleMatcher object."""
+
+    def test___len__(self):
+        """Test getting the number of rules."""
+        matcher = setproperties.RuleMatcher()
+        matcher.add_rule({"a": 1}, name="/obj/geo1")
+        matcher.add_rule({"b": 2}, name="/obj/geo1")
+        matcher.add_rule({"c": 3}, name="/obj/*")
+
+        assert len(matcher) == 2
+
+    # Methods
+
+    # add_rule
+
+    @pytest.mark.parametrize("name, regex", [(None, None), ("/obj/geo1", "geo.*")])
+    def test_add_rule__invalid_args(self, name, regex):
+        """Test adding a rule without exactly one of a name or regex."""
+        matcher = setproperties.RuleMatcher()
+
+        with pytest.raises(ValueError):
+            matcher.add_rule({"a": 1}, name=name, regex=regex)
+
+    def test_add_rule__invalid_regex(self):
+        """Test adding a rule with an invalid regex."""
+        matcher = setproperties.RuleMatcher()
+
+        with pytest.raises(ValueError):
+            matcher.add_rule({"a": 1}, regex="geo(")
+
+    def test_add_rule__name(self):
+        """Test adding rules for plain names."""
+        matcher = setproperties.RuleMatcher()
+        matcher.add_rule({"a": 1, "b": 1}, name="/obj/geo1")
+        matcher.add_rule({"b": 2}, name="/obj/geo1")
+
+        assert matcher._names == {"/obj/geo1": {"a": 1, "b": 2}}
+        assert not matcher._patterns
+
+    def test_add_rule__patterns(self):
+        """Test adding rules for glob and regex patterns."""
+        matcher = setproperties.RuleMatcher()
+        matcher.compile()
+
+        matcher.add_rule({"a": 1}, name="/obj/geo*")
+        matcher.add_rule({"b": 2}, regex=r"/obj/box\d+")
+
+        assert matcher._prefixes == {
+            "/obj/geo.*": "/obj/geo",
+            r"/obj/box\d+": "/obj/box",
+        }
+        assert not matcher._separate_patterns
+        assert not matcher._is_compiled
+
+    @pytest.mark.parametrize(
+        "regex",
+        [
+            "(?i)/OBJ/geo.*",
+            r"(?P<name>/obj/geo)\d",
+            r"/obj/(geo)\1",
+            r"/obj/(?P<name>geo)(?P=name)",
+            r"/obj/(geo)?(?(1)1|2)",
+        ],
+    )
+    def test_add_rule__separate(self, regex):
+        """Test adding regex rules which can't be combined with others."""
+        matcher = setproperties.RuleMatcher()
+        matcher.add_rule({"a": 1}, regex=regex)
+
+        assert matcher._separate_patterns == {regex}
+
+    # compile
+
+    def test_compile(self):
+        """Test grouping patterns by their prefix."""
+        matcher = setproperties.RuleMatcher()
+        matcher.add_rule({"a": 1}, name="/obj/geo*")
+        matcher.add_rule({"b": 2}, name="/obj/box*")
+        matcher.add_rule({"c": 3}, name="/obj/geo?")
+        matcher.add_rule({"d": 4}, regex=".*light.*")
+
+        matcher.compile()
+
+        assert matcher._is_compiled
+        assert [length for length, _ in matcher._groups] == [0, 8]
+        assert sorted(matcher._groups[1][1]) == ["/obj/box", "/obj/geo"]
+        assert matcher._separate == []
+
+    def test_compile__separate(self):
+        """Test patterns which can't be combined are compiled separately."""
+        matcher = setproperties.RuleMatcher()
+        matcher.add_rule({"a": 1}, name="/obj/geo*")
+        matcher.add_rule({"b": 2}, regex=r"(?P<name>/obj/box)\d")
+
+        matcher.compile()
+
+        assert [length for length, _ in matcher._groups] == [8]
+        assert [(index, prefix) for index, prefix, _ in matcher._separate] == [(1, "")]
+
+    # match
+
+    def test_match(self):
+        """Test matching names."""
+        matcher = setproperties.RuleMatcher()
+        matcher.add_rule({"a": 1}, name="/obj/geo*")
+        matcher.add_rule({"b": 2}, regex=".*1")
+        matcher.add_rule({"c": 3}, name="/obj/geo1")
+        matcher.add_rule({"a": 4}, name="/obj/geo1")
+        matcher.compile()
+
+        assert matcher.match("/obj/geo1") == {"a": 4, "c": 3}
+        assert matcher.match("/obj/geo2") == {"a": 1}
+        assert matcher.match("/obj/box1") == {"b": 2}
+        assert matcher.match("/obj/box2") is None
+
+    def test_match__first_pattern(self):
+        """Test that the first added matching pattern is used."""
+        matcher = setproperties.RuleMatcher()
+        matcher.add_rule({"a": 1}, regex=".*")
+        matcher.add_rule({"b": 2}, name="/obj/geo*")
+        matcher.compile()
+
+        assert matcher.match("/obj/geo1") == {"a": 1}
+
+    def test_match__separate(self):
+        """Test matching patterns which can't be combined with others."""
+        matcher = setproperties.RuleMatcher()
+        matcher.add_rule({"a": 1}, regex="(?i)/OBJ/GEO.*")
+        matcher.add_rule({"b": 2}, regex=r"(?P<name>/obj/box)\d")
+        matcher.add_rule({"c": 3}, regex=r"(?P<name>/obj/sphere)\d")
+        matcher.add_rule({"d": 4}, regex=r"/obj/(a)\1")
+        matcher.add_rule({"e": 5}, name="/obj/*")
+        matcher.compile()
+
+        assert matcher.match("/obj/geo1") == {"a": 1}
+        assert matcher.match("/obj/box1") == {"b": 2}
+        assert matcher.match("/obj/sphere1") == {"c": 3}
+        assert matcher.match("/obj/aa") == {"d": 4}
+        assert matcher.match("/obj/ab") == {"e": 5}
+
+    def test_match__separate_order(self):
+        """Test that a combined pattern added first takes precedence."""
+        matcher = setproperties.RuleMatcher()
+        matcher.add_rule({"a": 1}, name="/obj/*")
+        matcher.add_rule({"b": 2}, regex="(?i)/OBJ/GEO.*")
+        matcher.compile()
+
+        assert matcher.match("/obj/geo1") == {"a": 1}
+
+    def test_match__cached(self, mocker):
+        """Test that results are cached."""
+        matcher = setproperties.RuleMatcher()
+        matcher.add_rule({"a": 1}, name="/obj/geo*")
+        matcher.compile()
+
+        assert matcher.match("/obj/geo1") == {"a": 1}
+
+        matcher._groups = mocker.MagicMock()
+
+        assert matcher.match("/obj/geo1") == {"a": 1}
+        matcher._groups.__iter__.assert_not_called()
+
+    def test_match__cache_size(self, mocker):
+        """Test that the oldest results are discarded when the cache is full."""
+        mocker.patch.object(setproperties, "_MAX_CACHED_RESULTS", 2)
+
+        matcher = setproperties.RuleMatcher()
+        matcher.add_rule({"a": 1}, name="/obj/geo*")
+        matcher.compile()
+
+        matcher.match("/obj/geo1")
+        matcher.match("/obj/geo2")
+        matcher.match("/obj/geo3")
+
+        assert list(matcher._results) == ["/obj/geo2", "/obj/geo3"]
+
+    def test_match__not_compiled(self):
+        """Test that patterns added after compiling are compiled when matching."""
+        matcher = setproperties.RuleMatcher()
+        matcher.compile()
+
+        assert matcher.match("/obj/geo1") is None
+
+        matcher.add_rule({"a": 1}, name="/obj/geo*")
+
+        assert matcher.match("/obj/geo1") == {"a": 1}
+
+
+class Test_SetProperties:
+    """Test the houdini_toolbox.pyfilter.operations.setproperties.SetProperties object."""
+
+    def test___init__(self, mocker):
+        """Test object initialization."""
+        mock_super_init = mocker.patch.object(
+            setproperties.PyFilterOperation, "__init__"
+        )
+
+        mock_manager = mocker.MagicMock(spec=PyFilterManager)
+
+        op = setproperties.SetProperties(mock_manager)
+
+        mock_super_init.assert_called_with(mock_manager)
+
+        assert op._camera_properties == {}
+        assert op._matchers == {}
+
+    # Non-Public Methods
+
+    # _apply_matching
+
+    def test__apply_matching__no_matcher(self, init_operation, mocker):
+        """Test applying properties for a stage without rules."""
+        mock_get = mocker.patch(
+            "houdini_toolbox.pyfilter.operations.setproperties.get_property"
+        )
+
+        op = init_operation()
+        op._matchers = {}
+
+        op._apply_matching("instance")
+
+        mock_get.assert_not_called()
+
+    def test__apply_matching__not_string(self, init_operation, mocker):
+        """Test applying properties when the name is not a string."""
+        mocker.patch(
+            "houdini_toolbox.pyfilter.operations.setproperties.get_property",
+            return_value=1,
+        )
+
+        mock_matcher = mocker.MagicMock(spec=setproperties.RuleMatcher)
+
+        op = init_operation()
+        op._matchers = {"instance": mock_matcher}
+
+        op._apply_matching("instance")
+
+        mock_matcher.match.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "stage, property_name",
+        [
+            ("fog", "object:name"),
+            ("instance", "object:name"),
+            ("light", "object:name"),
+            ("plane", "plane:variable"),
+        ],
+    )
+    def test__apply_matching(self, init_operation, mocker, stage, property_name):
+        """Test applying properties of matching rules."""
+        mock_get = mocker.patch(
+            "houdini_toolbox.pyfilter.operations.setproperties.get_property",
+            return_value="name",
+        )
+        mock_set = mocker.patch(
+            "houdini_toolbox.pyfilter.operations.setproperties.set_properties"
+        )
+
+        mock_matcher = mocker.MagicMock(spec=setproperties.RuleMatcher)
+
+        op = init_operation()
+        op._matchers = {stage: mock_matcher}
+
+        op._apply_matching(stage)
+
+        mock_get.assert_called_with(property_name)
+        mock_matcher.match.assert_called_with("name")
+        mock_set.assert_called_with(mock_matcher.match.return_value)
+
+    def test__apply_matching__no_match(self, init_operation, mocker):
+        """Test applying properties when no rules match."""
+        mocker.patch(
+            "houdini_toolbox.pyfilter.operations.setproperties.get_property",
+            return_value="name",
+        )
+        mock_set = mocker.patch(
+            "houdini_toolbox.pyfilter.operations.setproperties.set_properties"
+        )
+
+        mock_matcher = mocker.MagicMock(spec=setproperties.RuleMatcher)
+        mock_matcher.match.return_value = None
+
+        op = init_operation()
+        op._matchers = {"instance": mock_matcher}
+
+        op._apply_matching("instance")
+
+        mock_set.assert_not_called()
+
+    # Properties
+
+    def test_camera_properties(self, init_operation, mocker):
+        """Test the 'camera_properties' property."""
+        mock_value = mocker.MagicMock(spec=dict)
+
+        op = init_operation()
+        op._camera_properties = mock_value
+
+        assert op.camera_properties == mock_value
+
+    def test_matchers(self, init_operation, mocker):
+        """Test the 'matchers' property."""
+        mock_value = mocker.MagicMock(spec=dict)
+
+        op = init_operation()
+        op._matchers = mock_value
+
+        assert op.matchers == mock_value
+
+    # Static Methods
+
+    def test_build_arg_string(self):
+        """Test arg string construction."""
+        result = setproperties.SetProperties.build_arg_string()
+        assert result == ""
+
+        result = setproperties.SetProperties.build_arg_string(
+            set_properties_file="/path/to/rules.json"
+        )
+        assert result == "--set-properties-file=/path/to/rules.json"
+
+    def test_register_parser_args(self, mocker):
+        """Test registering all the argument parser args."""
+        mock_parser = mocker.MagicMock(spec=argparse.ArgumentParser)
+
+        setproperties.SetProperties.register_parser_args(mock_parser)
+
+        mock_parser.add_argument.assert_called_with(
+            "--set-properties-file", action="append", dest="set_properties_files"
+        )
+
+    # Methods
+
+    # add_rules
+
+    def test_add_rules(self, init_operation):
+        """Test adding rules."""
+        op = init_operation()
+        op._camera_properties = {}
+        op._matchers = {}
+
+        op.add_rules(
+            [
+                {"stage": "camera", "properties": {"image:samples": 4}},
+                {
+                    "stage": "instance",
+                    "name": "/obj/geo*",
+                    "properties": {"object:phantom": True},
+                },
+                {
+                    "stage": "plane",
+                    "regex": "N|P",
+                    "properties": {"plane:quantize": "float"},
+                },
+            ]
+        )
+
+        assert op.camera_properties == {"image:samples": 4}
+        assert sorted(op.matchers) == ["instance", "plane"]
+
+        assert op.matchers["instance"].match("/obj/geo1") == {"object:phantom": True}
+        assert op.matchers["plane"].match("N") == {"plane:quantize": "float"}
+
+    @pytest.mark.parametrize(
+        "rule",
+        [
+            "rule",
+            {"stage": "instance", "name": "/obj/geo1"},
+            {"stage": "object", "name": "/obj/geo1", "properties": {}},
+            {"stage": "instance", "properties": {}},
+            {"stage": "instance", "regex": "geo(", "properties": {}},
+        ],
+    )
+    def test_add_rules__invalid(self, init_operation, rule):
+        """Test adding invalid rules."""
+        op = init_operation()
+        op._camera_properties = {}
+        op._matchers = {}
+
+        with pytest.raises(ValueError, match="Rule 0"):
+            op.add_rules([rule])
+
+    # filter_camera
+
+    def test_filter_camera(self, init_operation, patch_operation_logger, mocker):
+        """Test 'filter_camera'."""
+        mock_set = mocker.patch(
+            "houdini_toolbox.pyfilter.operations.setproperties.set_properties"
+        )
+
+        op = init_operation()
+        op._camera_properties = {"image:samples": 4}
+
+        op.filter_camera()
+
+        mock_set.assert_called_with({"image:samples": 4})
+
+    def test_filter_camera__no_properties(
+        self, init_operation, patch_operation_logger, mocker
+    ):
+        """Test 'filter_camera' when there are no camera properties."""
+        mock_set = mocker.patch(
+            "houdini_toolbox.pyfilter.operations.setproperties.set_properties"
+        )
+
+        op = init_operation()
+        op._camera_properties = {}
+
+        op.filter_camera()
+
+        mock_set.assert_not_called()
+
+    @pytest.mark.parametrize("stage", ["fog", "instance", "light", "plane"])
+    def test_filter_stage(self, init_operation, mocker, stage):
+        """Test the per object filter stages."""
+        mock_apply = mocker.patch.object(setproperties.SetProperties, "_apply_matching")
+
+        op = init_operation()
+
+        getattr(op, f"filter_{stage}")()
+
+        mock_apply.assert_called_with(stage)
+
+    # process_parsed_args
+
+    def test_process_parsed_args__noop(self, init_operation, mocker):
+        """Test processing parsed args when no args are set."""
+        mock_add = mocker.patch.object(setproperties.SetProperties, "add_rules")
+
+        mock_namespace = mocker.MagicMock(spec=argparse.Namespace)
+        mock_namespace.set_properties_files = None
+
+        op = init_operation()
+
+        op.process_parsed_args(mock_namespace)
+
+        mock_add.assert_not_called()
+
+    def test_process_parsed_args(self, init_operation, mocker, tmp_path):
+        """Test processing parsed args when rules files are set."""
+        path1 = tmp_path / "rules1.json"
+        path1.write_text(
+            json.dumps([{"stage": "light", "name": "/obj/key", "properties": {"a": 1}}])
+        )
+
+        path2 = tmp_path / "rules2.json"
+        path2.write_text(
+            json.dumps(
+                {
+                    "rules": [
+                        {"stage": "light", "name": "/obj/*", "properties": {"b": 2}}
+                    ]
+                }
+            )
+        )
+
+        mock_namespace = mocker.MagicMock(spec=argparse.Namespace)
+        mock_namespace.set_properties_files = [str(path1), str(path2)]
+
+        op = init_operation()
+        op._camera_properties = {}
+        op._matchers = {}
+
+        op.process_parsed_args(mock_namespace)
+
+        assert op.matchers["light"]._is_compiled
+        assert op.matchers["light"].match("/obj/key") == {"a": 1, "b": 2}
+        assert op.should_run()
+
+    # should_run
+
+    @pytest.mark.parametrize(
+        "camera_properties, matchers, expected",
+        [
+            ({}, {}, False),
+            ({"image:samples": 4}, {}, True),
+            ({}, {"instance": setproperties.RuleMatcher()}, True),
+        ],
+    )
+    def test_should_run(self, init_operation, camera_properties, matchers, expected):
+        """Test whether or not the operation should run."""
+        op = init_operation()
+        op._camera_properties = camera_properties
+        op._matchers = matchers
+
+        assert op.should_run() == expected
+
+
+@pytest.mark.parametrize(
+    "regex, expected",
+    [
+        ("/obj/geo.*", True),
+        ("/obj/(geo|light).*", True),
+        ("(?i)/obj/geo.*", False),
+        ("(?s)/obj/geo.*", False),
+        ("/obj/(?i:geo).*", True),
+        ("/obj/(?P<name>geo).*", False),
+        (r"/obj/(geo)\1", False),
+    ],
+)
+def test__can_combine_regex(regex, expected):
+    """Test the houdini_toolbox.pyfilter.operations.setproperties._can_combine_regex."""
+    assert setproperties._can_combine_regex(regex) == expected
+
+
+class Test__get_regex_prefix:
+    """Test houdini_toolbox.pyfilter.operations.setproperties._get_regex_prefix."""
+
+    @pytest.mark.parametrize(
+        "regex, expected",
+        [
+            ("/obj/geo1", "/obj/geo1"),
+            (r"/obj/geo\d+", "/obj/geo"),
+            ("/obj/geo.*", "/obj/geo"),
+            ("/obj/geos?", "/obj/geo"),
+            ("/obj/geo(1|2)", ""),
+            ("(?i)/obj/geo", ""),
+            (".*geo", ""),
+        ],
+    )
+    def test(self, regex, expected):
+        """Test getting the prefix of regular expressions."""
+        assert setproperties._get_regex_prefix(regex) == expected
+
+
+class Test__glob_to_regex:
+    """Test houdini_toolbox.pyfilter.operations.setproperties._glob_to_regex."""
+
+    @pytest.mark.parametrize(
+        "pattern",
+        ["/obj/geo*", "/obj/geo?", "/obj/[!a]*", "/obj/[]]", "/obj/[", "*.[ch]", "a+b"],
+    )
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "/obj/geo1",
+            "/obj/geo12",
+            "/obj/a",
+            "/obj/b",
+            "/obj/]",
+            "/obj/[",
+            "x.c",
+            "a+b",
+        ],
+    )
+    def test(self, pattern, name):
+        """Test that converted patterns match the same names as fnmatch."""
+        regex = setproperties._glob_to_regex(pattern)
+
+        assert bool(re.fullmatch(regex, name)) == fnmatch.fnmatchcase(name, pattern)
+
+        assert not re.compile(regex).groups
+
+
+class Test_load_rules_file:
+    """Test houdini_toolbox.pyfilter.operations.setproperties.load_rules_file."""
+
+    def test_json(self, tmp_path):
+        """Test loading a JSON list of rules."""
+        rules = [{"stage": "camera", "properties": {"image:samples": 4}}]
+
+        path = tmp_path / "rules.json"
+        path.write_text(json.dumps(rules))
+
+        assert setproperties.load_rules_file(str(path)) == rules
+
+    def test_yaml(self, tmp_path):
+        """Test loading YAML rules under a 'rules' key."""
+        pytest.importorskip("yaml")
+
+        path = tmp_path / "rules.yaml"
+        path.write_text(
+            "rules:\n  - stage: camera\n    properties:\n      image:samples: 4\n"
+        )
+
+        assert setproperties.load_rules_file(str(path)) == [
+            {"stage": "camera", "properties": {"image:samples": 4}}
+        ]
+
+    def test_yaml__not_available(self, tmp_path, mocker):
+        """Test loading a YAML file when PyYAML is not available."""
+        mocker.patch.dict("sys.modules", {"yaml": None})
+
+        path = tmp_path / "rules.yaml"
+        path.write_text("rules: []\n")
+
+        with pytest.raises(ValueError, match="PyYAML"):
+            setproperties.load_rules_file(str(path))
+
+    def test_no_rules(self, tmp_path):
+        """Test loading a file without a list of rules."""
+        path = tmp_path / "rules.json"
+        path.write_text(json.dumps({"stage": "camera"}))
+
+        with pytest.raises(ValueError):
+            setproperties.load_rules_file(str(path))
@@ -0,0 +1,59 @@
+"""Reference implementation of houdini_toolbox.pyfilter.property._transform_values.
+
+Shared by the property tests and benchmark to check and measure the current
+implementation against decoding every string with json.loads().
+
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+# Standard Library
+import json
+from typing import Any, List, Optional
+
+# Houdini Toolbox
+from houdini_toolbox.pyfilter import property as prop
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+
+
+def transform_values_with_json(values: Optional[List[Any]]) -> Any:
+    """Transform values by trying to decode every string with json.loads().
+
+    This is how values were originally transformed and the current
+    implementation must produce the same results.
+
+    :param values: The values to transform.
+    :return: The transformed values.
+
+    """
+    if values is None:
+        return None
+
+    if len(values) == 1:
+        value = values[0]
+
+        if isinstance(value, str):
+            try:
+                value = json.loads(value)
+
+            except ValueError:
+                value_components = value.split()
+
+                if len(value_components) > 2:
+                    value = dict(tuple(zip(*[iter(value_components)] * 2)))
+
+                else:
+                    value = prop._parse_string_for_bool(value)
+
+        return value
+
+    try:
+        return [json.loads(val) for val in values]
+
+    except (TypeError, ValueError):
+        return values
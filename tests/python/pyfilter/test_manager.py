@@ -6,6 +6,8 @@
 
 # Standard Library
 import argparse
+import json
+import os
 
 # Third Party
 import pytest
@@ -38,6 +40,47 @@ def init_manager(mocker):
 # =============================================================================
 
 
+class Test_RunDecision:
+    """Test houdini_toolbox.pyfilter.manager._RunDecision object."""
+
+    def test___init__(self, mocker):
+        """Test object initialization."""
+        mock_should_run = mocker.MagicMock()
+
+        decision = manager._RunDecision(mock_should_run)
+
+        assert decision._result is None
+        assert decision._should_run == mock_should_run
+
+    def test___call____undecided(self, mocker):
+        """Test calling before the decision is made."""
+        mock_should_run = mocker.MagicMock(side_effect=(True, False))
+
+        decision = manager._RunDecision(mock_should_run)
+
+        assert decision()
+        assert not decision()
+
+    def test_decide(self, mocker):
+        """Test making the decision."""
+        mock_should_run = mocker.MagicMock(return_value=1)
+
+        decision = manager._RunDecision(mock_should_run)
+        decision.decide()
+
+        assert decision.result is True
+
+        mock_should_run.return_value = False
+
+        # The cached result is used until the decision is made again.
+        assert decision()
+        assert mock_should_run.call_count == 1
+
+        decision.decide()
+
+        assert not decision()
+
+
 class TestManager:
     """Test houdini_toolbox.pyfilter.manager.PyFilterManager object."""
 
@@ -52,15 +95,29 @@ class TestManager:
         mock_process = mocker.patch(
             "houdini_toolbox.pyfilter.manager.PyFilterManager._process_parsed_args"
         )
+        mock_build_checks = mocker.patch(
+            "houdini_toolbox.pyfilter.manager.PyFilterManager._build_run_checks"
+        )
+        mock_build_dispatch = mocker.patch(
+            "houdini_toolbox.pyfilter.manager.PyFilterManager._build_stage_dispatch"
+        )
 
         mgr = manager.PyFilterManager()
 
         assert mgr._data == {}
+        assert mgr._operation_flags == {}
         assert mgr._operations == []
+        assert mgr._profile_mode is None
+        assert mgr._profiler is None
+        assert mgr._run_checks == {}
+        assert mgr._stage_decisions == {}
+        assert mgr._stage_dispatch == {}
 
-        mock_register.assert_called()
+        mock_register.assert_called_with(None)
         mock_parse.assert_called()
         mock_process.assert_called_with(mock_parse.return_value)
+        mock_build_checks.assert_called()
+        mock_build_dispatch.assert_called()
 
     # Properties
 
@@ -84,11 +141,99 @@ class TestManager:
 
     # Methods
 
+    def test__build_run_checks(self, init_manager, mocker):
+        """Test determining how to check whether operations should run."""
+        mock_operations = mocker.patch.object(
+            manager.PyFilterManager, "operations", new_callable=mocker.PropertyMock
+        )
+        mock_decision = mocker.patch("houdini_toolbox.pyfilter.manager._RunDecision")
+
+        mock_per_call = mocker.MagicMock(spec=PyFilterOperation)
+        mock_per_call.run_decision_stage = None
+
+        mock_args_run = mocker.MagicMock(spec=PyFilterOperation)
+        mock_args_run.run_decision_stage = manager.DECIDE_AFTER_ARGS
+        mock_args_run.should_run.return_value = True
+
+        mock_args_skip = mocker.MagicMock(spec=PyFilterOperation)
+        mock_args_skip.run_decision_stage = manager.DECIDE_AFTER_ARGS
+        mock_args_skip.should_run.return_value = False
+
+        mock_stage = mocker.MagicMock(spec=PyFilterOperation)
+        mock_stage.run_decision_stage = "filter_camera"
+
+        mock_operations.return_value = [
+            mock_per_call,
+            mock_args_run,
+            mock_args_skip,
+            mock_stage,
+        ]
+
+        mgr = init_manager()
+        mgr._build_run_checks()
+
+        assert mgr._run_checks == {
+            mock_per_call: mock_per_call.should_run,
+            mock_args_run: None,
+            mock_stage: mock_decision.return_value,
+        }
+        assert mgr._stage_decisions == {"filter_camera": [mock_decision.return_value]}
+
+        mock_decision.assert_called_once_with(mock_stage.should_run)
+        mock_per_call.should_run.assert_not_called()
+        mock_stage.should_run.assert_not_called()
+
+    def test__build_stage_dispatch(self, init_manager, mocker):
+        """Test building the dispatch tables for the known stages."""
+        mock_get = mocker.patch.object(manager.PyFilterManager, "_get_stage_functions")
+
+        mgr = init_manager()
+        mgr._build_stage_dispatch()
+
+        assert mgr._stage_dispatch == {
+            stage_name: mock_get.return_value for stage_name in manager.STAGE_NAMES
+        }
+
+        mock_get.assert_any_call("filter_instance")
+
+    def test__get_parsed_args__no_args(self, init_manager, mocker):
+        """Test getting pyfilter args when no operations have args."""
+        mock_operations = mocker.patch.object(
+            manager.PyFilterManager, "operations", new_callable=mocker.PropertyMock
+        )
+        mock_build_parser = mocker.patch(
+            "houdini_toolbox.pyfilter.manager._build_parser"
+        )
+
+        mocker.patch.object(manager.sys, "argv", ["ht-pyfilter.py", "ip"])
+
+        mock_operations.return_value = [PyFilterOperation(None)]
+
+        mgr = init_manager()
+        mgr._operation_flags = {}
+
+        result = mgr._get_parsed_args()
+
+        assert result == argparse.Namespace()
+
+        mock_build_parser.assert_not_called()
+
     def test__get_parsed_args(self, init_manager, mocker):
         """Test getting pyfilter args."""
+        mock_operations = mocker.patch.object(
+            manager.PyFilterManager, "operations", new_callable=mocker.PropertyMock
+        )
         mock_build_parser = mocker.patch(
             "houdini_toolbox.pyfilter.manager._build_parser"
         )
+
+        class _ArgsOperation(PyFilterOperation):
+            @staticmethod
+            def register_parser_args(parser):
+                pass
+
+        mock_operations.return_value = [PyFilterOperation(None), _ArgsOperation(None)]
+        mocker.patch.object(manager.sys, "argv", ["ht-pyfilter.py", "ip"])
         mock_register_args = mocker.patch.object(
             manager.PyFilterManager, "_register_parser_args"
         )
@@ -98,6 +243,7 @@ class TestManager:
         mock_build_parser.return_value = mock_parser
 
         mgr = init_manager()
+        mgr._operation_flags = {}
 
         result = mgr._get_parsed_args()
 
@@ -105,6 +251,98 @@ class TestManager:
 
         mock_register_args.assert_called_with(mock_parser)
 
+    @pytest.mark.parametrize(
+        "argv, expected",
+        [
+            (["ht-pyfilter.py", "ip"], False),
+            (["ht-pyfilter.py", "ip", "--log-dedup"], True),
+        ],
+    )
+    def test__get_parsed_args__operation_flags(
+        self, init_manager, mocker, argv, expected
+    ):
+        """Test args are only parsed when an operation's flags are passed."""
+        mock_operations = mocker.patch.object(
+            manager.PyFilterManager, "operations", new_callable=mocker.PropertyMock
+        )
+        mock_build_parser = mocker.patch(
+            "houdini_toolbox.pyfilter.manager._build_parser"
+        )
+        mocker.patch.object(manager.PyFilterManager, "_register_parser_args")
+        mocker.patch.object(manager.sys, "argv", argv)
+
+        class _ArgsOperation(PyFilterOperation):
+            @staticmethod
+            def register_parser_args(parser):
+                pass
+
+        operation = _ArgsOperation(None)
+        mock_operations.return_value = [operation]
+
+        mgr = init_manager()
+        mgr._operation_flags = {operation: ["--log-"]}
+
+        result = mgr._get_parsed_args()
+
+        if expected:
+            assert (
+                result
+                == mock_build_parser.return_value.parse_known_args.return_value[0]
+            )
+
+        else:
+            assert result == argparse.Namespace()
+            mock_build_parser.assert_not_called()
+
+    def test__get_stage_functions(self, init_manager, mocker):
+        """Test getting the functions for a stage."""
+        mock_operation1 = mocker.MagicMock(spec=PyFilterOperation)
+        mock_operation1.filter_instance = mocker.MagicMock()
+
+        # An operation which doesn't implement the stage.
+        mock_operation2 = mocker.MagicMock(spec=PyFilterOperation)
+
+        mock_operation3 = mocker.MagicMock(spec=PyFilterOperation)
+        mock_operation3.filter_instance = mocker.MagicMock()
+
+        mgr = init_manager()
+        mgr._profiler = None
+        mgr._run_checks = {
+            mock_operation1: mock_operation1.should_run,
+            mock_operation2: mock_operation2.should_run,
+            mock_operation3: None,
+        }
+
+        result = mgr._get_stage_functions("filter_instance")
+
+        assert result == (
+            (mock_operation1.should_run, mock_operation1.filter_instance),
+            (None, mock_operation3.filter_instance),
+        )
+
+    def test__get_stage_functions__profile(self, init_manager, mocker):
+        """Test getting the functions for a stage when profiling."""
+
+        class _Operation(PyFilterOperation):
+            def filter_instance(self):
+                pass
+
+        operation = _Operation(None)
+
+        mock_profiler = mocker.MagicMock(spec=manager.StageProfiler)
+
+        mgr = init_manager()
+        mgr._profiler = mock_profiler
+        mgr._run_checks = {operation: None}
+
+        result = mgr._get_stage_functions("filter_instance")
+
+        assert result == ((None, mock_profiler.wrap.return_value),)
+
+        mock_profiler.wrap.assert_called_with(
+            "_Operation", "filter_instance", operation.filter_instance
+        )
+
     def test__process_parsed_args(self, init_manager, mocker):
         """Test having registered operations process their known args."""
         mock_operations = mocker.patch.object(
@@ -112,40 +350,53 @@ class TestManager:
         )
 
         mock_args = mocker.MagicMock(spec=argparse.Namespace)
+        mock_args.pyfilter_profile = None
 
         mock_operation = mocker.MagicMock(spec=PyFilterOperation)
 
         mock_operations.return_value = [mock_operation]
 
         mgr = init_manager()
+        mgr._profiler = None
 
         mgr._process_parsed_args(mock_args)
 
+        assert mgr._profile_mode is None
+        assert mgr._profiler is None
+
         mock_operation.process_parsed_args.assert_called_with(mock_args)
 
+    def test__process_parsed_args__profile(self, init_manager, mocker):
+        """Test processing args when profiling is enabled."""
+        mocker.patch.object(
+            manager.PyFilterManager,
+            "operations",
+            new_callable=mocker.PropertyMock,
+            return_value=[],
+        )
+        mock_profiler = mocker.patch("houdini_toolbox.pyfilter.manager.StageProfiler")
+
+        mgr = init_manager()
+        mgr._profiler = None
+
+        mgr._process_parsed_args(argparse.Namespace(pyfilter_profile="json"))
+
+        assert mgr._profile_mode == "json"
+        assert mgr._profiler == mock_profiler.return_value
+
     # _register_operations
 
-    def test__register_operations__no_data(self, init_manager, mocker):
-        """Test registering a file with no operation definitions."""
-        mock_find_files = mocker.patch(
-            "houdini_toolbox.pyfilter.manager._find_operation_files"
-        )
-        mock_get_data = mocker.patch(
-            "houdini_toolbox.pyfilter.manager._get_operation_data"
+    def test__register_operations__no_entries(self, init_manager, mocker):
+        """Test registering when there are no operation entries."""
+        mocker.patch(
+            "houdini_toolbox.pyfilter.manager._get_operation_entries", return_value=[]
         )
         mock_get_class = mocker.patch("houdini_toolbox.pyfilter.manager._get_class")
 
-        mock_path = mocker.MagicMock(spec=str)
-        mock_find_files.return_value = (mock_path,)
-
-        data = {}
-        mock_get_data.return_value = data
-
         mgr = init_manager()
 
         mgr._register_operations()
 
-        mock_get_data.assert_called_with(mock_path)
         mock_get_class.assert_not_called()
 
     def test__register_operations__no_class(self, init_manager, mocker):
@@ -153,34 +404,27 @@ class TestManager:
         mock_operations = mocker.patch.object(
             manager.PyFilterManager, "operations", new_callable=mocker.PropertyMock
         )
-        mock_find_files = mocker.patch(
-            "houdini_toolbox.pyfilter.manager._find_operation_files"
-        )
-        mock_get_data = mocker.patch(
-            "houdini_toolbox.pyfilter.manager._get_operation_data"
+        mock_get_entries = mocker.patch(
+            "houdini_toolbox.pyfilter.manager._get_operation_entries"
         )
         mock_get_class = mocker.patch(
             "houdini_toolbox.pyfilter.manager._get_class", return_value=None
         )
         mock_logger = mocker.patch("houdini_toolbox.pyfilter.manager._logger")
 
-        mock_path = mocker.MagicMock(spec=str)
-        mock_find_files.return_value = (mock_path,)
-
         mock_module_name = mocker.MagicMock(spec=str)
         mock_class_name = mocker.MagicMock(spec=str)
 
-        data = {"operations": [(mock_module_name, mock_class_name)]}
-        mock_get_data.return_value = data
+        mock_get_entries.return_value = [(mock_module_name, mock_class_name)]
 
         mgr = init_manager()
+        mgr._operation_flags = {}
 
         operations = []
         mock_operations.return_value = operations
 
         mgr._register_operations()
 
-        mock_get_data.assert_called_with(mock_path)
         mock_get_class.assert_called_with(mock_module_name, mock_class_name)
 
         assert operations == []
@@ -191,36 +435,113 @@ class TestManager:
         mock_operations = mocker.patch.object(
             manager.PyFilterManager, "operations", new_callable=mocker.PropertyMock
         )
-        mock_find_files = mocker.patch(
-            "houdini_toolbox.pyfilter.manager._find_operation_files"
-        )
-        mock_get_data = mocker.patch(
-            "houdini_toolbox.pyfilter.manager._get_operation_data"
+        mock_get_entries = mocker.patch(
+            "houdini_toolbox.pyfilter.manager._get_operation_entries"
         )
         mock_get_class = mocker.patch("houdini_toolbox.pyfilter.manager._get_class")
 
-        mock_path = mocker.MagicMock(spec=str)
-        mock_find_files.return_value = (mock_path,)
-
         mock_module_name = mocker.MagicMock(spec=str)
         mock_class_name = mocker.MagicMock(spec=str)
 
-        data = {"operations": [(mock_module_name, mock_class_name)]}
-        mock_get_data.return_value = data
+        mock_get_entries.return_value = [(mock_module_name, mock_class_name)]
 
         mgr = init_manager()
+        mgr._operation_flags = {}
 
         operations = []
         mock_operations.return_value = operations
 
         mgr._register_operations()
 
-        mock_get_data.assert_called_with(mock_path)
         mock_get_class.assert_called_with(mock_module_name, mock_class_name)
 
         assert mock_get_class.return_value.return_value in operations
         mock_get_class.return_value.assert_called_with(mgr)
 
+        assert mgr._operation_flags == {mock_get_class.return_value.return_value: None}
+
+    def test__register_operations__entries(self, init_manager, mocker):
+        """Test registering operations from passed entries."""
+        mock_get_entries = mocker.patch(
+            "houdini_toolbox.pyfilter.manager._get_operation_entries"
+        )
+        mock_operations = mocker.patch.object(
+            manager.PyFilterManager, "operations", new_callable=mocker.PropertyMock
+        )
+        mock_get_class = mocker.patch("houdini_toolbox.pyfilter.manager._get_class")
+
+        operations = []
+        mock_operations.return_value = operations
+
+        mgr = init_manager()
+        mgr._operation_flags = {}
+        mgr._register_operations([{"module": "module_name", "class": "ClassName"}])
+
+        mock_get_entries.assert_not_called()
+        mock_get_class.assert_called_with("module_name", "ClassName")
+
+        assert operations == [mock_get_class.return_value.return_value]
+
+    def test__register_operations__flags(self, init_manager, mocker):
+        """Test registering operations which are loaded by their flags."""
+        mock_operations = mocker.patch.object(
+            manager.PyFilterManager, "operations", new_callable=mocker.PropertyMock
+        )
+        mock_get_entries = mocker.patch(
+            "houdini_toolbox.pyfilter.manager._get_operation_entries"
+        )
+        mock_get_class = mocker.patch("houdini_toolbox.pyfilter.manager._get_class")
+        mocker.patch.object(
+            manager.sys, "argv", ["ht-pyfilter.py", "ip", "--ip-res-scale=0.5"]
+        )
+
+        mock_get_entries.return_value = [
+            {"module": "module1", "class": "Class1", "flags": ["--ip-"]},
+            {"module": "module2", "class": "Class2", "flags": ["--zdepth"]},
+            {
+                "module": "module3",
+                "class": "Class3",
+                "flags": ["--log-"],
+                "always": True,
+            },
+        ]
+
+        mgr = init_manager()
+        mgr._operation_flags = {}
+
+        operations = []
+        mock_operations.return_value = operations
+
+        mgr._register_operations()
+
+        assert mock_get_class.call_args_list == [
+            mocker.call("module1", "Class1"),
+            mocker.call("module3", "Class3"),
+        ]
+
+        mock_get_class.return_value.assert_called_with(mgr)
+        assert mock_get_class.return_value.call_count == 2
+
+        assert len(operations) == 2
+
+    def test__get_parsed_args__manager_args(self, init_manager, mocker):
+        """Test getting pyfilter args when only the manager has args."""
+        mocker.patch.object(
+            manager.PyFilterManager,
+            "operations",
+            new_callable=mocker.PropertyMock,
+            return_value=[],
+        )
+        mocker.patch.object(
+            manager.sys, "argv", ["ht-pyfilter.py", "--pyfilter-profile=json"]
+        )
+
+        mgr = init_manager()
+
+        result = mgr._get_parsed_args()
+
+        assert result.pyfilter_profile == "json"
+
     def test__register_parser_args(self, init_manager, mocker):
         """Test registering known args for the operations."""
         mock_operations = mocker.patch.object(
@@ -239,84 +560,246 @@ class TestManager:
 
         mock_operation.register_parser_args.assert_called_with(mock_parser)
 
-    # run_operations_for_stage
+    # _report_profile
 
-    def test_run_operations_for_stage__no_operations(self, init_manager, mocker):
-        """Test running for a stage with no operations."""
-        mocker.patch.object(
-            manager.PyFilterManager, "operations", new_callable=mocker.PropertyMock
+    def test__report_profile__no_profiler(self, init_manager, mocker):
+        """Test reporting when not profiling."""
+        mock_mantra_logger = mocker.patch(
+            "houdini_toolbox.pyfilter.manager._mantra_logger"
         )
 
-        mock_stage_name = mocker.MagicMock(spec=str)
+        mgr = init_manager()
+        mgr._profile_mode = None
+        mgr._profiler = None
+
+        mgr._report_profile()
+
+        mock_mantra_logger.info.assert_not_called()
+
+    def test__report_profile(self, init_manager, mocker):
+        """Test reporting the profile to the log."""
+        mock_mantra_logger = mocker.patch(
+            "houdini_toolbox.pyfilter.manager._mantra_logger"
+        )
+        mock_get = mocker.patch("houdini_toolbox.pyfilter.manager.get_property")
+
+        mock_profiler = mocker.MagicMock(spec=manager.StageProfiler)
 
         mgr = init_manager()
+        mgr._profile_mode = "log"
+        mgr._profiler = mock_profiler
 
-        result = mgr.run_operations_for_stage(mock_stage_name)
+        mgr._report_profile()
 
-        assert not result
+        mock_mantra_logger.info.assert_called_with(
+            mock_profiler.format_summary.return_value
+        )
+        mock_get.assert_not_called()
+        mock_profiler.write.assert_not_called()
+
+    @pytest.mark.parametrize("image_path", ["ip", "", None])
+    def test__report_profile__json_not_file(self, init_manager, mocker, image_path):
+        """Test reporting the profile as json when not rendering to a file."""
+        mocker.patch("houdini_toolbox.pyfilter.manager._mantra_logger")
+        mocker.patch(
+            "houdini_toolbox.pyfilter.manager.get_property", return_value=image_path
+        )
 
-    def test_run_operations_for_stage__no_runnable(self, init_manager, mocker):
-        """Test running for a stage with no operations which should run."""
-        mock_operations = mocker.patch.object(
-            manager.PyFilterManager, "operations", new_callable=mocker.PropertyMock
+        mock_profiler = mocker.MagicMock(spec=manager.StageProfiler)
+
+        mgr = init_manager()
+        mgr._profile_mode = "json"
+        mgr._profiler = mock_profiler
+
+        mgr._report_profile()
+
+        mock_profiler.write.assert_not_called()
+
+    def test__report_profile__json(self, init_manager, mocker):
+        """Test reporting the profile as json next to the image."""
+        mocker.patch("houdini_toolbox.pyfilter.manager._mantra_logger")
+        mock_get = mocker.patch(
+            "houdini_toolbox.pyfilter.manager.get_property",
+            return_value="/path/to/image.0001.exr",
         )
 
-        mock_stage_name = mocker.MagicMock(spec=str)
+        mock_profiler = mocker.MagicMock(spec=manager.StageProfiler)
 
-        mock_operation = mocker.MagicMock(spec=PyFilterOperation)
-        mock_operation.should_run.return_value = False
+        mgr = init_manager()
+        mgr._profile_mode = "json"
+        mgr._profiler = mock_profiler
+
+        mgr._report_profile()
+
+        mock_get.assert_called_with("image:filename")
+        mock_profiler.write.assert_called_with(
+            "/path/to/image.0001.pyfilter_profile.json"
+        )
+
+    def test__report_profile__json_error(self, init_manager, mocker):
+        """Test reporting the profile as json when the file can't be written."""
+        mocker.patch("houdini_toolbox.pyfilter.manager._mantra_logger")
+        mocker.patch(
+            "houdini_toolbox.pyfilter.manager.get_property",
+            return_value="/path/to/image.exr",
+        )
+        mock_logger = mocker.patch("houdini_toolbox.pyfilter.manager._logger")
+
+        mock_profiler = mocker.MagicMock(spec=manager.StageProfiler)
+        mock_profiler.write.side_effect = OSError
 
         mgr = init_manager()
+        mgr._profile_mode = "json"
+        mgr._profiler = mock_profiler
 
-        mock_operations.return_value = [mock_operation]
+        mgr._report_profile()
 
-        result = mgr.run_operations_for_stage(mock_stage_name)
+        mock_logger.warning.assert_called()
 
-        assert not result
+    # run_operations_for_stage
 
-    def test_run_operations_for_stage__no_matching_stage(self, init_manager, mocker):
-        """Test running for a stage where registered operations don't match the stage."""
-        mock_operations = mocker.patch.object(
-            manager.PyFilterManager, "operations", new_callable=mocker.PropertyMock
+    def test_run_operations_for_stage__profile(
+        self, init_manager, mocker, patch_soho, tmp_path
+    ):
+        """Test profiling a render with a stand-in mantra module."""
+        mock_mantra_logger = mocker.patch(
+            "houdini_toolbox.pyfilter.manager._mantra_logger"
         )
 
-        stage_name = "stage_name"
+        image_path = tmp_path / "image.0001.exr"
 
-        mock_operation = mocker.MagicMock(spec=PyFilterOperation)
-        mock_operation.should_run.return_value = True
+        patch_soho.mantra.property.return_value = [str(image_path)]
+
+        class _Operation(PyFilterOperation):
+            def filter_camera(self):
+                pass
 
         mgr = init_manager()
+        mgr._operations = [_Operation(mgr)]
+        mgr._process_parsed_args(argparse.Namespace(pyfilter_profile="json"))
+        mgr._build_run_checks()
+        mgr._build_stage_dispatch()
 
-        mock_operations.return_value = [mock_operation]
+        mgr.run_operations_for_stage("filter_camera")
+        mgr.run_operations_for_stage("filter_camera")
+        mgr.run_operations_for_stage("filter_quit")
+
+        mock_mantra_logger.info.assert_called()
+
+        with open(
+            tmp_path / "image.0001.pyfilter_profile.json", encoding="utf-8"
+        ) as handle:
+            report = json.load(handle)
+
+        assert [
+            (entry["operation"], entry["stage"], entry["calls"])
+            for entry in report["stages"]
+        ] == [("_Operation", "filter_camera", 2)]
+
+    def test_run_operations_for_stage__quit_profile(self, init_manager, mocker):
+        """Test the profile is reported when Mantra quits."""
+        mock_report = mocker.patch.object(manager.PyFilterManager, "_report_profile")
 
-        result = mgr.run_operations_for_stage(stage_name)
+        mgr = init_manager()
+        mgr._profiler = mocker.MagicMock(spec=manager.StageProfiler)
+        mgr._stage_decisions = {}
+        mgr._stage_dispatch = {"filter_camera": (), "filter_quit": ()}
+
+        mgr.run_operations_for_stage("filter_camera")
+
+        mock_report.assert_not_called()
+
+        mgr.run_operations_for_stage("filter_quit")
+
+        mock_report.assert_called()
+
+    def test_run_operations_for_stage__no_operations(self, init_manager):
+        """Test running for a stage with no operations."""
+        mgr = init_manager()
+        mgr._profiler = None
+        mgr._stage_decisions = {}
+        mgr._stage_dispatch = {"filter_camera": ()}
+
+        result = mgr.run_operations_for_stage("filter_camera")
 
         assert not result
 
-    def test_run_operations_for_stage(self, init_manager, mocker):
-        """Test running operations for a stage."""
-        mock_operations = mocker.patch.object(
-            manager.PyFilterManager, "operations", new_callable=mocker.PropertyMock
+    def test_run_operations_for_stage__no_runnable(self, init_manager, mocker):
+        """Test running for a stage with no operations which should run."""
+        mock_should_run = mocker.MagicMock(return_value=False)
+        mock_func = mocker.MagicMock()
+
+        mgr = init_manager()
+        mgr._profiler = None
+        mgr._stage_decisions = {}
+        mgr._stage_dispatch = {"filter_camera": ((mock_should_run, mock_func),)}
+
+        result = mgr.run_operations_for_stage("filter_camera")
+
+        assert not result
+
+        mock_func.assert_not_called()
+
+    def test_run_operations_for_stage__unknown_stage(self, init_manager, mocker):
+        """Test running for a stage which isn't in the dispatch tables."""
+        mock_get = mocker.patch.object(
+            manager.PyFilterManager, "_get_stage_functions", return_value=()
         )
 
-        stage_name = "stage_name"
+        mgr = init_manager()
+        mgr._profiler = None
+        mgr._stage_decisions = {}
+        mgr._stage_dispatch = {}
 
-        mock_func = mocker.MagicMock()
-        mock_func.return_value = True
+        result = mgr.run_operations_for_stage("stage_name")
 
-        mock_operation = mocker.MagicMock(spec=PyFilterOperation)
-        mock_operation.should_run.return_value = True
-        mock_operation.stage_name = mock_func
+        assert not result
+
+        assert mgr._stage_dispatch == {"stage_name": ()}
+
+        mock_get.assert_called_with("stage_name")
+
+    def test_run_operations_for_stage__decisions(self, init_manager, mocker):
+        """Test running a stage where operations decide whether to run."""
+        mock_decision = mocker.MagicMock(spec=manager._RunDecision)
+        mock_decision.return_value = True
+
+        mock_func = mocker.MagicMock()
 
         mgr = init_manager()
+        mgr._profiler = None
+        mgr._stage_decisions = {"filter_camera": [mock_decision]}
+        mgr._stage_dispatch = {"filter_camera": ((mock_decision, mock_func),)}
 
-        mock_operations.return_value = [mock_operation]
+        mgr.run_operations_for_stage("filter_camera")
 
-        result = mgr.run_operations_for_stage(stage_name, "value", bar="value")
+        mock_decision.decide.assert_called()
+        mock_func.assert_called()
+
+    def test_run_operations_for_stage(self, init_manager, mocker):
+        """Test running operations for a stage."""
+        mock_cache = mocker.patch("houdini_toolbox.pyfilter.manager.cache_properties")
+
+        mock_should_run = mocker.MagicMock(return_value=True)
+        mock_func1 = mocker.MagicMock(return_value=True)
+        mock_func2 = mocker.MagicMock(return_value=None)
+
+        mgr = init_manager()
+        mgr._profiler = None
+        mgr._stage_decisions = {}
+        mgr._stage_dispatch = {
+            "stage_name": ((mock_should_run, mock_func1), (None, mock_func2))
+        }
+
+        result = mgr.run_operations_for_stage("stage_name", "value", bar="value")
 
         assert result
 
-        mock_func.assert_called_with("value", bar="value")
+        mock_cache.assert_called()
+
+        # All the operations are run even after one returns True.
+        mock_func1.assert_called_with("value", bar="value")
+        mock_func2.assert_called_with("value", bar="value")
 
 
 def test_build_parser():
@@ -325,6 +808,10 @@ def test_build_parser():
 
     assert isinstance(result, argparse.ArgumentParser)
 
+    assert result.parse_args([]).pyfilter_profile is None
+    assert result.parse_args(["--pyfilter-profile"]).pyfilter_profile == "log"
+    assert result.parse_args(["--pyfilter-profile=json"]).pyfilter_profile == "json"
+
 
 class Test__find_operation_files:
     """Test houdini_toolbox.pyfilter.manager._find_operation_files."""
@@ -346,6 +833,21 @@ class Test__find_operation_files:
         assert result == mock_find.return_value
 
 
+@pytest.mark.parametrize(
+    "flags, filter_args, expected",
+    [
+        (["--ip-"], ["ip", "--ip-res-scale=0.5"], True),
+        (["--zdepth", "--deep-"], ["--deep-resolver", "camera"], True),
+        (["--zdepth"], ["ip", "--ip-res-scale=0.5"], False),
+        (["--zdepth"], [], False),
+        ([], ["--zdepth"], False),
+    ],
+)
+def test__flags_in_args(flags, filter_args, expected):
+    """Test houdini_toolbox.pyfilter.manager._flags_in_args."""
+    assert manager._flags_in_args(flags, filter_args) == expected
+
+
 class Test__get_class:
     """Test houdini_toolbox.pyfilter.manager._get_class."""
 
@@ -389,6 +891,121 @@ class Test__get_class:
         mock_import.assert_called_with(mock_module_name)
 
 
+class Test__get_operation_entries:
+    """Test houdini_toolbox.pyfilter.manager._get_operation_entries."""
+
+    def test_cached(self, mocker):
+        """Test getting the entries from the cache."""
+        mocker.patch(
+            "houdini_toolbox.pyfilter.manager._get_search_dirs",
+            return_value=["/path/pyfilter"],
+        )
+        mock_get_path = mocker.patch(
+            "houdini_toolbox.pyfilter.manager._get_registry_cache_path",
+            return_value="/path/to/cache",
+        )
+        mock_read = mocker.patch(
+            "houdini_toolbox.pyfilter.manager._read_registry_cache"
+        )
+        mock_find = mocker.patch(
+            "houdini_toolbox.pyfilter.manager._find_operation_files"
+        )
+
+        result = manager._get_operation_entries()
+
+        assert result == mock_read.return_value
+
+        mock_get_path.assert_called_with(["/path/pyfilter"])
+        mock_read.assert_called_with("/path/to/cache", ["/path/pyfilter"])
+        mock_find.assert_not_called()
+
+    def test_not_cached(self, mocker):
+        """Test getting the entries when they aren't cached."""
+        mocker.patch(
+            "houdini_toolbox.pyfilter.manager._get_search_dirs",
+            return_value=["/path/pyfilter"],
+        )
+        mocker.patch(
+            "houdini_toolbox.pyfilter.manager._get_registry_cache_path",
+            return_value="/path/to/cache",
+        )
+        mocker.patch(
+            "houdini_toolbox.pyfilter.manager._read_registry_cache",
+            return_value=None,
+        )
+        mocker.patch(
+            "houdini_toolbox.pyfilter.manager._find_operation_files",
+            return_value=("/path/1", "/path/2"),
+        )
+        mocker.patch(
+            "houdini_toolbox.pyfilter.manager._get_operation_data",
+            side_effect=({"operations": [["module1", "Class1"]]}, {}),
+        )
+        mock_write = mocker.patch(
+            "houdini_toolbox.pyfilter.manager._write_registry_cache"
+        )
+
+        result = manager._get_operation_entries()
+
+        assert result == [["module1", "Class1"]]
+
+        mock_write.assert_called_with(
+            "/path/to/cache",
+            ["/path/pyfilter"],
+            ("/path/1", "/path/2"),
+            [["module1", "Class1"]],
+        )
+
+    def test_no_cache(self, mocker):
+        """Test getting the entries when caching is disabled."""
+        mocker.patch("houdini_toolbox.pyfilter.manager._get_search_dirs")
+        mocker.patch(
+            "houdini_toolbox.pyfilter.manager._get_registry_cache_path",
+            return_value=None,
+        )
+        mock_read = mocker.patch(
+            "houdini_toolbox.pyfilter.manager._read_registry_cache"
+        )
+        mocker.patch(
+            "houdini_toolbox.pyfilter.manager._find_operation_files",
+            return_value=("/path/1",),
+        )
+        mocker.patch(
+            "houdini_toolbox.pyfilter.manager._get_operation_data",
+            return_value={"operations": [["module1", "Class1"]]},
+        )
+        mock_write = mocker.patch(
+            "houdini_toolbox.pyfilter.manager._write_registry_cache"
+        )
+
+        result = manager._get_operation_entries()
+
+        assert result == [["module1", "Class1"]]
+
+        mock_read.assert_not_called()
+        mock_write.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "entry, expected",
+    [
+        (["module", "Class"], ("module", "Class", None, True)),
+        ({"module": "module", "class": "Class"}, ("module", "Class", None, False)),
+        (
+            {"module": "module", "class": "Class", "flags": ["--flag"]},
+            ("module", "Class", ["--flag"], False),
+        ),
+        (
+            {"module": "module", "class": "Class", "flags": ["--flag"], "always": True},
+            ("module", "Class", ["--flag"], True),
+        ),
+    ],
+)
+def test__get_operation_entry(entry, expected):
+    """Test houdini_toolbox.pyfilter.manager._get_operation_entry."""
+    assert manager._get_operation_entry(entry) == expected
+
+
 class Test__get_operation_data:
     """Test houdini_toolbox.pyfilter.manager._get_operation_data."""
 
@@ -435,3 +1052,215 @@ class Test__get_operation_data:
         mock_handle.assert_called_with(mock_path, encoding="utf-8")
 
         mock_load.assert_called_with(mock_handle.return_value)
+
+
+class Test__get_registry_cache_dir:
+    """Test houdini_toolbox.pyfilter.manager._get_registry_cache_dir."""
+
+    def test_disabled(self, monkeypatch):
+        """Test when caching is disabled."""
+        monkeypatch.setenv(manager.REGISTRY_CACHE_DIR_VAR, "")
+
+        assert manager._get_registry_cache_dir() is None
+
+    def test_env(self, monkeypatch):
+        """Test when the cache directory is set."""
+        monkeypatch.setenv(manager.REGISTRY_CACHE_DIR_VAR, "/cache")
+
+        assert manager._get_registry_cache_dir() == "/cache"
+
+    def test_pref_dir(self, monkeypatch, tmp_path):
+        """Test using the user preferences directory."""
+        monkeypatch.delenv(manager.REGISTRY_CACHE_DIR_VAR, raising=False)
+        monkeypatch.setenv("HOUDINI_USER_PREF_DIR", str(tmp_path))
+
+        result = manager._get_registry_cache_dir()
+
+        assert result == os.path.join(str(tmp_path), "houdini_toolbox")
+
+    def test_home(self, monkeypatch, tmp_path):
+        """Test using the user's cache directory."""
+        monkeypatch.delenv(manager.REGISTRY_CACHE_DIR_VAR, raising=False)
+        monkeypatch.setenv("HOUDINI_USER_PREF_DIR", "/path/houdini__HVER__")
+        monkeypatch.setenv("HOME", str(tmp_path))
+
+        result = manager._get_registry_cache_dir()
+
+        assert result == os.path.join(str(tmp_path), ".cache", "houdini_toolbox")
+
+
+class Test__get_registry_cache_path:
+    """Test houdini_toolbox.pyfilter.manager._get_registry_cache_path."""
+
+    def test_disabled(self, mocker):
+        """Test when caching is disabled."""
+        mocker.patch(
+            "houdini_toolbox.pyfilter.manager._get_registry_cache_dir",
+            return_value=None,
+        )
+
+        assert manager._get_registry_cache_path(["/path1/pyfilter"]) is None
+
+    def test_search_dirs(self, mocker):
+        """Test the cache file depends on the searched directories."""
+        mocker.patch(
+            "houdini_toolbox.pyfilter.manager._get_registry_cache_dir",
+            return_value="/cache",
+        )
+
+        result1 = manager._get_registry_cache_path(["/path1/pyfilter"])
+        result2 = manager._get_registry_cache_path(["/path2/pyfilter"])
+
+        assert os.path.dirname(result1) == "/cache"
+        assert result1 != result2
+
+
+def test__get_search_dirs(mocker):
+    """Test houdini_toolbox.pyfilter.manager._get_search_dirs."""
+    mocker.patch("hou.houdiniPath", return_value=("/path1", "/path2"))
+
+    result = manager._get_search_dirs()
+
+    assert result == [
+        os.path.join("/path1", "pyfilter"),
+        os.path.join("/path2", "pyfilter"),
+    ]
+
+
+def test__get_mtimes(tmp_path):
+    """Test houdini_toolbox.pyfilter.manager._get_mtimes."""
+    path = tmp_path / "operations.json"
+    path.write_text("{}")
+
+    missing = str(tmp_path / "missing")
+
+    result = manager._get_mtimes([str(path), missing])
+
+    assert result == [[str(path), path.stat().st_mtime_ns], [missing, None]]
+
+
+class Test_registry_cache:
+    """Test reading and writing the operation registry cache."""
+
+    @pytest.fixture
+    def search_dir(self, tmp_path):
+        """A directory searched for operations files."""
+        path = tmp_path / "pyfilter"
+        path.mkdir()
+
+        return path
+
+    def test_round_trip(self, tmp_path, search_dir):
+        """Test reading back a written cache."""
+        operations_file = search_dir / "operations.json"
+        operations_file.write_text("{}")
+
+        cache_path = str(tmp_path / "cache" / "registry.json")
+
+        entries = [["module1", "Class1"], {"module": "module2", "class": "Class2"}]
+
+        search_dirs = [str(search_dir), str(tmp_path / "missing")]
+
+        manager._write_registry_cache(
+            cache_path, search_dirs, [str(operations_file)], entries
+        )
+
+        assert manager._read_registry_cache(cache_path, search_dirs) == entries
+
+        # The cache directory is private to the user.
+        assert os.stat(os.path.dirname(cache_path)).st_mode & 0o777 == 0o700
+
+    def test_modified(self, tmp_path, search_dir):
+        """Test the cache is invalid when a file is modified."""
+        operations_file = search_dir / "operations.json"
+        operations_file.write_text("{}")
+
+        cache_path = str(tmp_path / "registry.json")
+
+        manager._write_registry_cache(cache_path, [], [str(operations_file)], [])
+
+        stat = operations_file.stat()
+        os.utime(operations_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+
+        assert manager._read_registry_cache(cache_path, []) is None
+
+    def test_removed(self, tmp_path, search_dir):
+        """Test the cache is invalid when a file is removed."""
+        operations_file = search_dir / "operations.json"
+        operations_file.write_text("{}")
+
+        cache_path = str(tmp_path / "registry.json")
+
+        manager._write_registry_cache(cache_path, [], [str(operations_file)], [])
+
+        operations_file.unlink()
+
+        assert manager._read_registry_cache(cache_path, []) is None
+
+    def test_added(self, tmp_path, search_dir):
+        """Test the cache is invalid when a file is added to a searched directory."""
+        cache_path = str(tmp_path / "registry.json")
+
+        search_dirs = [str(search_dir)]
+
+        manager._write_registry_cache(cache_path, search_dirs, [], [])
+
+        stat = search_dir.stat()
+        (search_dir / "operations.json").write_text("{}")
+        os.utime(search_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+
+        assert manager._read_registry_cache(cache_path, search_dirs) is None
+
+    def test_directory_created(self, tmp_path):
+        """Test the cache is invalid when a searched directory is created."""
+        cache_path = str(tmp_path / "registry.json")
+
+        search_dirs = [str(tmp_path / "pyfilter")]
+
+        manager._write_registry_cache(cache_path, search_dirs, [], [])
+
+        (tmp_path / "pyfilter").mkdir()
+
+        assert manager._read_registry_cache(cache_path, search_dirs) is None
+
+    def test_search_dirs_changed(self, tmp_path, search_dir):
+        """Test the cache is invalid when the searched directories change."""
+        cache_path = str(tmp_path / "registry.json")
+
+        manager._write_registry_cache(cache_path, [str(search_dir)], [], [])
+
+        assert manager._read_registry_cache(cache_path, []) is None
+
+    def test_read_missing(self, tmp_path):
+        """Test reading a cache which doesn't exist."""
+        cache_path = str(tmp_path / "registry.json")
+
+        assert manager._read_registry_cache(cache_path, []) is None
+
+    @pytest.mark.parametrize(
+        "contents",
+        [
+            "invalid",
+            "[]",
+            json.dumps({"version": 1}),
+            json.dumps({"version": 2, "dirs": [], "files": [], "operations": {}}),
+        ],
+    )
+    def test_read_invalid(self, tmp_path, contents):
+        """Test reading a cache which is invalid."""
+        cache_path = tmp_path / "registry.json"
+        cache_path.write_text(contents)
+
+        assert manager._read_registry_cache(str(cache_path), []) is None
+
+    def test_write_error(self, tmp_path, mocker):
+        """Test failing to write the cache."""
+        mock_logger = mocker.patch("houdini_toolbox.pyfilter.manager._logger")
+
+        cache_path = tmp_path / "registry.json"
+
+        manager._write_registry_cache(str(cache_path), [], ["/does/not/exist"], [])
+
+        assert not cache_path.exists()
+
+        mock_logger.debug.assert_called()
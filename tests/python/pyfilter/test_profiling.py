@@ -0,0 +1,134 @@
+"""Test the houdini_toolbox.pyfilter.profiling module."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+# Standard Library
+import json
+
+# Third Party
+import pytest
+
+# Houdini Toolbox
+from houdini_toolbox.pyfilter import profiling
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+class Test_StageProfiler:
+    """Test houdini_toolbox.pyfilter.profiling.StageProfiler object."""
+
+    def test___init__(self):
+        """Test object initialization."""
+        profiler = profiling.StageProfiler()
+
+        assert profiler._stats == {}
+
+    # Properties
+
+    def test_stats(self):
+        """Test the 'stats' property."""
+        profiler = profiling.StageProfiler()
+        profiler._stats = {("Operation", "filter_camera"): [1, 2, 3]}
+
+        assert profiler.stats == {("Operation", "filter_camera"): (1, 2, 3)}
+
+    def test_total_time(self):
+        """Test the 'total_time' property."""
+        profiler = profiling.StageProfiler()
+        profiler._stats = {
+            ("Operation", "filter_camera"): [1, 2, 3],
+            ("Operation", "filter_plane"): [4, 5, 6],
+        }
+
+        assert profiler.total_time == 7
+
+    # Methods
+
+    def test_format_summary(self):
+        """Test formatting a summary."""
+        profiler = profiling.StageProfiler()
+        profiler._stats = {
+            ("Operation", "filter_camera"): [1, 2000000, 2000000],
+            ("Operation", "filter_plane"): [4, 5000000, 3000000],
+        }
+
+        result = profiler.format_summary()
+
+        assert result.split("\n") == [
+            "PyFilter profile: 7.000ms",
+            "\tOperation.filter_plane: 4 calls, 5.000ms total, 3.000ms max",
+            "\tOperation.filter_camera: 1 calls, 2.000ms total, 2.000ms max",
+        ]
+
+    def test_get_report__not_called(self):
+        """Test stages which were never called are left out of the report."""
+        profiler = profiling.StageProfiler()
+
+        profiler.wrap("Operation", "filter_camera", lambda: None)
+        wrapped = profiler.wrap("Operation", "filter_plane", lambda: None)
+
+        wrapped()
+
+        result = profiler.get_report()
+
+        assert [entry["stage"] for entry in result["stages"]] == ["filter_plane"]
+
+    def test_wrap(self, mocker):
+        """Test wrapping a function."""
+        mocker.patch.object(
+            profiling.time, "perf_counter_ns", side_effect=(10, 15, 20, 50)
+        )
+
+        mock_func = mocker.MagicMock()
+
+        profiler = profiling.StageProfiler()
+
+        wrapped = profiler.wrap("Operation", "filter_error", mock_func)
+
+        assert wrapped(1, prefix="") == mock_func.return_value
+        assert wrapped(2, prefix="") == mock_func.return_value
+
+        mock_func.assert_called_with(2, prefix="")
+
+        assert profiler.stats == {("Operation", "filter_error"): (2, 35, 30)}
+
+    def test_wrap__exception(self, mocker):
+        """Test calls which raise exceptions are still recorded."""
+        mocker.patch.object(profiling.time, "perf_counter_ns", side_effect=(10, 15))
+
+        mock_func = mocker.MagicMock(side_effect=RuntimeError)
+
+        profiler = profiling.StageProfiler()
+
+        wrapped = profiler.wrap("Operation", "filter_camera", mock_func)
+
+        with pytest.raises(RuntimeError):
+            wrapped()
+
+        assert profiler.stats == {("Operation", "filter_camera"): (1, 5, 5)}
+
+    def test_write(self, tmp_path):
+        """Test writing the stats to a file."""
+        profiler = profiling.StageProfiler()
+        profiler._stats = {("Operation", "filter_camera"): [1, 2000000, 2000000]}
+
+        path = tmp_path / "profile.json"
+
+        profiler.write(str(path))
+
+        assert json.loads(path.read_text()) == {
+            "total_ms": 2.0,
+            "stages": [
+                {
+                    "operation": "Operation",
+                    "stage": "filter_camera",
+                    "calls": 1,
+                    "total_ms": 2.0,
+                    "max_ms": 2.0,
+                }
+            ],
+        }
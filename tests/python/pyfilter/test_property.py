@@ -4,9 +4,14 @@
 # IMPORTS
 # =============================================================================
 
+# Third Party
+import pytest
+
 # Houdini Toolbox
 from houdini_toolbox.pyfilter import property as prop
 
+from .property_reference import transform_values_with_json
+
 # =============================================================================
 # TESTS
 # =============================================================================
@@ -128,17 +133,30 @@ class Test__transform_values:
 
     def test_single_string(self, mocker):
         """Test transforming a single string list."""
-        mock_loads = mocker.patch("houdini_toolbox.pyfilter.property.json.loads")
+        mock_decode = mocker.patch("houdini_toolbox.pyfilter.property._decode_string")
         mock_value = mocker.MagicMock(spec=str)
 
         result = prop._transform_values([mock_value])
 
-        assert result == mock_loads.return_value
+        assert result == mock_decode.return_value
+
+        mock_decode.assert_called_with(mock_value)
+
+    def test_single_string__not_shared(self):
+        """Test transformed containers are not shared between calls."""
+        result1 = prop._transform_values(['{"key": "value"}'])
+        result1["key"] = "changed"
+
+        result2 = prop._transform_values(['{"key": "value"}'])
+
+        assert result2 == {"key": "value"}
 
     def test_single_string_dict_value(self, mocker):
         """Test transforming a single string list which is a json blob."""
-        mock_loads = mocker.patch("houdini_toolbox.pyfilter.property.json.loads")
-        mock_loads.side_effect = ValueError
+        prop._decode_string.cache_clear()
+
+        mock_loads = mocker.patch("houdini_toolbox.pyfilter.property._loads")
+        mock_loads.return_value = prop._MISSING
 
         mock_key1 = mocker.MagicMock(spec=str)
         mock_key2 = mocker.MagicMock(spec=str)
@@ -154,10 +172,14 @@ class Test__transform_values:
 
         mock_loads.assert_called_with(mock_value)
 
+        prop._decode_string.cache_clear()
+
     def test_single_string_value(self, mocker):
         """Test transforming a single space separated string value."""
-        mock_loads = mocker.patch("houdini_toolbox.pyfilter.property.json.loads")
-        mock_loads.side_effect = ValueError
+        prop._decode_string.cache_clear()
+
+        mock_loads = mocker.patch("houdini_toolbox.pyfilter.property._loads")
+        mock_loads.return_value = prop._MISSING
 
         mock_parse = mocker.patch(
             "houdini_toolbox.pyfilter.property._parse_string_for_bool"
@@ -174,6 +196,8 @@ class Test__transform_values:
 
         mock_parse.assert_called_with(mock_value)
 
+        prop._decode_string.cache_clear()
+
     def test_single_int(self, mocker):
         """Test a single integer value."""
         mock_loads = mocker.patch("houdini_toolbox.pyfilter.property.json.loads")
@@ -187,7 +211,7 @@ class Test__transform_values:
 
     def test_multiple_values(self, mocker):
         """Test multiple string values which can be converted to json."""
-        mock_loads = mocker.patch("houdini_toolbox.pyfilter.property.json.loads")
+        mock_loads = mocker.patch("houdini_toolbox.pyfilter.property._loads")
 
         mock_values = [mocker.MagicMock(spec=str), mocker.MagicMock(spec=str)]
 
@@ -195,21 +219,35 @@ class Test__transform_values:
 
         assert result == [mock_loads.return_value, mock_loads.return_value]
 
+    def test_multiple_values__not_shared(self):
+        """Test transformed containers are not shared between calls."""
+        result1 = prop._transform_values(["[1]", "2"])
+        result1[0].append(3)
+
+        result2 = prop._transform_values(["[1]", "2"])
+
+        assert result2 == [[1], 2]
+
+    def test_multiple_values__bytes(self):
+        """Test multiple bytes values which can be converted to json."""
+        result = prop._transform_values([b"1", b'"value"'])
+
+        assert result == [1, "value"]
+
     def test_multiple_values__type_error(self, mocker):
-        """Test multiple string values which raise a TypeError converting to json."""
-        mock_loads = mocker.patch("houdini_toolbox.pyfilter.property.json.loads")
-        mock_loads.side_effect = TypeError
+        """Test multiple values which can't be converted from json."""
+        mocker.patch("houdini_toolbox.pyfilter.property._loads")
 
-        mock_values = [mocker.MagicMock(spec=str), mocker.MagicMock(spec=str)]
+        mock_values = [mocker.MagicMock(spec=str), mocker.MagicMock(spec=int)]
 
         result = prop._transform_values(mock_values)
 
         assert result == mock_values
 
     def test_multiple_values__value_error(self, mocker):
-        """Test multiple string values which raise a ValueError converting to json."""
-        mock_loads = mocker.patch("houdini_toolbox.pyfilter.property.json.loads")
-        mock_loads.side_effect = ValueError
+        """Test multiple string values which aren't valid json."""
+        mock_loads = mocker.patch("houdini_toolbox.pyfilter.property._loads")
+        mock_loads.return_value = prop._MISSING
 
         mock_values = [mocker.MagicMock(spec=str), mocker.MagicMock(spec=str)]
 
@@ -217,6 +255,195 @@ class Test__transform_values:
 
         assert result == mock_values
 
+    def test_multiple_values__bytes_value_error(self):
+        """Test multiple bytes values which aren't valid json."""
+        values = [b"1", b"[1"]
+
+        result = prop._transform_values(values)
+
+        assert result is values
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            [""],
+            [" "],
+            ["1"],
+            ["-1.5e3"],
+            ["  12  "],
+            ["1 2"],
+            ["1 2 3"],
+            ["1 2 3 4"],
+            ['"quoted"'],
+            ['"unterminated'],
+            ["[1, 2, 3]"],
+            ["[1, 2"],
+            ['{"key": [1, 2]}'],
+            ["{"],
+            ["true"],
+            ["True"],
+            ["false"],
+            ["FALSE"],
+            [" null\n"],
+            ["none"],
+            ["Infinity"],
+            ["-Infinity"],
+            ["truex"],
+            ["true false"],
+            ["nan"],
+            ["opdef:/Shop/v_constant clr 0 0 0"],
+            ["/obj/geo1"],
+            ["Cf+Af"],
+            ["\x0b1"],
+            [1],
+            [1.5],
+            [None],
+            [],
+            ["1", "2"],
+            ["1", "two"],
+            ["[1]", "{}"],
+            ["1", 2],
+            [1, 2],
+            ["null", "true"],
+            ["Infinity", "-Infinity"],
+            [b"1", "2"],
+        ],
+    )
+    def test_matches_json(self, values):
+        """Test the results match decoding every string with json.loads()."""
+        expected = transform_values_with_json(values)
+
+        result = prop._transform_values(values)
+
+        # NaN values are never equal so compare their representations.
+        assert repr(result) == repr(expected)
+        assert type(result) is type(expected)
+
+
+def test__copy_container():
+    """Test houdini_toolbox.pyfilter.property._copy_container."""
+    value = {"key": [1, {"nested": [2]}], "other": "value"}
+
+    result = prop._copy_container(value)
+
+    assert result == value
+
+    assert result is not value
+    assert result["key"] is not value["key"]
+    assert result["key"][1] is not value["key"][1]
+    assert result["key"][1]["nested"] is not value["key"][1]["nested"]
+
+
+class Test__decode_string:
+    """Test houdini_toolbox.pyfilter.property._decode_string."""
+
+    def test_json(self, mocker):
+        """Test decoding a json string."""
+        prop._decode_string.cache_clear()
+
+        mock_parse = mocker.patch(
+            "houdini_toolbox.pyfilter.property._parse_plain_string"
+        )
+
+        assert prop._decode_string("[1]") == [1]
+
+        mock_parse.assert_not_called()
+
+        prop._decode_string.cache_clear()
+
+    def test_plain(self, mocker):
+        """Test decoding a string which is not json."""
+        prop._decode_string.cache_clear()
+
+        mock_parse = mocker.patch(
+            "houdini_toolbox.pyfilter.property._parse_plain_string"
+        )
+
+        assert prop._decode_string("value") == mock_parse.return_value
+        assert prop._decode_string("value") == mock_parse.return_value
+
+        # The result is cached.
+        mock_parse.assert_called_once_with("value")
+
+        prop._decode_string.cache_clear()
+
+
+class Test__loads:
+    """Test houdini_toolbox.pyfilter.property._loads."""
+
+    def test_literal(self, mocker):
+        """Test decoding a json literal."""
+        mock_loads = mocker.patch("houdini_toolbox.pyfilter.property.json.loads")
+
+        assert prop._loads(" false ") is False
+        assert prop._loads("null") is None
+
+        mock_loads.assert_not_called()
+
+    def test_not_json(self, mocker):
+        """Test a string which can't be json."""
+        mock_loads = mocker.patch("houdini_toolbox.pyfilter.property.json.loads")
+
+        assert prop._loads("opdef:/Shop/v_matte") is prop._MISSING
+        assert prop._loads("") is prop._MISSING
+
+        mock_loads.assert_not_called()
+
+    def test_invalid(self):
+        """Test a string which looks like json but isn't valid."""
+        assert prop._loads("[1, 2") is prop._MISSING
+
+    def test(self):
+        """Test decoding a json string."""
+        assert prop._loads('{"key": 1}') == {"key": 1}
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("key1 value1 key2 value2", {"key1": "value1", "key2": "value2"}),
+        ("key1 value1 key2", {"key1": "value1"}),
+        ("True", True),
+        ("value1 value2", "value1 value2"),
+    ],
+)
+def test__parse_plain_string(value, expected):
+    """Test houdini_toolbox.pyfilter.property._parse_plain_string."""
+    assert prop._parse_plain_string(value) == expected
+
+
+class Test_cache_properties:
+    """Test houdini_toolbox.pyfilter.property.cache_properties."""
+
+    def test(self, mocker):
+        """Test caching properties within a block."""
+        stack = []
+        mocker.patch.object(prop, "_CACHE_STACK", stack)
+
+        with prop.cache_properties():
+            assert stack == [{}]
+
+            stack[-1]["name"] = "value"
+
+            # Nested blocks use the same cache.
+            with prop.cache_properties():
+                assert stack[-1] is stack[0]
+
+            assert stack == [{"name": "value"}]
+
+        assert stack == []
+
+    def test_exception(self, mocker):
+        """Test the cache is discarded when an exception occurs."""
+        stack = []
+        mocker.patch.object(prop, "_CACHE_STACK", stack)
+
+        with pytest.raises(RuntimeError):
+            with prop.cache_properties():
+                raise RuntimeError
+
+        assert stack == []
+
 
 def test_get_property(mocker, patch_soho):
     """Test houdini_toolbox.pyfilter.property.get_property."""
@@ -231,6 +458,32 @@ def test_get_property(mocker, patch_soho):
     mock_transform.assert_called_with(patch_soho.mantra.property.return_value)
 
 
+def test_get_property__not_cached(mocker, patch_soho):
+    """Test houdini_toolbox.pyfilter.property.get_property when the value isn't cached yet."""
+    cache = {}
+    mocker.patch.object(prop, "_CACHE_STACK", [cache])
+    mock_transform = mocker.patch("houdini_toolbox.pyfilter.property._transform_values")
+
+    result = prop.get_property("name")
+
+    assert result == mock_transform.return_value
+
+    assert cache == {"name": mock_transform.return_value}
+
+
+def test_get_property__cached(mocker, patch_soho):
+    """Test houdini_toolbox.pyfilter.property.get_property with a cached value."""
+    mocker.patch.object(prop, "_CACHE_STACK", [{"name": None}])
+    mock_transform = mocker.patch("houdini_toolbox.pyfilter.property._transform_values")
+
+    result = prop.get_property("name")
+
+    assert result is None
+
+    mock_transform.assert_not_called()
+    patch_soho.mantra.property.assert_not_called()
+
+
 def test_set_property(mocker, patch_soho):
     """Test houdini_toolbox.pyfilter.property.set_property."""
     mock_prep = mocker.patch("houdini_toolbox.pyfilter.property._prep_value_to_set")
@@ -242,3 +495,44 @@ def test_set_property(mocker, patch_soho):
 
     mock_prep.assert_called_with(mock_value)
     patch_soho.mantra.setproperty.assert_called_with(mock_name, mock_prep.return_value)
+
+
+def test_set_property__cached(mocker, patch_soho):
+    """Test houdini_toolbox.pyfilter.property.set_property removes the cached value."""
+    cache = {"name": 1, "other": 2}
+    mocker.patch.object(prop, "_CACHE_STACK", [cache])
+    mocker.patch("houdini_toolbox.pyfilter.property._prep_value_to_set")
+
+    prop.set_property("name", 3)
+
+    assert cache == {"other": 2}
+
+
+class Test_set_properties:
+    """Test houdini_toolbox.pyfilter.property.set_properties."""
+
+    def test(self, mocker, patch_soho):
+        """Test setting multiple properties."""
+        cache = {"name1": 1, "other": 2}
+        mocker.patch.object(prop, "_CACHE_STACK", [cache])
+        mock_prep = mocker.patch(
+            "houdini_toolbox.pyfilter.property._prep_value_to_set",
+            side_effect=lambda value: [value],
+        )
+
+        prop.set_properties({"name1": 3, "name2": 4})
+
+        mock_prep.assert_has_calls([mocker.call(3), mocker.call(4)])
+        patch_soho.mantra.setproperty.assert_has_calls(
+            [mocker.call("name1", [3]), mocker.call("name2", [4])]
+        )
+
+        assert cache == {"other": 2}
+
+    def test_not_caching(self, mocker, patch_soho):
+        """Test setting multiple properties when not caching."""
+        mocker.patch.object(prop, "_CACHE_STACK", [])
+
+        prop.set_properties({"name": "value"})
+
+        patch_soho.mantra.setproperty.assert_called_with("name", ["value"])
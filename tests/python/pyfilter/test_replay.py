@@ -0,0 +1,194 @@
+"""Test the houdini_toolbox.pyfilter.replay module."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+# Standard Library
+import json
+import sys
+
+# Third Party
+import pytest
+
+# Houdini Toolbox
+from houdini_toolbox.pyfilter import replay
+from houdini_toolbox.pyfilter.operations.recordproperties import RECORDING_VERSION
+
+# =============================================================================
+# GLOBALS
+# =============================================================================
+
+_ZDEPTH = {
+    "module": "houdini_toolbox.pyfilter.operations.zdepth",
+    "class": "ZDepthPass",
+}
+
+_HEADER = {"version": RECORDING_VERSION, "args": ["--zdepth"], "operations": [_ZDEPTH]}
+
+_CALLBACKS = [
+    {
+        "stage": "filter_instance",
+        "args": [],
+        "reads": {
+            "object:name": ["/obj/geo1"],
+            "object:matte": [0],
+            "object:phantom": [0],
+            "object:surface": ["opdef:/Shop/v_plastic"],
+        },
+        "sets": [
+            ["object:overridedetail", [True]],
+            ["object:surface", ["opdef:/Shop/v_constant", "clr", "0", "0", "0"]],
+            ["object:displace", []],
+        ],
+    },
+    {
+        "stage": "filter_instance",
+        "args": [],
+        "reads": {"object:name": ["/obj/geo2"], "object:matte": [1]},
+        "sets": [
+            ["object:overridedetail", [True]],
+            ["object:phantom", [1]],
+        ],
+    },
+    {"stage": "filter_quit", "args": [], "reads": {}, "sets": []},
+]
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+@pytest.fixture
+def write_recording(tmp_path):
+    """Fixture to write a recording."""
+
+    def _write(header, callbacks):
+        path = tmp_path / "recording.jsonl"
+
+        with open(path, "w", encoding="utf-8") as handle:
+            for record in [header] + callbacks:
+                handle.write(json.dumps(record) + "\n")
+
+        return str(path)
+
+    return _write
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+class Test_ReplayMantra:
+    """Test the houdini_toolbox.pyfilter.replay.ReplayMantra object."""
+
+    def test(self):
+        """Test serving and setting property values."""
+        stand_in = replay.ReplayMantra()
+
+        stand_in.begin_callback({"object:name": ["/obj/geo1"]})
+
+        assert stand_in.property("object:name") == ["/obj/geo1"]
+        assert stand_in.property("object:matte") is None
+
+        stand_in.setproperty("object:matte", [1])
+
+        assert stand_in.property("object:matte") == [1]
+        assert stand_in.sets == [["object:matte", [1]]]
+
+        stand_in.begin_callback({"object:name": ["/obj/geo2"]})
+
+        assert stand_in.property("object:name") == ["/obj/geo2"]
+        assert stand_in.property("object:matte") == [1]
+        assert stand_in.sets == []
+
+
+class Test_ReplayResult:
+    """Test the houdini_toolbox.pyfilter.replay.ReplayResult object."""
+
+    def test(self):
+        """Test the result properties."""
+        result = replay.ReplayResult(100, 0.5, 1, {"filter_instance": 100})
+
+        assert result.callbacks == 100
+        assert result.callbacks_per_second == 200
+        assert result.elapsed == 0.5
+        assert result.mismatches == 1
+        assert result.stage_counts == {"filter_instance": 100}
+
+        assert "200 callbacks/s" in result.format_summary()
+
+    def test_callbacks_per_second__no_time(self):
+        """Test the callback rate when no time elapsed."""
+        result = replay.ReplayResult(0, 0.0, 0, {})
+
+        assert result.callbacks_per_second == 0
+
+
+class Test_load_recording:
+    """Test houdini_toolbox.pyfilter.replay.load_recording."""
+
+    def test(self, write_recording):
+        """Test loading a recording."""
+        path = write_recording(_HEADER, _CALLBACKS)
+
+        assert replay.load_recording(path) == (_HEADER, _CALLBACKS)
+
+    def test_version(self, write_recording):
+        """Test loading a recording with an unknown version."""
+        path = write_recording({"version": -1}, [])
+
+        with pytest.raises(ValueError):
+            replay.load_recording(path)
+
+
+class Test_replay_recording:
+    """Test houdini_toolbox.pyfilter.replay.replay_recording."""
+
+    def test(self):
+        """Test replaying callbacks against the recorded operations."""
+        original_mantra = sys.modules.get("mantra")
+        original_argv = sys.argv
+
+        result = replay.replay_recording(_HEADER, _CALLBACKS, repeat=2)
+
+        assert result.callbacks == 6
+        assert result.mismatches == 0
+        assert result.stage_counts == {"filter_instance": 4, "filter_quit": 2}
+
+        assert sys.modules.get("mantra") is original_mantra
+        assert sys.argv is original_argv
+
+    def test_args(self):
+        """Test replaying with different args."""
+        result = replay.replay_recording(_HEADER, _CALLBACKS, args=[])
+
+        # The operation doesn't run without its flag.
+        assert result.mismatches == 2
+
+    def test_operations(self):
+        """Test replaying with different operations."""
+        result = replay.replay_recording(_HEADER, _CALLBACKS, operations=[])
+
+        assert result.mismatches == 2
+
+
+def test_main(write_recording, capsys):
+    """Test houdini_toolbox.pyfilter.replay.main."""
+    path = write_recording(_HEADER, _CALLBACKS)
+
+    replay.main(
+        [
+            path,
+            "--args=--zdepth",
+            "--operation=houdini_toolbox.pyfilter.operations.zdepth:ZDepthPass",
+            "--repeat=3",
+        ]
+    )
+
+    output = capsys.readouterr().out
+
+    assert "Replayed 9 callbacks" in output
+    assert "Callbacks setting different properties: 0" in output
@@ -1345,14 +1345,30 @@ class Test__get_aov_path_folders:
         assert result == ("path1", "path2", "hpath1", "hpath2")
 
 
+def test_add_aovs_to_ifd(mocker):
+    """Test houdini_toolbox.sohohooks.aovs.manager.add_aovs_to_ifd."""
+    mock_get = mocker.patch("houdini_toolbox.sohohooks.aovs.manager.get_aov_manager")
+
+    mock_wrangler = mocker.MagicMock()
+    mock_cam = mocker.MagicMock()
+    mock_now = mocker.MagicMock(spec=float)
+
+    manager.add_aovs_to_ifd(mock_wrangler, mock_cam, mock_now)
+
+    mock_get.return_value.add_aovs_to_ifd.assert_called_with(
+        mock_wrangler, mock_cam, mock_now
+    )
+
+
 class Test_build_menu_script:
     """Test houdini_toolbox.sohohooks.aovs.manager.build_menu_script."""
 
     def test_no_groups(self, mocker):
         """Test when no groups exist."""
-        mock_manager = mocker.patch(
-            "houdini_toolbox.sohohooks.aovs.manager.AOV_MANAGER", autospec=True
+        mock_get = mocker.patch(
+            "houdini_toolbox.sohohooks.aovs.manager.get_aov_manager"
         )
+        mock_manager = mock_get.return_value
 
         mock_manager.groups = None
 
@@ -1368,9 +1384,10 @@ class Test_build_menu_script:
 
     def test_with_groups(self, mocker):
         """Test when groups exist."""
-        mock_manager = mocker.patch(
-            "houdini_toolbox.sohohooks.aovs.manager.AOV_MANAGER", autospec=True
+        mock_get = mocker.patch(
+            "houdini_toolbox.sohohooks.aovs.manager.get_aov_manager"
         )
+        mock_manager = mock_get.return_value
 
         mock_group1 = mocker.MagicMock(spec=manager.AOVGroup)
         mock_group2 = mocker.MagicMock(spec=manager.AOVGroup)
@@ -1424,15 +1441,39 @@ def test_flatten_aov_items(mocker):
     assert result == (mock_aov, mock_group_aov)
 
 
+class Test_get_aov_manager:
+    """Test houdini_toolbox.sohohooks.aovs.manager.get_aov_manager."""
+
+    def test_existing(self, mocker):
+        """Test getting the manager when it has already been built."""
+        mock_manager = mocker.MagicMock(spec=manager.AOVManager)
+
+        mocker.patch("houdini_toolbox.sohohooks.aovs.manager._AOV_MANAGER", mock_manager)
+
+        assert manager.get_aov_manager() == mock_manager
+
+    def test_new(self, mocker):
+        """Test building the manager the first time it is requested."""
+        mock_cls = mocker.patch(
+            "houdini_toolbox.sohohooks.aovs.manager.AOVManager", autospec=True
+        )
+
+        mocker.patch("houdini_toolbox.sohohooks.aovs.manager._AOV_MANAGER", None)
+
+        result = manager.get_aov_manager()
+
+        assert result == mock_cls.return_value
+        assert manager._AOV_MANAGER == mock_cls.return_value
+
+
 def test_load_json_files(mocker, mock_hou_ui):
     """Test houdini_toolbox.sohohooks.aovs.manager.load_json_files."""
     mock_expand = mocker.patch(
         "houdini_toolbox.sohohooks.aovs.manager.os.path.expandvars"
     )
     mock_exists = mocker.patch("houdini_toolbox.sohohooks.aovs.manager.os.path.exists")
-    mock_manager = mocker.patch(
-        "houdini_toolbox.sohohooks.aovs.manager.AOV_MANAGER", autospec=True
-    )
+    mock_get = mocker.patch("houdini_toolbox.sohohooks.aovs.manager.get_aov_manager")
+    mock_manager = mock_get.return_value
 
     mock_expand.side_effect = ("expanded1", "expanded2")
 
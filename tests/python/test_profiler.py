@@ -0,0 +1,522 @@
+"""Test the houdini_toolbox.profiler module."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+# Standard Library
+import json
+import sys
+import types
+
+# Third Party
+import pytest
+
+# Houdini Toolbox
+from houdini_toolbox import profiler
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+@pytest.fixture
+def init_profiler(mocker):
+    """Fixture to initialize a profiler."""
+    mocker.patch.object(profiler.StartupProfiler, "__init__", lambda x: None)
+
+    def _create():
+        return profiler.StartupProfiler()
+
+    return _create
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+class Test__TimedLoader:
+    """Test houdini_toolbox.profiler._TimedLoader class."""
+
+    def test___getattr__(self, mocker):
+        """Test other attributes are looked up on the wrapped loader."""
+        mock_loader = mocker.MagicMock()
+        mock_profiler = mocker.MagicMock(spec=profiler.StartupProfiler)
+
+        loader = profiler._TimedLoader(mock_loader, mock_profiler)
+
+        assert loader.is_package == mock_loader.is_package
+
+    def test_create_module(self, mocker):
+        """Test timing the creation of a module."""
+        mock_loader = mocker.MagicMock()
+        mock_profiler = mocker.MagicMock(spec=profiler.StartupProfiler)
+        mock_spec = mocker.MagicMock()
+
+        loader = profiler._TimedLoader(mock_loader, mock_profiler)
+
+        result = loader.create_module(mock_spec)
+
+        assert result == mock_profiler.time_import.return_value
+
+        mock_profiler.time_import.assert_called_with(
+            mock_spec.name, mock_loader.create_module, mock_spec
+        )
+
+    def test_exec_module(self, mocker):
+        """Test timing the execution of a module."""
+        mock_loader = mocker.MagicMock()
+        mock_profiler = mocker.MagicMock(spec=profiler.StartupProfiler)
+
+        module = types.ModuleType("test_module")
+        module.__spec__ = mocker.MagicMock()
+
+        loader = profiler._TimedLoader(mock_loader, mock_profiler)
+
+        loader.exec_module(module)
+
+        assert module.__loader__ == mock_loader
+        assert module.__spec__.loader == mock_loader
+
+        mock_profiler.time_import.assert_called_with(
+            "test_module", mock_loader.exec_module, module
+        )
+
+
+class Test_StartupProfiler:
+    """Test houdini_toolbox.profiler.StartupProfiler class."""
+
+    def test___init__(self):
+        """Test object initialization."""
+        prof = profiler.StartupProfiler()
+
+        assert prof._constructions == {}
+        assert prof._imports == {}
+        assert prof._started is None
+        assert prof._total_time == 0.0
+
+    # Properties
+
+    def test_constructions(self, init_profiler, mocker):
+        """Test the 'constructions' property."""
+        mock_value = mocker.MagicMock(spec=dict)
+
+        prof = init_profiler()
+        prof._constructions = mock_value
+
+        assert prof.constructions == mock_value
+
+    def test_imports(self, init_profiler):
+        """Test the 'imports' property."""
+        prof = init_profiler()
+        prof._imports = {"module": [1.0, 2.0]}
+
+        assert prof.imports == {"module": (1.0, 2.0)}
+
+    def test_running(self, init_profiler):
+        """Test the 'running' property."""
+        prof = init_profiler()
+        prof._started = None
+
+        assert not prof.running
+
+        prof._started = 1.0
+
+        assert prof.running
+
+    def test_total_time__stopped(self, init_profiler):
+        """Test the 'total_time' property when the profiler is stopped."""
+        prof = init_profiler()
+        prof._started = None
+        prof._total_time = 2.0
+
+        assert prof.total_time == 2.0
+
+    def test_total_time__running(self, init_profiler, mocker):
+        """Test the 'total_time' property when the profiler is running."""
+        mocker.patch("houdini_toolbox.profiler.time.perf_counter", return_value=5.0)
+
+        prof = init_profiler()
+        prof._started = 4.0
+        prof._total_time = 2.0
+
+        assert prof.total_time == 3.0
+
+    # Methods
+
+    def test_find_spec(self, init_profiler, mocker):
+        """Test finding a spec and wrapping its loader."""
+        mock_finder1 = mocker.MagicMock(spec=[])
+        mock_finder2 = mocker.MagicMock()
+        mock_finder2.find_spec.return_value = None
+        mock_finder3 = mocker.MagicMock()
+
+        mock_spec = mock_finder3.find_spec.return_value
+        mock_loader = mock_spec.loader
+
+        mock_path = mocker.MagicMock()
+
+        prof = init_profiler()
+
+        mocker.patch.object(
+            sys, "meta_path", [prof, mock_finder1, mock_finder2, mock_finder3]
+        )
+
+        result = prof.find_spec("test_module", mock_path)
+
+        assert result == mock_spec
+        assert isinstance(mock_spec.loader, profiler._TimedLoader)
+        assert mock_spec.loader._loader == mock_loader
+
+        mock_finder2.find_spec.assert_called_with("test_module", mock_path, None)
+
+    def test_find_spec__not_found(self, init_profiler, mocker):
+        """Test finding a spec which no finder can find."""
+        mock_finder = mocker.MagicMock()
+        mock_finder.find_spec.return_value = None
+
+        prof = init_profiler()
+
+        mocker.patch.object(sys, "meta_path", [prof, mock_finder])
+
+        assert prof.find_spec("test_module", None) is None
+
+    def test_find_spec__no_exec_module(self, init_profiler, mocker):
+        """Test finding a spec whose loader cannot be timed."""
+        mock_finder = mocker.MagicMock()
+
+        mock_spec = mock_finder.find_spec.return_value
+        mock_spec.loader = mocker.MagicMock(spec=[])
+
+        prof = init_profiler()
+
+        mocker.patch.object(sys, "meta_path", [prof, mock_finder])
+
+        result = prof.find_spec("test_module", None)
+
+        assert not isinstance(result.loader, profiler._TimedLoader)
+
+    def test_format_report(self, init_profiler, mocker):
+        """Test formatting the report."""
+        mocker.patch.object(
+            profiler.StartupProfiler,
+            "get_report",
+            return_value={
+                "total_seconds": 1.5,
+                "imports": [
+                    {
+                        "module": "module",
+                        "self_seconds": 0.25,
+                        "cumulative_seconds": 0.5,
+                    }
+                ],
+                "constructions": [{"name": "MANAGER", "seconds": 0.125}],
+            },
+        )
+
+        prof = init_profiler()
+
+        result = prof.format_report()
+
+        assert result == (
+            "Startup profile: 1.5000s\n"
+            "Imports (self / cumulative):\n"
+            "\t0.2500s / 0.5000s\tmodule\n"
+            "Constructions:\n"
+            "\t0.1250s\tMANAGER"
+        )
+
+    def test_get_report(self, init_profiler, mocker):
+        """Test getting the report."""
+        mocker.patch.object(
+            profiler.StartupProfiler,
+            "total_time",
+            new_callable=mocker.PropertyMock(return_value=2.0),
+        )
+
+        prof = init_profiler()
+        prof._imports = {"a": [0.1, 0.5], "b": [0.3, 0.3]}
+        prof._constructions = {"A_MANAGER": 0.1, "B_MANAGER": 0.2}
+
+        result = prof.get_report()
+
+        assert result == {
+            "total_seconds": 2.0,
+            "imports": [
+                {"module": "b", "self_seconds": 0.3, "cumulative_seconds": 0.3},
+                {"module": "a", "self_seconds": 0.1, "cumulative_seconds": 0.5},
+            ],
+            "constructions": [
+                {"name": "B_MANAGER", "seconds": 0.2},
+                {"name": "A_MANAGER", "seconds": 0.1},
+            ],
+        }
+
+    def test_start_stop(self, init_profiler, mocker):
+        """Test starting and stopping the profiler."""
+        mocker.patch(
+            "houdini_toolbox.profiler.time.perf_counter", side_effect=(1.0, 3.0)
+        )
+
+        mock_finder = mocker.MagicMock()
+
+        prof = init_profiler()
+        prof._started = None
+        prof._total_time = 0.5
+
+        mocker.patch.object(sys, "meta_path", [mock_finder])
+
+        prof.start()
+        prof.start()
+
+        assert sys.meta_path == [prof, mock_finder]
+
+        prof.stop()
+        prof.stop()
+
+        assert sys.meta_path == [mock_finder]
+        assert prof._started is None
+        assert prof._total_time == 2.5
+
+    def test_time_call(self, init_profiler, mocker):
+        """Test timing a construction."""
+        mocker.patch(
+            "houdini_toolbox.profiler.time.perf_counter", side_effect=(1.0, 1.5)
+        )
+
+        mock_func = mocker.MagicMock()
+
+        prof = init_profiler()
+        prof._constructions = {}
+
+        result = prof.time_call("MANAGER", mock_func, 1, key=2)
+
+        assert result == mock_func.return_value
+        assert prof._constructions == {"MANAGER": 0.5}
+
+        mock_func.assert_called_with(1, key=2)
+
+    def test_time_import(self):
+        """Test nested imports are excluded from the self time."""
+        prof = profiler.StartupProfiler()
+
+        times = iter((1.0, 2.0, 5.0, 10.0))
+
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(profiler.time, "perf_counter", lambda: next(times))
+
+            def _parent():
+                prof.time_import("child", lambda: None)
+
+            prof.time_import("parent", _parent)
+
+        assert prof.imports == {"child": (3.0, 3.0), "parent": (6.0, 9.0)}
+
+    def test_write(self, init_profiler, mocker, tmp_path):
+        """Test writing the report to a file."""
+        mock_report = {"total_seconds": 1.0, "imports": [], "constructions": []}
+
+        mocker.patch.object(
+            profiler.StartupProfiler, "get_report", return_value=mock_report
+        )
+
+        path = tmp_path / "profile.json"
+
+        prof = init_profiler()
+        prof.write(str(path))
+
+        assert json.loads(path.read_text()) == mock_report
+
+
+class Test__time_constructions:
+    """Test houdini_toolbox.profiler._time_constructions."""
+
+    def test(self, mocker):
+        """Test timing the first construction of the singletons."""
+        mocker.patch("houdini_toolbox.nodes.styles.manager._STYLE_MANAGER", None)
+        mocker.patch("houdini_toolbox.sohohooks.aovs.manager._AOV_MANAGER", None)
+        mock_get_style = mocker.patch(
+            "houdini_toolbox.nodes.styles.manager.get_style_manager"
+        )
+        mock_get_aov = mocker.patch(
+            "houdini_toolbox.sohohooks.aovs.manager.get_aov_manager"
+        )
+        mock_create = mocker.patch("houdini_toolbox.profiler._time_create_library")
+
+        mock_profiler = mocker.MagicMock(spec=profiler.StartupProfiler)
+
+        profiler._time_constructions(mock_profiler)
+
+        assert mock_profiler.time_call.call_args_list == [
+            mocker.call("STYLE_MANAGER", mock_get_style),
+            mocker.call("AOV_MANAGER", mock_get_aov),
+        ]
+
+        mock_create.assert_called_with(mock_profiler)
+
+    def test_already_built(self, mocker):
+        """Test singletons which have already been built are not timed."""
+        mocker.patch(
+            "houdini_toolbox.nodes.styles.manager._STYLE_MANAGER", mocker.MagicMock()
+        )
+        mocker.patch(
+            "houdini_toolbox.sohohooks.aovs.manager._AOV_MANAGER", mocker.MagicMock()
+        )
+        mock_create = mocker.patch("houdini_toolbox.profiler._time_create_library")
+
+        mock_profiler = mocker.MagicMock(spec=profiler.StartupProfiler)
+
+        profiler._time_constructions(mock_profiler)
+
+        mock_profiler.time_call.assert_not_called()
+
+        mock_create.assert_called_with(mock_profiler)
+
+
+class Test__time_create_library:
+    """Test houdini_toolbox.profiler._time_create_library."""
+
+    def test_already_imported(self, mocker):
+        """Test when the library has already been created."""
+        mock_import = mocker.patch("houdini_toolbox.profiler.importlib.import_module")
+
+        mocker.patch.dict(
+            sys.modules, {"houdini_toolbox.inline.lib": mocker.MagicMock()}
+        )
+
+        mock_profiler = mocker.MagicMock(spec=profiler.StartupProfiler)
+
+        profiler._time_create_library(mock_profiler)
+
+        mock_import.assert_not_called()
+
+    def test_no_inlinecpp(self, mocker):
+        """Test when inlinecpp is not available."""
+        mock_import = mocker.patch("houdini_toolbox.profiler.importlib.import_module")
+
+        mocker.patch.dict(sys.modules, {"inlinecpp": None})
+        sys.modules.pop("houdini_toolbox.inline.lib", None)
+
+        mock_profiler = mocker.MagicMock(spec=profiler.StartupProfiler)
+
+        profiler._time_create_library(mock_profiler)
+
+        mock_import.assert_not_called()
+
+    def test(self, mocker):
+        """Test timing the library creation."""
+        mock_inlinecpp = mocker.MagicMock()
+        mock_create = mock_inlinecpp.createLibrary
+
+        mocker.patch.dict(sys.modules, {"inlinecpp": mock_inlinecpp})
+        sys.modules.pop("houdini_toolbox.inline.lib", None)
+
+        mock_profiler = mocker.MagicMock(spec=profiler.StartupProfiler)
+
+        def _import(module_name):
+            assert module_name == "houdini_toolbox.inline.lib"
+
+            result = mock_inlinecpp.createLibrary("cpp_methods", catch_crashes=True)
+
+            assert result == mock_profiler.time_call.return_value
+
+        mocker.patch(
+            "houdini_toolbox.profiler.importlib.import_module", side_effect=_import
+        )
+
+        profiler._time_create_library(mock_profiler)
+
+        mock_profiler.time_call.assert_called_with(
+            "inline.lib.createLibrary", mock_create, "cpp_methods", catch_crashes=True
+        )
+
+        assert mock_inlinecpp.createLibrary == mock_create
+
+
+class Test_profile_imports:
+    """Test houdini_toolbox.profiler.profile_imports."""
+
+    def test(self, mocker):
+        """Test profiling a block of code."""
+        mock_cls = mocker.patch(
+            "houdini_toolbox.profiler.StartupProfiler", autospec=True
+        )
+        mock_time = mocker.patch("houdini_toolbox.profiler._time_constructions")
+        mock_logger = mocker.patch("houdini_toolbox.profiler._logger")
+
+        mock_profiler = mock_cls.return_value
+        mock_path = mocker.MagicMock(spec=str)
+
+        with profiler.profile_imports(mock_path) as result:
+            assert result == mock_profiler
+            mock_profiler.start.assert_called()
+            mock_profiler.stop.assert_not_called()
+
+        mock_time.assert_called_with(mock_profiler)
+        mock_profiler.stop.assert_called()
+        mock_logger.info.assert_called_with(mock_profiler.format_report.return_value)
+        mock_profiler.write.assert_called_with(mock_path)
+
+    def test_error(self, mocker):
+        """Test the profiler is stopped if the block raises an error."""
+        mock_cls = mocker.patch(
+            "houdini_toolbox.profiler.StartupProfiler", autospec=True
+        )
+        mock_time = mocker.patch("houdini_toolbox.profiler._time_constructions")
+
+        mock_profiler = mock_cls.return_value
+
+        with pytest.raises(RuntimeError):
+            with profiler.profile_imports():
+                raise RuntimeError()
+
+        mock_time.assert_not_called()
+        mock_profiler.stop.assert_called()
+        mock_profiler.write.assert_not_called()
+
+
+def test_profile_startup(mocker):
+    """Test houdini_toolbox.profiler.profile_startup."""
+    mock_profile = mocker.patch("houdini_toolbox.profiler.profile_imports")
+    mock_import = mocker.patch("houdini_toolbox.profiler.importlib.import_module")
+
+    mock_profiler = mock_profile.return_value.__enter__.return_value
+    mock_path = mocker.MagicMock(spec=str)
+
+    result = profiler.profile_startup(mock_path)
+
+    assert result == mock_profiler.get_report.return_value
+
+    mock_profile.assert_called_with(mock_path)
+    mock_import.assert_has_calls(
+        [mocker.call(name) for name in profiler._STARTUP_MODULES]
+    )
+
+
+class Test_startup_profile:
+    """Test houdini_toolbox.profiler.startup_profile."""
+
+    def test_not_set(self, mocker):
+        """Test when the environment variable is not set."""
+        mock_profile = mocker.patch("houdini_toolbox.profiler.profile_imports")
+
+        mocker.patch.dict(profiler.os.environ, {}, clear=True)
+
+        with profiler.startup_profile() as result:
+            assert result is None
+
+        mock_profile.assert_not_called()
+
+    def test_set(self, mocker):
+        """Test when the environment variable is set."""
+        mock_profile = mocker.patch("houdini_toolbox.profiler.profile_imports")
+
+        mocker.patch.dict(
+            profiler.os.environ, {profiler.PROFILE_PATH_VAR: "/path/to/profile.json"}
+        )
+
+        with profiler.startup_profile() as result:
+            assert result == mock_profile.return_value.__enter__.return_value
+
+        mock_profile.assert_called_with("/path/to/profile.json")